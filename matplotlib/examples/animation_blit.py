@@ -17,25 +17,21 @@ import pylab as p
 ax = p.subplot(111)
 canvas = ax.figure.canvas
 
-# create the initial line
+# create the initial line; the blit manager keeps the background
+# without it and redraws just the line on every update
 x = nx.arange(0,2*nx.pi,0.01)
-line, = p.plot(x, nx.sin(x), animated=True, lw=2)
+line, = p.plot(x, nx.sin(x), lw=2)
+manager = canvas.get_blit_manager()
+manager.add_artist(line)
 
 # for profiling
 tstart = time.time()
 
 def update_line(*args):
-    if update_line.background is None:
-        update_line.background = canvas.copy_from_bbox(ax.bbox)
-
-    # restore the clean slate background
-    canvas.restore_region(update_line.background)
     # update the data
     line.set_ydata(nx.sin(x+update_line.cnt/10.0))
-    # just draw the animated artist
-    ax.draw_artist(line)
-    # just redraw the axes rectangle
-    canvas.blit(ax.bbox)
+    # restore the background, draw the line and blit the axes
+    manager.update()
 
     if update_line.cnt==200:
         # print the timing info and quit
@@ -45,6 +41,5 @@ def update_line(*args):
     update_line.cnt += 1
     return True
 update_line.cnt = 0
-update_line.background = None
 gobject.idle_add(update_line)
 p.show()
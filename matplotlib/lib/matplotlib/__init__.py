@@ -181,12 +181,19 @@ _python23 = major>=2 and minor1>=3
 
 _havemath = _python23
 
-try:
-    import datetime
-    import dateutil
-    import pytz
-except ImportError: _havedate = False
-else: _havedate = True
+def _have_modules(*names):
+    '''
+    Return True if all the top level modules names can be found on
+    sys.path.  They are not imported, so checking costs no import time
+    '''
+    import imp
+    for name in names:
+        try: imp.find_module(name)
+        except ImportError: return False
+    return True
+
+# dateutil and pytz are only imported when dates are used
+_havedate = _python23 and _have_modules('dateutil', 'pytz')
 
 #try:
 #    import pkg_resources # pkg_resources is part of setuptools
@@ -580,6 +587,9 @@ def validate_verbose_fileo(s):
     return verbose.fileo
 
 
+validate_ps_imageencoding = ValidateInStrings(['flate', 'runlength', 'hex'],
+                                             ignorecase=True)
+
 validate_ps_papersize = ValidateInStrings([
         'executive', 'letter', 'legal', 'ledger',
         'a0', 'a1', 'a2','a3', 'a4', 'a5', 'a6', 'a7', 'a8', 'a9', 'a10',
@@ -724,6 +734,7 @@ defaultParams = {
     'lines.markeredgewidth'       : [0.5, validate_float],
     'lines.markersize'  : [6, validate_float],       # markersize, in points
     'lines.antialiased' : [True, validate_bool],     # antialised (no jaggies)
+    'lines.markercull' : [False, validate_bool],     # skip overplotted markers
     'lines.dash_joinstyle' : ['miter', validate_joinstyle],
     'lines.solid_joinstyle' : ['miter', validate_joinstyle],
     'lines.dash_capstyle' : ['butt', validate_capstyle],
@@ -753,6 +764,8 @@ defaultParams = {
     'text.color'        : ['k', validate_color],     # black
     'text.usetex'       : [False, validate_usetex],
     'text.dvipnghack'    : [False, validate_bool],
+    'text.texcachesize' : [50., validate_float], # megabytes of tex masks
+    'text.mathcachesize' : [8., validate_float], # megabytes of mathtext layouts
     'text.fontstyle'    : ['normal', str],
     'text.fontangle'    : ['normal', str],
     'text.fontvariant'  : ['normal', str],
@@ -820,6 +833,7 @@ defaultParams = {
     'figure.dpi'        : [ 80, validate_float],   # DPI
     'figure.facecolor'  : [ 0.75, validate_color], # facecolor; scalar gray
     'figure.edgecolor'  : [ 'w', validate_color],  # edgecolor; white
+    'figure.incremental': [ False, validate_bool], # redraw only changed axes
 
     'figure.subplot.left'   : [0.125, ValidateInterval(0, 1, closedmin=False, closedmax=False)],
     'figure.subplot.right'  : [0.9, ValidateInterval(0, 1, closedmin=False, closedmax=False)],
@@ -840,6 +854,8 @@ defaultParams = {
     'ps.useafm'   : [ False, validate_bool],  # Set PYTHONINSPECT
     'ps.usedistiller'   : [ False, validate_ps_distiller],  # use ghostscript or xpdf to distill ps output
     'ps.distiller.res'  : [6000, validate_int],       # dpi
+    'ps.imageencoding'  : ['flate', validate_ps_imageencoding], # flate, runlength or hex
+    'pdf.compression'   : [6, validate_int],          # zlib level, 0 is none
     'plugins.directory' : ['.matplotlib_plugins', str], # where plugin directory is locate
 
     }
@@ -1084,7 +1100,7 @@ def rcdefaults():
 
 _knownBackends = {
     'Agg2':1, 'Agg':1, 'Cairo':1, 'CocoaAgg':1, 'FltkAgg':1, 'GD':1, 'GDK':1,
-    'GTK':1, 'GTKAgg':1, 'GTKCairo':1, 'Paint':1, 'PS':1, 'LaTeX':1, 'QtAgg':1,
+    'GTK':1, 'GTKAgg':1, 'GTKCairo':1, 'Paint':1, 'PDF':1, 'PS':1, 'LaTeX':1, 'QtAgg':1,
     'SVG':1, 'EMF':1, 'Template':1, 'TkAgg':1, 'WX':1, 'WXAgg':1, 'WXGLAgg':1,}
 
 
@@ -1,7 +1,7 @@
 from __future__ import division
 import sys
 from cbook import iterable, flatten
-from transforms import identity_transform
+from transforms import identity_transform, SpatialIndex
 import warnings
 ## Note, matplotlib artists use the doc strings for set and get
 # methods to enable the introspection methods of set and get in the
@@ -40,6 +40,7 @@ class Artist:
         self._clipon = False
         self._lod = False
         self._label = ''
+        self._spatialIndex = None  # a (transform key, SpatialIndex) tuple
 
         self.eventson = False  # fire events only if eventson
         self._oid = 0  # an observer id
@@ -197,6 +198,42 @@ class Artist:
         if changed: self.pchanged()
 
 
+    def _get_display_vertices(self):
+        """
+        Return x, y, connect where x and y are numerix arrays of the
+        artist's vertices in display coords and connect is True if
+        they are the consecutive points of a line.  Return None if the
+        artist does not support a spatial index
+        """
+        return None
+
+    def _get_transform_key(self):
+        'return a hashable description of the current transform values'
+        t = self._transform
+        try: funcs = t.get_funcx().get_type(), t.get_funcy().get_type()
+        except RuntimeError: funcs = None  # non-separable
+        # a point through the whole transform picks up any offset
+        return tuple(t.as_vec6_val()) + (funcs, t.xy_tup((1.0, 1.0)))
+
+    def get_spatial_index(self):
+        """
+        Return a matplotlib.transforms.SpatialIndex of the artist's
+        display space vertices, or None if the artist doesn't support
+        one.  The index is cached; it is rebuilt when the transform
+        changes (eg, a view limit or dpi change) or the data are set
+        """
+        key = self._get_transform_key()
+        if self._spatialIndex is not None:
+            oldkey, index = self._spatialIndex
+            if oldkey==key: return index
+
+        verts = self._get_display_vertices()
+        if verts is None: return None
+        x, y, connect = verts
+        index = SpatialIndex(x, y, connect)
+        self._spatialIndex = key, index
+        return index
+
     def get_label(self):
         return self._label
 
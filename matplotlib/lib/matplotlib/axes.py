@@ -6,7 +6,7 @@ from numerix import absolute, arange, array, asarray, ones, divide,\
      transpose, log, log10, Float, Float32, ravel, zeros,\
      Int16, Int32, Int, Float64, ceil, indices, \
      shape, which, where, sqrt, asum, compress, maximum, minimum, \
-     typecode
+     typecode, inf
 
 import numerix.ma as ma
 
@@ -38,6 +38,7 @@ from patches import Patch, Rectangle, Circle, Polygon, Arrow, Wedge, Shadow, bbo
 from table import Table
 from text import Text, TextWithDash, _process_text_args
 from transforms import Bbox, Point, Value, Affine, NonseparableTransformation
+from transforms import bbox_all
 from transforms import  FuncXY, Func, LOG10, IDENTITY, POLAR
 from transforms import get_bbox_transform, unit_bbox, one, origin, zero
 from transforms import blend_xy_sep_transform, Interval
@@ -45,9 +46,6 @@ from font_manager import FontProperties
 
 import matplotlib
 
-if matplotlib._havedate:
-    from dates import date_ticker_factory
-
 def delete_masked_points(*args):
     """
     Find all masked points in a set of arguments, and return
@@ -654,6 +652,61 @@ class Axes(Artist):
         if not a.is_transform_set():
             a.set_transform(self.transData)
         a.axes = self
+        self._track_artist(a)
+
+    def _track_artist(self, a):
+        'mark the axes dirty whenever a property of artist a changes'
+        if getattr(a, '_trackingaxes', None) is self: return
+        a._trackingaxes = self
+        a.add_callback(self._artist_changed)
+
+    def _artist_changed(self, a):
+        self._dirty = True
+
+    def set_dirty(self):
+        """
+        Draw the axes again on the next incremental figure draw; see
+        Figure.set_incremental.  The axes and axis setters and the
+        properties of the axes artists are noticed without this; call
+        it after changing what the axes draws in some other way, eg the
+        attributes of a Tick instance or a locator's parameters
+        """
+        self._dirty = True
+
+    def _get_draw_state(self):
+        'return the state a clean axes has kept since it was last drawn'
+        return (self.viewLim.get_bounds(), self.bbox.get_bounds(),
+                self.get_visible(), self.axison, self._frameon,
+                id(self.legend_), len(self.lines), len(self.patches),
+                len(self.texts), len(self.collections), len(self.images),
+                len(self.artists), len(self.tables),
+                self.get_xscale(), self.get_yscale(),
+                self._get_axis_state(self.xaxis),
+                self._get_axis_state(self.yaxis))
+
+    def _get_axis_state(self, axis):
+        """
+        return the grid flags, tick locators and formatters of axis;
+        the tickers themselves are kept, not their ids, so a new one
+        can not compare equal to one that was freed
+        """
+        return (axis._gridOnMajor, axis._gridOnMinor,
+                axis.get_major_locator(), axis.get_minor_locator(),
+                axis.get_major_formatter(), axis.get_minor_formatter())
+
+    def _get_drawn_bbox(self, renderer):
+        """
+        Return the Bbox in display coords that the last draw rendered
+        into: the axes bbox grown to hold the tick labels, titles and
+        legend
+        """
+        bboxes = [self.bbox]
+        for t in self._get_drawn_texts():
+            if t.get_visible() and t.get_text():
+                bboxes.append(t.get_window_extent(renderer))
+        if self.legend_ is not None:
+            bboxes.append(self.legend_.get_window_extent())
+        return bbox_all(bboxes)
 
     def cla(self):
         'Clear the current axes'
@@ -706,6 +759,11 @@ class Axes(Artist):
         self.axesPatch.set_linewidth(rcParams['axes.linewidth'])
         self.axison = True
 
+        self._track_artist(self.axesPatch)
+        self._track_artist(self.xaxis.label)
+        self._track_artist(self.yaxis.label)
+        self._dirty = True
+
     def add_artist(self, a):
         'Add any artist to the axes'
         self.artists.append(a)
@@ -758,9 +816,9 @@ class Axes(Artist):
 
         if l.get_transform() != self.transData:
             xys = self._get_verts_in_data_coords(
-                l.get_transform(), zip(xdata, ydata))
-            xdata = array([x for x,y in xys])
-            ydata = array([y for x,y in xys])
+                l.get_transform(), transpose(array([xdata, ydata])))
+            xdata = xys[:,0]
+            ydata = xys[:,1]
 
         self.update_datalim_numerix( xdata, ydata )
         label = l.get_label()
@@ -772,8 +830,7 @@ class Axes(Artist):
             return xys
         # data is not in axis data units.  We must transform it to
         # display and then back to data to get it in data units
-        xys = trans.seq_xy_tups(xys)
-        return [ self.transData.inverse_xy_tup(xy) for xy in xys]
+        return self.transData.inverse_numerix_xy(trans.numerix_xy(xys))
 
     def add_patch(self, p):
         """
@@ -1478,17 +1535,19 @@ class Axes(Artist):
 
         self._cachedRenderer = renderer
 
-
-    def __draw_animate(self):
-        # ignore for now; broken
-        if self._lastRenderer is None:
-            raise RuntimeError('You must first call ax.draw()')
-        dsu = [(a.zorder, a) for a in self.animated.keys()]
-        dsu.sort()
-        renderer = self._lastRenderer
-        renderer.blit()
-        for tmp, a in dsu:
-            a.draw(renderer)
+    def _get_drawn_texts(self):
+        """
+        Return the Text instances that draw renders, so their tex can
+        be prepared in one batch
+        """
+        if not self.get_visible(): return []
+        texts = self.texts + [self.title]
+        if self.axison:
+            texts.extend(self.xaxis._get_drawn_texts())
+            texts.extend(self.yaxis._get_drawn_texts())
+        if self.legend_ is not None:
+            texts.extend(self.legend_.texts)
+        return texts
 
     def errorbar(self, x, y, yerr=None, xerr=None,
                  fmt='b-', ecolor=None, capsize=3,
@@ -1756,6 +1815,7 @@ class Axes(Artist):
         """
         self.xaxis.grid(b)
         self.yaxis.grid(b)
+        self._dirty = True
 
 
     def hist(self, x, bins=10, normed=0, bottom=0,
@@ -1863,7 +1923,8 @@ class Axes(Artist):
                shape=None,
                filternorm=1,
                filterrad=4.0,
-               imlim=None):
+               imlim=None,
+               pyramid=None):
         """
 
         IMSHOW(X, cmap=None, norm=None, aspect=None, interpolation=None,
@@ -1944,6 +2005,13 @@ class Axes(Artist):
            parameter, ie when interpolation is one of: 'sinc',
            'lanczos' or 'blackman'
 
+         * pyramid is None, 'mean' or 'max'.  If not None, decimated
+           copies of the image are made once, each pixel the mean or
+           max of 2x2 pixels of the one before, and only the part in
+           view of the coarsest copy that still has a pixel for each
+           screen pixel is resampled when drawing.  Use it for images
+           much larger than the axes; see AxesImage.set_pyramid
+
 
     """
 
@@ -1954,7 +2022,7 @@ class Axes(Artist):
 
         im = AxesImage(self, cmap, norm, aspect, interpolation, origin, extent,
                        filternorm=filternorm,
-                       filterrad=filterrad)
+                       filterrad=filterrad, pyramid=pyramid)
         if norm is None and shape is None:
             im.set_clim(vmin, vmax)
 
@@ -1968,6 +2036,7 @@ class Axes(Artist):
         if self._autoscaleon:
             self.set_xlim((xmin, xmax))
             self.set_ylim((ymin, ymax))
+        self._track_artist(im)
         self.images.append(im)
 
         return im
@@ -2290,7 +2359,15 @@ class Axes(Artist):
         Y3 = compress(ravel(mask==0),ravel(ma.filled(Y[1:,1:])))
         X4 = compress(ravel(mask==0),ravel(ma.filled(X[0:-1,1:])))
         Y4 = compress(ravel(mask==0),ravel(ma.filled(Y[0:-1,1:])))
-        verts = zip(zip(X1,Y1),zip(X2,Y2),zip(X3,Y3),zip(X4,Y4))
+        verts = zeros((len(X1), 4, 2), Float)
+        verts[:,0,0] = X1
+        verts[:,0,1] = Y1
+        verts[:,1,0] = X2
+        verts[:,1,1] = Y2
+        verts[:,2,0] = X3
+        verts[:,2,1] = Y3
+        verts[:,3,0] = X4
+        verts[:,3,1] = Y4
 
         C = compress(ravel(mask==0),ravel(ma.filled(C[0:Nx-1,0:Ny-1])))
 
@@ -2817,8 +2894,9 @@ class Axes(Artist):
         and drange for help on creating the required floating point dates
         """
 
-        if not matplotlib._havedate:
-            raise SystemExit('plot_date: no dates support - dates require python2.3')
+        try: import dates
+        except ImportError:
+            raise SystemExit('plot_date: no dates support - dates require python2.3, dateutil and pytz')
 
         if not self._hold: self.cla()
 
@@ -3070,7 +3148,7 @@ class Axes(Artist):
             facecolors = colors,
             edgecolors = edgecolors,
             linewidths = linewidths,
-            offsets = zip(x,y),
+            offsets = transpose(array([x, y], Float)),
             transOffset = self.transData,
             )
         collection.set_alpha(alpha)
@@ -3352,6 +3430,7 @@ class Axes(Artist):
             self.xaxis.set_minor_locator(NullLocator())
             self.xaxis.set_minor_formatter(NullFormatter())
             self.transData.get_funcx().set_type( IDENTITY )
+        self._dirty = True
 
     def set_xticklabels(self, labels, fontdict=None, **kwargs):
         """
@@ -3362,6 +3441,7 @@ class Axes(Artist):
 
         ACCEPTS: sequence of strings
         """
+        self._dirty = True
         return self.xaxis.set_ticklabels(labels, fontdict, **kwargs)
 
     def set_xticks(self, ticks):
@@ -3370,6 +3450,7 @@ class Axes(Artist):
 
         ACCEPTS: sequence of floats
         """
+        self._dirty = True
         return self.xaxis.set_ticks(ticks)
 
 
@@ -3476,6 +3557,7 @@ class Axes(Artist):
             self.yaxis.set_minor_locator(NullLocator())
             self.yaxis.set_minor_formatter(NullFormatter())
             self.transData.get_funcy().set_type( IDENTITY )
+        self._dirty = True
 
     def set_yticklabels(self, labels, fontdict=None, **kwargs):
         """
@@ -3486,6 +3568,7 @@ class Axes(Artist):
 
         ACCEPTS: sequence of strings
         """
+        self._dirty = True
         return self.yaxis.set_ticklabels(labels, fontdict, **kwargs)
 
     def set_yticks(self, ticks):
@@ -3494,6 +3577,7 @@ class Axes(Artist):
 
         ACCEPTS: sequence of floats
         """
+        self._dirty = True
         return self.yaxis.set_ticks(ticks)
 
 
@@ -3809,6 +3893,7 @@ class Axes(Artist):
         tz is the time zone to use in labeling dates.  Defaults to rc value.
         """
 
+        from dates import date_ticker_factory
         span  = self.dataLim.intervalx().span()
         locator, formatter = date_ticker_factory(span, tz)
         self.xaxis.set_major_locator(locator)
@@ -3820,6 +3905,7 @@ class Axes(Artist):
         tz is the time zone to use in labeling dates.  Defaults to rc value.
         """
 
+        from dates import date_ticker_factory
         span  = self.dataLim.intervaly().span()
         locator, formatter = date_ticker_factory(span, tz)
         self.yaxis.set_major_locator(locator)
@@ -3913,18 +3999,20 @@ class Axes(Artist):
                 xt, yt = zip(*verts)
             elif isinstance(a, Patch):
                 verts = a.get_verts()
-                tverts = a.get_transform().seq_xy_tups(verts)
-                xt, yt = zip(*tverts)
+                tverts = a.get_transform().numerix_xy(verts)
+                xt, yt = tverts[:,0], tverts[:,1]
             elif isinstance(a, Line2D):
-                xdata = a.get_xdata(valid_only = True)
-                ydata = a.get_ydata(valid_only = True)
-                xt, yt = a.get_transform().numerix_x_y(xdata, ydata)
+                # use the line's cached spatial index rather than
+                # visiting every vertex
+                nearest = a.get_spatial_index().nearest(*xywin)
+                if nearest is None: return inf
+                return nearest[1]
 
             return dist_x_y(xywin, asarray(xt), asarray(yt))
 
         artists = self.lines + self.patches + self.texts
         if callable(among):
-            artists = filter(test, artists)
+            artists = filter(among, artists)
         elif iterable(among):
             amongd = dict([(k,1) for k in among])
             artists = [a for a in artists if a in amongd]
@@ -4199,6 +4287,7 @@ class PolarAxes(Axes):
         self.patches = []
         self.collections = []
         self.texts = []     # text in axis coords
+        self.legend_ = None
 
         self.grid(self._gridOn)
         self.title =  Text(
@@ -4225,6 +4314,8 @@ class PolarAxes(Axes):
         self.axesPatch.set_transform(self.transData)
         self.axesPatch.set_linewidth(rcParams['axes.linewidth'])
         self.axison = True
+        self._track_artist(self.axesPatch)
+        self._dirty = True
 
         # we need to set a view and data interval from 0->rmax to make
         # the formatter and locator work correctly
@@ -4333,6 +4424,7 @@ class PolarAxes(Axes):
             t.set_clip_on(False)
             self.rgridlabels.append(t)
 
+        self._dirty = True
         return self.rgridlines, self.rgridlabels
 
 
@@ -4389,6 +4481,7 @@ class PolarAxes(Axes):
             self._set_artist_props(t)
             t.set_clip_on(False)
             self.thetagridlabels.append(t)
+        self._dirty = True
         return self.thetagridlines, self.thetagridlabels
 
 
@@ -4433,6 +4526,19 @@ class PolarAxes(Axes):
         self.transAxes.thaw()  # release the lazy objects
         renderer.close_group('polar_axes')
 
+    def _get_drawn_texts(self):
+        'Return the Text instances that draw renders'
+        if not self.get_visible(): return []
+        return (self.thetagridlabels + self.rgridlabels + self.texts +
+                [self.title])
+
+    def _get_draw_state(self):
+        'return the state a clean axes has kept since it was last drawn'
+        return (self.viewLim.get_bounds(), self.bbox.get_bounds(),
+                self.get_visible(), self.axison, self._frameon, self._gridOn,
+                len(self.lines), len(self.patches), len(self.texts),
+                len(self.collections), len(self.images))
+
 
     def format_coord(self, theta, r):
         'return a format string formatting the coordinate'
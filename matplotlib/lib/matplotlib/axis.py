@@ -1,7 +1,7 @@
 """
 Classes for the ticks and x and y axis
 """
-from __future__ import division
+from __future__ import division, generators
 import copy
 import math
 import re
@@ -523,6 +523,12 @@ class Axis(Artist):
 
         self.majorTicks.extend([self._get_tick(major=True)  for i in range(1)])
         self.minorTicks.extend([self._get_tick(major=False) for i in range(1)])
+        for tick in self.majorTicks + self.minorTicks:
+            self._track_tick(tick)
+
+        # the key, ticks, offset string and label extents of the last
+        # tick layout; see iter_ticks
+        self._ticklayout = None
 
     def get_view_interval(self):
         'return the Interval instance for this axis view limits'
@@ -540,53 +546,13 @@ class Axis(Artist):
         'Draw the axis lines, grid lines, tick lines and labels'
         if not self.get_visible(): return
         renderer.open_group(__name__)
-        ticklabelBoxes = []
-        ticklabelBoxes2 = []
-
-        majorTicks = self.get_major_ticks()
-        majorLocs = self.major.locator()
-        self.major.formatter.set_locs(majorLocs)
-        majorLabels = [self.major.formatter(val, i) for i, val in enumerate(majorLocs)]
-
 
-        seen = {}
-
-        interval = self.get_view_interval()
-        for tick, loc, label in zip(majorTicks, majorLocs, majorLabels):
-            if tick is None: continue
-            if not interval.contains(loc): continue
-            seen[loc] = 1
-            tick.update_position(loc)
-            tick.set_label1(label)
-            tick.set_label2(label)
+        ticks = list(self.iter_ticks())
+        offset = self._ticklayout[2]
+        for tick in ticks:
             tick.draw(renderer)
-            if tick.label1On:
-                extent = tick.label1.get_window_extent(renderer)
-                ticklabelBoxes.append(extent)
-            if tick.label2On:
-                extent = tick.label2.get_window_extent(renderer)
-                ticklabelBoxes2.append(extent)
-
-        minorTicks = self.get_minor_ticks()
-        minorLocs = self.minor.locator()
-        self.minor.formatter.set_locs(minorLocs)
-        minorLabels = [self.minor.formatter(val, i) for i, val in enumerate(minorLocs)]
-
-        for tick, loc, label in zip(minorTicks, minorLocs, minorLabels):
-            if tick is None: continue
-            if not interval.contains(loc): continue
-            #if seen.has_key(loc): continue
-            tick.update_position(loc)
-            tick.set_label1(label)
-            tick.set_label2(label)
-
-            tick.draw(renderer)
-            if tick.label1On:
-                extent = tick.label1.get_window_extent(renderer)
-                ticklabelBoxes.append(extent)
-            if tick.label2On:
-                extent = tick.label2.get_window_extent(renderer)
-                ticklabelBoxes2.append(extent)
+        ticklabelBoxes, ticklabelBoxes2 = self._get_ticklabel_extents(
+            renderer, ticks)
 
         # scale up the axis label box to also find the neighbors, not
         # just the tick labels that actually overlap note we need a
@@ -596,7 +562,7 @@ class Axis(Artist):
         self.label.draw(renderer)
 
         self._update_offset_text_position(ticklabelBoxes, ticklabelBoxes2)
-        self.offsetText.set_text( self.major.formatter.get_offset() )
+        self.offsetText.set_text(offset)
         self.offsetText.draw(renderer)
 
         if 0: # draw the bounding boxes around the text for debug
@@ -607,6 +573,96 @@ class Axis(Artist):
 
         renderer.close_group(__name__)
 
+    def iter_ticks(self):
+        """
+        Iterate over the major and then the minor ticks in the view
+        interval, with their positions and labels updated from the
+        locators and formatters.  The layout is kept until the view or
+        data interval, a locator or formatter, or a property of a tick
+        label changes; after changing the state of a locator or
+        formatter in place, call reset_ticks
+        """
+        key = (self.get_view_interval().get_bounds(),
+               self.get_data_interval().get_bounds(),
+               self.major.locator, self.major.formatter,
+               self.minor.locator, self.minor.formatter)
+        if self._ticklayout is None or self._ticklayout[0]!=key:
+            ticks = self._update_ticks()
+            offset = self.major.formatter.get_offset()
+            self._ticklayout = [key, ticks, offset, None]
+        return iter(self._ticklayout[1])
+
+    def _update_ticks(self):
+        'update the ticks from the locators and formatters and return them'
+        interval = self.get_view_interval()
+        updated = []
+        for ticker, get_ticks in ((self.major, self.get_major_ticks),
+                                  (self.minor, self.get_minor_ticks)):
+            locs = ticker.locator()
+            ticker.formatter.set_locs(locs)
+            labels = [ticker.formatter(val, i) for i, val in enumerate(locs)]
+            for tick, loc, label in zip(get_ticks(len(locs)), locs, labels):
+                if tick is None: continue
+                if not interval.contains(loc): continue
+                tick.update_position(loc)
+                tick.set_label1(label)
+                tick.set_label2(label)
+                updated.append(tick)
+        return updated
+
+    def _get_ticklabel_extents(self, renderer, ticks):
+        """
+        Return the window extents of the label1s and the label2s of
+        ticks, kept with the tick layout while the renderer type, dpi
+        and axes position are unchanged
+        """
+        key = (renderer.__class__, self.figure.dpi.get(),
+               self.axes.bbox.get_bounds(),
+               [(tick.label1On, tick.label2On, tick._pad.get())
+                for tick in ticks])
+        layout = self._ticklayout
+        if layout is not None and layout[3] is not None and layout[3][0]==key:
+            return layout[3][1], layout[3][2]
+
+        bboxes = []
+        bboxes2 = []
+        for tick in ticks:
+            if tick.label1On:
+                bboxes.append(tick.label1.get_window_extent(renderer))
+            if tick.label2On:
+                bboxes2.append(tick.label2.get_window_extent(renderer))
+        if layout is not None: layout[3] = key, bboxes, bboxes2
+        return bboxes, bboxes2
+
+    def reset_ticks(self):
+        """
+        Discard the cached tick layout, so the next draw asks the
+        locators and formatters again
+        """
+        self._ticklayout = None
+
+    def _track_tick(self, tick):
+        'discard the tick layout whenever a tick label property changes'
+        tick.label1.add_callback(self._tick_changed)
+        tick.label2.add_callback(self._tick_changed)
+
+    def _tick_changed(self, a):
+        self._ticklayout = None
+
+    def _get_drawn_texts(self):
+        """
+        Return the Text instances that draw renders, so their tex can
+        be prepared in one batch
+        """
+        if not self.get_visible(): return []
+        texts = []
+        for tick in self.iter_ticks():
+            if tick.label1On: texts.append(tick.label1)
+            if tick.label2On: texts.append(tick.label2)
+        self.offsetText.set_text(self._ticklayout[2])
+        texts.extend([self.label, self.offsetText])
+        return texts
+
     def _get_label(self):
         raise NotImplementedError('Derived must override')
 
@@ -678,10 +734,12 @@ class Axis(Artist):
         'Get the formatter of the minor ticker'
         return self.minor.formatter
 
-    def get_major_ticks(self):
-        'get the tick instances; grow as necessary'
-
-        numticks = len(self.major.locator())
+    def get_major_ticks(self, numticks=None):
+        """
+        get the tick instances; grow as necessary.  numticks defaults
+        to the number of locations of the major locator
+        """
+        if numticks is None: numticks = len(self.major.locator())
 
         if len(self.majorTicks)<numticks:
             # update the new tick label properties from the old
@@ -691,21 +749,26 @@ class Axis(Artist):
                 #tick = protoTick
                 if self._gridOnMajor: tick.gridOn = True
                 self._copy_tick_props(protoTick, tick)
+                self._track_tick(tick)
                 self.majorTicks.append(tick)
         ticks = self.majorTicks[:numticks]
 
         return ticks
 
 
-    def get_minor_ticks(self):
-        'get the minor tick instances; grow as necessary'
-        numticks = len(self.minor.locator())
+    def get_minor_ticks(self, numticks=None):
+        """
+        get the minor tick instances; grow as necessary.  numticks
+        defaults to the number of locations of the minor locator
+        """
+        if numticks is None: numticks = len(self.minor.locator())
         if len(self.minorTicks)<numticks:
             protoTick = self.minorTicks[0]
             for i in range(numticks-len(self.minorTicks)):
                 tick = self._get_tick(major=False)
                 if self._gridOnMinor: tick.gridOn = True
                 self._copy_tick_props(protoTick, tick)
+                self._track_tick(tick)
                 self.minorTicks.append(tick)
         ticks = self.minorTicks[:numticks]
 
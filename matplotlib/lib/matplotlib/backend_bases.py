@@ -139,8 +139,8 @@ class RendererBase:
             gc.set_antialiased( antialiaseds[i % Naa] )
             seg = segments[i % Nsegments]
             if not len(seg): continue
-            x, y = zip(*seg)
-            x, y = transform.numerix_x_y(array(x), array(y))
+            tseg = transform.numerix_xy(asarray(seg, Float))
+            x, y = tseg[:,0], tseg[:,1]
             if usingOffsets:
                 xo, yo = transOffset.xy_tup(offsets[i % Noffsets])
                 x += xo
@@ -233,12 +233,14 @@ class RendererBase:
             gc.set_antialiased( antialiaseds[i % Naa] )
             #print 'verts', zip(thisxverts, thisyverts)
 
-            tverts = transform.seq_xy_tups(verts[i % Nverts])
+            tverts = transform.numerix_xy(asarray(verts[i % Nverts], Float))
+            x, y = tverts[:,0], tverts[:,1]
             if usingOffsets:
                 xo,yo = transOffset.xy_tup(offsets[i % Noffsets])
-                tverts = [(x+xo,y+yo) for x,y in tverts]
+                x = x + xo
+                y = y + yo
 
-            self.draw_polygon(gc, rgbFace, tverts)
+            self.draw_polygon(gc, rgbFace, zip(x.tolist(), y.tolist()))
 
     def draw_polygon(self, gc, rgbFace, points):
         """
@@ -321,6 +323,15 @@ class RendererBase:
     def draw_tex(self, gc, x, y, s, prop, angle, ismath='TeX!'):
         raise NotImplementedError
 
+    def prepare_tex(self, texs):
+        """
+        texs is a sequence of (tex, fontsize) for all the strings the
+        figure is about to draw with text.usetex.  Backends can
+        override this to process them in one batch; the default does
+        nothing
+        """
+        pass
+
     def draw_text(self, gc, x, y, s, prop, angle, ismath=False):
         """
         Draw the text.Text instance s at x,y (display coords) with font
@@ -408,6 +419,7 @@ class GraphicsContextBase:
         self._linewidth = 1
         self._rgb = (0.0, 0.0, 0.0)
         self._hatch = None
+        self._markercull = 0
 
     def copy_properties(self, gc):
         'Copy properties from gc to self'
@@ -421,6 +433,7 @@ class GraphicsContextBase:
         self._linewidth = gc._linewidth
         self._rgb = gc._rgb
         self._hatch = gc._hatch
+        self._markercull = gc._markercull
 
     def get_alpha(self):
         """
@@ -474,6 +487,10 @@ class GraphicsContextBase:
         """
         return self._linewidth
 
+    def get_markercull(self):
+        "Return true if overplotted opaque markers may be skipped"
+        return self._markercull
+
     def get_rgb(self):
         """
         returns a tuple of three floats from 0-1.  color can be a
@@ -557,6 +574,15 @@ class GraphicsContextBase:
         """
         self._linewidth = w
 
+    def set_markercull(self, b):
+        """
+        True if an opaque marker may be skipped where the same marker
+        was already drawn at the same pixel - not supported on all
+        backends
+        """
+        if b: self._markercull = 1
+        else: self._markercull = 0
+
     def set_linestyle(self, style):
         """
         Set the linestyle to be one of ('solid', 'dashed', 'dashdot',
@@ -739,6 +765,118 @@ class KeyEvent(LocationEvent):
 
 
 
+class BlitManager:
+    """
+    Redraw the animated artists of a canvas without drawing the rest
+    of the figure.  After every full draw of the canvas the manager
+    keeps the background of the axes which hold its artists, ie what
+    the draw rendered without them, and draws its artists on top.
+    update restores the background, draws the artists and blits the
+    axes.  Use it from the canvas with
+
+        manager = canvas.get_blit_manager()
+        line, = ax.plot(x, y)
+        manager.add_artist(line)
+
+        def update_line(*args):
+            line.set_ydata(...)
+            manager.update()
+
+    If the figure is resized or its dpi changes, or an axes moves or
+    its view limits change, the background is stale and update draws
+    the whole canvas.  With renderers which cannot copy regions, eg
+    the vector backends, update always draws the whole canvas.
+    """
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.artists = []
+        self._background = None   # the key and a list of (bbox, region)
+        self._renderer = None
+        canvas.mpl_connect('draw_event', self._on_draw)
+        canvas.mpl_connect('resize_event', self._on_resize)
+
+    def add_artist(self, a):
+        """
+        Animate artist a.  It is set animated, so a full draw of the
+        figure leaves it out of the background
+        """
+        a.set_animated(True)
+        if a not in self.artists: self.artists.append(a)
+        self._background = None
+
+    def remove_artist(self, a):
+        'stop animating artist a, and draw it with the figure again'
+        a.set_animated(False)
+        if a in self.artists: self.artists.remove(a)
+        self._background = None
+
+    def invalidate(self):
+        """
+        Discard the background, so the next update draws the whole
+        canvas.  Call this after changing anything in the figure but
+        the animated artists
+        """
+        self._background = None
+
+    def update(self):
+        """
+        Draw the animated artists on the background and blit them to
+        the canvas, or draw the whole canvas if the background is stale
+        """
+        if self._background is None or self._background[0]!=self._get_key():
+            self.canvas.draw()
+            return
+        for bbox, region in self._background[1]:
+            self._renderer.restore_region(region)
+        self._draw_artists(self._renderer)
+        for bbox, region in self._background[1]:
+            self.canvas.blit(bbox)
+
+    def _get_bboxes(self):
+        'return the bboxes of the axes, or the figure, holding the artists'
+        fig = self.canvas.figure
+        bboxes = {}
+        for a in self.artists:
+            ax = getattr(a, 'axes', None)
+            if ax is None: bbox = fig.bbox
+            else: bbox = ax.bbox
+            bboxes[id(bbox)] = bbox
+        return bboxes.values()
+
+    def _get_key(self):
+        'return the state the background was drawn with'
+        fig = self.canvas.figure
+        key = [fig.bbox.get_bounds(), fig.dpi.get()]
+        for a in self.artists:
+            ax = getattr(a, 'axes', None)
+            if ax is not None:
+                key.append((ax.bbox.get_bounds(), ax.viewLim.get_bounds()))
+        return key
+
+    def _draw_artists(self, renderer):
+        dsu = [(a.zorder, i, a) for i, a in enumerate(self.artists)
+               if a.get_visible()]
+        dsu.sort()
+        for zorder, i, a in dsu:
+            a.draw(renderer)
+
+    def _on_draw(self, event):
+        'keep the background of a full draw and draw the artists on it'
+        renderer = event.renderer
+        if hasattr(renderer, 'copy_from_bbox') and self.artists:
+            self._renderer = renderer
+            self._background = self._get_key(), [
+                (bbox, renderer.copy_from_bbox(bbox))
+                for bbox in self._get_bboxes()]
+        else:
+            self._renderer = None
+            self._background = None
+        self._draw_artists(renderer)
+
+    def _on_resize(self, event):
+        self._background = None
+
+
 class FigureCanvasBase:
     """
     The canvas the figure renders into.
@@ -756,6 +894,8 @@ class FigureCanvasBase:
         'motion_notify_event',
               )
 
+    _blitmanager = None
+
     def __init__(self, figure):
         figure.set_canvas(self)
         self.figure = figure
@@ -774,6 +914,15 @@ class FigureCanvasBase:
         """
         pass
 
+    def get_blit_manager(self):
+        """
+        Return the BlitManager which animates artists on this canvas,
+        creating it on first use
+        """
+        if self._blitmanager is None:
+            self._blitmanager = BlitManager(self)
+        return self._blitmanager
+
     def resize(self, w, h):
         """
         set the canvas size in pixels
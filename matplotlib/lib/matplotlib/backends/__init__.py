@@ -6,7 +6,7 @@ __all__ = ['backend','show','draw_if_interactive',
 
 interactive_bk     = ['GTK','GTKAgg','GTKCairo','FltkAgg','QtAgg','TkAgg',
                       'WX','WXAgg','CocoaAgg']
-non_interactive_bk = ['Agg2', 'Agg','Cairo','GD','GDK','Paint','PS', 'LaTeX', 'SVG','EMF','Template']
+non_interactive_bk = ['Agg2', 'Agg','Cairo','GD','GDK','Paint','PDF', 'PS', 'LaTeX', 'SVG','EMF','Template']
 all_backends       = interactive_bk + non_interactive_bk
 
 
@@ -72,18 +72,18 @@ from __future__ import division
 
 import os, sys
 from matplotlib import verbose, rcParams
-from matplotlib.numerix import array, Float, zeros, transpose
+from matplotlib.numerix import array, asarray, Float, zeros, transpose
+from matplotlib import agg
 from matplotlib._image import fromarray
 from matplotlib._pylab_helpers import Gcf
 from matplotlib.backend_bases import RendererBase,\
      GraphicsContextBase, FigureManagerBase, FigureCanvasBase
 
-from matplotlib.cbook import enumerate, is_string_like, exception_to_str
+from matplotlib.cbook import enumerate, is_string_like, exception_to_str, lrudict,\
+     countingdict
 from matplotlib.figure import Figure
 from matplotlib.font_manager import fontManager
 from matplotlib.ft2font import FT2Font
-from matplotlib.mathtext import math_parse_s_ft2font
-from matplotlib.texmanager import TexManager
 from matplotlib.transforms import lbwh_to_bbox
 from matplotlib.numerix.mlab import fliplr
 import matplotlib.numerix
@@ -106,7 +106,9 @@ class RendererAgg(RendererBase):
     """
 
     debug=1
-    texd = {}  # a cache of tex image rasters
+    texd = lrudict(50)  # a cache of tex image rasters
+    # a cache of text widths and heights shared by all renderers
+    metricsd = countingdict(2000)
     def __init__(self, width, height, dpi):
         if __debug__: verbose.report('RendererAgg.__init__', 'debug-annoying')
         self.dpi = dpi
@@ -125,13 +127,12 @@ class RendererAgg(RendererBase):
         self.draw_line_collection = self._renderer.draw_line_collection
         self.draw_quad_mesh = self._renderer.draw_quad_mesh
         self.draw_poly_collection = self._renderer.draw_poly_collection
-        self.draw_regpoly_collection = self._renderer.draw_regpoly_collection
 
         self.copy_from_bbox = self._renderer.copy_from_bbox
         self.restore_region = self._renderer.restore_region
 
 
-        self.texmanager = TexManager()
+        self.texmanager = None
 
         self.bbox = lbwh_to_bbox(0,0, self.width, self.height)
         if __debug__: verbose.report('RendererAgg.__init__ done', 'debug-annoying')
@@ -152,6 +153,42 @@ class RendererAgg(RendererBase):
             gcEdge, rgbFace, x, y, width/2, height/2)  # ellipse takes radius
 
 
+    def draw_regpoly_collection(
+        self, clipbox, offsets, transOffset, verts, sizes,
+        facecolors, edgecolors, linewidths, antialiaseds):
+        """
+        Draw a regular poly collection; see
+        RendererBase.draw_regpoly_collection.
+
+        Antialiased polygons with one linewidth, eg from scatter, are
+        drawn as markers: the polygon is rasterized once for each
+        size, rounded to a quarter pixel, and stamped at each offset
+        in its own colors
+        """
+        if __debug__: verbose.report('RendererAgg.draw_regpoly_collection', 'debug-annoying')
+        if (offsets is None or not len(offsets) or len(linewidths)!=1
+            or len(antialiaseds)!=1 or not antialiaseds[0]):
+            self._renderer.draw_regpoly_collection(
+                clipbox, offsets, transOffset, verts, sizes,
+                facecolors, edgecolors, linewidths, antialiaseds)
+            return
+
+        gc = self.new_gc()
+        if clipbox is not None:
+            gc.set_clip_rectangle(clipbox.get_bounds())
+        gc.set_linewidth(linewidths[0])
+
+        path = agg.path_storage()
+        for i, (x, y) in enumerate(verts):
+            if i==0: path.move_to(x, y)
+            else: path.line_to(x, y)
+        path.end_poly()
+
+        offsets = asarray(offsets, Float)
+        self._renderer.draw_markers(gc, path, None,
+                                    offsets[:,0], offsets[:,1], transOffset,
+                                    facecolors, edgecolors, sizes)
+
     def _draw_image(self, x, y, im):
         """
         Draw the Image instance into the current axes; x, y is the
@@ -186,6 +223,7 @@ class RendererAgg(RendererBase):
         Draw the math text using matplotlib.mathtext
         """
         if __debug__: verbose.report('RendererAgg.draw_mathtext', 'debug-annoying')
+        from matplotlib.mathtext import math_parse_s_ft2font
         size = prop.get_size_in_points()
         width, height, fonts = math_parse_s_ft2font(
             s, self.dpi.get(), size, angle)
@@ -242,20 +280,26 @@ class RendererAgg(RendererBase):
         if ismath=='TeX':
             # todo: handle props
             size = prop.get_size_in_points()
-            Z = self.texmanager.get_rgba(s, size, rgb)
+            Z = self.get_texmanager().get_rgba(s, size, rgb)
             m,n,tmp = Z.shape
             return n,m
 
+        key = s, hash(prop), self.dpi.get(), ismath
+        wh = self.metricsd.get(key)
+        if wh is not None: return wh
+
         if ismath:
+            from matplotlib.mathtext import math_parse_s_ft2font
             width, height, fonts = math_parse_s_ft2font(
                 s, self.dpi.get(), prop.get_size_in_points())
-            return width, height
-        font = self._get_agg_font(prop)
-        font.set_text(s, 0.0)  # the width and height of unrotated string
-        w, h = font.get_width_height()
-        w /= 64.0  # convert from subpixels
-        h /= 64.0
-        return w, h
+            wh = width, height
+        else:
+            font = self._get_agg_font(prop)
+            font.set_text(s, 0.0)  # the width and height of unrotated string
+            w, h = font.get_width_height()
+            wh = w/64.0, h/64.0  # convert from subpixels
+        self.metricsd[key] = wh
+        return wh
 
     def draw_tex(self, gc, x, y, s, prop, angle):
         # todo, handle props, angle, origins
@@ -268,10 +312,11 @@ class RendererAgg(RendererBase):
             w,h = h,w
             x -= w
 
-        key = s, size, rgb, angle, self.texmanager.get_font_config()
+        texmanager = self.get_texmanager()
+        key = s, size, rgb, angle, texmanager.get_font_config()
         im = self.texd.get(key)
         if im is None:
-            Z = self.texmanager.get_rgba(s, size, rgb)
+            Z = texmanager.get_rgba(s, size, rgb)
             if flip:
                 r = Z[:,:,0]
                 g = Z[:,:,1]
@@ -296,6 +341,20 @@ class RendererAgg(RendererBase):
         else: bbox = lbwh_to_bbox(*cliprect)
         self.draw_image(x, self.height-y, im, bbox)
 
+    def prepare_tex(self, texs):
+        """
+        Run latex and dvipng once for all of texs, a sequence of
+        (tex, fontsize), rather than once per string in draw_tex
+        """
+        self.get_texmanager().make_greys(texs)
+
+    def get_texmanager(self):
+        'return the TexManager, which is created on first use'
+        if self.texmanager is None:
+            from matplotlib.texmanager import TexManager
+            self.texmanager = TexManager()
+        return self.texmanager
+
     def get_canvas_width_height(self):
         'return the canvas width and height in display coords'
         return self.width, self.height
@@ -338,6 +397,10 @@ class RendererAgg(RendererBase):
         if __debug__: verbose.report('RendererAgg.tostring_argb', 'debug-annoying')
         return self._renderer.tostring_argb()
 
+    def tostring_png(self):
+        if __debug__: verbose.report('RendererAgg.tostring_png', 'debug-annoying')
+        return self._renderer.tostring_png()
+
     def buffer_rgba(self,x,y):
         if __debug__: verbose.report('RendererAgg.buffer_rgba', 'debug-annoying')
         return self._renderer.buffer_rgba(x,y)
@@ -406,6 +469,14 @@ class FigureCanvasAgg(FigureCanvasBase):
         if __debug__: verbose.report('FigureCanvasAgg.tostring_argb', 'debug-annoying')
         return self.renderer.tostring_argb()
 
+    def tostring_png(self):
+        """
+        Return the last drawn figure encoded as png in a string,
+        without going through a file
+        """
+        if __debug__: verbose.report('FigureCanvasAgg.tostring_png', 'debug-annoying')
+        return self.renderer.tostring_png()
+
     def buffer_rgba(self,x,y):
         if __debug__: verbose.report('FigureCanvasAgg.buffer_rgba', 'debug-annoying')
         return self.renderer.buffer_rgba(x,y)
@@ -424,7 +495,9 @@ class FigureCanvasAgg(FigureCanvasBase):
         If the extension matches BMP or RAW, write an RGBA bitmap file
 
         If filename is a fileobject, write png to file object (thus
-        you can, for example, write the png to stdout
+        you can, for example, write the png to stdout).  Any object
+        with a write method will do, eg a cStringIO instance if you
+        want the png in memory
         """
         if __debug__: verbose.report('FigureCanvasAgg.print_figure', 'debug-annoying')
 
@@ -452,7 +525,6 @@ class FigureCanvasAgg(FigureCanvasBase):
         if not is_string_like(filename):
             # assume png and write to fileobject
             self.renderer._renderer.write_png(filename)
-            #pass
         else:
             # take a look at the extension and choose the print handler
             basename, ext = os.path.splitext(filename)
@@ -474,6 +546,10 @@ class FigureCanvasAgg(FigureCanvasBase):
                 from backend_svg import FigureCanvasSVG
                 svg = self.switch_backends(FigureCanvasSVG)
                 svg.print_figure(filename, dpi, facecolor, edgecolor, orientation)
+            elif ext.find('pdf')>=0:
+                from backend_pdf import FigureCanvasPdf # lazy import
+                pdf = self.switch_backends(FigureCanvasPdf)
+                pdf.print_figure(filename, dpi, facecolor, edgecolor, orientation)
             elif ext.find('ps')>=0 or ext.find('ep')>=0:
                 from backend_ps import FigureCanvasPS # lazy import
                 ps = self.switch_backends(FigureCanvasPS)
@@ -37,7 +37,6 @@ from matplotlib.backend_bases import RendererBase, GraphicsContextBase,\
      FigureManagerBase, FigureCanvasBase
 from matplotlib.cbook      import enumerate, izip
 from matplotlib.figure     import Figure
-from matplotlib.mathtext   import math_parse_s_ft2font
 import matplotlib.numerix as numx
 from matplotlib.transforms import Bbox
 
@@ -324,6 +323,7 @@ class RendererCairo(RendererBase):
                           "_draw_mathtext()")
             return
 
+        from matplotlib.mathtext import math_parse_s_ft2font
         size = prop.get_size_in_points()
         width, height, fonts = math_parse_s_ft2font(
             s, self.dpi.get(), size)
@@ -380,6 +380,7 @@ class RendererCairo(RendererBase):
     def get_text_width_height(self, s, prop, ismath):
         if _debug: print '%s.%s()' % (self.__class__.__name__, _fn_name())
         if ismath:
+            from matplotlib.mathtext import math_parse_s_ft2font
             width, height, fonts = math_parse_s_ft2font(
                s, self.dpi.get(), prop.get_size_in_points())
             return width, height
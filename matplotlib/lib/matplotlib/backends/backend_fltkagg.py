@@ -28,7 +28,6 @@ from matplotlib.figure import Figure
 from matplotlib._pylab_helpers import Gcf
 from matplotlib.numerix import asarray
 import matplotlib.windowing as windowing
-from matplotlib.widgets import SubplotTool
 
 
 import thread,time
@@ -572,6 +571,7 @@ class NavigationToolbar2FltkAgg(NavigationToolbar2):
         canvas = FigureCanvasFltkAgg(toolfig)   
         window.end()    
         toolfig.subplots_adjust(top=0.9)
+        from matplotlib.widgets import SubplotTool
         tool =  SubplotTool(self.canvas.figure, toolfig)
         window.show()
         canvas.show()
@@ -22,7 +22,6 @@ from matplotlib.backend_bases import RendererBase, GraphicsContextBase, \
      FigureManagerBase, FigureCanvasBase
 from matplotlib.cbook import is_string_like, enumerate
 from matplotlib.figure import Figure
-from matplotlib.mathtext import math_parse_s_ft2font
 import matplotlib.numerix as numerix
 from matplotlib.numerix import asarray, fromstring, UInt8, zeros, \
      where, transpose, nonzero, indices, ones, nx
@@ -199,6 +198,7 @@ class RendererGDK(RendererBase):
 
 
     def _draw_mathtext(self, gc, x, y, s, prop, angle):
+        from matplotlib.mathtext import math_parse_s_ft2font
         size = prop.get_size_in_points()
         width, height, fonts = math_parse_s_ft2font(
             s, self.dpi.get(), size)
@@ -343,6 +343,7 @@ class RendererGDK(RendererBase):
 
     def get_text_width_height(self, s, prop, ismath):
         if ismath:
+            from matplotlib.mathtext import math_parse_s_ft2font
             width, height, fonts = math_parse_s_ft2font(
                 s, self.dpi.get(), prop.get_size_in_points())
             return width, height
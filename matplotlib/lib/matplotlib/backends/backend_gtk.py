@@ -25,7 +25,6 @@ from matplotlib.figure import Figure
 import matplotlib.numerix as numerix
 from matplotlib.numerix import asarray, fromstring, UInt8, zeros, \
      where, transpose, nonzero, indices, ones, nx
-from matplotlib.widgets import SubplotTool
 
 
 backend_version = "%d.%d.%d" % gtk.pygtk_version
@@ -38,9 +37,7 @@ _debug = False
 PIXELS_PER_INCH = 96
 
 # Image formats that this backend supports - for FileChooser and print_figure()
-IMAGE_FORMAT = ['bmp', 'eps', 'jpg', 'png', 'ps', 'svg']
-# pdf not ready yet
-#IMAGE_FORMAT  = ['bmp', 'eps', 'jpg', 'png', 'pdf', 'ps', 'svg']
+IMAGE_FORMAT = ['bmp', 'eps', 'jpg', 'pdf', 'png', 'ps', 'svg']
 IMAGE_FORMAT.sort()
 IMAGE_FORMAT_DEFAULT  = 'png'
 
@@ -343,9 +340,11 @@ class FigureCanvasGTK (gtk.DrawingArea, FigureCanvasBase):
             except gobject.GError, exc:
                 error_msg_gtk('Save figure failure:\n%s' % (exc,), parent=self)
 
-        elif ext in ('eps', 'ps', 'svg',):
+        elif ext in ('eps', 'pdf', 'ps', 'svg',):
             if ext == 'svg':
                 from backend_svg import FigureCanvasSVG as FigureCanvas
+            elif ext == 'pdf':
+                from backend_pdf import FigureCanvasPdf as FigureCanvas
             else:
                 from backend_ps  import FigureCanvasPS  as FigureCanvas
 
@@ -371,18 +370,6 @@ class FigureCanvasGTK (gtk.DrawingArea, FigureCanvasBase):
                 fc.print_figure(filename, dpi, facecolor, edgecolor,
                                 orientation)
 
-        elif ext in ('pdf',):
-            try:
-                from backend_cairo import FigureCanvasCairo  as FigureCanvas
-            except:
-                error_msg_gtk('Save figure failure:\n'
-                          'Cairo must be installed to save as pdf',
-                          parent=self)
-            else:
-                fc = self.switch_backends(FigureCanvas)
-                fc.print_figure(filename, dpi, facecolor, edgecolor,
-                                orientation)
-
         else:
             error_msg_gtk('Format "%s" is not supported.\nSupported formats are %s.' %
                       (ext, ', '.join(IMAGE_FORMAT)),
@@ -643,6 +630,7 @@ class NavigationToolbar2GTK(NavigationToolbar2, gtk.Toolbar):
         toolfig = Figure(figsize=(6,3))
         canvas = self._get_canvas(toolfig)
         toolfig.subplots_adjust(top=0.9)
+        from matplotlib.widgets import SubplotTool
         tool =  SubplotTool(self.canvas.figure, toolfig)
 
         w = int (toolfig.bbox.width())
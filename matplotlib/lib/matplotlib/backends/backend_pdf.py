@@ -0,0 +1,942 @@
+"""
+A PDF backend which writes PDF 1.4 files directly, without going
+through PostScript and an external distiller.
+
+Content streams and images are Flate compressed (see the
+pdf.compression rc parameter) and TrueType fonts are embedded as
+subsets which only contain the outlines of the glyphs that are drawn.
+"""
+
+from __future__ import division
+import math, md5, os, struct, time, zlib
+
+from matplotlib import verbose, __version__, rcParams, get_data_path
+from matplotlib.backend_bases import RendererBase, GraphicsContextBase,\
+     FigureManagerBase, FigureCanvasBase
+from matplotlib.cbook import is_string_like, reverse_dict
+from matplotlib.figure import Figure
+from matplotlib.font_manager import fontManager
+from matplotlib.ft2font import FT2Font, KERNING_UNSCALED
+from matplotlib.numerix import fromstring, UInt8, Float32, alltrue, \
+     equal, ravel
+
+backend_version = 'PDF-1.4'
+
+def new_figure_manager(num, *args, **kwargs):
+    thisFig = Figure(*args, **kwargs)
+    canvas  = FigureCanvasPdf(thisFig)
+    manager = FigureManagerPdf(canvas, num)
+    return manager
+
+
+def _num_to_str(val):
+    if is_string_like(val): return val
+
+    ival = int(val)
+    if val==ival: return str(ival)
+
+    s = "%1.3f"%val
+    s = s.rstrip("0")
+    s = s.rstrip(".")
+    return s
+
+def _nums_to_str(*args):
+    return ' '.join(map(_num_to_str,args))
+
+def quote_pdf_string(s):
+    "Quote the characters of S which are special in a PDF string literal."
+    s=s.replace("\\", "\\\\")
+    s=s.replace("(", "\\(")
+    s=s.replace(")", "\\)")
+    s=s.replace("\r", "\\r")
+    s=s.replace("\n", "\\n")
+    return s
+
+
+class Name:
+    'A PDF name object, eg /Type'
+    def __init__(self, name):
+        self.name = name
+
+    def pdfRepr(self):
+        return '/' + self.name
+
+class Reference:
+    'A reference to the indirect PDF object with number id'
+    def __init__(self, id):
+        self.id = id
+
+    def pdfRepr(self):
+        return '%d 0 R' % self.id
+
+def pdfRepr(obj):
+    """
+    Return the PDF syntax for obj, which is a Name, Reference, None,
+    bool, number, string, or a dict or sequence of these
+    """
+    if hasattr(obj, 'pdfRepr'):
+        return obj.pdfRepr()
+    elif obj is None:
+        return 'null'
+    elif obj is True:
+        return 'true'
+    elif obj is False:
+        return 'false'
+    elif isinstance(obj, (int, long, float)):
+        return _num_to_str(obj)
+    elif is_string_like(obj):
+        return '(%s)' % quote_pdf_string(obj)
+    elif isinstance(obj, dict):
+        items = obj.items()
+        items.sort()
+        return '<< %s >>' % ' '.join(['/%s %s' % (key, pdfRepr(val))
+                                      for key, val in items])
+    elif isinstance(obj, (list, tuple)):
+        return '[%s]' % ' '.join([pdfRepr(val) for val in obj])
+    raise TypeError('Do not know how to write %s to PDF' % type(obj))
+
+
+class _Stream:
+    """
+    Accumulate the data of a PDF stream, compressing it as it is
+    written if level is not zero
+    """
+    def __init__(self, level):
+        if level:
+            self._compressobj = zlib.compressobj(level)
+        else:
+            self._compressobj = None
+        self._chunks = []
+
+    def write(self, data):
+        if self._compressobj is not None:
+            data = self._compressobj.compress(data)
+        if data:
+            self._chunks.append(data)
+
+    def getvalue(self):
+        if self._compressobj is not None:
+            self._chunks.append(self._compressobj.flush())
+            self._compressobj = None
+        return ''.join(self._chunks)
+
+
+# The sfnt tables needed to draw glyphs by index from an embedded
+# TrueType font; see section 5.8 of the PDF reference
+_truetype_tables = ('cmap', 'cvt ', 'fpgm', 'glyf', 'head', 'hhea',
+                    'hmtx', 'loca', 'maxp', 'prep')
+
+def _sfnt_checksum(data):
+    'the sfnt checksum of data, whose length is a multiple of 4'
+    return sum(struct.unpack('>%dL' % (len(data)//4), data)) & 0xffffffffL
+
+def subset_truetype(data, glyphs):
+    """
+    Return a TrueType font file made from the font file contents data
+    which only contains the outlines of the glyph indices in glyphs,
+    plus .notdef and the components of composite glyphs.  Glyph
+    indices are unchanged, the outlines of the other glyphs are
+    dropped, as are the tables a PDF viewer does not need.
+
+    ValueError is raised if data is not a TrueType outline font.
+    """
+    version, numTables = struct.unpack('>LH', data[:6])
+    tables = {}
+    for i in range(numTables):
+        tag, checksum, offset, length = struct.unpack(
+            '>4sLLL', data[12+16*i:28+16*i])
+        tables[tag] = data[offset:offset+length]
+    for tag in ('head', 'maxp', 'loca', 'glyf'):
+        if not tables.has_key(tag):
+            raise ValueError('Not a TrueType font; no %s table' % tag)
+
+    head = tables['head']
+    indexToLocFormat = struct.unpack('>h', head[50:52])[0]
+    numGlyphs = struct.unpack('>H', tables['maxp'][4:6])[0]
+    if indexToLocFormat==0:
+        loca = [2*offset for offset in struct.unpack(
+            '>%dH' % (numGlyphs+1), tables['loca'][:2*(numGlyphs+1)])]
+    else:
+        loca = struct.unpack(
+            '>%dL' % (numGlyphs+1), tables['loca'][:4*(numGlyphs+1)])
+    glyf = tables['glyf']
+
+    keep = {}
+    todo = [0] + list(glyphs)
+    while todo:
+        gind = todo.pop()
+        if keep.has_key(gind) or gind<0 or gind>=numGlyphs: continue
+        keep[gind] = 1
+        start, end = loca[gind], loca[gind+1]
+        if end-start<10: continue   # no outline
+        numberOfContours = struct.unpack('>h', glyf[start:start+2])[0]
+        if numberOfContours>=0: continue
+
+        # a composite glyph; keep the glyphs it is made of
+        pos = start + 10
+        while 1:
+            flags, component = struct.unpack('>HH', glyf[pos:pos+4])
+            todo.append(component)
+            pos += 4
+            if flags & 0x0001: pos += 4    # ARG_1_AND_2_ARE_WORDS
+            else:              pos += 2
+            if   flags & 0x0008: pos += 2  # WE_HAVE_A_SCALE
+            elif flags & 0x0040: pos += 4  # WE_HAVE_AN_X_AND_Y_SCALE
+            elif flags & 0x0080: pos += 8  # WE_HAVE_A_TWO_BY_TWO
+            if not flags & 0x0020: break   # MORE_COMPONENTS
+
+    outlines = []
+    offsets = [0]
+    offset = 0
+    for gind in range(numGlyphs):
+        if keep.has_key(gind):
+            outline = glyf[loca[gind]:loca[gind+1]]
+            outline += '\0' * (-len(outline) % 4)
+            outlines.append(outline)
+            offset += len(outline)
+        offsets.append(offset)
+    tables['glyf'] = ''.join(outlines)
+    tables['loca'] = struct.pack('>%dL' % len(offsets), *offsets)
+    # long loca offsets, and a zero checkSumAdjustment
+    tables['head'] = (head[:8] + '\0\0\0\0' + head[12:50] +
+                      struct.pack('>h', 1) + head[52:])
+
+    tags = [tag for tag in _truetype_tables if tables.has_key(tag)]
+    tags.sort()
+    numTables = len(tags)
+    entrySelector = 0
+    while 2**(entrySelector+1)<=numTables: entrySelector += 1
+    searchRange = 16 * 2**entrySelector
+    header = struct.pack('>LHHHH', version, numTables, searchRange,
+                         entrySelector, 16*numTables-searchRange)
+
+    directory = []
+    body = []
+    offset = 12 + 16*numTables
+    for tag in tags:
+        table = tables[tag]
+        padded = table + '\0' * (-len(table) % 4)
+        directory.append(struct.pack('>4sLLL', tag, _sfnt_checksum(padded),
+                                     offset, len(table)))
+        body.append(padded)
+        offset += len(padded)
+    return header + ''.join(directory) + ''.join(body)
+
+
+class PdfFont:
+    """
+    A TrueType font used in a PdfFile.  Text is drawn with two byte
+    glyph indices (the Identity-H encoding) and the glyphs used are
+    recorded, so that only they are embedded when the file is closed
+    """
+    def __init__(self, fname, name, ref):
+        self.fname = fname
+        self.name = name
+        self.ref = ref
+        self.font = FT2Font(fname)
+        self.glyphd = reverse_dict(self.font.get_charmap())
+        self.used = {}  # glyph index -> character code
+
+    def encode(self, ccodes):
+        """
+        Return the operand of the TJ operator which shows the character
+        codes in ccodes, with the kerning between them
+        """
+        font = self.font
+        scale = -1000.0/font.units_per_EM
+        items = []
+        run = []
+        lastgind = None
+        for ccode in ccodes:
+            gind = self.glyphd.get(ccode, 0)
+            self.used.setdefault(gind, ccode)
+            if lastgind is not None:
+                kern = font.get_kerning(lastgind, gind, KERNING_UNSCALED)
+                if kern:
+                    items.append('<%s>' % ''.join(run))
+                    items.append(_num_to_str(kern*scale))
+                    run = []
+            run.append('%04x' % gind)
+            lastgind = gind
+        items.append('<%s>' % ''.join(run))
+        return '[%s]' % ' '.join(items)
+
+    def get_widths(self):
+        """
+        Return the W array of the CIDFont: the advance widths of the
+        used glyphs in thousandths of an em
+        """
+        font = self.font
+        # at 1000 pixels to the em, linearHoriAdvance is the width we
+        # want as a 16.16 fixed point number
+        font.set_size(1000, 72)
+        used = self.used.items()
+        used.sort()
+        widths = []
+        last = None
+        for gind, ccode in used:
+            width = int(round(font.load_char(ccode).linearHoriAdvance/65536.0))
+            if last is not None and gind==last+1:
+                widths[-1].append(width)
+            else:
+                widths.extend([gind, [width]])
+            last = gind
+        font.clear()
+        return widths
+
+    def get_tounicode(self):
+        'Return the ToUnicode CMap which maps glyph indices to unicode'
+        pairs = ['<%04x> <%04x>' % item for item in self.used.items()
+                 if item[1]<=0xffff]
+        pairs.sort()
+        chunks = []
+        for i in range(0, len(pairs), 100):
+            chunk = pairs[i:i+100]
+            chunks.append('%d beginbfchar\n%s\nendbfchar\n' % (
+                len(chunk), '\n'.join(chunk)))
+        return _tounicode_cmap % ''.join(chunks)
+
+    def write(self, pdf):
+        'Write the font and its descriptor to the PdfFile pdf'
+        font = self.font
+        gids = self.used.keys()
+        gids.sort()
+        tag = ''.join([chr(ord('A') + ord(c) % 26)
+                       for c in md5.new(repr(gids)).digest()[:6]])
+        basefont = Name('%s+%s' % (tag, font.postscript_name))
+
+        def cvt(length):
+            'convert font units to thousandths of an em'
+            return int(round(length*1000.0/font.units_per_EM))
+
+        post = font.get_sfnt_table('post')
+        if post is None: italicAngle = 0
+        else:
+            major, minor = post['italicAngle']
+            italicAngle = major + minor/65536.0
+        pclt = font.get_sfnt_table('pclt')
+        if pclt is None: capHeight = font.ascender
+        else: capHeight = pclt['capHeight']
+        os2 = font.get_sfnt_table('OS/2')
+        if os2 is None:
+            weight, fsType = 400, 0
+        else:
+            weight, fsType = os2['usWeightClass'], os2['fsType']
+
+        flags = 32                          # nonsymbolic
+        if font.face_flags & 4: flags |= 1  # FT_FACE_FLAG_FIXED_WIDTH
+        if font.style_flags & 1: flags |= 64 # FT_STYLE_FLAG_ITALIC
+
+        descriptor = {
+            'Type'        : Name('FontDescriptor'),
+            'FontName'    : basefont,
+            'Flags'       : flags,
+            'FontBBox'    : [cvt(val) for val in font.bbox],
+            'ItalicAngle' : italicAngle,
+            'Ascent'      : cvt(font.ascender),
+            'Descent'     : cvt(font.descender),
+            'CapHeight'   : cvt(capHeight),
+            'StemV'       : 50 + int((weight/65.0)**2),
+            }
+
+        # fsType bit 1 is a restricted license which forbids embedding
+        if fsType & 0x0002:
+            verbose.report('Not embedding %s, its license does not allow it'
+                           % self.fname)
+        else:
+            try:
+                fontfile = subset_truetype(file(self.fname, 'rb').read(),
+                                           gids)
+            except (ValueError, struct.error), msg:
+                verbose.report('Could not embed %s: %s' % (self.fname, msg))
+            else:
+                descriptor['FontFile2'] = pdf.writeStream(
+                    fontfile, {'Length1' : len(fontfile)})
+
+        cidfont = {
+            'Type'           : Name('Font'),
+            'Subtype'        : Name('CIDFontType2'),
+            'BaseFont'       : basefont,
+            'CIDSystemInfo'  : {'Registry' : 'Adobe',
+                                'Ordering' : 'Identity',
+                                'Supplement' : 0},
+            'FontDescriptor' : pdf.writeObject(descriptor),
+            'W'              : self.get_widths(),
+            'CIDToGIDMap'    : Name('Identity'),
+            }
+
+        pdf.writeObject({
+            'Type'            : Name('Font'),
+            'Subtype'         : Name('Type0'),
+            'BaseFont'        : basefont,
+            'Encoding'        : Name('Identity-H'),
+            'DescendantFonts' : [pdf.writeObject(cidfont)],
+            'ToUnicode'       : pdf.writeStream(self.get_tounicode()),
+            }, self.ref)
+
+
+class PdfFile:
+    """
+    Write the objects of a PDF file to the file object fh, which only
+    needs a write method.  Pages are added with newPage and endPage,
+    and the resources they use (fonts, images and alpha states) are
+    shared between them and written by close
+    """
+    def __init__(self, fh):
+        self._fh = fh
+        self._pos = 0
+        self._offsets = {}  # object number -> file offset
+        self._nextid = 1
+        self._write('%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+
+        self._level = rcParams['pdf.compression']
+        self.rootRef = self.reserveObject()
+        self.pagesRef = self.reserveObject()
+        self.resourcesRef = self.reserveObject()
+        self.pages = []
+        self.fonts = {}       # font file name -> PdfFont
+        self.xobjects = {}    # name -> Reference
+        self.alphaStates = {} # alpha -> Name
+        self.contents = None
+
+    def _write(self, data):
+        self._fh.write(data)
+        self._pos += len(data)
+
+    def reserveObject(self):
+        'Return a Reference for an object to be written later'
+        ref = Reference(self._nextid)
+        self._nextid += 1
+        return ref
+
+    def _beginObject(self, ref):
+        self._offsets[ref.id] = self._pos
+        self._write('%d 0 obj\n' % ref.id)
+
+    def writeObject(self, obj, ref=None):
+        'Write obj as an indirect object and return its Reference'
+        if ref is None: ref = self.reserveObject()
+        self._beginObject(ref)
+        self._write('%s\nendobj\n' % pdfRepr(obj))
+        return ref
+
+    def writeStream(self, data, extra=None, ref=None):
+        """
+        Write a stream object with the contents data, compressing it
+        unless compression is turned off.  extra is a dict of
+        additional entries for the stream dictionary
+        """
+        stream = _Stream(self._level)
+        stream.write(data)
+        return self._writeStreamData(stream, extra, ref)
+
+    def _writeStreamData(self, stream, extra, ref):
+        data = stream.getvalue()
+        d = {'Length' : len(data)}
+        if self._level:
+            d['Filter'] = Name('FlateDecode')
+        if extra: d.update(extra)
+        if ref is None: ref = self.reserveObject()
+        self._beginObject(ref)
+        self._write('%s\nstream\n' % pdfRepr(d))
+        self._write(data)
+        self._write('\nendstream\nendobj\n')
+        return ref
+
+    def newPage(self, width, height, rotate=0):
+        """
+        Start a page of width x height points and return the stream
+        its content should be written to
+        """
+        self.pages.append((width, height, rotate))
+        self.contents = _Stream(self._level)
+        return self.contents
+
+    def endPage(self):
+        'Write the current page'
+        width, height, rotate = self.pages[-1]
+        contentsRef = self._writeStreamData(self.contents, None, None)
+        self.contents = None
+        page = {
+            'Type'      : Name('Page'),
+            'Parent'    : self.pagesRef,
+            'MediaBox'  : [0, 0, width, height],
+            'Resources' : self.resourcesRef,
+            'Contents'  : contentsRef,
+            }
+        if rotate: page['Rotate'] = rotate
+        self.pages[-1] = self.writeObject(page)
+
+    def fontName(self, fname):
+        'Return the resource name of the TrueType font file fname'
+        font = self.fonts.get(fname)
+        if font is None:
+            font = PdfFont(fname, Name('F%d' % (len(self.fonts)+1)),
+                           self.reserveObject())
+            self.fonts[fname] = font
+        return font
+
+    def alphaState(self, alpha):
+        'Return the name of the graphics state which sets alpha'
+        name = self.alphaStates.get(alpha)
+        if name is None:
+            name = Name('A%d' % (len(self.alphaStates)+1))
+            self.alphaStates[alpha] = name
+        return name
+
+    def imageObject(self, width, height, data, colorspace, smask=None):
+        """
+        Write width x height 8 bit image data in colorspace
+        ('DeviceRGB' or 'DeviceGray') as an image XObject and return its
+        name.  smask is the alpha channel as 8 bit gray data, or None
+        """
+        d = {'Type'             : Name('XObject'),
+             'Subtype'          : Name('Image'),
+             'Width'            : width,
+             'Height'           : height,
+             'ColorSpace'       : Name(colorspace),
+             'BitsPerComponent' : 8,
+             }
+        if smask is not None:
+            mask = d.copy()
+            mask['ColorSpace'] = Name('DeviceGray')
+            d['SMask'] = self.writeStream(smask, mask)
+        ref = self.writeStream(data, d)
+        name = Name('I%d' % (len(self.xobjects)+1))
+        self.xobjects[name.name] = ref
+        return name, ref
+
+    def close(self):
+        'Write the shared resources, the document catalog and the xref'
+        fonts = {}
+        for font in self.fonts.values():
+            font.write(self)
+            fonts[font.name.name] = font.ref
+        alphaStates = {}
+        for alpha, name in self.alphaStates.items():
+            alphaStates[name.name] = {'Type' : Name('ExtGState'),
+                                      'CA' : alpha, 'ca' : alpha}
+
+        self.writeObject({
+            'Font'      : fonts,
+            'XObject'   : self.xobjects,
+            'ExtGState' : alphaStates,
+            'ProcSet'   : [Name('PDF'), Name('Text'),
+                           Name('ImageB'), Name('ImageC')],
+            }, self.resourcesRef)
+        self.writeObject({'Type'  : Name('Pages'),
+                          'Kids'  : self.pages,
+                          'Count' : len(self.pages)}, self.pagesRef)
+        self.writeObject({'Type'  : Name('Catalog'),
+                          'Pages' : self.pagesRef}, self.rootRef)
+        infoRef = self.writeObject({
+            'Producer'     : 'matplotlib pdf backend %s' % __version__,
+            'CreationDate' : time.strftime('D:%Y%m%d%H%M%S'),
+            })
+
+        xref = self._pos
+        self._write('xref\n0 %d\n0000000000 65535 f \n' % self._nextid)
+        for id in range(1, self._nextid):
+            self._write('%010d 00000 n \n' % self._offsets[id])
+        self._write('trailer\n%s\nstartxref\n%d\n%%%%EOF\n' % (
+            pdfRepr({'Size' : self._nextid,
+                     'Root' : self.rootRef,
+                     'Info' : infoRef}), xref))
+
+
+_joind = {'miter':0, 'round':1, 'bevel':2}
+_capd  = {'butt':0, 'round':1, 'projecting':2}
+
+# the graphics state at the start of a page and after each clip change
+_default_state = {
+    'stroke'    : (0.0, 0.0, 0.0),
+    'fill'      : (0.0, 0.0, 0.0),
+    'linewidth' : 1.0,
+    'joinstyle' : 0,
+    'capstyle'  : 0,
+    'dashes'    : (0, None),
+    'alpha'     : 1.0,
+    }
+
+_fontd = {}
+_fnamed = {}
+class RendererPdf(RendererBase):
+    """
+    Draw into the current page of the PdfFile pdf
+    """
+    def __init__(self, width, height, pdf):
+        self.width = width
+        self.height = height
+        self.pdf = pdf
+        self._write = pdf.contents.write
+        self._clip = None
+        self._state = _default_state.copy()
+        # everything is drawn inside a q/Q pair, which is closed and
+        # reopened whenever the clip rectangle changes
+        self._write('q\n')
+
+    def _get_font(self, prop):
+        key = hash(prop)
+        font = _fontd.get(key)
+        if font is None:
+            fname = fontManager.findfont(prop)
+            font = FT2Font(str(fname))
+            _fontd[key] = font
+            _fnamed[key] = str(fname)
+        font.clear()
+        size = prop.get_size_in_points()
+        font.set_size(size, 72.0)
+        return font
+
+    def _set_clip(self, cliprect):
+        if cliprect==self._clip: return
+        self._write('Q\nq\n')
+        if cliprect is not None:
+            self._write('%s re W n\n' % _nums_to_str(*cliprect))
+        self._clip = cliprect
+        self._state = _default_state.copy()
+
+    def _set_state(self, key, value, ops):
+        if self._state[key]!=value:
+            self._state[key] = value
+            self._write(ops)
+
+    def _set_gc(self, gc, rgbFace=None):
+        """
+        Emit the operators which change the graphics state to the
+        attributes of gc, filling with rgbFace
+        """
+        self._set_clip(gc.get_clip_rectangle())
+        set_state = self._set_state
+
+        rgb = tuple(gc.get_rgb())
+        set_state('stroke', rgb, '%s RG\n' % _nums_to_str(*rgb))
+        if rgbFace is not None:
+            rgbFace = tuple(rgbFace)
+            set_state('fill', rgbFace, '%s rg\n' % _nums_to_str(*rgbFace))
+
+        alpha = gc.get_alpha()
+        if alpha!=self._state['alpha']:
+            set_state('alpha', alpha,
+                      '%s gs\n' % self.pdf.alphaState(alpha).pdfRepr())
+        linewidth = gc.get_linewidth()
+        set_state('linewidth', linewidth, '%s w\n' % _num_to_str(linewidth))
+        join = _joind[gc.get_joinstyle()]
+        set_state('joinstyle', join, '%d j\n' % join)
+        cap = _capd[gc.get_capstyle()]
+        set_state('capstyle', cap, '%d J\n' % cap)
+
+        offset, seq = gc.get_dashes()
+        if seq is None:
+            set_state('dashes', (0, None), '[] 0 d\n')
+        else:
+            seq = tuple(seq)
+            set_state('dashes', (offset, seq), '[%s] %s d\n' % (
+                _nums_to_str(*seq), _num_to_str(offset or 0)))
+
+    def _draw_path(self, path, gc, rgbFace):
+        """
+        Emit the path construction operators path, then fill it with
+        rgbFace if it is not None and stroke it with the attributes of
+        gc
+        """
+        self._set_gc(gc, rgbFace)
+        stroke = gc.get_linewidth()>0
+        if rgbFace is None:
+            if stroke: paint = 'S'
+            else: paint = 'n'
+        else:
+            if stroke: paint = 'B'
+            else: paint = 'f'
+        self._write('%s %s\n' % (path, paint))
+
+    def draw_arc(self, gc, rgbFace, x, y, width, height, angle1, angle2):
+        """
+        Draw an arc centered at x,y with width and height and angles
+        from 0.0 to 360.0, approximated by Bezier curves of at most 90
+        degrees each
+        """
+        rx, ry = 0.5*width, 0.5*height
+        theta1 = angle1*math.pi/180.0
+        theta2 = angle2*math.pi/180.0
+        nsegs = max(1, int(math.ceil(abs(theta2-theta1)/(0.5*math.pi))))
+        delta = (theta2-theta1)/nsegs
+        k = 4.0/3.0*math.tan(0.25*delta)
+
+        cos, sin = math.cos, math.sin
+        path = ['%s m' % _nums_to_str(x+rx*cos(theta1), y+ry*sin(theta1))]
+        for i in range(nsegs):
+            t1 = theta1 + i*delta
+            t2 = t1 + delta
+            path.append('%s c' % _nums_to_str(
+                x+rx*(cos(t1)-k*sin(t1)), y+ry*(sin(t1)+k*cos(t1)),
+                x+rx*(cos(t2)+k*sin(t2)), y+ry*(sin(t2)-k*cos(t2)),
+                x+rx*cos(t2), y+ry*sin(t2)))
+        if abs(angle2-angle1)>=360: path.append('h')
+        self._draw_path('\n'.join(path), gc, rgbFace)
+
+    def _rgba(self, im):
+        h, w, s = im.as_rgba_str()
+        rgba = fromstring(s, UInt8)
+        rgba.shape = (h, w, 4)
+        return h, w, rgba
+
+    def _alpha(self, rgba):
+        'return the alpha channel of rgba, or None if it is opaque'
+        alpha = rgba[:,:,3]
+        if alltrue(ravel(equal(alpha, 255))): return None
+        return alpha.tostring()
+
+    def _gray(self, rgba, rc=0.3, gc=0.59, bc=0.11):
+        r = rgba[:,:,0].astype(Float32)
+        g = rgba[:,:,1].astype(Float32)
+        b = rgba[:,:,2].astype(Float32)
+        gray = (rc*r + gc*g + bc*b).astype(UInt8)
+        return gray.tostring()
+
+    def draw_image(self, x, y, im, bbox):
+        """
+        Draw the Image instance into the current axes; x is the
+        distance in pixels from the left hand side of the canvas and y
+        is the distance from bottom
+
+        bbox is a matplotlib.transforms.BBox instance for clipping, or
+        None
+        """
+        im.flipud_out()
+        h, w, rgba = self._rgba(im)
+        im.flipud_out()
+
+        if im.is_grayscale:
+            data = self._gray(rgba)
+            colorspace = 'DeviceGray'
+        else:
+            data = rgba[:,:,:3].tostring()
+            colorspace = 'DeviceRGB'
+        name, ref = self.pdf.imageObject(w, h, data, colorspace,
+                                         self._alpha(rgba))
+
+        self._write('q\n')
+        if bbox is not None:
+            self._write('%s re W n\n' % _nums_to_str(*bbox.get_bounds()))
+        self._write('%s cm %s Do\nQ\n' % (
+            _nums_to_str(w, 0, 0, h, x, y), name.pdfRepr()))
+
+    def draw_line(self, gc, x0, y0, x1, y1):
+        """
+        Draw a single line from x0,y0 to x1,y1
+        """
+        self._draw_path('%s m %s l' % (_nums_to_str(x0, y0),
+                                       _nums_to_str(x1, y1)), gc, None)
+
+    def draw_lines(self, gc, x, y, transform=None):
+        """
+        x and y are equal length arrays, draw lines connecting each
+        point in x, y
+        """
+        if len(x)==0: return
+        if len(x)!=len(y):
+            raise ValueError('x and y must be the same length')
+
+        if transform:  # this won't be called if draw_markers is hidden
+            x, y = transform.numerix_x_y(x, y)
+
+        path = ['%1.3f %1.3f m' % (x[0], y[0])]
+        path.extend(['%1.3f %1.3f l' % xy for xy in zip(x[1:], y[1:])])
+        self._draw_path('\n'.join(path), gc, None)
+
+    def draw_point(self, gc, x, y):
+        """
+        Draw a single point at x,y
+        """
+        self.draw_line(gc, x, y, x+1, y+1)
+
+    def draw_polygon(self, gc, rgbFace, points):
+        """
+        Draw a polygon.  points is a len vertices tuple, each element
+        giving the x,y coords a vertex
+
+        If rgbFace is not None, fill the poly with it.  gc
+        is a GraphicsContext instance
+        """
+        path = ['%s m' % _nums_to_str(*points[0])]
+        path.extend(['%s l' % _nums_to_str(x, y) for x, y in points[1:]])
+        path.append('h')
+        self._draw_path('\n'.join(path), gc, rgbFace)
+
+    def draw_rectangle(self, gc, rgbFace, x, y, width, height):
+        """
+        Draw a rectangle with lower left at x,y with width and height.
+
+        If rgbFace is not None, fill the rectangle with it.  gc
+        is a GraphicsContext instance
+        """
+        self._draw_path('%s re' % _nums_to_str(x, y, width, height),
+                        gc, rgbFace)
+
+    def draw_tex(self, gc, x, y, s, prop, angle, ismath='TeX!'):
+        """
+        text.usetex is not supported by the PDF backend; draw the tex
+        source as plain text
+        """
+        self.draw_text(gc, x, y, s, prop, angle, False)
+
+    def _show_glyphs(self, pdffont, size, x, y, angle, ccodes):
+        'Emit the text operators which show ccodes at x,y'
+        if angle:
+            theta = angle*math.pi/180.0
+            c, s = math.cos(theta), math.sin(theta)
+            matrix = _nums_to_str(c, s, -s, c, x, y)
+        else:
+            matrix = _nums_to_str(1, 0, 0, 1, x, y)
+        self._write('%s %s Tf %s Tm %s TJ\n' % (
+            pdffont.name.pdfRepr(), _num_to_str(size), matrix,
+            pdffont.encode(ccodes)))
+
+    def draw_text(self, gc, x, y, s, prop, angle, ismath):
+        """
+        draw a Text instance
+        """
+        if ismath=='TeX':
+            ismath = False
+        if ismath:
+            return self.draw_mathtext(gc, x, y, s, prop, angle)
+
+        font = self._get_font(prop)
+        font.set_text(s, 0.0)
+        descent = font.get_descent()/64.0
+        theta = angle*math.pi/180.0
+        x -= descent*math.sin(theta)
+        y += descent*math.cos(theta)
+
+        self._set_gc(gc, gc.get_rgb())
+        pdffont = self.pdf.fontName(_fnamed[hash(prop)])
+        self._write('BT\n')
+        if isinstance(s, unicode): ccodes = map(ord, s)
+        else: ccodes = map(ord, s.decode('latin-1'))
+        self._show_glyphs(pdffont, prop.get_size_in_points(), x, y, angle,
+                          ccodes)
+        self._write('ET\n')
+
+    def draw_mathtext(self, gc, x, y, s, prop, angle):
+        """
+        Draw the math text using matplotlib.mathtext and the BaKoMa
+        TrueType fonts
+        """
+        from matplotlib.mathtext import math_parse_s_ft2font_svg
+        fontsize = prop.get_size_in_points()
+        width, height, glyphs = math_parse_s_ft2font_svg(s, 72, fontsize)
+        theta = angle*math.pi/180.0
+        cos, sin = math.cos(theta), math.sin(theta)
+
+        self._set_gc(gc, gc.get_rgb())
+        self._write('BT\n')
+        for fontname, fontsize, num, ox, oy, metrics in glyphs:
+            fname = os.path.join(get_data_path(), fontname + '.ttf')
+            self._show_glyphs(self.pdf.fontName(fname), fontsize,
+                              x + ox*cos - oy*sin, y + ox*sin + oy*cos,
+                              angle, [num])
+        self._write('ET\n')
+
+    def finish(self):
+        self._write('Q\n')
+
+    def flipy(self):
+        'return true if small y numbers are top for renderer'
+        return False
+
+    def get_canvas_width_height(self):
+        'return the canvas width and height in display coords'
+        return self.width, self.height
+
+    def get_text_width_height(self, s, prop, ismath):
+        """
+        get the width and height in display coords of the string s
+        with FontPropertry prop
+        """
+        if ismath and ismath!='TeX':
+            from matplotlib.mathtext import math_parse_s_ft2font_svg
+            width, height, glyphs = math_parse_s_ft2font_svg(
+                s, 72, prop.get_size_in_points())
+            return width, height
+        font = self._get_font(prop)
+        font.set_text(s, 0.0)
+        w, h = font.get_width_height()
+        w /= 64.0  # convert from subpixels
+        h /= 64.0
+        return w, h
+
+
+class FigureCanvasPdf(FigureCanvasBase):
+
+    def draw(self):
+        pass
+
+    def print_figure(self, outfile, dpi=72,
+                     facecolor='w', edgecolor='w',
+                     orientation='portrait'):
+        """
+        Render the figure to a PDF file.  Set the figure patch face and
+        edge colors.  This is useful because some of the GUIs have a
+        gray figure face color background and you'll probably want to
+        override this on hardcopy
+
+        outfile is a file name or an object with a write method.  The
+        page is the size of the figure, rotated to landscape if
+        orientation is 'landscape'
+        """
+        # save figure settings
+        origDPI       = self.figure.dpi.get()
+        origfacecolor = self.figure.get_facecolor()
+        origedgecolor = self.figure.get_edgecolor()
+
+        self.figure.dpi.set(72)
+        self.figure.set_facecolor(facecolor)
+        self.figure.set_edgecolor(edgecolor)
+        width, height = self.figure.get_size_inches()
+        w, h = width*72, height*72
+
+        if is_string_like(outfile):
+            basename, ext = os.path.splitext(outfile)
+            if not ext: outfile += '.pdf'
+            fh = file(outfile, 'wb')
+        else:
+            fh = outfile
+
+        if orientation=='landscape': rotate = 90
+        else: rotate = 0
+
+        pdf = PdfFile(fh)
+        pdf.newPage(w, h, rotate)
+        renderer = RendererPdf(w, h, pdf)
+        self.figure.draw(renderer)
+        renderer.finish()
+        pdf.endPage()
+        pdf.close()
+        if fh is not outfile: fh.close()
+
+        # restore figure settings
+        self.figure.dpi.set(origDPI)
+        self.figure.set_facecolor(origfacecolor)
+        self.figure.set_edgecolor(origedgecolor)
+
+class FigureManagerPdf(FigureManagerBase):
+    pass
+
+FigureManager = FigureManagerPdf
+
+_tounicode_cmap = """\
+/CIDInit /ProcSet findresource begin
+12 dict begin
+begincmap
+/CIDSystemInfo << /Registry (Adobe) /Ordering (UCS) /Supplement 0 >> def
+/CMapName /Adobe-Identity-UCS def
+/CMapType 2 def
+1 begincodespacerange
+<0000> <ffff>
+endcodespacerange
+%sendcmap
+CMapName currentdict /CMap defineresource pop
+end
+end
+"""
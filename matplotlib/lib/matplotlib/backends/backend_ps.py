@@ -3,8 +3,8 @@ A PostScript backend, which can produce both PostScript .ps and
 
 """
 
-from __future__ import division
-import glob, math, md5, os, shutil, sys, time
+from __future__ import division, generators
+import glob, math, md5, os, shutil, sys, time, zlib
 def _fn_name(): return sys._getframe(1).f_code.co_name
 
 from tempfile import gettempdir
@@ -16,19 +16,17 @@ from matplotlib.afm import AFM
 from matplotlib.backend_bases import RendererBase, GraphicsContextBase,\
      FigureManagerBase, FigureCanvasBase
 
-from matplotlib.cbook import is_string_like, izip, reverse_dict
+from matplotlib.cbook import is_string_like, izip, reverse_dict, countingdict
 from matplotlib.figure import Figure
 
 from matplotlib.font_manager import fontManager
 from matplotlib.ft2font import FT2Font, KERNING_UNFITTED, KERNING_DEFAULT, KERNING_UNSCALED
-from matplotlib.mathtext import math_parse_s_ps, bakoma_fonts
 from matplotlib.text import Text
-from matplotlib.texmanager import TexManager
 
 from matplotlib.transforms import get_vec6_scales
 
-from matplotlib.numerix import fromstring, UInt8, Float32, equal, alltrue, \
-     nonzero, take, where, ones, put
+from matplotlib.numerix import fromstring, UInt8, Float32, Float64, equal, \
+     alltrue, nonzero, take, where, ones, put, zeros, floor
 import binascii
 import re
 
@@ -102,6 +100,72 @@ def quote_ps_string(s):
     s=re.sub(r"[^ -~\n]", lambda x: r"\%03o"%ord(x.group()), s)
     return s
 
+def ascii85_lines(s):
+    """
+    ASCII85 encode the string s, in lines of 75 characters.  Unless
+    it is the last part of the data, len(s) must be a multiple of 60
+    so that the lines of consecutive calls line up
+    """
+    pad = -len(s) % 4
+    b = fromstring(s + '\0'*pad, UInt8).astype(Float64)
+    b.shape = (len(b)//4, 4)
+    v = ((b[:,0]*256 + b[:,1])*256 + b[:,2])*256 + b[:,3]
+    digits = zeros((len(v), 5), UInt8)
+    for i in range(4, -1, -1):
+        q = floor(v/85)
+        digits[:,i] = (v - 85*q + 33).astype(UInt8)
+        v = q
+    s = digits.tostring()
+    if pad: s = s[:-pad]
+    lines = []
+    for i in range(0, len(s), 75):
+        line = s[i:i+75]
+        # whitespace is ignored; keep lines from looking like DSC comments
+        if line[:1]=='%': line = ' ' + line
+        lines.append(line)
+    return '\n'.join(lines) + '\n'
+
+_runs = re.compile(r'(.)\1{2,127}', re.DOTALL)
+def runlength_encode(s):
+    """
+    Compress s with the PostScript RunLengthEncode filter scheme,
+    without the end of data marker
+    """
+    out = []
+    def literal(s):
+        for i in range(0, len(s), 128):
+            chunk = s[i:i+128]
+            out.append(chr(len(chunk)-1) + chunk)
+    pos = 0
+    for match in _runs.finditer(s):
+        start, end = match.span()
+        literal(s[pos:start])
+        out.append(chr(257-(end-start)) + match.group(1))
+        pos = end
+    literal(s[pos:])
+    return ''.join(out)
+
+def encode_image_data(data, encoding, chunksize=60*1024):
+    """
+    Generate the ASCII85 text of the image data compressed with
+    encoding, 'flate' or 'runlength', a chunk at a time.  The last
+    chunk ends with the ~> end of data marker
+    """
+    if encoding=='flate':
+        compressor = zlib.compressobj(6)
+        compress, flush = compressor.compress, compressor.flush
+    else:
+        compress, flush = runlength_encode, lambda: '\x80'
+
+    pending = ''
+    for i in range(0, len(data), chunksize):
+        pending += compress(data[i:i+chunksize])
+        n = len(pending) - len(pending)%60
+        if n:
+            yield ascii85_lines(pending[:n])
+            pending = pending[n:]
+    yield ascii85_lines(pending + flush()) + '~>\n'
+
 
 _fontd = {}
 _afmfontd = {}
@@ -131,6 +195,9 @@ class RendererPS(RendererBase):
     context instance that controls the colors/styles.
     """
 
+    # a cache of text widths and heights shared by all renderers
+    metricsd = countingdict(2000)
+
     def __init__(self, width, height, pswriter):
         self.width = width
         self.height = height
@@ -138,6 +205,7 @@ class RendererPS(RendererBase):
         if rcParams['text.usetex']:
             self.textcnt = 0
             self.psfrag = []
+            from matplotlib.texmanager import TexManager
             self.texmanager = TexManager()
 
         # current renderer state (None=uninitialised)
@@ -149,6 +217,8 @@ class RendererPS(RendererBase):
         self.fontname = None
         self.fontsize = None
         self.hatch = None
+        # raised to 3 by features that need it, eg FlateDecode
+        self.languageLevel = 2
 
     def set_color(self, r, g, b, store=1):
         if (r,g,b) != self.color:
@@ -265,28 +335,29 @@ class RendererPS(RendererBase):
             #print s, w, h
             return w, h
 
+        useafm = rcParams['ps.useafm']
+        key = s, hash(prop), ismath, useafm
+        wh = self.metricsd.get(key)
+        if wh is not None: return wh
+
         if ismath:
+            from matplotlib.mathtext import math_parse_s_ps
             width, height, pswriter = math_parse_s_ps(
                 s, 72, prop.get_size_in_points())
-            return width, height
-
-        if rcParams['ps.useafm']:
-            if ismath: s = s[1:-1]
+            wh = width, height
+        elif useafm:
             font = self._get_font_afm(prop)
             l,b,w,h = font.get_str_bbox(s)
 
             fontsize = prop.get_size_in_points()
-            w *= 0.001*fontsize
-            h *= 0.001*fontsize
-            return w, h
-
-        font = self._get_font_ttf(prop)
-        font.set_text(s, 0.0)
-        w, h = font.get_width_height()
-        w /= 64.0  # convert from subpixels
-        h /= 64.0
-        #print s, w, h
-        return w, h
+            wh = w*0.001*fontsize, h*0.001*fontsize
+        else:
+            font = self._get_font_ttf(prop)
+            font.set_text(s, 0.0)
+            w, h = font.get_width_height()
+            wh = w/64.0, h/64.0  # convert from subpixels
+        self.metricsd[key] = wh
+        return wh
 
     def flipy(self):
         'return true if small y numbers are top for renderer'
@@ -375,7 +446,6 @@ class RendererPS(RendererBase):
         else:
             h, w, bits = self._rgb(im)
             imagecmd = "false 3 colorimage"
-        hexlines = '\n'.join(self._hex_lines(bits))
 
         xscale, yscale = w, h
 
@@ -385,8 +455,13 @@ class RendererPS(RendererBase):
         if bbox is not None:
             clipx,clipy,clipw,cliph = bbox.get_bounds()
             clip = '%s clipbox' % _nums_to_str(clipw, cliph, clipx, clipy)
+        else:
+            clip = ''
         #y = figh-(y+h)
-        ps = """gsave
+        encoding = rcParams['ps.imageencoding']
+        if encoding=='hex':
+            hexlines = '\n'.join(self._hex_lines(bits))
+            ps = """gsave
 %(clip)s
 %(x)s %(y)s translate
 %(xscale)s %(yscale)s scale
@@ -398,7 +473,32 @@ currentfile DataString readhexstring pop
 %(hexlines)s
 grestore
 """ % locals()
-        self._pswriter.write(ps)
+            self._pswriter.write(ps)
+        else:
+            # the image reads the data through the decode filters,
+            # which are then flushed up to the ~> after the data
+            if encoding=='flate':
+                decode = 'FlateDecode'
+                self.languageLevel = 3
+            else:
+                decode = 'RunLengthDecode'
+            ps = """gsave
+%(clip)s
+%(x)s %(y)s translate
+%(xscale)s %(yscale)s scale
+/ImageSource currentfile /ASCII85Decode filter def
+/ImageData ImageSource /%(decode)s filter def
+{
+%(w)s %(h)s 8 [ %(w)s 0 0 -%(h)s 0 %(h)s ]
+ImageData %(imagecmd)s
+ImageData flushfile ImageSource flushfile
+} exec
+""" % locals()
+            write = self._pswriter.write
+            write(ps)
+            for chunk in encode_image_data(bits, encoding):
+                write(chunk)
+            write('grestore\n')
 
         # unflip
         im.flipud_out()
@@ -787,6 +887,7 @@ grestore
         if debugPS:
             self._pswriter.write("% mathtext\n")
 
+        from matplotlib.mathtext import math_parse_s_ps
         fontsize = prop.get_size_in_points()
         width, height, pswriter = math_parse_s_ps(s, 72, fontsize)
         self.set_color(*gc.get_rgb())
@@ -1049,6 +1150,7 @@ class FigureCanvasPS(FigureCanvasBase):
         print >>fh, ("%%Creator: matplotlib version "
                      +__version__+", http://matplotlib.sourceforge.net/")
         print >>fh, "%%CreationDate: "+time.ctime(time.time())
+        print >>fh, "%%%%LanguageLevel: %d" % renderer.languageLevel
         print >>fh, "%%Orientation: " + orientation
         if not isEPSF:
             print >>fh, "%%DocumentPaperSizes: "+papertype
@@ -1059,6 +1161,7 @@ class FigureCanvasPS(FigureCanvasBase):
         Ndict = len(psDefs)
         print >>fh, "%%BeginProlog"
         if not rcParams['text.usetex']:
+            from matplotlib.mathtext import bakoma_fonts
             type42 = _type42 + [os.path.join(self.basepath, name) + '.ttf' \
                                 for name in bakoma_fonts]
             if not rcParams['ps.useafm']:
@@ -1088,8 +1191,10 @@ class FigureCanvasPS(FigureCanvasBase):
             print >>fh, "%d rotate"%rotation
         print >>fh, "%s clipbox"%_nums_to_str(width*72, height*72, 0, 0)
 
-        # write the figure
-        print >>fh, self._pswriter.getvalue()
+        # write the figure, without copying it into one string
+        self._pswriter.seek(0)
+        shutil.copyfileobj(self._pswriter, fh)
+        print >>fh
 
         # write the trailer
         #print >>fh, "grestore"
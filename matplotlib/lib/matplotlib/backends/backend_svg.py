@@ -1,6 +1,6 @@
 from __future__ import division
 
-import os, codecs, base64, tempfile
+import os, codecs, base64
 
 from matplotlib import verbose, __version__
 from matplotlib.backend_bases import RendererBase, GraphicsContextBase,\
@@ -9,7 +9,6 @@ from matplotlib.colors import rgb2hex
 from matplotlib.figure import Figure
 from matplotlib.font_manager import fontManager
 from matplotlib.ft2font import FT2Font
-from matplotlib.mathtext import math_parse_s_ft2font_svg
 
 backend_version = __version__
 
@@ -125,29 +124,12 @@ class RendererSVG(RendererBase):
         self._draw_svg_element('circle', details, gc, rgbFace)
 
     def draw_image(self, x, y, im, bbox):
-        filename = os.path.join (tempfile.gettempdir(),
-                                 tempfile.gettempprefix() + '.png'
-                                 )
-
-        verbose.report ('Writing image file for include: %s' % filename)
-        # im.write_png() accepts a filename, not file object, would be
-        # good to avoid using files and write to mem with StringIO
-
-        # JDH: it *would* be good, but I don't know how to do this
-        # since libpng seems to want a FILE* and StringIO doesn't seem
-        # to provide one.  I suspect there is a way, but I don't know
-        # it
-
+        # encode the png in memory and embed it base64 encoded
         im.flipud_out()
 
         h,w = im.get_size_out()
         y = self.height-y-h
-        im.write_png(filename)
-
-	imfile = file (filename, 'r')
-	image64 = base64.b64encode (imfile.read())
-	imfile.close()
-	os.remove(filename)
+        image64 = base64.b64encode(im.as_png_str())
         lines = [image64[i:i+76] for i in range(0, len(image64), 76)]
 
         self._svgwriter.write (
@@ -218,6 +200,7 @@ class RendererSVG(RendererBase):
         """
         Draw math text using matplotlib.mathtext
         """
+        from matplotlib.mathtext import math_parse_s_ft2font_svg
         fontsize = prop.get_size_in_points()
         width, height, svg_glyphs = math_parse_s_ft2font_svg(s, 72, fontsize)
         color = rgb2hex(gc.get_rgb())
@@ -250,6 +233,7 @@ class RendererSVG(RendererBase):
 
     def get_text_width_height(self, s, prop, ismath):
         if ismath:
+            from matplotlib.mathtext import math_parse_s_ft2font_svg
             width, height, glyphs = math_parse_s_ft2font_svg(
                 s, 72, prop.get_size_in_points())
             return width, height
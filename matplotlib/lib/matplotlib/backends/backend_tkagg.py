@@ -20,7 +20,6 @@ from matplotlib._pylab_helpers import Gcf
 from matplotlib.numerix import asarray
 
 import matplotlib.windowing as windowing
-from matplotlib.widgets import SubplotTool
 
 rcParams = matplotlib.rcParams
 verbose = matplotlib.verbose
@@ -607,6 +606,7 @@ class NavigationToolbar2TkAgg(NavigationToolbar2, Tk.Frame):
         window = Tk.Tk()
         canvas = FigureCanvasTkAgg(toolfig, master=window)    
         toolfig.subplots_adjust(top=0.9)
+        from matplotlib.widgets import SubplotTool
         tool =  SubplotTool(self.canvas.figure, toolfig)
         canvas.show()
         canvas.get_tk_widget().pack(side=Tk.TOP, fill=Tk.BOTH, expand=1)
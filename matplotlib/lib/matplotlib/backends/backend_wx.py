@@ -157,7 +157,6 @@ from matplotlib.artist import Artist
 from matplotlib.cbook import exception_to_str
 from matplotlib.figure import Figure
 from matplotlib.text import _process_text_args, Text
-from matplotlib.widgets import SubplotTool
 from matplotlib import rcParams
 
 ##import wx
@@ -1511,6 +1510,7 @@ class SubplotToolWX(wx.Frame):
         sizer.Add(canvas, 1, wx.LEFT|wx.TOP|wx.GROW)
         self.SetSizer(sizer)
         self.Fit()
+        from matplotlib.widgets import SubplotTool
         tool = SubplotTool(targetfig, toolfig)
         
 
@@ -1604,6 +1604,7 @@ class NavigationToolbar2Wx(NavigationToolbar2, wx.ToolBar):
         sizer.Add(canvas, 1, wx.LEFT|wx.TOP|wx.GROW)
         frame.SetSizer(sizer)
         frame.Fit()
+        from matplotlib.widgets import SubplotTool
         tool = SubplotTool(self.canvas.figure, toolfig)
         frame.Show()
         
@@ -0,0 +1,269 @@
+"""
+Render many figures to png with the Agg backend, in parallel in
+forked worker processes.
+
+A spec is a function which draws into the Figure it is passed, or a
+tuple (func, arg1, arg2, ...) to call func(fig, arg1, arg2, ...).
+Specs use the object oriented API on fig; they should not use pylab,
+so there is no Gcf bookkeeping to clean up between figures.
+
+    from matplotlib.batch import render_many
+
+    def plot_series(fig, data):
+        ax = fig.add_subplot(111)
+        ax.plot(data)
+
+    specs = [(plot_series, data) for data in allseries]
+    for i, png in render_many(specs, processes=4, figsize=(4,3), dpi=72):
+        file('series%d.png' % i, 'wb').write(png)
+
+The modules, fonts, font cache and colormaps are loaded and exercised
+once in the calling process before the workers are forked, so every
+worker starts warm.  Each worker draws all its specs into one Figure
+and keeps one RendererAgg for each figure size it sees, and workers
+can be replaced after maxtasks figures to bound the memory any slow
+leak can take.
+"""
+
+from __future__ import division, generators
+import errno, os, select, struct, sys, traceback
+
+from matplotlib import rcParams
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg, RendererAgg
+
+
+def cpu_count():
+    'Return the number of processors online, or 1 if it is not known'
+    try:
+        return max(1, os.sysconf('SC_NPROCESSORS_ONLN'))
+    except (AttributeError, ValueError, OSError):
+        return 1
+
+def warm():
+    """
+    Import and exercise everything drawing a figure needs: the font
+    manager and its cache, the Agg fonts, colormaps, images and
+    mathtext.  render_many calls this before forking its workers
+    """
+    fig = Figure(figsize=(2,2), dpi=72)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    ax.plot([0, 1], [0, 1])
+    ax.imshow([[0, 1], [1, 0]])
+    ax.set_title(r'$\alpha$')
+    canvas.draw()
+    fig.clf()
+
+
+class BatchCanvas(FigureCanvasAgg):
+    """
+    An Agg canvas which keeps the renderer of every figure size it
+    draws, and clears it before drawing into it again
+    """
+    def __init__(self, figure):
+        FigureCanvasAgg.__init__(self, figure)
+        self._renderers = {}
+
+    def draw(self):
+        renderer = self.get_renderer()
+        renderer.clear()
+        self.figure.draw(renderer)
+
+    def get_renderer(self):
+        l,b,w,h = self.figure.bbox.get_bounds()
+        key = w, h, self.figure.dpi.get()
+        renderer = self._renderers.get(key)
+        if renderer is None:
+            renderer = RendererAgg(w, h, self.figure.dpi)
+            self._renderers[key] = renderer
+        self.renderer = renderer
+        return renderer
+
+
+class BatchRenderer:
+    """
+    Render specs to png strings, one after the other, with one Figure
+    which is reset to figsize, dpi and the colors before each spec
+    """
+    def __init__(self, figsize=None, dpi=None, facecolor='w', edgecolor='w'):
+        if figsize is None: figsize = rcParams['figure.figsize']
+        if dpi is None: dpi = rcParams['savefig.dpi']
+        self.figsize = figsize
+        self.dpi = dpi
+        self.facecolor = facecolor
+        self.edgecolor = edgecolor
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        self.canvas = BatchCanvas(self.figure)
+
+    def render(self, spec):
+        'Draw spec and return the png data'
+        fig = self.figure
+        fig.clf()
+        fig.set_figsize_inches(self.figsize)
+        fig.dpi.set(self.dpi)
+        fig.set_facecolor(self.facecolor)
+        fig.set_edgecolor(self.edgecolor)
+
+        if callable(spec):
+            func, args = spec, ()
+        else:
+            func, args = spec[0], tuple(spec[1:])
+        func(fig, *args)
+        self.canvas.draw()
+        fig.clf()
+        return self.canvas.tostring_png()
+
+
+_header = '!lBL'   # spec index, failed flag, data length
+_headersize = struct.calcsize(_header)
+
+def _read(fd, n):
+    'read exactly n bytes from the pipe fd'
+    chunks = []
+    while n:
+        s = os.read(fd, min(n, 1<<16))
+        if not s: raise RuntimeError('A batch worker died')
+        chunks.append(s)
+        n -= len(s)
+    return ''.join(chunks)
+
+def _write(fd, s):
+    while s:
+        s = s[os.write(fd, s):]
+
+
+class _Worker:
+    """
+    A forked process which renders the spec indices written to its
+    task pipe and writes the png data or the traceback back
+    """
+    def __init__(self, specs, renderer, others):
+        taskr, self.tasks = os.pipe()
+        self.results, resultw = os.pipe()
+        self.ntasks = 0
+        self.pid = os.fork()
+        if self.pid:
+            os.close(taskr)
+            os.close(resultw)
+            return
+
+        status = 1
+        try:
+            try:
+                os.close(self.tasks)
+                os.close(self.results)
+                for other in others:
+                    os.close(other.tasks)
+                    os.close(other.results)
+                self._run(specs, renderer, taskr, resultw)
+                status = 0
+            except OSError, err:
+                # render_many stopped listening, eg another spec failed
+                if err.errno!=errno.EPIPE: traceback.print_exc()
+            except:
+                traceback.print_exc()
+        finally:
+            os._exit(status)
+
+    def _run(self, specs, renderer, taskr, resultw):
+        while 1:
+            s = os.read(taskr, 4)
+            if len(s)<4: break
+            i = struct.unpack('!l', s)[0]
+            if i<0: break
+            try:
+                data = renderer.render(specs[i])
+                failed = 0
+            except:
+                data = ''.join(traceback.format_exception(*sys.exc_info()))
+                failed = 1
+            _write(resultw, struct.pack(_header, i, failed, len(data)))
+            _write(resultw, data)
+
+    def send(self, i):
+        'render spec i'
+        _write(self.tasks, struct.pack('!l', i))
+        self.ntasks += 1
+
+    def receive(self):
+        'return the index, failed flag and data of the next result'
+        i, failed, n = struct.unpack(_header, _read(self.results, _headersize))
+        return i, failed, _read(self.results, n)
+
+    def close(self):
+        'stop the worker and wait for it'
+        try: _write(self.tasks, struct.pack('!l', -1))
+        except OSError: pass
+        os.close(self.tasks)
+        os.close(self.results)
+        os.waitpid(self.pid, 0)
+
+
+def render_many(specs, processes=None, figsize=None, dpi=None,
+                facecolor='w', edgecolor='w', maxtasks=None):
+    """
+    Render the sequence specs to png and generate (index, png)
+    tuples, where index is the position of the spec in specs and png
+    the png file contents as a string.
+
+    processes is the number of workers, by default one for each
+    processor.  With more than one, the figures are rendered in
+    forked processes and generated in the order they are finished.
+    With one, or where os.fork is not available, they are rendered
+    in order in this process.
+
+    figsize, dpi, facecolor and edgecolor set up the figure each spec
+    draws into; figsize and dpi default to the rc figure.figsize and
+    savefig.dpi.  A worker is replaced by a new one after maxtasks
+    figures if maxtasks is not None.
+
+    If a spec raises an exception, the workers are stopped and a
+    RuntimeError with the traceback from the worker is raised.
+    """
+    specs = list(specs)
+    if processes is None: processes = cpu_count()
+    processes = min(processes, len(specs))
+    warm()
+    renderer = BatchRenderer(figsize, dpi, facecolor, edgecolor)
+
+    if processes<=1 or not hasattr(os, 'fork'):
+        for i in range(len(specs)):
+            yield i, renderer.render(specs[i])
+        return
+
+    pending = range(len(specs)-1, -1, -1)
+    workers = []
+    try:
+        for k in range(processes):
+            worker = _Worker(specs, renderer, workers)
+            workers.append(worker)
+            worker.send(pending.pop())
+
+        while workers:
+            ready = select.select([w.results for w in workers], [], [])[0]
+            for worker in [w for w in workers if w.results in ready]:
+                i, failed, data = worker.receive()
+                if failed:
+                    raise RuntimeError(
+                        'Rendering spec %d failed in a batch worker:\n%s'
+                        % (i, data))
+
+                if maxtasks is not None and worker.ntasks>=maxtasks:
+                    workers.remove(worker)
+                    worker.close()
+                    if pending:
+                        worker = _Worker(specs, renderer, workers)
+                        workers.append(worker)
+                if pending:
+                    worker.send(pending.pop())
+                elif worker in workers:
+                    workers.remove(worker)
+                    worker.close()
+                yield i, data
+    except:
+        for worker in workers:
+            os.close(worker.tasks)
+            os.close(worker.results)
+            os.waitpid(worker.pid, 0)
+        raise
@@ -482,6 +482,55 @@ class maxdict(dict):
         dict.__setitem__(self, k, v)
         self._killkeys.append(k)        
 
+class lrudict(dict):
+    """
+    A dictionary with a maximum size that discards the least recently
+    used item when it is full.  Like maxdict, this only overrides
+    __getitem__, get and __setitem__, so use with caution
+    """
+    def __init__(self, maxsize):
+        dict.__init__(self)
+        self.maxsize = maxsize
+        self._keys = []
+    def __getitem__(self, k):
+        v = dict.__getitem__(self, k)
+        self._keys.remove(k)
+        self._keys.append(k)
+        return v
+    def get(self, k, default=None):
+        if self.has_key(k): return self[k]
+        return default
+    def __setitem__(self, k, v):
+        if self.has_key(k):
+            self._keys.remove(k)
+        elif len(self)>=self.maxsize:
+            dict.__delitem__(self, self._keys.pop(0))
+        dict.__setitem__(self, k, v)
+        self._keys.append(k)
+
+class countingdict(dict):
+    """
+    A dictionary with a maximum size which counts the hits and misses
+    of get; setting a new item when it is full empties it first.  Like
+    maxdict, this only overrides get and __setitem__
+    """
+    def __init__(self, maxsize):
+        dict.__init__(self)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+    def get(self, k, default=None):
+        try: v = dict.__getitem__(self, k)
+        except KeyError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return v
+    def __setitem__(self, k, v):
+        if len(self)>=self.maxsize and not self.has_key(k):
+            self.clear()
+        dict.__setitem__(self, k, v)
+
 
 
 class Stack:
@@ -121,3 +121,4 @@ class ScalarMappable:
         """
         for observer in self.observers:
             observer.notify(self)
+        if hasattr(self, 'pchanged'): self.pchanged()
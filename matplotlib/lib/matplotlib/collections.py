@@ -15,8 +15,38 @@ from backend_bases import GraphicsContextBase
 from cbook import is_string_like, iterable
 from colors import colorConverter, looks_like_color
 from cm import ScalarMappable
-from numerix import arange, sin, cos, pi, asarray, sqrt, array
-from transforms import identity_transform
+from numerix import arange, sin, cos, pi, asarray, sqrt, array, \
+     transpose, resize, zeros, Float, NewAxis
+from transforms import identity_transform, SpatialIndex
+
+
+def _is_none_color(c):
+    'return True if c is the string "None", used to turn edges off'
+    return is_string_like(c) and c=='None'
+
+def _offsets_array(offsets):
+    'return offsets, an x,y pair or a sequence of them, as an Nx2 array'
+    if offsets is None: return None
+    offsets = asarray(offsets, Float)
+    if len(offsets.shape)==1: offsets = offsets[NewAxis,:]
+    return offsets
+
+def _verts_array(seqs):
+    """
+    Return seqs, a sequence of sequences of x,y vertices, as an NxMx2
+    Float array if they all have the same length M, else as a list of
+    Mx2 Float arrays
+    """
+    if hasattr(seqs, 'shape') and len(seqs.shape)==3:
+        return asarray(seqs, Float)
+    arrays = []
+    for seq in seqs:
+        if len(seq): seq = asarray(seq, Float)
+        else: seq = zeros((0,2), Float)
+        arrays.append(seq)
+    if len(arrays) and len(dict([(len(a), 1) for a in arrays]))==1:
+        return array(arrays, Float)
+    return arrays
 
 class Collection(Artist):
     """
@@ -29,7 +59,10 @@ class Collection(Artist):
     than the number of elements of the collection.  A length 1
     property is shared by all the elements of the collection
 
-    All color args to a collection are sequences of rgba tuples
+    All color args to a collection are sequences of rgba tuples.  The
+    collections store them as Nx4 Float arrays, offsets as Nx2 and
+    vertices as NxMx2 Float arrays, which the renderers can read
+    without unpacking a python object for every number
     """
 
     def __init__(self):
@@ -42,20 +75,20 @@ class Collection(Artist):
 
     def _get_color(self, c, N=1):
         if looks_like_color(c):
-            return  [colorConverter.to_rgba(c)]*N
+            return resize(array(colorConverter.to_rgba(c), Float), (N, 4))
         elif iterable(c) and len(c) and iterable(c[0]) and len(c[0])==4:
             # looks like a tuple of rgba
-            return c
+            return asarray(c, Float)
         else:
             raise TypeError('c must be a matplotlib color arg or nonzero length sequence of rgba tuples')
 
     def _get_value(self, val):
-        try: return (float(val), )
+        try: return array((float(val),), Float)
         except TypeError:
             if iterable(val) and len(val):
                 try: float(val[0])
                 except TypeError: pass # raise below
-                else: return val
+                else: return asarray(val, Float)
 
         raise TypeError('val must be a float or nonzero sequence of floats')
 
@@ -101,18 +134,18 @@ class PatchCollection(Collection, ScalarMappable):
         Collection.__init__(self)
         ScalarMappable.__init__(self, norm, cmap)
 
-        if edgecolors is None: edgecolors =\
-           self._get_color(rcParams['patch.edgecolor'])
-        if facecolors is None: facecolors = \
-           self._get_color(rcParams['patch.facecolor'])
+        if edgecolors is None: edgecolors = rcParams['patch.edgecolor']
+        if facecolors is None: facecolors = rcParams['patch.facecolor']
         if linewidths is None: linewidths = ( rcParams['patch.linewidth'],)
         if antialiaseds is None: antialiaseds = ( rcParams['patch.antialiased'],)
 
+        if not _is_none_color(edgecolors):
+            edgecolors = self._get_color(edgecolors)
         self._edgecolors = edgecolors
-        self._facecolors  = facecolors
-        self._linewidths  = linewidths
-        self._antialiaseds = antialiaseds
-        self._offsets = offsets
+        self._facecolors  = self._get_color(facecolors)
+        self._linewidths  = self._get_value(linewidths)
+        self._antialiaseds = self._get_value(antialiaseds)
+        self._offsets = _offsets_array(offsets)
         self._transOffset = transOffset
 
 
@@ -125,6 +158,7 @@ class PatchCollection(Collection, ScalarMappable):
         ACCEPTS: float or sequence of floats
         """
         self._linewidths = self._get_value(lw)
+        self.pchanged()
 
     def set_color(self, c):
         """
@@ -146,6 +180,7 @@ class PatchCollection(Collection, ScalarMappable):
         ACCEPTS: matplotlib color arg or sequence of rgba tuples
         """
         self._facecolors = self._get_color(c, len(self._facecolors))
+        self.pchanged()
 
     def set_edgecolor(self, c):
         """
@@ -155,7 +190,13 @@ class PatchCollection(Collection, ScalarMappable):
 
         ACCEPTS: matplotlib color arg or sequence of rgba tuples
         """
-        self._edgecolors = self._get_color(c, len(self._edgecolors))
+        if _is_none_color(c):
+            self._edgecolors = c
+        elif _is_none_color(self._edgecolors):
+            self._edgecolors = self._get_color(c)
+        else:
+            self._edgecolors = self._get_color(c, len(self._edgecolors))
+        self.pchanged()
 
     def set_alpha(self, alpha):
         """
@@ -169,9 +210,12 @@ class PatchCollection(Collection, ScalarMappable):
         except TypeError: raise TypeError('alpha must be a float')
         else:
             Artist.set_alpha(self, alpha)
-            self._facecolors = [(r,g,b,alpha) for r,g,b,a in self._facecolors]
-            if self._edgecolors != 'None':
-                self._edgecolors = [(r,g,b,alpha) for r,g,b,a in self._edgecolors]
+            self._facecolors = array(self._facecolors, Float)
+            self._facecolors[:,3] = alpha
+            if not _is_none_color(self._edgecolors):
+                self._edgecolors = array(self._edgecolors, Float)
+                self._edgecolors[:,3] = alpha
+        self.pchanged()
 
     def update_scalarmappable(self):
         """
@@ -181,7 +225,7 @@ class PatchCollection(Collection, ScalarMappable):
         if self._A is None: return
         if len(self._A.shape)>1:
             raise ValueError('PatchCollections can only map rank 1 arrays')
-        self._facecolors = self.to_rgba(self._A, self._alpha)
+        self._facecolors = asarray(self.to_rgba(self._A, self._alpha), Float)
         #print self._A.shape, type(R), R.shape
         #self._facecolors = [(r,g,b,a) for r,g,b,a in R]
 
@@ -241,11 +285,17 @@ class PolyCollection(PatchCollection):
     def __init__(self, verts, **kwargs):
         """
         verts is a sequence of ( verts0, verts1, ...) where verts_i is
-        a sequence of xy tuples of vertices.
+        a sequence of xy tuples of vertices, or an NxMx2 array of N
+        polygons of M vertices.
         See PatchCollection for kwargs.
         """
         PatchCollection.__init__(self,**kwargs)
-        self._verts = verts
+        self.set_verts(verts)
+
+    def set_verts(self, verts):
+        'set the sequence of polygon vertex sequences'
+        self._verts = _verts_array(verts)
+        self.pchanged()
 
     def draw(self, renderer):
         if not self.get_visible(): return
@@ -253,7 +303,7 @@ class PolyCollection(PatchCollection):
         self._transform.freeze()
         self._transOffset.freeze()
         self.update_scalarmappable()
-        if self._edgecolors == 'None':
+        if _is_none_color(self._edgecolors):
             self._edgecolors = self._facecolors
         renderer.draw_poly_collection(
             self._verts, self._transform, self.clipbox,
@@ -304,13 +354,13 @@ class RegularPolyCollection(PatchCollection):
         scaling.
         """
         PatchCollection.__init__(self,**kwargs)
-        self._sizes = asarray(sizes)
+        self._sizes = asarray(sizes, Float)
         self._dpi = dpi
 
         r = 1.0/math.sqrt(math.pi)  # unit area
 
         theta = (2*math.pi/numsides)*arange(numsides) + rotation
-        self._verts = zip( r*sin(theta), r*cos(theta) )
+        self._verts = transpose(array([r*sin(theta), r*cos(theta)], Float))
 
 
 
@@ -322,7 +372,7 @@ class RegularPolyCollection(PatchCollection):
         self.update_scalarmappable()
         scales = sqrt(self._sizes*self._dpi.get()/72.0)
 
-        if self._edgecolors == 'None':
+        if _is_none_color(self._edgecolors):
             self._edgecolors = self._facecolors
 
         renderer.draw_regpoly_collection(
@@ -364,7 +414,8 @@ class LineCollection(Collection):
                  ):
         """
         segments is a sequence of ( line0, line1, line2), where
-        linen = (x0, y0), (x1, y1), ... (xm, ym).
+        linen = (x0, y0), (x1, y1), ... (xm, ym), or an NxMx2 array
+        of N lines of M points.
         Each line can be a different length.
 
         colors must be a tuple of RGBA tuples (eg arbitrary color
@@ -397,35 +448,66 @@ class LineCollection(Collection):
             linewidths   = (rcParams['lines.linewidth'], )
 
         if colors is None       :
-            colors       = self._get_color(rcParams['lines.color'])
+            colors       = rcParams['lines.color']
         if antialiaseds is None :
             antialiaseds = (rcParams['lines.antialiased'], )
 
-        self._segments = list(segments)
-        self._colors = colors
-        self._aa = antialiaseds
-        self._lw = linewidths
+        self.set_segments(segments)
+        self._colors = self._get_color(colors)
+        self._aa = self._get_value(antialiaseds)
+        self._lw = self._get_value(linewidths)
         self.set_linestyle(linestyle)
         if transOffset is None:
             if offsets is not None:
                 self._add_offsets(offsets)
                 offsets = None
             transOffset = identity_transform()
-        self._offsets = offsets
+        self._offsets = _offsets_array(offsets)
         self._transOffset = transOffset
 
+    def set_segments(self, segments):
+        'set the sequence of line segments; see __init__'
+        self._segments = _verts_array(segments)
+        self._spatialIndexes = None
+        self.pchanged()
+
+    def get_segments(self):
+        'return the line segments, as an NxMx2 array or a list of Mx2 arrays'
+        return self._segments
+
     def _add_offsets(self, offsets):
         segs = self._segments
         Nsegs = len(segs)
-        Noffs = len(offsets)
-        if not iterable(offsets[0]):  # i.e., not a tuple but an x-offset
-            xo, yo = offsets
-            for i in range(Nsegs):
-                segs[i] = [(x+xo*i, y+yo*i) for x,y in segs[i]]
+        if not Nsegs: return
+        offsets = asarray(offsets, Float)
+        if len(offsets.shape)==1:  # i.e., not a tuple but an x-offset
+            offsets = arange(Nsegs)[:,NewAxis]*offsets[NewAxis,:]
+        offsets = resize(offsets, (Nsegs, 2))
+        if hasattr(segs, 'shape'):
+            self._segments = segs + offsets[:,NewAxis,:]
         else:
-            for i in range(Nsegs):
-                xo, yo = offsets[i%Noffs]
-                segs[i] = [(x+xo, y+yo) for x,y in segs[i]]
+            self._segments = [seg+offset for seg, offset in zip(segs, offsets)]
+        self._spatialIndexes = None
+
+    def get_spatial_indexes(self):
+        """
+        Return a display space SpatialIndex of the connected vertices
+        of each non-empty segment.  The indexes are cached until the
+        transform or the segments change
+        """
+        key = self._get_transform_key()
+        if self._spatialIndexes is not None:
+            oldkey, indexes = self._spatialIndexes
+            if oldkey==key: return indexes
+
+        trans = self.get_transform()
+        indexes = []
+        for seg in self._segments:
+            if not len(seg): continue
+            tseg = trans.numerix_xy(seg)
+            indexes.append(SpatialIndex(tseg[:,0], tseg[:,1], True))
+        self._spatialIndexes = key, indexes
+        return indexes
 
 
     def draw(self, renderer):
@@ -451,6 +533,7 @@ class LineCollection(Collection):
         """
 
         self._lw = self._get_value(lw)
+        self.pchanged()
 
     def set_linestyle(self, ls):
         """
@@ -465,6 +548,7 @@ class LineCollection(Collection):
 
 
         self._ls = dashes
+        self.pchanged()
 
     def set_color(self, c):
         """
@@ -476,6 +560,7 @@ class LineCollection(Collection):
         ACCEPTS: matplotlib color arg or sequence of rgba tuples
         """
         self._colors = self._get_color(c, len(self._colors))
+        self.pchanged()
 
     def color(self, c):
         """
@@ -502,7 +587,9 @@ class LineCollection(Collection):
         except TypeError: raise TypeError('alpha must be a float')
         else:
             Artist.set_alpha(self, alpha)
-            self._colors = [(r,g,b,alpha) for r,g,b,a in self._colors]
+            self._colors = array(self._colors, Float)
+            self._colors[:,3] = alpha
+        self.pchanged()
 
     def get_linewidth(self):
         return self._lw
@@ -32,7 +32,7 @@ import re
 
 from numerix import array, arange, take, put, Float, Int, where, \
      zeros, asarray, sort, searchsorted, sometrue, ravel, divide,\
-     clip, ones, typecode, typecodes
+     clip, ones, typecode, typecodes, UInt8
 from numerix.mlab import amin, amax
 import numerix.ma as ma
 from cbook import enumerate, is_string_like, iterable
@@ -521,6 +521,18 @@ class Colormap:
         #print rgba[0,1:10,:]       # Now the same for numpy, numeric...
         return rgba
 
+    def _lut_bytes(self, alpha=1.0):
+        """
+        Return the lookup table as an N+3 x 4 UInt8 array, the N colors
+        with the given alpha followed by the under, over and bad colors.
+        The bytes are those _image.fromarray makes of the floats
+        __call__ returns.
+        """
+        if not self._isinit: self._init()
+        lut = array(self._lut)
+        lut[:-3, -1] = min(max(alpha, 0.0), 1.0)
+        return (255*lut).astype(UInt8)
+
     def set_bad(self, color = 'k', alpha = 0.0):
         self._rgba_bad = colorConverter.to_rgba(color, alpha)
         if self._isinit: self._set_extremes()
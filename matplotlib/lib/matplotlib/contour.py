@@ -327,10 +327,11 @@ class ContourLabeler:
                                           colors,
                                           self.label_cvalues, fslist):
             con = self.collections[icon]
-            toremove = []
-            toadd = []
+            segments = []
             lw = self.get_label_width(lev, fmt, fsize)
-            for segNum, linecontour in enumerate(con._segments):
+            for linecontour in con.get_segments():
+                linecontour = [tuple(xy) for xy in linecontour]
+                segments.append(linecontour)
                 # for closed contours add one more point to
                 # avoid division by zero
                 if linecontour[0] == linecontour[-1]:
@@ -352,13 +353,9 @@ class ContourLabeler:
                     if inline:
                         new = self.break_linecontour(linecontour, rotation,
                                                        lw, ind)
-                        toadd.extend(new)
-                        #for c in new: toadd.append(c)
-                        toremove.append(linecontour)
-            for c in toremove:
-                con._segments.remove(c)
-            for c in toadd:
-                con._segments.append(c)
+                        segments.pop()
+                        segments.extend(new)
+            con.set_segments(segments)
 
 
 
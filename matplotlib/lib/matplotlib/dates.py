@@ -86,14 +86,18 @@ except ImportError:
 
 from cbook import iterable, is_string_like
 from pytz import timezone
-from numerix import arange, asarray
+from pytz.tzinfo import StaticTzInfo, DstTzInfo
+from numerix import arange, asarray, around, clip, equal, \
+     floor, ravel, searchsorted, take, where, Float, Int
 from ticker import Formatter, Locator, Base
 from dateutil.rrule import rrule, MO, TU, WE, TH, FR, SA, SU, YEARLY,\
      MONTHLY, WEEKLY, DAILY, HOURLY, MINUTELY, SECONDLY
 from dateutil.relativedelta import relativedelta
-import dateutil.parser
 
 UTC = timezone('UTC')
+_epoch = datetime.datetime(1970, 1, 1)
+_epoch_utc = datetime.datetime(1970, 1, 1, tzinfo=UTC)
+EPOCH_ORDINAL = 719163   # the Gregorian ordinal of 1970-01-01
 
 def _get_rc_timezone():
     s = matplotlib.rcParams['timezone']
@@ -164,28 +168,319 @@ def _from_ordinalf(x, tz=None):
 
     return dt
 
+def _to_ordinalf_seq(d):
+    """
+    convert a sequence of datetimes to an array of UTC float days.
+    Each datetime minus the epoch gives its days, seconds and
+    microseconds in one C call; the rest is array arithmetic
+    """
+    d = list(d)
+    if not len(d): return asarray([], Float)
+    if getattr(d[0], 'tzinfo', None) is None: epoch = _epoch
+    else: epoch = _epoch_utc
+    try:
+        deltas = [dt - epoch for dt in d]
+    except TypeError:
+        # dates, or naive and aware datetimes mixed
+        return asarray([_to_ordinalf(dt) for dt in d], Float)
+    t = asarray([(delta.days, delta.seconds, delta.microseconds)
+                 for delta in deltas], Float)
+    return (EPOCH_ORDINAL + t[:,0] + t[:,1]/SECONDS_PER_DAY +
+            t[:,2]/MUSECONDS_PER_DAY)
+
+_utcoffset_tables = {}
+def _get_utcoffset_table(tz):
+    """
+    Return the UTC transition times of the pytz timezone tz as an
+    array of float days, the UTC offsets in microseconds from each
+    transition on and the list of the tzinfo instances in effect, or
+    None if tz is not a pytz StaticTzInfo or DstTzInfo.  The tables
+    are cached by the class of tz, which the tzinfos of a zone share
+    """
+    key = tz.__class__
+    table = _utcoffset_tables.get(key)
+    if table is not None: return table
+
+    if isinstance(tz, StaticTzInfo):
+        transitions = [1.]
+        offsets = [tz.utcoffset(None)]
+        tzinfos = [tz]
+    elif isinstance(tz, DstTzInfo):
+        seconds = getattr(tz, '_utc_transition_seconds', None)
+        if seconds is not None:
+            transitions = [EPOCH_ORDINAL + s/SECONDS_PER_DAY for s in seconds]
+        else:
+            transitions = [_to_ordinalf(dt) for dt in tz._utc_transition_times]
+        offsets = [inf[0] for inf in tz._transition_info]
+        tzinfos = [tz._tzinfos[inf] for inf in tz._transition_info]
+    else:
+        return None
+
+    offsets = [delta.days*MUSECONDS_PER_DAY + delta.seconds*1e6 +
+               delta.microseconds for delta in offsets]
+    # a last transition no date reaches, for the searchsorted in
+    # _from_ordinalf_seq
+    table = (asarray(transitions + [1e300], Float), asarray(offsets, Float),
+             tzinfos)
+    _utcoffset_tables[key] = table
+    return table
+
+def _civil_from_ordinal(ix):
+    """
+    Return the year, month and day arrays of the float array ix of
+    whole Gregorian ordinals; the arithmetic is that of the proleptic
+    Gregorian calendar in 400 year eras, starting on March 1
+    """
+    z = ix + 305.        # days since 0000-03-01
+    era = floor(z/146097.)
+    doe = z - era*146097.
+    yoe = floor((doe - floor(doe/1460.) + floor(doe/36524.) -
+                 floor(doe/146096.))/365.)
+    doy = doe - (365.*yoe + floor(yoe/4.) - floor(yoe/100.))
+    mp = floor((5.*doy + 2.)/153.)
+    day = doy - floor((153.*mp + 2.)/5.) + 1.
+    month = mp + where(mp<10., 3., -9.)
+    year = yoe + era*400. + (month<=2.)
+    return year, month, day
+
+def _from_ordinalf_seq(x, tz):
+    """
+    convert a sequence of Gregorian floats to a list of datetimes in
+    the timezone tz.  The local times are computed with array
+    arithmetic from the cached UTC offset table of tz, rounded to the
+    microsecond like _from_ordinalf
+    """
+    table = _get_utcoffset_table(tz)
+    if table is None:
+        return [_from_ordinalf(val, tz) for val in x]
+    transitions, offsets, tzinfos = table
+
+    x = ravel(asarray(x, Float))
+    if not len(x): return []
+    # the transition in effect: searchsorted puts a time equal to a
+    # transition before it, but the transition has happened then
+    ind = searchsorted(transitions, x)
+    ind = ind + equal(take(transitions, ind), x)
+    ind = clip(ind-1, 0, len(offsets)-1)
+
+    day = floor(x)
+    mus = around((x-day)*MUSECONDS_PER_DAY)
+    # compensate for rounding errors
+    frac = mus - floor(mus/1e6)*1e6
+    mus = where(frac<10., mus-frac, mus)
+    mus = where(frac>999990., mus+1e6-frac, mus)
+    mus = mus + take(offsets, ind)
+    carry = floor(mus/MUSECONDS_PER_DAY)
+    day = day + carry
+    mus = mus - carry*MUSECONDS_PER_DAY
+
+    year, month, mday = _civil_from_ordinal(day)
+    hour = floor(mus/3.6e9)
+    mus = mus - hour*3.6e9
+    minute = floor(mus/6e7)
+    mus = mus - minute*6e7
+    second = floor(mus/1e6)
+    mus = mus - second*1e6
+
+    fields = [a.astype(Int).tolist() for a in
+              (year, month, mday, hour, minute, second, mus)]
+    fields.append([tzinfos[i] for i in ind.tolist()])
+    return map(datetime.datetime, *fields)
+
+def _ordinal_from_civil(year, month, day):
+    """
+    Return the float array of the Gregorian ordinals of the year,
+    month and day float arrays; the inverse of _civil_from_ordinal
+    """
+    year = year - (month<=2.)
+    era = floor(year/400.)
+    yoe = year - era*400.
+    mp = where(month>2., month-3., month+9.)
+    doy = floor((153.*mp + 2.)/5.) + day - 1.
+    doe = 365.*yoe + floor(yoe/4.) - floor(yoe/100.) + doy
+    return era*146097. + doe - 305.
+
+
+# The date string formats datestr2num recognizes without dateutil,
+# as regular expressions with named groups for the fields.  They
+# parse as dateutil.parser.parse does, which handles everything else
+_datestr_time = (r'(?:(?:[ \t]+|T)(?P<hour>\d{1,2}):(?P<minute>\d\d)'
+                 r'(?::(?P<second>\d\d)(?:\.(?P<fraction>\d+))?)?'
+                 r'(?:[ \t]*(?P<tzsign>[+-])(?P<tzhour>\d\d):?(?P<tzminute>\d\d))?)?')
+_datestr_formats = [re.compile(r'^[ \t]*%s%s[ \t]*$' % (date, _datestr_time), re.M)
+                    for date in (
+    r'(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})',
+    r'(?P<year>\d{4})/(?P<month>\d{1,2})/(?P<day>\d{1,2})',
+    r'(?P<month>\d{1,2})/(?P<day>\d{1,2})/(?P<year>\d{4}|\d\d)',
+    r'(?P<day>\d{1,2})[- ](?P<monthname>[A-Za-z]{3,9})[- ](?P<year>\d{4}|\d\d)',
+    r'(?P<monthname>[A-Za-z]{3,9})[ \t]+(?P<day>\d{1,2}),?[ \t]+(?P<year>\d{4})',
+    r'(?P<year>\d{4})(?P<month>\d\d)(?P<day>\d\d)',
+    )]
+_datestr_fields = ('year', 'month', 'day', 'hour', 'minute', 'second',
+                   'fraction', 'tzsign', 'tzhour', 'tzminute')
+
+_monthnames = {}
+for i, name in enumerate(('january', 'february', 'march', 'april', 'may',
+                          'june', 'july', 'august', 'september', 'october',
+                          'november', 'december')):
+    _monthnames[name] = _monthnames[name[:3]] = i+1
+_monthnames['sept'] = 9
+
+# the format of the last date string datestr2num parsed, tried first
+_last_datestr_format = _datestr_formats[0]
+
+def _datestr_format(strings):
+    'Return the first format matching all of strings, or None'
+    for format in _datestr_formats:
+        for s in strings:
+            if format.match(s) is None: break
+        else:
+            return format
+    return None
+
+def _datestr_matches(format, strings):
+    """
+    Return the field tuples of the strings matching format, in the
+    order of _datestr_fields, and the indices of the strings which
+    do not match it
+    """
+    groups = [format.groupindex.get(name) for name in _datestr_fields]
+    monthname = format.groupindex.get('monthname')
+    if monthname is not None: groups[1] = monthname
+
+    text = '\n'.join(strings)
+    if text.count('\n')==len(strings)-1:
+        # all the strings in one findall when they all match
+        matches = format.findall(text)
+        if len(matches)==len(strings):
+            return [tuple([g and m[g-1] or '' for g in groups])
+                    for m in matches], []
+
+    fields = []
+    failed = []
+    for i, s in enumerate(strings):
+        m = format.match(s)
+        if m is None or '\n' in s:
+            failed.append(i)
+            fields.append(None)
+        else:
+            m = m.groups()
+            fields.append(tuple([g and m[g-1] or '' for g in groups]))
+    return fields, failed
+
+def _convert_year(year):
+    'The 4 digit year of the 2 digit year, as dateutil guesses it'
+    thisyear = time.localtime()[0]
+    year += thisyear//100*100
+    if abs(year-thisyear)>=50:
+        if year<thisyear: year += 100
+        else: year -= 100
+    return year
+
+def _int_column(values):
+    'a float array of the digit strings values, with 0 for empty ones'
+    try:
+        return asarray(map(int, values), Float)
+    except ValueError:
+        return asarray([int(v or 0) for v in values], Float)
+
+def _fields_to_num(fields):
+    """
+    Convert the field tuples of _datestr_matches to an array of float
+    days and an array which is 0 where the fields are not a valid date
+    """
+    (year, month, day, hour, minute, second, fraction,
+     tzsign, tzhour, tzminute) = zip(*fields)
+
+    # the years are converted to ints first, since only numpy makes
+    # floats of digit strings
+    if min(map(len, year))==2:
+        year = [len(y)==2 and _convert_year(int(y)) or int(y) for y in year]
+    else:
+        year = map(int, year)
+    year = asarray(year, Float)
+    try:
+        month = asarray(map(int, month), Float)
+    except ValueError:
+        month = asarray([_monthnames.get(m.lower(), 0) for m in month], Float)
+    day = _int_column(day)
+    hour = _int_column(hour)
+    minute = _int_column(minute)
+    second = _int_column(second)
+    mus = asarray([int((f+'000000')[:6]) for f in fraction], Float)
+    offset = asarray([(s=='-' and -1 or 1)*(int(h or 0)*60 + int(m or 0))
+                      for s, h, m in zip(tzsign, tzhour, tzminute)], Float)
+
+    # the calendar arithmetic accepts eg Feb 30 as Mar 2; only the
+    # dates it gives back unchanged are valid
+    ordinal = _ordinal_from_civil(year, month, day)
+    y, m, d = _civil_from_ordinal(ordinal)
+    valid = (equal(y, year)*equal(m, month)*equal(d, day)*
+             (hour<24.)*(minute<60.)*(second<60.))
+    num = ordinal + (hour/HOURS_PER_DAY + (minute-offset)/MINUTES_PER_DAY +
+                     second/SECONDS_PER_DAY + mus/MUSECONDS_PER_DAY)
+    return num, valid
+
 def datestr2num(d):
     """
-    Convert a date string to a datenum using dateutil.parser.parse
-    d can be a single string or a sequence of strings
+    Convert a date string to a datenum.  d can be a single string or
+    a sequence of strings; for a list the return value is a list, and
+    for other sequences an array.
+
+    The common numeric formats, eg 2005-01-31 13:45:00 or 01/31/2005,
+    and day month name year dates like 31-Jan-2005 are parsed
+    directly; the format of a sequence is found from its first
+    strings.  Strings in any other format are parsed with
+    dateutil.parser.parse
     """
+    global _last_datestr_format
     if is_string_like(d):
-        dt = dateutil.parser.parse(d)
-        return date2num(dt)
+        strings = [d]
+        format = _last_datestr_format
+        if format.match(d) is None: format = _datestr_format(strings)
+    else:
+        strings = list(d)
+        format = _datestr_format(strings[:20])
+
+    if format is None:
+        failed = range(len(strings))
+        num = asarray([0.]*len(strings), Float)
     else:
-        return date2num([dateutil.parser.parse(s) for s in d])
+        _last_datestr_format = format
+        fields, failed = _datestr_matches(format, strings)
+        for i in failed:
+            fields[i] = ('1970', '1', '1') + ('',)*7   # a placeholder
+        if fields:
+            num, valid = _fields_to_num(fields)
+            failed = failed + [i for i, v in enumerate(valid) if not v]
+        else:
+            num = asarray([], Float)
+
+    if failed:
+        import dateutil.parser  # the parser is slow to import
+        num = num.tolist()
+        for i in failed:
+            num[i] = date2num(dateutil.parser.parse(strings[i]))
+        num = asarray(num, Float)
+
+    if is_string_like(d): return num[0]
+    if isinstance(d, list): return num.tolist()
+    return num
     
     
 def date2num(d):
     """
     d is either a datetime instance or a sequence of datetimes
 
-    return value is a floating point number (or sequence of floats)
-    which gives number of days (fraction part represents hours,
-    minutes, seconds) since 0001-01-01 00:00:00 UTC
+    return value is a floating point number (or a list of floats for
+    a list, an array of floats for other sequences) which gives number
+    of days (fraction part represents hours, minutes, seconds) since
+    0001-01-01 00:00:00 UTC
     """
     if not iterable(d): return _to_ordinalf(d)
-    else: return [_to_ordinalf(val) for val in d]
+    nums = _to_ordinalf_seq(d)
+    if isinstance(d, list): return nums.tolist()
+    return nums
 
 
 def num2date(x, tz=None):
@@ -196,11 +491,13 @@ def num2date(x, tz=None):
     Return value is a datetime instance in timezone tz (default to
     rcparams TZ value)
 
-    if x is a sequence, a sequence of datetimes will be returned
+    if x is a sequence or array, a list of datetimes will be
+    returned; for pytz timezones their local times are computed with
+    array arithmetic
     """
     if tz is None: tz = _get_rc_timezone()
     if not iterable(x): return _from_ordinalf(x, tz)
-    else: return [_from_ordinalf(val, tz) for val in x]
+    else: return _from_ordinalf_seq(x, tz)
 
 def drange(dstart, dend, delta):
     """
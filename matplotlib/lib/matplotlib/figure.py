@@ -1,7 +1,7 @@
 """
 Figure class -- add docstring here!
 """
-import sys
+import math, sys
 from artist import Artist
 from axes import Axes, Subplot, PolarSubplot, PolarAxes
 from cbook import flatten, allequal, popd, Stack, iterable
@@ -14,6 +14,7 @@ from text import Text, _process_text_args
 
 from legend import Legend
 from transforms import Bbox, Value, Point, get_bbox_transform, unit_bbox
+from transforms import lbwh_to_bbox
 from numerix import array, clip, transpose, minimum, maximum
 from mlab import linspace, meshgrid
 from ticker import FormatStrFormatter
@@ -143,8 +144,10 @@ class Figure(Artist):
             linewidth=linewidth,
             )
         self._set_artist_props(self.figurePatch)
+        self.figurePatch.add_callback(self._artist_changed)
 
         self._hold = rcParams['axes.hold']
+        self._incremental = rcParams['figure.incremental']
         self.canvas = None
 
         if subplotpars is None:
@@ -235,6 +238,7 @@ class Figure(Artist):
         im.set_alpha(alpha)
         if norm is None:
             im.set_clim(vmin, vmax)
+        im.add_callback(self._artist_changed)
         self.images.append(im)
         return im
 
@@ -488,6 +492,8 @@ class Figure(Artist):
         self.texts=[]
         self.images = []
         self.legends = []
+        self._drawcache = None
+        self._dirty = True
 
     def clear(self):
         """
@@ -505,6 +511,32 @@ class Figure(Artist):
         renderer.open_group('figure')
         self.transFigure.freeze()  # eval the lazy objects
 
+        if rcParams['text.usetex']:
+            # let the renderer run tex once for all the strings
+            renderer.prepare_tex(self._get_tex_strings())
+
+        # render the background and the axes
+        if self._incremental and hasattr(renderer, 'copy_from_bbox'):
+            self._draw_incremental(renderer)
+        else:
+            self._draw_background(renderer)
+            for a in self.axes: a.draw(renderer)
+
+        # render the figure text
+        for t in self.texts: t.draw(renderer)
+
+        for legend in self.legends:
+            legend.draw(renderer)
+
+        self.transFigure.thaw()  # release the lazy objects
+        renderer.close_group('figure')
+
+        self._cachedRenderer = renderer
+
+        self.canvas.draw_event(renderer)
+
+    def _draw_background(self, renderer):
+        'draw the figure frame, patches, lines and images under the axes'
         if self.frameon: self.figurePatch.draw(renderer)
 
         for p in self.patches: p.draw(renderer)
@@ -524,22 +556,94 @@ class Figure(Artist):
             l, b, w, h = self.bbox.get_bounds()
             renderer.draw_image(0, 0, im, self.bbox)
 
-
-        # render the axes
-        for a in self.axes: a.draw(renderer)
-
-        # render the figure text
-        for t in self.texts: t.draw(renderer)
-
+    def _draw_incremental(self, renderer):
+        """
+        Restore the rasters of the background and of the axes which
+        have not changed since the last draw, and draw the others and
+        cache their rasters.  An axes is drawn if it is dirty, or if
+        it overlaps an axes drawn before it, which would cover it
+        """
+        state = self._get_draw_state()
+        if self._dirty or self._drawcache is None or self._drawcache[0]!=state:
+            self._draw_background(renderer)
+            background = renderer.copy_from_bbox(self.bbox)
+            axstates = {}
+        else:
+            background, axstates = self._drawcache[1:]
+            renderer.restore_region(background)
+
+        drawn = []   # the regions drawn into so far
+        newstates = {}
+        for a in self.axes:
+            old = axstates.get(a)
+            if (old is not None and not a._dirty and
+                old[0]==a._get_draw_state() and
+                not [bbox for bbox in drawn if bbox.overlaps(old[1])]):
+                renderer.restore_region(old[2])
+                newstates[a] = old
+                continue
+
+            a.draw(renderer)
+            a._dirty = False
+            bbox = self._get_region_bbox(a._get_drawn_bbox(renderer))
+            newstates[a] = (a._get_draw_state(), bbox,
+                            renderer.copy_from_bbox(bbox))
+            drawn.append(bbox)
+            if old is not None: drawn.append(old[1])
+
+        self._drawcache = state, background, newstates
+        self._dirty = False
+
+    def _get_region_bbox(self, bbox):
+        """
+        Return bbox padded by the tick length, rounded out to whole
+        pixels and clipped to the figure
+        """
+        pad = 4*self.dpi.get()/72.0
+        l = max(0, math.floor(bbox.xmin()-pad))
+        b = max(0, math.floor(bbox.ymin()-pad))
+        r = min(self.bbox.width(), math.ceil(bbox.xmax()+pad))
+        t = min(self.bbox.height(), math.ceil(bbox.ymax()+pad))
+        return lbwh_to_bbox(l, b, max(1, r-l), max(1, t-b))
+
+    def _get_draw_state(self):
+        'return the state the cached background was drawn with'
+        return (self.bbox.get_bounds(), self.dpi.get(), self.frameon,
+                [id(a) for a in self.axes], len(self.patches),
+                len(self.lines), len(self.images))
+
+    def _artist_changed(self, a):
+        self._dirty = True
+
+    def set_incremental(self, b):
+        """
+        Set whether draw caches a raster of the background and of each
+        axes, so the next draw restores the axes which have not changed
+        instead of drawing them again.  The renderer must support
+        copy_from_bbox and restore_region, eg Agg; with others the
+        figure is always drawn in full.  See Axes.set_dirty
+
+        ACCEPTS: True | False
+        """
+        self._incremental = b
+        self._drawcache = None
+
+    def get_incremental(self):
+        'return whether the figure draws incrementally'
+        return self._incremental
+
+    def _get_tex_strings(self):
+        """
+        Return a list of (tex, fontsize) for the text that draw will
+        render
+        """
+        texts = self.texts[:]
+        for a in self.axes:
+            texts.extend(a._get_drawn_texts())
         for legend in self.legends:
-            legend.draw(renderer)
-
-        self.transFigure.thaw()  # release the lazy objects
-        renderer.close_group('figure')
-
-        self._cachedRenderer = renderer
-
-        self.canvas.draw_event(renderer)
+            texts.extend(legend.texts)
+        return [(t.get_text(), t.get_size()) for t in texts
+                if t.get_visible() and t.get_text()]
 
     def draw_artist(self, a):
         'draw artist only -- this is available only after the figure is drawn'
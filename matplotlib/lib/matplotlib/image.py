@@ -4,18 +4,68 @@ operations.
 
 """
 from __future__ import division
-import sys, os
+import sys, os, math
 from matplotlib import rcParams
 from artist import Artist
-from colors import normalize, colorConverter
+from colors import normalize, colorConverter, Colormap
 import cm
 import numerix
 import numerix.ma as ma
-from numerix import arange, asarray, UInt8, Float32, repeat, NewAxis, typecode
+from numerix import arange, asarray, UInt8, Float32, repeat, NewAxis, \
+     typecode, maximum, floor, Float, Int8, Int16, UInt16, Int32, UInt32, Int
 import _image
 
 
 
+def _fromscalars(mappable, A, isoutput):
+    """
+    Return an _image.Image of the array A colored by the ScalarMappable
+    mappable.  If its norm is a normalize and its cmap a Colormap which
+    maps with its lookup table, _image.fromscalars normalizes and looks
+    up the colors in one pass, without the float rgba array to_rgba
+    makes; other norms, colormaps and rgb(a) arrays go through to_rgba.
+    """
+    norm, cmap = mappable.norm, mappable.cmap
+    if (len(A.shape)!=2 or norm.__class__ is not normalize or
+        not isinstance(cmap, Colormap) or
+        cmap.__class__.__call__.im_func is not Colormap.__call__.im_func):
+        return _image.fromarray(mappable.to_rgba(A, mappable._alpha), isoutput)
+
+    A = ma.asarray(A)
+    norm.autoscale(A)
+    vmin, vmax = float(norm.vmin), float(norm.vmax)
+    if vmin > vmax:
+        raise ValueError("minvalue must be less than or equal to maxvalue")
+    return _image.fromscalars(ma.filled(A, 0), ma.getmaskorNone(A),
+                              vmin, vmax, norm.clip,
+                              cmap._lut_bytes(mappable._alpha), isoutput)
+
+
+def _reduce(A, reduction):
+    """
+    Return the array A decimated by 2 in its rows and columns, each
+    pixel the mean or the max, as reduction is 'mean' or 'max', of a
+    2x2 block of A.  An odd last row or column is dropped.
+    """
+    rows, cols = A.shape[0]//2*2, A.shape[1]//2*2
+    a = A[0:rows:2, 0:cols:2]
+    b = A[1:rows:2, 0:cols:2]
+    c = A[0:rows:2, 1:cols:2]
+    d = A[1:rows:2, 1:cols:2]
+    if reduction=='max':
+        if ma.isMaskedArray(A): return ma.maximum(ma.maximum(a, b),
+                                                  ma.maximum(c, d))
+        return maximum(maximum(a, b), maximum(c, d))
+    tc = typecode(A)
+    if tc not in (Int8, UInt8, Int16, UInt16, Int32, UInt32, Int):
+        return ((a+b+c+d)*0.25).astype(tc)
+    # sum integers as floats, which do not overflow, and round
+    a, b, c, d = [x.astype(Float) for x in (a, b, c, d)]
+    mean = (a+b+c+d)*0.25 + 0.5
+    if ma.isMaskedArray(A): return ma.floor(mean).astype(tc)
+    return floor(mean).astype(tc)
+
+
 class AxesImage(Artist, cm.ScalarMappable):
 
     def __init__(self, ax,
@@ -27,6 +77,7 @@ class AxesImage(Artist, cm.ScalarMappable):
                  extent=None,
                  filternorm=1,
                  filterrad=4.0,
+                 pyramid=None,
                  ):
 
         """
@@ -39,6 +90,8 @@ class AxesImage(Artist, cm.ScalarMappable):
         registered with data plots.  Default is the image dimensions
         in pixels
 
+        pyramid is None, 'mean' or 'max'; see set_pyramid
+
         """
         Artist.__init__(self)
         cm.ScalarMappable.__init__(self, norm, cmap)
@@ -48,6 +101,10 @@ class AxesImage(Artist, cm.ScalarMappable):
         self._extent = extent
         self.set_filternorm(filternorm)
         self.set_filterrad(filterrad)
+        self._pyramid = None
+        self._levels = None
+        self._imcachekey = None
+        self.set_pyramid(pyramid)
 
 
         # map interpolation strings to module constants
@@ -119,37 +176,11 @@ class AxesImage(Artist, cm.ScalarMappable):
         cm.ScalarMappable.changed(self)
 
     def make_image(self):
-        if self._A is not None:
-            if self._imcache is None:
-                if typecode(self._A) == UInt8:
-                    im = _image.frombyte(self._A, 0)
-                else:
-                    x = self.to_rgba(self._A, self._alpha)
-                    im = _image.fromarray(x, 0)
-                self._imcache = im
-            else:
-                im = self._imcache
-        else:
+        if self._A is None:
             raise RuntimeError('You must first set the image array or the image attribute')
 
-
-        bg = colorConverter.to_rgba(self.axes.get_frame().get_facecolor(), 0)
-
-        if self.origin=='upper':
-            im.flipud_in()
-
-        im.set_bg( *bg)
-        im.is_grayscale = (self.cmap.name == "gray" and
-                           len(self._A.shape) == 2)
-
-        im.set_aspect(self._aspectd[self._aspect])
-        im.set_interpolation(self._interpd[self._interpolation])
-
-
-
         # image input dimensions
-        numrows, numcols = im.get_size()
-        im.reset_matrix()
+        numrows, numcols = self.get_size()
 
         xmin, xmax, ymin, ymax = self.get_extent()
         dxintv = xmax-xmin
@@ -159,9 +190,6 @@ class AxesImage(Artist, cm.ScalarMappable):
         sx = dxintv/self.axes.viewLim.width()
         sy = dyintv/self.axes.viewLim.height()
 
-        if im.get_interpolation()!=_image.NEAREST:
-            im.apply_translation(-1, -1)
-
         # the viewport translation
         tx = (xmin-self.axes.viewLim.xmin())/dxintv * numcols
 
@@ -174,22 +202,44 @@ class AxesImage(Artist, cm.ScalarMappable):
 
         l, b, widthDisplay, heightDisplay = self.axes.bbox.get_bounds()
 
-
-        im.apply_translation(tx, ty)
-        im.apply_scaling(sx, sy)
-
         # resize viewport to display
         rx = widthDisplay / numcols
         ry = heightDisplay  / numrows
 
-
-        if im.get_aspect()==_image.ASPECT_PRESERVE:
+        if self._aspectd[self._aspect]==_image.ASPECT_PRESERVE:
             if ry < rx: rx = ry
             # todo: center the image in viewport
-            im.apply_scaling(rx, rx)
+            ry = rx
 
+        # im is a block of the image or of a pyramid level, whose pixels
+        # are step image pixels wide, starting at image column col0 and
+        # row row0 counted from ymin
+        if self._pyramid is None:
+            im, step, col0, row0 = self._make_full_image()
         else:
-            im.apply_scaling(rx, ry)
+            im, step, col0, row0 = self._make_pyramid_image(
+                tx, ty, sx*rx, sy*ry, widthDisplay, heightDisplay)
+
+        bg = colorConverter.to_rgba(self.axes.get_frame().get_facecolor(), 0)
+
+        if self.origin=='upper':
+            im.flipud_in()
+
+        im.set_bg( *bg)
+        im.is_grayscale = (self.cmap.name == "gray" and
+                           len(self._A.shape) == 2)
+
+        im.set_aspect(self._aspectd[self._aspect])
+        im.set_interpolation(self._interpd[self._interpolation])
+
+        im.reset_matrix()
+
+        if im.get_interpolation()!=_image.NEAREST:
+            im.apply_translation(-1, -1)
+
+        im.apply_translation((col0+tx)/step, (row0+ty)/step)
+        im.apply_scaling(sx, sy)
+        im.apply_scaling(rx*step, ry*step)
 
         #print tx, ty, sx, sy, rx, ry, widthDisplay, heightDisplay
         im.resize(int(widthDisplay+0.5), int(heightDisplay+0.5),
@@ -200,6 +250,99 @@ class AxesImage(Artist, cm.ScalarMappable):
 
         return im
 
+    def _make_image(self, A, key):
+        """
+        Return the _image.Image of the block A of the image array,
+        cached under key until the array or its colors change
+        """
+        if self._imcache is None or self._imcachekey!=key:
+            if typecode(A) == UInt8:
+                self._imcache = _image.frombyte(A, 0)
+            else:
+                self._imcache = _fromscalars(self, A, 0)
+            self._imcachekey = key
+        return self._imcache
+
+    def _make_full_image(self):
+        'Return the image of the whole array; see make_image'
+        return self._make_image(self._A, None), 1, 0, 0
+
+    def _make_pyramid_image(self, tx, ty, scalex, scaley, width, height):
+        """
+        Return the image of the part of the coarsest pyramid level with
+        a pixel for every display pixel which is in view; see make_image.
+        scalex and scaley are the display pixels per image pixel.
+        """
+        levels = self._get_levels()
+        level = 0
+        while (level+1<len(levels) and
+               max(scalex, scaley)*2**(level+1)<=1):
+            level += 1
+        A = levels[level]
+        step = 2**level
+        rows, cols = A.shape[:2]
+        row0 = 0
+        if self.origin=='upper':
+            # the rows a level drops are at the bottom
+            row0 = self._A.shape[0] - rows*step
+
+        # the level pixels in view, with a margin for the resize filter
+        pad = int(self._filterrad) + 3
+        def visible(start, size, scale, num):
+            first = max(0, int(math.floor(start/step)) - pad)
+            last = min(num, int(math.ceil((start + size/scale)/step)) + pad)
+            if last<=first:
+                first = max(0, min(first, num-1))
+                last = first + 1
+            return first, last
+        c0, c1 = visible(-tx, width, scalex, cols)
+        r0, r1 = visible(-ty-row0, height, scaley, rows)
+
+        if self.origin=='upper':
+            block = A[rows-r1:rows-r0, c0:c1]
+        else:
+            block = A[r0:r1, c0:c1]
+        if len(block.shape)==2 and not self.norm.scaled():
+            # scale the colors to the whole array, not the block
+            self.norm.autoscale(self._A)
+        im = self._make_image(block, (level, r0, r1, c0, c1))
+        return im, step, c0*step, row0 + r0*step
+
+    def _get_levels(self):
+        """
+        Return the pyramid levels, the image array and its decimations
+        by 2, 4, 8... down to 64 pixels or so, making them on first use
+        """
+        if self._levels is None:
+            levels = [self._A]
+            while min(levels[-1].shape[:2])>=128:
+                levels.append(_reduce(levels[-1], self._pyramid))
+            self._levels = levels
+        return self._levels
+
+    def set_pyramid(self, reduction):
+        """
+        Set how the image is drawn when it has many more pixels than
+        the axes.  If None, the whole array is resampled at every draw.
+        If 'mean' or 'max', the image is decimated by 2, 4, 8... once,
+        each pixel of a level the mean or max of 2x2 pixels of the
+        previous one, and only the part of the coarsest level that
+        still has a pixel for each display pixel which is in view is
+        resampled, so panning and zooming large images is fast.
+
+        ACCEPTS: [ None | 'mean' | 'max' ]
+        """
+        if reduction not in (None, 'mean', 'max'):
+            raise ValueError('Illegal pyramid reduction; must be None, "mean" or "max"')
+        if reduction != self._pyramid:
+            self._pyramid = reduction
+            self._levels = None
+            self._imcache = None
+
+    def get_pyramid(self):
+        'Return the pyramid reduction, None, mean or max; see set_pyramid'
+        return self._pyramid
+
 
     def draw(self, renderer, *args, **kwargs):
         if not self.get_visible(): return
@@ -208,7 +351,10 @@ class AxesImage(Artist, cm.ScalarMappable):
         renderer.draw_image(l, b, im, self.axes.bbox)
 
     def write_png(self, fname):
-        """Write the image to png file with fname"""
+        """
+        Write the image as png to fname, a filename or any object
+        with a write method
+        """
         im = self.make_image(False)
         im.write_png(fname)
 
@@ -231,6 +377,8 @@ class AxesImage(Artist, cm.ScalarMappable):
             self._A = X
 
         self._imcache =None
+        self._levels = None
+        self.pchanged()
 
     def set_array(self, A):
         """
@@ -393,6 +541,7 @@ class NonUniformImage(AxesImage):
         self._Ax = x
         self._Ay = y
         self._imcache = None
+        self.pchanged()
 
     def set_array(self, *args):
         raise NotImplementedError('Method not supported')
@@ -459,9 +608,7 @@ class FigureImage(Artist, cm.ScalarMappable):
         if self._A is None:
             raise RuntimeError('You must first set the image array')
 
-        x = self.to_rgba(self._A, self._alpha)
-
-        im = _image.fromarray(x, 1)
+        im = _fromscalars(self, self._A, 1)
         im.set_bg( *colorConverter.to_rgba(self.figure.get_facecolor(), 0) )
         im.is_grayscale = (self.cmap.name == "gray" and
                            len(self._A.shape) == 2)
@@ -473,7 +620,10 @@ class FigureImage(Artist, cm.ScalarMappable):
         renderer.draw_image(self.ox, self.oy, im, self.origin, self.figure.bbox)
 
     def write_png(self, fname):
-        """Write the image to png file with fname"""
+        """
+        Write the image as png to fname, a filename or any object
+        with a write method
+        """
         im = self.make_image()
         im.write_png(fname)
 
@@ -35,7 +35,7 @@ from patches import Patch, Rectangle, RegularPolygon, Shadow, bbox_artist, draw_
 from collections import LineCollection, RegularPolyCollection, PatchCollection
 from text import Text
 from transforms import Bbox, Point, Value, get_bbox_transform, bbox_all,\
-     unit_bbox, inverse_transform_bbox, lbwh_to_bbox
+     unit_bbox, inverse_transform_bbox, lbwh_to_bbox, transform_bbox
 
 
 
@@ -276,7 +276,7 @@ The following dimensions are in axes coords
                 legline.set_clip_box(None)
                 lw = handle.get_linewidth()[0]
                 dashes = handle.get_dashes()
-                color = handle.get_colors()[0]
+                color = tuple(handle.get_colors()[0])
                 legline.set_color(color)
                 legline.set_linewidth(lw)
                 legline.set_dashes(dashes)
@@ -287,9 +287,9 @@ The following dimensions are in axes coords
                 p = Rectangle(xy=(min(self._xdata), y-3/4*HEIGHT),
                               width = self.handlelen, height=HEIGHT/2,
                               )
-                p.set_facecolor(handle._facecolors[0])
-                if handle._edgecolors != 'None':
-                    p.set_edgecolor(handle._edgecolors[0])
+                p.set_facecolor(tuple(handle._facecolors[0]))
+                if not is_string_like(handle._edgecolors):
+                    p.set_edgecolor(tuple(handle._edgecolors[0]))
                 self._set_artist_props(p)
                 p.set_clip_box(None)
                 ret.append(p)
@@ -310,13 +310,18 @@ The following dimensions are in axes coords
 
         Second element is a list of bounding boxes for all the patches in
         the legend's handles.
+
+        Third element is a list of display space SpatialIndex
+        instances, one for each line and each line in a line
+        collection.  The indexes are cached by the lines and the
+        collections.
         """
 
         if not self.isaxes:
             raise Exception, 'Auto legends not available for figure legends.'
 
         def get_handles(ax):
-            handles = ax.lines
+            handles = ax.lines[:]
             handles.extend(ax.patches)
             handles.extend([c for c in ax.collections if isinstance(c, LineCollection)])
 
@@ -328,40 +333,27 @@ The following dimensions are in axes coords
         bboxes = []
         lines = []
 
-        inv = ax.transAxes.inverse_xy_tup
         for handle in handles:
 
             if isinstance(handle, Line2D):
 
-                xdata = handle.get_xdata(valid_only = True)
-                ydata = handle.get_ydata(valid_only = True)
-                trans = handle.get_transform()
-                xt, yt = trans.numerix_x_y(xdata, ydata)
-
-                # XXX need a special method in transform to do a list of verts
-                averts = [inv(v) for v in zip(xt, yt)]
-                lines.append(averts)
+                lines.append(handle.get_spatial_index())
 
             elif isinstance(handle, Patch):
 
                 verts = handle.get_verts()
                 trans = handle.get_transform()
-                tverts = trans.seq_xy_tups(verts)
+                tverts = trans.numerix_xy(verts)
 
-                averts = [inv(v) for v in tverts]
+                averts = ax.transAxes.inverse_numerix_xy(tverts)
 
                 bbox = unit_bbox()
                 bbox.update(averts, True)
                 bboxes.append(bbox)
 
             elif isinstance(handle, LineCollection):
-                hlines = handle.get_lines()
-                trans = handle.get_transform()
-                for line in hlines:
-                    tline = trans.seq_xy_tups(line)
-                    aline = [inv(v) for v in tline]
-                    lines.extend(line)
-                    
+                lines.extend(handle.get_spatial_indexes())
+
         return [vertices, bboxes, lines]
 
     def draw_frame(self, b):
@@ -443,10 +435,12 @@ The following dimensions are in axes coords
         consider = [self._loc_to_axes_coords(x, width, height) for x in range(1, len(self.codes))]
 
         tx, ty = self.legendPatch.xy
+        transAxes = self.parent.transAxes
 
         candidates = []
         for l, b in consider:
             legendBox = lbwh_to_bbox(l, b, width, height)
+            displayBox = transform_bbox(transAxes, legendBox)
             badness = 0
             badness = legendBox.count_contains(verts)
             ox, oy = l-tx, b-ty
@@ -454,8 +448,8 @@ The following dimensions are in axes coords
                 if legendBox.overlaps(bbox):
                     badness += 1
 
-            for line in lines:
-                if line_cuts_bbox(line, legendBox):
+            for index in lines:
+                if index.cuts_bbox(displayBox):
                     badness += 1
 
             if badness == 0:
@@ -12,14 +12,15 @@ import agg
 from numerix import Float, alltrue, arange, array, logical_and,\
      nonzero, searchsorted, take, asarray, ones, where, less, ravel, \
      greater, logical_and, cos, sin, pi,\
-     compress, zeros, concatenate, cumsum, typecode, NewAxis
+     compress, zeros, concatenate, cumsum, typecode, NewAxis, floor, \
+     not_equal, argmin, argmax
 import numerix.ma as ma
 from matplotlib import verbose
 from artist import Artist, setp
 from cbook import iterable, is_string_like
 from colors import colorConverter
 
-from transforms import lbwh_to_bbox, LOG10
+from transforms import lbwh_to_bbox, LOG10, identity_transform
 from matplotlib import rcParams
 
 TICKLEFT, TICKRIGHT, TICKUP, TICKDOWN = range(4)
@@ -124,6 +125,10 @@ class Line2D(Artist):
         }
 
     zorder = 2
+    _identity = identity_transform()
+    # give up on level of detail decimation when the line crosses
+    # between pixel columns more than this many times per column
+    _lodMaxRuns = 8
     validCap = ('butt', 'round', 'projecting')
     validJoin =   ('miter', 'round', 'bevel')
 
@@ -179,6 +184,7 @@ class Line2D(Artist):
 
         if markersize is None  : markersize=rcParams['lines.markersize']
         if antialiased is None : antialiased=rcParams['lines.antialiased']
+        self._markercull = rcParams['lines.markercull']
         if dash_capstyle is None : dash_capstyle=rcParams['lines.dash_capstyle']
         if dash_joinstyle is None : dash_joinstyle=rcParams['lines.dash_joinstyle']
         if solid_capstyle is None : solid_capstyle=rcParams['lines.solid_capstyle']
@@ -215,6 +221,7 @@ class Line2D(Artist):
         self.set_marker(marker)
 
         self._logcache = None
+        self._lodOn = False
 
         if len(kwargs): setp(self, **kwargs)
 
@@ -284,36 +291,31 @@ class Line2D(Artist):
         self._y = asarray(y, Float)
 
         self._logcache = None
+        self._spatialIndex = None
+        self.pchanged()
 
-
+    def _get_display_vertices(self):
+        x, y = self._get_plottable()
+        xt, yt = self._transform.numerix_x_y(x, y)
+        return xt, yt, True
 
     def _is_sorted(self, x):
         "return true if x is sorted"
         if len(x)<2: return 1
         return alltrue(x[1:]-x[0:-1]>=0)
 
-    def _get_plottable(self):
-        # If log scale is set, only pos data will be returned
-
-        x, y = self._x, self._y
-
+    def _get_log_scales(self):
+        'return logx, logy; True for each axis with a log10 transform'
         try: logx = self._transform.get_funcx().get_type()==LOG10
         except RuntimeError: logx = False  # non-separable
 
         try: logy = self._transform.get_funcy().get_type()==LOG10
         except RuntimeError: logy = False  # non-separable
 
-        if not logx and not logy:
-            return x, y
-
-        if self._logcache is not None:
-            waslogx, waslogy, xcache, ycache = self._logcache
-            if logx==waslogx and waslogy==logy:
-                return xcache, ycache
-
-        Nx = len(x)
-        Ny = len(y)
+        return logx, logy
 
+    def _take_positive(self, x, y, logx, logy):
+        'return the x, y points which are valid on the log axes'
         if logx: indx = greater(x, 0)
         else:    indx = ones(len(x))
 
@@ -321,17 +323,96 @@ class Line2D(Artist):
         else:    indy = ones(len(y))
 
         ind = nonzero(logical_and(indx, indy))
-        x = take(x, ind)
-        y = take(y, ind)
+        return take(x, ind), take(y, ind)
+
+    def _get_plottable(self):
+        # If log scale is set, only pos data will be returned
+
+        x, y = self._x, self._y
+
+        logx, logy = self._get_log_scales()
+
+        if not logx and not logy:
+            return x, y
+
+        if self._logcache is not None:
+            waslogx, waslogy, xcache, ycache = self._logcache
+            if logx==waslogx and waslogy==logy:
+                return xcache, ycache
+
+        x, y = self._take_positive(x, y, logx, logy)
 
         self._logcache = logx, logy, x, y
         return x, y
 
+    def _get_lod_segments(self):
+        """
+        Return a list of (xt, yt) display space arrays, one for each
+        unmasked segment of the line, with the vertices decimated by
+        _lod_decimate.  Points which are invalid on a log axis are
+        dropped from each segment.
+        """
+        if self._segments is None:
+            segments = [(self._x, self._y)]
+        else:
+            segments = [(self._x[ii[0]:ii[1]], self._y[ii[0]:ii[1]])
+                        for ii in self._segments]
+
+        logx, logy = self._get_log_scales()
+        width = self.figure.bbox.width()
+        ret = []
+        for x, y in segments:
+            if logx or logy:
+                x, y = self._take_positive(x, y, logx, logy)
+            if len(x)==0: continue
+            xt, yt = self._transform.numerix_x_y(x, y)
+            ret.append(self._lod_decimate(xt, yt, width))
+        return ret
+
+    def _lod_decimate(self, xt, yt, width):
+        """
+        Pixel column min/max decimation of the display space vertices
+        xt, yt.  Each run of consecutive points which fall in the same
+        pixel column is replaced by its first, minimum, maximum and
+        last points, in their original order, so the line has at most
+        about 4 vertices per horizontal pixel and renders the same as
+        the full resolution line.
+
+        If the data do not reduce (eg, x is not ordered and wanders
+        back and forth across the columns) xt, yt are returned
+        unchanged.
+        """
+        N = len(xt)
+        if N <= 4*width: return xt, yt
+
+        cols = floor(xt)
+        breaks = nonzero(not_equal(cols[1:], cols[:-1])) + 1
+        bounds = concatenate(((0,), breaks, (N,)))
+        Nruns = len(bounds) - 1
+        if 4*Nruns >= N or Nruns > self._lodMaxRuns*width:
+            return xt, yt
+
+        ind = []
+        for i in range(Nruns):
+            i0, i1 = int(bounds[i]), int(bounds[i+1])
+            if i1-i0<=4:
+                ind.extend(range(i0, i1))
+                continue
+            seg = yt[i0:i1]
+            imin = i0 + int(argmin(seg))
+            imax = i0 + int(argmax(seg))
+            if imin>imax: imin, imax = imax, imin
+            ind.extend((i0, imin, imax, i1-1))
+
+        return take(xt, ind), take(yt, ind)
+
     def draw(self, renderer):
         #renderer.open_group('line2d')
 
         if not self._visible: return
         self._newstyle = hasattr(renderer, 'draw_markers')
+        self._lodOn = (self._lod and self._linestyle not in ('steps', 'None')
+                       and self.figure is not None)
         gc = renderer.new_gc()
         gc.set_foreground(self._color)
         gc.set_antialiased(self._antialiased)
@@ -363,7 +444,12 @@ class Line2D(Artist):
         funcname = self._lineStyles.get(self._linestyle, '_draw_nothing')
         lineFunc = getattr(self, funcname)
 
-        if self._segments is not None:
+        if self._lodOn:
+            # decimated in display space; _draw_lines passes an
+            # identity transform to the backend
+            for xd, yd in self._get_lod_segments():
+                lineFunc(renderer, gc, xd, yd)
+        elif self._segments is not None:
             for ii in self._segments:
                 lineFunc(renderer, gc, xt[ii[0]:ii[1]], yt[ii[0]:ii[1]])
         else:
@@ -374,6 +460,7 @@ class Line2D(Artist):
             gc = renderer.new_gc()
             gc.set_foreground(self._markeredgecolor)
             gc.set_linewidth(self._markeredgewidth)
+            gc.set_markercull(self._markercull)
             if self.get_clip_on():
                 gc.set_clip_rectangle(self.clipbox.get_bounds())
             funcname = self._markers.get(self._marker, '_draw_nothing')
@@ -392,6 +479,7 @@ class Line2D(Artist):
     def get_markeredgewidth(self): return self._markeredgewidth
     def get_markerfacecolor(self): return self._markerfacecolor
     def get_markersize(self): return self._markersize
+    def get_markercull(self): return self._markercull
     def get_xdata(self, valid_only = False):
         if valid_only:
             return self._x
@@ -410,6 +498,7 @@ class Line2D(Artist):
         ACCEPTS: [True | False]
         """
         self._antialiased = b
+        self.pchanged()
 
     def set_color(self, color):
         """
@@ -418,6 +507,7 @@ class Line2D(Artist):
         ACCEPTS: any matplotlib color - see help(colors)
         """
         self._color = color
+        self.pchanged()
 
     def set_linewidth(self, w):
         """
@@ -426,6 +516,7 @@ class Line2D(Artist):
         ACCEPTS: float value in points
         """
         self._linewidth = w
+        self.pchanged()
 
     def set_linestyle(self, s):
         """
@@ -434,6 +525,7 @@ class Line2D(Artist):
         ACCEPTS: [ '-' | '--' | '-.' | ':' | 'steps' | 'None' ]
         """
         self._linestyle = s
+        self.pchanged()
 
 
     def set_marker(self, marker):
@@ -444,6 +536,7 @@ class Line2D(Artist):
 
         """
         self._marker = marker
+        self.pchanged()
 
     def set_markeredgecolor(self, ec):
         """
@@ -452,6 +545,7 @@ class Line2D(Artist):
         ACCEPTS: any matplotlib color - see help(colors)
         """
         self._markeredgecolor = ec
+        self.pchanged()
 
     def set_markeredgewidth(self, ew):
         """
@@ -460,6 +554,7 @@ class Line2D(Artist):
         ACCEPTS: float value in points
         """
         self._markeredgewidth = ew
+        self.pchanged()
 
     def set_markerfacecolor(self, fc):
         """
@@ -468,6 +563,19 @@ class Line2D(Artist):
         ACCEPTS: any matplotlib color - see help(colors)
         """
         self._markerfacecolor = fc
+        self.pchanged()
+
+    def set_markercull(self, b):
+        """
+        Set whether the backend may skip drawing an opaque marker
+        where the same marker is already drawn at the same pixel, which
+        is much faster for dense clouds of points.  Agg only; the
+        default is rc lines.markercull
+
+        ACCEPTS: [True | False]
+        """
+        self._markercull = b
+        self.pchanged()
 
     def set_markersize(self, sz):
         """
@@ -476,6 +584,7 @@ class Line2D(Artist):
         ACCEPTS: float
         """
         self._markersize = sz
+        self.pchanged()
 
     def set_xdata(self, x):
         """
@@ -509,6 +618,16 @@ class Line2D(Artist):
         else:
             self.set_linestyle('--')
         self._dashSeq = seq  # TODO: offset ignored for now
+        self.pchanged()
+
+    def _draw_lines(self, renderer, gc, xt, yt):
+        if not self._newstyle:
+            renderer.draw_lines(gc, xt, yt)
+        elif self._lodOn:
+            # the vertices are already in display coords
+            renderer.draw_lines(gc, xt, yt, self._identity)
+        else:
+            renderer.draw_lines(gc, xt, yt, self._transform)
 
     def _draw_nothing(self, renderer, gc, xt, yt):
         pass
@@ -530,10 +649,7 @@ class Line2D(Artist):
     def _draw_solid(self, renderer, gc, xt, yt):
         if len(xt)<2: return
         gc.set_linestyle('solid')
-        if self._newstyle:
-            renderer.draw_lines(gc, xt, yt, self._transform)
-        else:
-            renderer.draw_lines(gc, xt, yt)
+        self._draw_lines(renderer, gc, xt, yt)
 
 
     def _draw_dashed(self, renderer, gc, xt, yt):
@@ -542,28 +658,19 @@ class Line2D(Artist):
         if self._dashSeq is not None:
             gc.set_dashes(0, self._dashSeq)
 
-        if self._newstyle:
-            renderer.draw_lines(gc, xt, yt, self._transform)
-        else:
-            renderer.draw_lines(gc, xt, yt)
+        self._draw_lines(renderer, gc, xt, yt)
 
 
     def _draw_dash_dot(self, renderer, gc, xt, yt):
         if len(xt)<2: return
         gc.set_linestyle('dashdot')
-        if self._newstyle:
-            renderer.draw_lines(gc, xt, yt, self._transform)
-        else:
-            renderer.draw_lines(gc, xt, yt)
+        self._draw_lines(renderer, gc, xt, yt)
 
     def _draw_dotted(self, renderer, gc, xt, yt):
 
         if len(xt)<2: return
         gc.set_linestyle('dotted')
-        if self._newstyle:
-            renderer.draw_lines(gc, xt, yt, self._transform)
-        else:
-            renderer.draw_lines(gc, xt, yt)
+        self._draw_lines(renderer, gc, xt, yt)
 
     def _draw_point(self, renderer, gc, xt, yt):
 
@@ -1028,6 +1135,7 @@ class Line2D(Artist):
         self._linewidth = other._linewidth
         self._color = other._color
         self._markersize = other._markersize
+        self._markercull = other._markercull
         self._markerfacecolor = other._markerfacecolor
         self._markeredgecolor = other._markeredgecolor
         self._markeredgewidth = other._markeredgewidth
@@ -1130,6 +1238,7 @@ class Line2D(Artist):
         if s not in self.validJoin:
             raise ValueError('set_dash_joinstyle passed "%s"; valid joinstyles are %s'%(s, self.validJoin))
         self._dashjoinstyle = s
+        self.pchanged()
 
     def set_solid_joinstyle(self, s):
         """
@@ -1140,6 +1249,7 @@ class Line2D(Artist):
         if s not in self.validJoin:
             raise ValueError('set_solid_joinstyle passed "%s"; valid joinstyles are %s'%(s, self.validJoin))
         self._solidjoinstyle = s
+        self.pchanged()
 
 
     def get_dash_joinstyle(self):
@@ -1164,6 +1274,7 @@ class Line2D(Artist):
             raise ValueError('set_dash_capstyle passed "%s"; valid capstyles are %s'%(s, self.validJoin))
 
         self._dashcapstyle = s
+        self.pchanged()
 
 
     def set_solid_capstyle(self, s):
@@ -1176,6 +1287,7 @@ class Line2D(Artist):
             raise ValueError('set_solid_capstyle passed "%s"; valid capstyles are %s'%(s, self.validJoin))
 
         self._solidcapstyle = s
+        self.pchanged()
 
 
     def get_dash_capstyle(self):
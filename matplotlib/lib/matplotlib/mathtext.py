@@ -138,7 +138,7 @@ from matplotlib.pyparsing import Literal, Word, OneOrMore, ZeroOrMore, \
      StringStart, StringEnd, ParseException, FollowedBy, Regex
 
 from matplotlib.afm import AFM
-from matplotlib.cbook import enumerate, iterable, Bunch
+from matplotlib.cbook import enumerate, iterable, Bunch, lrudict
 from matplotlib.ft2font import FT2Font
 from matplotlib.font_manager import fontManager
 from matplotlib._mathtext_data import latex_to_bakoma, cmkern, \
@@ -885,6 +885,7 @@ class SymbolElement(Element):
 
     def set_size_info(self, fontsize, dpi):
         Element.set_size_info(self, fontsize, dpi)
+        self.kern = None  # the kern depends on the size; see advance
         self.metrics = Element.fonts.get_metrics(
             self.font, self.sym, self.fontsize, dpi)
 
@@ -1193,125 +1194,232 @@ class Handler:
 
 handler = Handler()
 
-lbrace = Literal('{').suppress()
-rbrace = Literal('}').suppress()
-lbrack = Literal('[')
-rbrack = Literal(']')
-lparen = Literal('(')
-rparen = Literal(')')
-grouping = lbrack | rbrack | lparen | rparen
+_expression = None
 
-bslash = Literal('\\')
+def _get_expression():
+    """
+    Return the pyparsing expression for math strings, building the
+    grammar on first use rather than at import
+    """
+    global _expression
+    if _expression is not None: return _expression
+
+    lbrace = Literal('{').suppress()
+    rbrace = Literal('}').suppress()
+    lbrack = Literal('[')
+    rbrack = Literal(']')
+    lparen = Literal('(')
+    rparen = Literal(')')
+    grouping = lbrack | rbrack | lparen | rparen
+
+    bslash = Literal('\\')
 
 
-langle = Literal('<')
-rangle = Literal('>')
-equals = Literal('=')
-relation = langle | rangle | equals
+    langle = Literal('<')
+    rangle = Literal('>')
+    equals = Literal('=')
+    relation = langle | rangle | equals
 
-colon =  Literal(':')
-comma =  Literal(',')
-period =  Literal('.')
-semicolon =  Literal(';')
-exclamation =  Literal('!')
+    colon =  Literal(':')
+    comma =  Literal(',')
+    period =  Literal('.')
+    semicolon =  Literal(';')
+    exclamation =  Literal('!')
 
-punctuation = colon | comma | period | semicolon 
+    punctuation = colon | comma | period | semicolon 
 
-at =  Literal('@')
-percent =  Literal('%')
-ampersand =  Literal('&')
-misc = exclamation | at | percent | ampersand
+    at =  Literal('@')
+    percent =  Literal('%')
+    ampersand =  Literal('&')
+    misc = exclamation | at | percent | ampersand
 
-over = Literal('over')
-under = Literal('under')
-#~ composite = over | under
-overUnder = over | under
+    over = Literal('over')
+    under = Literal('under')
+    #~ composite = over | under
+    overUnder = over | under
 
-accent = Literal('hat') | Literal('check') | Literal('dot') | \
-         Literal('breve') | Literal('acute') | Literal('ddot') | \
-         Literal('grave') | Literal('tilde') | Literal('bar') | \
-         Literal('vec') | Literal('"') | Literal("`") | Literal("'") |\
-         Literal('~') | Literal('.') | Literal('^')
-         
+    accent = Literal('hat') | Literal('check') | Literal('dot') | \
+             Literal('breve') | Literal('acute') | Literal('ddot') | \
+             Literal('grave') | Literal('tilde') | Literal('bar') | \
+             Literal('vec') | Literal('"') | Literal("`") | Literal("'") |\
+             Literal('~') | Literal('.') | Literal('^')
 
 
 
-number = Combine(Word(nums) + Optional(Literal('.')) + Optional( Word(nums) ))
 
-plus = Literal('+')
-minus = Literal('-')
-times = Literal('*')
-div = Literal('/')
-binop = plus | minus | times | div
+    number = Combine(Word(nums) + Optional(Literal('.')) + Optional( Word(nums) ))
 
+    plus = Literal('+')
+    minus = Literal('-')
+    times = Literal('*')
+    div = Literal('/')
+    binop = plus | minus | times | div
 
-roman      = Literal('rm')
-cal        = Literal('cal')
-italics    = Literal('it')
-typewriter = Literal('tt')
-fontname   = roman | cal | italics | typewriter
 
-texsym = Combine(bslash + Word(alphanums) + NotAny("{"))
+    roman      = Literal('rm')
+    cal        = Literal('cal')
+    italics    = Literal('it')
+    typewriter = Literal('tt')
+    fontname   = roman | cal | italics | typewriter
 
-char = Word(alphanums + ' ', exact=1).leaveWhitespace()
+    texsym = Combine(bslash + Word(alphanums) + NotAny("{"))
 
-space = FollowedBy(bslash) + (Literal(r'\ ') | Literal(r'\/') | Group(Literal(r'\hspace{') + number + Literal('}'))).setParseAction(handler.space).setName('space')
+    char = Word(alphanums + ' ', exact=1).leaveWhitespace()
 
-symbol = Regex("("+")|(".join(
-    [
-    r"\\[a-zA-Z0-9]+(?!{)",
-    r"[a-zA-Z0-9 ]",
-    r"[+\-*/]",
-    r"[<>=]",
-    r"[:,.;!]",
-    r"[!@%&]",
-    r"[[\]()]",
-    ])+")"
-               ).setParseAction(handler.symbol).leaveWhitespace()
+    space = FollowedBy(bslash) + (Literal(r'\ ') | Literal(r'\/') | Group(Literal(r'\hspace{') + number + Literal('}'))).setParseAction(handler.space).setName('space')
 
-#~ symbol = (texsym ^ char ^ binop ^ relation ^ punctuation ^ misc ^ grouping  ).setParseAction(handler.symbol).leaveWhitespace()
-_symbol = (texsym | char | binop | relation | punctuation | misc | grouping  ).setParseAction(handler.symbol).leaveWhitespace()
+    symbol = Regex("("+")|(".join(
+        [
+        r"\\[a-zA-Z0-9]+(?!{)",
+        r"[a-zA-Z0-9 ]",
+        r"[+\-*/]",
+        r"[<>=]",
+        r"[:,.;!]",
+        r"[!@%&]",
+        r"[[\]()]",
+        ])+")"
+                   ).setParseAction(handler.symbol).leaveWhitespace()
 
-subscript = Forward().setParseAction(handler.subscript).setName("subscript")
-superscript = Forward().setParseAction(handler.superscript).setName("superscript")
-subsuperscript = Forward().setParseAction(handler.subsuperscript).setName("subsuperscript")
+    #~ symbol = (texsym ^ char ^ binop ^ relation ^ punctuation ^ misc ^ grouping  ).setParseAction(handler.symbol).leaveWhitespace()
+    _symbol = (texsym | char | binop | relation | punctuation | misc | grouping  ).setParseAction(handler.symbol).leaveWhitespace()
 
-font = Forward().setParseAction(handler.font).setName("font")
+    subscript = Forward().setParseAction(handler.subscript).setName("subscript")
+    superscript = Forward().setParseAction(handler.superscript).setName("superscript")
+    subsuperscript = Forward().setParseAction(handler.subsuperscript).setName("subsuperscript")
 
+    font = Forward().setParseAction(handler.font).setName("font")
 
-accent = Group( Combine(bslash + accent) + Optional(lbrace) + symbol + Optional(rbrace)).setParseAction(handler.accent).setName("accent")
-group = Group( lbrace + OneOrMore(symbol^subscript^superscript^subsuperscript^space^font^accent) + rbrace).setParseAction(handler.group).setName("group")
-#~ group = Group( lbrace + OneOrMore(subsuperscript | subscript | superscript | symbol | space ) + rbrace).setParseAction(handler.group).setName("group")
 
-#composite = Group( Combine(bslash + composite) + lbrace + symbol + rbrace + lbrace + symbol + rbrace).setParseAction(handler.composite).setName("composite")
-#~ composite = Group( Combine(bslash + composite) + group + group).setParseAction(handler.composite).setName("composite")
-composite = Group( Combine(bslash + overUnder) + group + group).setParseAction(handler.composite).setName("composite")
+    accent = Group( Combine(bslash + accent) + Optional(lbrace) + symbol + Optional(rbrace)).setParseAction(handler.accent).setName("accent")
+    group = Group( lbrace + OneOrMore(symbol^subscript^superscript^subsuperscript^space^font^accent) + rbrace).setParseAction(handler.group).setName("group")
+    #~ group = Group( lbrace + OneOrMore(subsuperscript | subscript | superscript | symbol | space ) + rbrace).setParseAction(handler.group).setName("group")
 
+    #composite = Group( Combine(bslash + composite) + lbrace + symbol + rbrace + lbrace + symbol + rbrace).setParseAction(handler.composite).setName("composite")
+    #~ composite = Group( Combine(bslash + composite) + group + group).setParseAction(handler.composite).setName("composite")
+    composite = Group( Combine(bslash + overUnder) + group + group).setParseAction(handler.composite).setName("composite")
 
 
 
 
 
-symgroup = font | group | symbol 
 
-subscript << Group( Optional(symgroup) + Literal('_') + symgroup  )
-superscript << Group( Optional(symgroup) + Literal('^') + symgroup  )
-subsuperscript << Group( symgroup + Literal('_') + symgroup + Literal('^') + symgroup  )
+    symgroup = font | group | symbol 
 
-font << Group( Combine(bslash + fontname) + group)
+    subscript << Group( Optional(symgroup) + Literal('_') + symgroup  )
+    superscript << Group( Optional(symgroup) + Literal('^') + symgroup  )
+    subsuperscript << Group( symgroup + Literal('_') + symgroup + Literal('^') + symgroup  )
 
+    font << Group( Combine(bslash + fontname) + group)
 
 
-expression = OneOrMore(
-    space ^ font ^ accent ^ symbol ^ subscript ^ superscript ^ subsuperscript ^ group ^ composite  ).setParseAction(handler.expression).setName("expression")
-#~ expression = OneOrMore(
-    #~ group | composite | space | font | subsuperscript | subscript | superscript | symbol ).setParseAction(handler.expression).setName("expression")
+
+    expression = OneOrMore(
+        space ^ font ^ accent ^ symbol ^ subscript ^ superscript ^ subsuperscript ^ group ^ composite  ).setParseAction(handler.expression).setName("expression")
+    #~ expression = OneOrMore(
+        #~ group | composite | space | font | subsuperscript | subscript | superscript | symbol ).setParseAction(handler.expression).setName("expression")
+
+    _expression = expression
+    return expression
 
 ####
 
 
 
 
+class LayoutCache:
+    """
+    A least recently used cache of laid out math strings, which keeps
+    at most maxentries entries and, when maxbytes is not None, at most
+    maxbytes of estimated memory.  With maxbytes None, the limit is
+    rcParams['text.mathcachesize'] megabytes
+    """
+    def __init__(self, maxentries=100, maxbytes=None):
+        self.maxentries = maxentries
+        self.maxbytes = maxbytes
+        self.clear()
+
+    def clear(self):
+        'empty the cache'
+        self._d = {}      # key -> (value, nbytes)
+        self._keys = []   # least recently used first
+        self.nbytes = 0
+
+    def has_key(self, key):
+        return self._d.has_key(key)
+
+    def __len__(self):
+        return len(self._d)
+
+    def get(self, key):
+        'return the value of key, or None'
+        item = self._d.get(key)
+        if item is None: return None
+        self._keys.remove(key)
+        self._keys.append(key)
+        return item[0]
+
+    def set(self, key, value, nbytes):
+        'store value, which takes about nbytes of memory, under key'
+        if self._d.has_key(key): self._discard(key)
+        maxbytes = self.maxbytes
+        if maxbytes is None:
+            maxbytes = rcParams['text.mathcachesize']*1024*1024
+        while self._keys and (len(self._keys)>=self.maxentries or
+                              self.nbytes+nbytes>maxbytes):
+            self._discard(self._keys[0])
+        self._d[key] = value, nbytes
+        self._keys.append(key)
+        self.nbytes += nbytes
+
+    def _discard(self, key):
+        value, nbytes = self._d.pop(key)
+        self._keys.remove(key)
+        self.nbytes -= nbytes
+
+
+# the parsed expressions do not depend on the fonts, size or dpi, so
+# they are kept apart from the layouts
+_parsed = lrudict(200)
+
+def _parse(s):
+    """
+    Return the ExpressionElement and the list of its symbols for the
+    math string s, without the $s, parsing each string only once
+    """
+    parsed = _parsed.get(s)
+    if parsed is None:
+        handler.clear()
+        _get_expression().parseString(s)
+        parsed = handler.expr, handler.symbols
+        handler.clear()
+        _parsed[s] = parsed
+    return parsed
+
+def _layout(s, fonts, fontsize, dpi):
+    """
+    Lay out the math string s, without the $s, with fonts at fontsize
+    points and dpi.  Return the expression and its width and height
+    """
+    expr, symbols = _parse(s)
+    Element.fonts = fonts
+    expr.set_size_info(fontsize, dpi)
+
+    # set the origin once to allow w, h compution
+    expr.set_origin(0, 0)
+    xmin = min([e.xmin() for e in symbols])
+    xmax = max([e.xmax() for e in symbols])
+    ymin = min([e.ymin() for e in symbols])
+    ymax = max([e.ymax() for e in symbols])
+
+    # now set the true origin - doesn't affect with and height
+    w, h =  xmax-xmin, ymax-ymin
+    # a small pad for the canvas size
+    w += 2
+    h += 2
+
+    expr.set_origin(0, h-ymax)
+    return expr, w, h
+
 def math_parse_s_ft2font(s, dpi, fontsize, angle=0):
     """
     Parse the math expression s, return the (bbox, fonts) tuple needed
@@ -1326,42 +1434,24 @@ def math_parse_s_ft2font(s, dpi, fontsize, angle=0):
     if major==2 and minor1==2:
         raise SystemExit('mathtext broken on python2.2.  We hope to get this fixed soon')
 
+    # the backends rotate the cached fonts in place for angle 90
     cacheKey = (s, dpi, fontsize, angle)
-    s = s[1:-1]  # strip the $ from front and back
-    if math_parse_s_ft2font.cache.has_key(cacheKey):
-        w, h, bfonts = math_parse_s_ft2font.cache[cacheKey]
+    cached = math_parse_s_ft2font.cache.get(cacheKey)
+    if cached is not None:
+        w, h, bfonts = cached
         return w, h, bfonts.fonts.values()
 
     bakomaFonts = BakomaTrueTypeFonts()
-    Element.fonts = bakomaFonts
-    handler.clear()
-    expression.parseString( s )
-
-    handler.expr.set_size_info(fontsize, dpi)
+    expr, w, h = _layout(s[1:-1], bakomaFonts, fontsize, dpi)
+    bakomaFonts.set_canvas_size(w,h)
+    expr.render()
 
-    # set the origin once to allow w, h compution
-    handler.expr.set_origin(0, 0)
-    xmin = min([e.xmin() for e in handler.symbols])
-    xmax = max([e.xmax() for e in handler.symbols])
-    ymin = min([e.ymin() for e in handler.symbols])
-    ymax = max([e.ymax() for e in handler.symbols])
-
-    # now set the true origin - doesn't affect with and height
-    w, h =  xmax-xmin, ymax-ymin
-    # a small pad for the canvas size
-    w += 2
-    h += 2
-
-    handler.expr.set_origin(0, h-ymax)
-
-    Element.fonts.set_canvas_size(w,h)
-    handler.expr.render()
-    handler.clear()
-
-    math_parse_s_ft2font.cache[cacheKey] = w, h, bakomaFonts
+    # the bitmaps dominate the memory
+    nbytes = len(bakomaFonts.fonts)*int(w)*int(h)
+    math_parse_s_ft2font.cache.set(cacheKey, (w, h, bakomaFonts), nbytes)
     return w, h, bakomaFonts.fonts.values()
 
-math_parse_s_ft2font.cache = {}
+math_parse_s_ft2font.cache = LayoutCache()
 
 def math_parse_s_ft2font_svg(s, dpi, fontsize, angle=0):
     """
@@ -1377,42 +1467,24 @@ def math_parse_s_ft2font_svg(s, dpi, fontsize, angle=0):
     if major==2 and minor1==2:
         print >> sys.stderr, 'mathtext broken on python2.2.  We hope to get this fixed soon'
         sys.exit()
-    cacheKey = (s, dpi, fontsize, angle)
-    s = s[1:-1]  # strip the $ from front and back
-    if math_parse_s_ft2font_svg.cache.has_key(cacheKey):
-        w, h, svg_glyphs = math_parse_s_ft2font_svg.cache[cacheKey]
-        return w, h, svg_glyphs
-
-    bakomaFonts = BakomaTrueTypeFonts(useSVG=True)
-    Element.fonts = bakomaFonts
-    handler.clear()
-    expression.parseString( s )
-
-    handler.expr.set_size_info(fontsize, dpi)
-
-    # set the origin once to allow w, h compution
-    handler.expr.set_origin(0, 0)
-    xmin = min([e.xmin() for e in handler.symbols])
-    xmax = max([e.xmax() for e in handler.symbols])
-    ymin = min([e.ymin() for e in handler.symbols])
-    ymax = max([e.ymax() for e in handler.symbols])
-
-    # now set the true origin - doesn't affect with and height
-    w, h =  xmax-xmin, ymax-ymin
-    # a small pad for the canvas size
-    w += 2
-    h += 2
 
-    handler.expr.set_origin(0, h-ymax)
+    # the layout does not depend on the angle
+    cacheKey = (s, dpi, fontsize)
+    cached = math_parse_s_ft2font_svg.cache.get(cacheKey)
+    if cached is not None:
+        return cached
 
-    Element.fonts.set_canvas_size(w,h)
-    handler.expr.render()
-    handler.clear()
+    bakomaFonts = BakomaTrueTypeFonts(useSVG=True)
+    expr, w, h = _layout(s[1:-1], bakomaFonts, fontsize, dpi)
+    bakomaFonts.set_canvas_size(w,h)
+    expr.render()
 
-    math_parse_s_ft2font_svg.cache[cacheKey] = w, h, bakomaFonts.svg_glyphs
-    return w, h, bakomaFonts.svg_glyphs
+    svg_glyphs = bakomaFonts.svg_glyphs
+    nbytes = 100*len(svg_glyphs)   # a rough size of a glyph tuple
+    math_parse_s_ft2font_svg.cache.set(cacheKey, (w, h, svg_glyphs), nbytes)
+    return w, h, svg_glyphs
 
-math_parse_s_ft2font_svg.cache = {}
+math_parse_s_ft2font_svg.cache = LayoutCache()
 
 
 def math_parse_s_ps(s, dpi, fontsize):
@@ -1425,47 +1497,25 @@ def math_parse_s_ps(s, dpi, fontsize):
     return is width, height, fonts
 
     """
-    cacheKey = (s, dpi, fontsize)
-    s = s[1:-1]  # strip the $ from front and back
-    if math_parse_s_ps.cache.has_key(cacheKey):
-        w, h, pswriter = math_parse_s_ps.cache[cacheKey]
-        return w, h, pswriter
-
-    if rcParams['ps.useafm']:
-        standardFonts = StandardPSFonts()
-        Element.fonts = standardFonts
-    else:
-        bakomaFonts = BakomaPSFonts()
-        Element.fonts = bakomaFonts
-    handler.clear()
-    expression.parseString( s )
-
-    handler.expr.set_size_info(fontsize, dpi)
-
-    # set the origin once to allow w, h compution
-    handler.expr.set_origin(0, 0)
-    xmin = min([e.xmin() for e in handler.symbols])
-    xmax = max([e.xmax() for e in handler.symbols])
-    ymin = min([e.ymin() for e in handler.symbols])
-    ymax = max([e.ymax() for e in handler.symbols])
-
-    # now set the true origin - doesn't affect with and height
-    w, h =  xmax-xmin, ymax-ymin
-    # a small pad for the canvas size
-    w += 2
-    h += 2
+    useafm = rcParams['ps.useafm']
+    cacheKey = (s, dpi, fontsize, useafm)
+    cached = math_parse_s_ps.cache.get(cacheKey)
+    if cached is not None:
+        return cached
 
-    handler.expr.set_origin(0, h-ymax)
+    if useafm: fonts = StandardPSFonts()
+    else: fonts = BakomaPSFonts()
+    expr, w, h = _layout(s[1:-1], fonts, fontsize, dpi)
 
     pswriter = StringIO()
-    Element.fonts.set_canvas_size(w, h, pswriter)
-    handler.expr.render()
-    handler.clear()
+    fonts.set_canvas_size(w, h, pswriter)
+    expr.render()
 
-    math_parse_s_ps.cache[cacheKey] = w, h, pswriter
+    nbytes = len(pswriter.getvalue())
+    math_parse_s_ps.cache.set(cacheKey, (w, h, pswriter), nbytes)
     return w, h, pswriter
 
-math_parse_s_ps.cache = {}
+math_parse_s_ps.cache = LayoutCache()
 
 if 0: #__name__=='___main__':
     
@@ -1486,13 +1536,13 @@ if 0: #__name__=='___main__':
     for s in stests:
         try:
             print s
-            print (expression + StringEnd()).parseString( s[1:-1] )
+            print (_get_expression() + StringEnd()).parseString( s[1:-1] )
         except ParseException, pe:
             print "*** ERROR ***", pe.msg
             print s
             print 'X' + (' '*pe.loc)+'^'
             # how far did we get?
-            print expression.parseString( s[1:-1] )
+            print _get_expression().parseString( s[1:-1] )
         print
 
     #w, h, fonts = math_parse_s_ps(s, 20, 72)
@@ -1507,7 +1557,7 @@ if __name__=='__main__':
     if 0:
         Element.fonts = DummyFonts()
         handler.clear()
-        expression.parseString( s )
+        _get_expression().parseString( s )
 
         handler.expr.set_size_info(12, 72)
 
@@ -77,6 +77,7 @@ class Patch(Artist):
         ACCEPTS: [True | False]
         """
         self._antialiased = aa
+        self.pchanged()
 
     def set_edgecolor(self, color):
         """
@@ -85,6 +86,7 @@ class Patch(Artist):
         ACCEPTS: any matplotlib color - see help(colors)
         """
         self._edgecolor = color
+        self.pchanged()
 
     def set_facecolor(self, color):
         """
@@ -93,6 +95,7 @@ class Patch(Artist):
         ACCEPTS: any matplotlib color - see help(colors)
         """
         self._facecolor = color
+        self.pchanged()
 
     def set_linewidth(self, w):
         """
@@ -101,6 +104,7 @@ class Patch(Artist):
         ACCEPTS: float
         """
         self._linewidth = w
+        self.pchanged()
 
     def set_fill(self, b):
         """
@@ -109,6 +113,7 @@ class Patch(Artist):
         ACCEPTS: [True | False]
         """
         self.fill = b
+        self.pchanged()
 
     def get_fill(self):
         'return whether fill is set'
@@ -137,6 +142,7 @@ class Patch(Artist):
         2. Hatching is done with solid black lines of width 0.
         """
         self._hatch = h
+        self.pchanged()
  
     def get_hatch(self):
         'return the current hatching pattern'
@@ -162,7 +168,7 @@ class Patch(Artist):
             gc.set_hatch(self._hatch )
 
         verts = self.get_verts()
-        tverts = self._transform.seq_xy_tups(verts)
+        tverts = self._transform.numerix_xy(verts)
 
         renderer.draw_polygon(gc, rgbFace, tverts)
 
@@ -177,7 +183,7 @@ class Patch(Artist):
 
     def get_window_extent(self, renderer=None):
         verts = self.get_verts()
-        tverts = self._transform.seq_xy_tups(verts)
+        tverts = self._transform.numerix_xy(verts)
         return bound_vertices(tverts)
 
 
@@ -309,6 +315,7 @@ class Rectangle(Patch):
         ACCEPTS: float
         """
         self.xy[0] = x
+        self.pchanged()
 
     def set_y(self, y):
         """
@@ -317,6 +324,7 @@ class Rectangle(Patch):
         ACCEPTS: float
         """
         self.xy[1] = y
+        self.pchanged()
 
     def set_width(self, w):
         """
@@ -325,6 +333,7 @@ class Rectangle(Patch):
         ACCEPTS: float
         """
         self.width = w
+        self.pchanged()
 
     def set_height(self, h):
         """
@@ -333,6 +342,7 @@ class Rectangle(Patch):
         ACCEPTS: float
         """
         self.height = h
+        self.pchanged()
 
     def set_bounds(self, *args):
         """
@@ -347,6 +357,7 @@ class Rectangle(Patch):
         self.xy = array([float(l),float(b)])
         self.width = w
         self.height = h
+        self.pchanged()
 
 
 class RegularPolygon(Patch):
@@ -975,7 +975,8 @@ if _imread.__doc__ is not None:
     imread.__doc__ = _shift_string(_imread.__doc__)
 
 
-def load(fname,comments='%',delimiter=None, converters=None,skiprows=0):
+def load(fname,comments='%',delimiter=None, converters=None,skiprows=0,
+         usecols=None):
     """
     Load ASCII data from fname into an array and return the array.
 
@@ -1014,10 +1015,20 @@ def load(fname,comments='%',delimiter=None, converters=None,skiprows=0):
     column 0 is a date string: converters={0:datestr2num}
 
     skiprows is the number of rows from the top to skip
+
+    usecols, if not None, is a sequence of the column numbers to load,
+    eg usecols=(0,2) loads the first and third columns; the other
+    columns are not converted.
+
+    The file is read a megabyte at a time and each column is
+    converted with one call to map into a typed buffer of floats, so
+    load needs about twice the memory of the array it returns.
     """
+    from array import array as typedarray
 
     if converters is None: converters = {}
-    if is_string_like(fname):
+    opened = is_string_like(fname)
+    if opened:
         if fname.endswith('.gz'):
             import gzip
             fh = gzip.open(fname)
@@ -1027,19 +1038,56 @@ def load(fname,comments='%',delimiter=None, converters=None,skiprows=0):
         fh = fname
     else:
         raise ValueError('fname must be a string or file handle')
-    X = []
+
     numCols = None
-    for i,line in enumerate(fh):
-        if i<skiprows: continue
-        line = line[:line.find(comments)].strip()
-        if not len(line): continue
-        row = [converters.get(i,float)(val) for i,val in enumerate(line.split(delimiter))]
-        thisLen = len(row)
-        if numCols is not None and thisLen != numCols:
-            raise ValueError('All rows must have the same number of columns')
-        X.append(row)
-
-    X = array(X)
+    numRows = 0
+    columns = []
+    while 1:
+        lines = fh.readlines(1<<20)
+        if not len(lines): break
+        if skiprows:
+            numLines = len(lines)
+            lines = lines[skiprows:]
+            skiprows = max(0, skiprows-numLines)
+        if comments and ''.join(lines).find(comments)>=0:
+            lines = [line.split(comments, 1)[0] for line in lines]
+        lines = [line for line in [line.strip() for line in lines] if line]
+        if not len(lines): continue
+
+        if numCols is None:
+            numCols = len(lines[0].split(delimiter))
+            if usecols is None: usecols = range(numCols)
+            for j in usecols:
+                if j<0 or j>=numCols:
+                    raise ValueError('usecols %d is not a column of %d' % (
+                        j, numCols))
+            columns = [typedarray('d') for j in usecols]
+
+        # check every row has numCols values, then split the whole
+        # chunk at once; column j is every numCols'th value from the j'th
+        if delimiter is None:
+            counts = [len(line.split()) for line in lines]
+        else:
+            counts = [line.count(delimiter)+1 for line in lines]
+        if counts.count(numCols)!=len(counts):
+            for i, count in enumerate(counts):
+                if count!=numCols: break
+            raise ValueError('Data row %d has %d columns; the first row has %d' % (
+                numRows+i+1, count, numCols))
+        if delimiter is None:
+            values = ' '.join(lines).split()
+        else:
+            values = delimiter.join(lines).split(delimiter)
+        for j, column in zip(usecols, columns):
+            column.fromlist(map(converters.get(j,float), values[j::numCols]))
+        numRows += len(lines)
+    if opened: fh.close()
+    if numCols is None: return zeros((0,), Float)
+
+    X = zeros((numRows, len(columns)), Float)
+    for j, column in enumerate(columns):
+        X[:,j] = fromstring(column.tostring(), Float)
+        del column[:]
     r,c = X.shape
     if r==1 or c==1:
         X.shape = max([r,c]),
@@ -1075,9 +1123,13 @@ def save(fname, X, fmt='%.18e',delimiter=' '):
 
     delimiter is used to separate the fields, eg delimiter ',' for
     comma-separated values
+
+    The rows are formatted many thousands at a time, with one string
+    format of the flattened values.
     """
 
-    if is_string_like(fname):
+    opened = is_string_like(fname)
+    if opened:
         if fname.endswith('.gz'):
             import gzip
             fh = gzip.open(fname,'wb')
@@ -1090,15 +1142,15 @@ def save(fname, X, fmt='%.18e',delimiter=' '):
 
 
     X = asarray(X)
-    origShape = None
     if len(X.shape)==1:
-        origShape = X.shape
-        X.shape = len(X), 1
-    for row in X:
-        fh.write(delimiter.join([fmt%val for val in row]) + '\n')
-
-    if origShape is not None:
-        X.shape = origShape
+        X = reshape(X, (len(X), 1))
+    numCols = X.shape[1]
+    rowfmt = delimiter.join([fmt]*numCols) + '\n'
+    step = max(1, (1<<16)//max(1, numCols))
+    for i in range(0, len(X), step):
+        rows = X[i:i+step]
+        fh.write((rowfmt*len(rows)) % tuple(ravel(rows).tolist()))
+    if opened: fh.close()
 
 
 
@@ -25,6 +25,13 @@ as follows
   s = r'\TeX\ is Number $\displaystyle\sum_{n=1}^\infty\frac{-e^{i\pi}}{2^n}$!'
   Z = self.texmanager.get_rgba(s, size=12, dpi=80, rgb=(1,0,0))
 
+The alpha masks behind the rgba arrays (see get_grey) are cached in
+memory and as raw 8 bit masks in tex.cache, keyed on a hash of the tex
+string, font size, font preamble and dpi.  The masks, tex, dvi, png and
+eps files in tex.cache are shared by all processes using the cache dir;
+the least recently used are deleted when they exceed
+rcParams['text.texcachesize'] megabytes
+
 To enable tex rendering of all text in your matplotlib figure, set
 text.usetex in your matplotlibrc file (http://matplotlib.sf.net/matplotlibrc)
 or include these two lines in your script:
@@ -37,8 +44,10 @@ import glob, os, sys, md5, shutil, warnings
 from matplotlib import get_configdir, get_home, get_data_path, \
      rcParams, verbose
 from matplotlib._image import readpng
+from matplotlib.cbook import lrudict
 from matplotlib.numerix import ravel, where, array, \
-     zeros, Float, absolute, nonzero, sqrt
+     zeros, Float, absolute, nonzero, sqrt, UInt8, fromstring, \
+     reshape
      
 debug = False
      
@@ -64,9 +73,16 @@ WARNING: found a TeX cache dir in the deprecated location "%s".
 
     dvipngVersion = None
 
-    arrayd = {}
+    # per process caches, bounded in the number of strings
+    arrayd = lrudict(50)
+    greyd = lrudict(200)
     postscriptd = {}
     pscnt = 0
+
+    # estimated size of the cache dir: the size after the last scan
+    # plus what this process wrote since, see _cache_written
+    _cachesize = None
+    _cachewrites = 0
     
     serif = ('cmr', '')
     sans_serif = ('cmss', '')
@@ -146,6 +162,16 @@ WARNING: found a TeX cache dir in the deprecated location "%s".
     def get_prefix(self, tex, fontsize):
         s = tex + self._fontconfig + '%f'% fontsize
         return md5.md5(s).hexdigest()
+
+    def get_grey_key(self, tex, fontsize, dpi):
+        """
+        Return the content hash identifying the alpha mask of tex at
+        fontsize and dpi
+        """
+        s = '\n'.join([tex, self._font_preamble, self.font_family,
+                       '%f'%fontsize, '%d'%dpi,
+                       str(rcParams['text.dvipnghack'])])
+        return md5.md5(s).hexdigest()
         
     def get_font_config(self):
         return self._fontconfig
@@ -154,21 +180,29 @@ WARNING: found a TeX cache dir in the deprecated location "%s".
         return self._font_preamble
         
     def get_tex_command(self, tex, fname, fontsize):
-        
+        return self.get_batch_tex_command([(tex, fontsize)], fname)
+
+    def get_batch_tex_command(self, texs, fname):
+        """
+        Write a document with one page for each (tex, fontsize) in
+        texs to fname and return the command to run latex on it
+        """
         fh = file(fname, 'w')
         fontcmd = {'sans-serif' : r'{\sffamily %s}',
             'monospace'  : r'{\ttfamily %s}'}.get(self.font_family, 
                 r'{\rmfamily %s}')
-        tex = fontcmd % tex
+        pages = [r'\fontsize{%f}{%f}%s' % (fontsize, fontsize*1.25,
+                                           fontcmd % tex)
+                 for tex, fontsize in texs]
         s = r"""\documentclass[10pt]{article}
 %s
 \setlength{\paperwidth}{72in}
 \setlength{\paperheight}{72in}
 \pagestyle{empty}
 \begin{document}
-\fontsize{%f}{%f}%s
+%s
 \end{document}
-""" % (self._font_preamble, fontsize, fontsize*1.25, tex)
+""" % (self._font_preamble, '\n\\newpage\n'.join(pages))
         fh.write(s)
         fh.close()
         command = 'latex -interaction=nonstopmode "%s"'%fname
@@ -182,7 +216,8 @@ WARNING: found a TeX cache dir in the deprecated location "%s".
         dvibase = prefix + '.dvi'
         dvifile = os.path.join(self.texcache, dvibase)        
 
-        if force or not os.path.exists(dvifile):
+        made = force or not os.path.exists(dvifile)
+        if made:
             command = self.get_tex_command(tex, fname, fontsize)
             verbose.report(command, 'debug-annoying')            
             stdin, stdout, stderr = os.popen3(command)
@@ -195,21 +230,22 @@ WARNING: found a TeX cache dir in the deprecated location "%s".
         # dir and move it if necessary and then cleanup
         if os.path.exists(dvibase):
             shutil.move(dvibase, dvifile)
-            for fname in glob.glob(prefix+'*'):
-                os.remove(fname)
+            for name in glob.glob(prefix+'*'):
+                os.remove(name)
+        if made: self._cache_written(fname, dvifile)
         return dvifile
         
-    def make_png(self, tex, fontsize, force=0):
+    def make_png(self, tex, fontsize, dpi=80, force=0):
         if debug: force = True
         
         dvifile = self.make_dvi(tex, fontsize)
         prefix = self.get_prefix(tex, fontsize)
-        pngfile = os.path.join(self.texcache, '%s.png'% prefix)
+        pngfile = os.path.join(self.texcache, '%s_%d.png'% (prefix, dpi))
 
         self.get_dvipng_version()  # raises if dvipng is not up-to-date
         #print 'makepng', prefix, dvifile, pngfile
         #command = 'dvipng -bg Transparent -fg "rgb 0.0 0.0 0.0" -D %d -T tight -o "%s" "%s"'% (dpi, pngfile, dvifile)
-        command = 'dvipng -bg Transparent -D 80 -T tight -o "%s" "%s"'% (pngfile, dvifile)        
+        command = 'dvipng -bg Transparent -D %d -T tight -o "%s" "%s"'% (dpi, pngfile, dvifile)
 
         #assume white bg
         #command = "dvipng -bg 'rgb 1.0 1.0 1.0' -fg 'rgb 0.0 0.0 0.0' -D %d -T tight -o %s %s"% (dpi, pngfile, dvifile)
@@ -223,6 +259,7 @@ WARNING: found a TeX cache dir in the deprecated location "%s".
             verbose.report(stdout.read(), 'debug-annoying')
             err = stderr.read()
             if err: verbose.report(err, 'helpful')
+            self._cache_written(pngfile)
         return pngfile
 
     def make_ps(self, tex, fontsize, force=0):
@@ -239,6 +276,7 @@ WARNING: found a TeX cache dir in the deprecated location "%s".
             verbose.report(stdout.read(), 'debug-annoying')
             err = stderr.read()
             if err: verbose.report(err, 'helpful')
+            self._cache_written(psfile)
 
         return psfile
 
@@ -366,19 +404,10 @@ WARNING: found a TeX cache dir in the deprecated location "%s".
         Z = self.arrayd.get(key)
         
         if Z is None:
-            # force=True to skip cacheing while debugging
-            pngfile = self.make_png(tex, fontsize, force=False)
-            X = readpng(pngfile)
-            vers = self.get_dvipng_version()
-            #print 'dvipng version', vers
-            if vers<'1.6' or rcParams['text.dvipnghack']:
-                # hack the alpha channel as described in comment above
-                alpha = sqrt(1-X[:,:,0])
-            else:
-                alpha = X[:,:,-1]
-            
+            alpha = self.get_grey(tex, fontsize)
+            m, n = alpha.shape
 
-            Z = zeros(X.shape, Float)
+            Z = zeros((m, n, 4), Float)
             Z[:,:,0] = r
             Z[:,:,1] = g
             Z[:,:,2] = b
@@ -388,6 +417,202 @@ WARNING: found a TeX cache dir in the deprecated location "%s".
 
         return Z
 
+    def get_grey(self, tex, fontsize=None, dpi=80):
+        """
+        Return the alpha mask of tex string as an MxN float array.
+        See get_rgba for how the mask is extracted from the dvipng
+        output
+        """
+        if not fontsize: fontsize = rcParams['font.size']
+        key = self.get_grey_key(tex, fontsize, dpi)
+        alpha = self.greyd.get(key)
+        if alpha is not None: return alpha
+
+        fname = os.path.join(self.texcache, key + '.alpha')
+        alpha = self._read_grey(fname)
+        if alpha is None:
+            # force=True to skip cacheing while debugging
+            pngfile = self.make_png(tex, fontsize, dpi, force=False)
+            alpha = self._write_grey(fname, self._read_png_alpha(pngfile))
+
+        self.greyd[key] = alpha
+        return alpha
+
+    def make_greys(self, texs, dpi=80):
+        """
+        Make the alpha masks of all (tex, fontsize) in texs that are
+        not cached yet with a single latex and dvipng run, one page
+        per string.  Strings the batch fails on are left to get_grey
+        """
+        pending = []
+        seen = {}
+        for tex, fontsize in texs:
+            key = self.get_grey_key(tex, fontsize, dpi)
+            if seen.has_key(key) or self.greyd.has_key(key): continue
+            seen[key] = 1
+            fname = os.path.join(self.texcache, key + '.alpha')
+            alpha = self._read_grey(fname)
+            if alpha is not None:
+                self.greyd[key] = alpha
+            else:
+                pending.append((tex, fontsize, key, fname))
+        # a single string is no cheaper in a batch
+        if len(pending)<2: return
+
+        prefix = md5.md5(''.join([key for tex, fontsize, key, fname
+                                  in pending])).hexdigest()
+        texfile = os.path.join(self.texcache, prefix + '.tex')
+        dvibase = prefix + '.dvi'
+        dvifile = os.path.join(self.texcache, dvibase)
+        command = self.get_batch_tex_command(
+            [(tex, fontsize) for tex, fontsize, key, fname in pending],
+            texfile)
+        verbose.report(command, 'debug-annoying')
+        stdin, stdout, stderr = os.popen3(command)
+        verbose.report(stdout.read(), 'debug-annoying')
+        err = stderr.read()
+        if err: verbose.report(err, 'helpful')
+
+        # see make_dvi
+        if os.path.exists(dvibase):
+            shutil.move(dvibase, dvifile)
+            for fname in glob.glob(prefix+'*'):
+                os.remove(fname)
+
+        if os.path.exists(dvifile):
+            self.get_dvipng_version()  # raises if dvipng is not up-to-date
+            # dvipng numbers the pages it writes from 1
+            pngbase = os.path.join(self.texcache, prefix + '_%d.png')
+            command = 'dvipng -bg Transparent -D %d -T tight -o "%s" "%s"'% (
+                dpi, pngbase, dvifile)
+            verbose.report(command, 'debug-annoying')
+            stdin, stdout, stderr = os.popen3(command)
+            verbose.report(stdout.read(), 'debug-annoying')
+            err = stderr.read()
+            if err: verbose.report(err, 'helpful')
+
+            # a string that produces no page would shift all the pages
+            # after it, so only use the batch if the page count is right
+            pngfiles = [pngbase % (i+1) for i in range(len(pending))]
+            ok = (not os.path.exists(pngbase % (len(pending)+1)) and
+                  len(filter(os.path.exists, pngfiles))==len(pending))
+            if ok:
+                for (tex, fontsize, key, fname), pngfile in zip(pending, pngfiles):
+                    alpha = self._write_grey(fname,
+                                             self._read_png_alpha(pngfile))
+                    self.greyd[key] = alpha
+            else:
+                verbose.report('TeX batch did not produce one page per '
+                               'string; rendering them one at a time',
+                               'helpful')
+
+        for fname in glob.glob(os.path.join(self.texcache, prefix+'*')):
+            try: os.remove(fname)
+            except OSError: pass
+
+    def _read_png_alpha(self, pngfile):
+        'Return the alpha mask of a dvipng file; see get_rgba'
+        X = readpng(pngfile)
+        vers = self.get_dvipng_version()
+        #print 'dvipng version', vers
+        if vers<'1.6' or rcParams['text.dvipnghack']:
+            # hack the alpha channel as described in get_rgba
+            return sqrt(1-X[:,:,0])
+        else:
+            return X[:,:,-1]
+
+    def _read_grey(self, fname):
+        """
+        Return the mask stored in fname, or None if there is no usable
+        mask.  Reading a mask marks it as recently used
+        """
+        try:
+            fh = file(fname, 'rb')
+            try:
+                m, n = [int(val) for val in fh.readline().split()]
+                s = fh.read()
+            finally:
+                fh.close()
+        except (IOError, ValueError):
+            return None
+        if len(s)!=m*n: return None
+        try: os.utime(fname, None)
+        except OSError: pass
+        return reshape(fromstring(s, UInt8), (m, n))/255.
+
+    def _write_grey(self, fname, alpha):
+        """
+        Store the float mask alpha in fname as a header line with the
+        shape followed by the 8 bit mask, and return the mask as it
+        will be read back
+        """
+        m, n = alpha.shape
+        mask = (alpha*255 + 0.5).astype(UInt8)
+        # write to a temporary name and rename so other processes
+        # sharing the cache never see a partially written mask
+        tmpname = '%s.%d.tmp' % (fname, os.getpid())
+        try:
+            fh = file(tmpname, 'wb')
+            fh.write('%d %d\n' % (m, n))
+            fh.write(mask.tostring())
+            fh.close()
+            # rename does not replace an existing file on windows
+            if sys.platform=='win32' and os.path.exists(fname):
+                os.remove(fname)
+            os.rename(tmpname, fname)
+        except (IOError, OSError), msg:
+            verbose.report('Could not cache tex mask %s: %s'%(fname, msg),
+                           'helpful')
+            if os.path.exists(tmpname): os.remove(tmpname)
+        else:
+            self._cache_written(fname)
+        return mask/255.
+
+    def _cache_written(self, *fnames):
+        """
+        Add the sizes of the files just written to the cache dir to the
+        size estimate, and scan the cache dir with _evict_cache when the
+        estimate exceeds rcParams['text.texcachesize'] megabytes, on
+        the first write, and every 100 writes to catch what other
+        processes wrote
+        """
+        klass = self.__class__
+        if klass._cachesize is None:
+            self._evict_cache()
+            return
+        klass._cachewrites += 1
+        for fname in fnames:
+            try: klass._cachesize += os.path.getsize(fname)
+            except OSError: pass
+        maxsize = rcParams['text.texcachesize']*1024*1024
+        if klass._cachesize>maxsize or klass._cachewrites>=100:
+            self._evict_cache()
+
+    def _evict_cache(self):
+        """
+        Delete the least recently used files in the cache dir until
+        they fit in rcParams['text.texcachesize'] megabytes
+        """
+        maxsize = rcParams['text.texcachesize']*1024*1024
+        entries = []
+        total = 0
+        for fname in glob.glob(os.path.join(self.texcache, '*')):
+            # skip masks still being written by another process
+            if fname.endswith('.tmp'): continue
+            try: st = os.stat(fname)
+            except OSError: continue # removed by another process
+            entries.append((st.st_mtime, st.st_size, fname))
+            total += st.st_size
+        if total>maxsize:
+            entries.sort()
+            for mtime, size, fname in entries:
+                if total<=maxsize: break
+                try: os.remove(fname)
+                except OSError: pass
+                total -= size
+        self.__class__._cachesize = total
+        self.__class__._cachewrites = 0
+
     def get_dvipng_version(self):
         if self.dvipngVersion is not None: return self.dvipngVersion
         sin, sout = os.popen2('dvipng --version')
@@ -493,6 +493,7 @@ class Text(Artist):
         ACCEPTS: any matplotlib color - see help(colors)
         """
         self._backgroundcolor = color
+        self.pchanged()
 
 
     def set_color(self, color):
@@ -507,6 +508,7 @@ class Text(Artist):
         except TypeError:
             color = tuple(color)
         self._color = color
+        self.pchanged()
 
     def set_ha(self, align):
         'alias for set_horizontalalignment'
@@ -522,6 +524,7 @@ class Text(Artist):
         if align not in legal:
             raise ValueError('Horizontal alignment must be one of %s' % str(legal))
         self._horizontalalignment = align
+        self.pchanged()
 
     def set_ma(self, align):
         'alias for set_verticalalignment'
@@ -541,6 +544,7 @@ class Text(Artist):
         if align not in legal:
             raise ValueError('Horizontal alignment must be one of %s' % str(legal))
         self._multialignment = align
+        self.pchanged()
 
     def set_family(self, fontname):
         """
@@ -549,6 +553,7 @@ class Text(Artist):
         ACCEPTS: [ 'serif' | 'sans-serif' | 'cursive' | 'fantasy' | 'monospace' ]
         """
         self._fontproperties.set_family(fontname)
+        self.pchanged()
 
     def set_variant(self, variant):
         """
@@ -557,6 +562,7 @@ class Text(Artist):
         ACCEPTS: [ 'normal' | 'small-caps' ]
         """
         self._fontproperties.set_variant(variant)
+        self.pchanged()
 
     def set_name(self, fontname):
         """
@@ -565,6 +571,7 @@ class Text(Artist):
         ACCEPTS: string eg, ['Sans' | 'Courier' | 'Helvetica' ...]
         """
         self._fontproperties.set_name(fontname)
+        self.pchanged()
 
     def set_fontname(self, fontname):
         'alias for set_name'
@@ -577,10 +584,12 @@ class Text(Artist):
         ACCEPTS: [ 'normal' | 'italic' | 'oblique']
         """
         self._fontproperties.set_style(fontstyle)
+        self.pchanged()
 
     def set_fontstyle(self, fontstyle):
         'alias for set_style'
         self._fontproperties.set_style(fontstyle)
+        self.pchanged()
 
     def set_size(self, fontsize):
         """
@@ -589,14 +598,17 @@ class Text(Artist):
         ACCEPTS: [ size in points | relative size eg 'smaller', 'x-large' ]
         """
         self._fontproperties.set_size(fontsize)
+        self.pchanged()
 
     def set_fontsize(self, fontsize):
         'alias for set_size'
         self._fontproperties.set_size(fontsize)
+        self.pchanged()
 
     def set_fontweight(self, weight):
         'alias for set_weight'
         self._fontproperties.set_weight(weight)
+        self.pchanged()
 
     def set_weight(self, weight):
         """
@@ -605,6 +617,7 @@ class Text(Artist):
         ACCEPTS: [ 'normal' | 'bold' | 'heavy' | 'light' | 'ultrabold' | 'ultralight']
         """
         self._fontproperties.set_weight(weight)
+        self.pchanged()
 
     def set_position(self, xy):
         """
@@ -622,6 +635,7 @@ class Text(Artist):
         ACCEPTS: float
         """
         self._x = float(x)
+        self.pchanged()
 
 
     def set_y(self, y):
@@ -631,6 +645,7 @@ class Text(Artist):
         ACCEPTS: float
         """
         self._y = float(y)
+        self.pchanged()
 
 
     def set_rotation(self, s):
@@ -640,6 +655,7 @@ class Text(Artist):
         ACCEPTS: [ angle in degrees 'vertical' | 'horizontal'
         """
         self._rotation = s
+        self.pchanged()
 
 
 
@@ -658,6 +674,7 @@ class Text(Artist):
             raise ValueError('Vertical alignment must be one of %s' % str(legal))
 
         self._verticalalignment = align
+        self.pchanged()
 
     def set_text(self, s):
         """
@@ -670,6 +687,7 @@ class Text(Artist):
         self._text = s
         #self._substrings = scanner(s)  # support embedded mathtext
         self._substrings = []           # ignore embedded mathtext for now
+        self.pchanged()
 
     def is_math_text(self):
         if rcParams['text.usetex']: return 'TeX'
@@ -685,6 +703,7 @@ class Text(Artist):
         ACCEPTS: a matplotlib.font_manager.FontProperties instance
         """
         self._fontproperties = fp
+        self.pchanged()
 
 
 
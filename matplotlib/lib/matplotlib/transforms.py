@@ -58,7 +58,8 @@ The bbox methods are
   get_bounds()        - get the left, bottom, width, height bounding tuple
   update(xys, ignore) - update the bbox to bound all the xy tuples in
       xys; if ignore is true ignore the current contents of bbox and
-      just bound the tuples.  If ignore is false, bound self + tuples
+      just bound the tuples.  If ignore is false, bound self + tuples.
+      xys may also be an Nx2 numerix array
   width()             - return the width of the bbox
   height()            - return the height of the bbox
   xmax()              - return the x coord of upper right
@@ -122,7 +123,9 @@ All transformations
   seq_x_y(x, y)         - transform the python sequences x and y
   numerix_x_y(x, y)     - x and y are numerix 1D arrays
   seq_xy_tups(seq)      - seq is a sequence of xy tuples
+  numerix_xy(xy)        - xy is an Nx2 numerix array; return an Nx2 array
   inverse_xy_tup(xy)    - apply the inverse transformation to tuple xy
+  inverse_numerix_xy(xy) - apply the inverse transformation to Nx2 array xy
 
   set_offset(xy, trans) - xy is an x,y tuple and trans is a
     Transformation instance.  This will apply a post transformational
@@ -147,6 +150,28 @@ Affine transformations
   as_vec6() - return the affine as length 6 list of Values
 
 
+The SpatialIndex class buckets a set of vertices (usually in display
+coords) on a uniform grid so that point queries do not have to visit
+every vertex.  It is built from numerix arrays with
+
+  index = SpatialIndex(x, y, connect)
+
+where connect is True if the vertices are the consecutive points of a
+line.  The methods are
+
+  nearest(x, y)          - return index, distance of the closest vertex
+                           to x, y, or None if there are no vertices
+  count_contains(bbox)   - return the number of vertices in bbox
+  indices_in_bbox(bbox)  - return the sorted indices of the vertices in bbox
+  cuts_bbox(bbox)        - return True if the line through the vertices
+                           crosses an edge of bbox (connect only)
+  get_bounds()           - get the left, bottom, width, height of the vertices
+  size()                 - the number of vertices
+
+Line2D.get_spatial_index caches an index of the line's display space
+vertices.
+
+
 In general, you shouldn't need to construct your own transformations,
 but should use the helper functions defined in this module.
 
@@ -186,7 +211,7 @@ but should use the helper functions defined in this module.
 The units/transform_unit.py code has many examples.
 """
 import math
-from _transforms import Value, Point, Interval, Bbox, Affine
+from _transforms import Value, Point, Interval, Bbox, Affine, SpatialIndex
 from _transforms import IDENTITY, LOG10, POLAR, Func, FuncXY
 from _transforms import SeparableTransformation, NonseparableTransformation
 from matplotlib.numerix import array, Float
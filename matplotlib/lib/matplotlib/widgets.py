@@ -11,10 +11,26 @@ from mlab import linspace, dist
 from patches import Circle, Rectangle
 from lines import Line2D
 from numerix import array
-from transforms import blend_xy_sep_transform
+from transforms import blend_xy_sep_transform, lbwh_to_bbox
 
 import thread
 
+
+def select_vertices(artist, x1, y1, x2, y2):
+    """
+    Return the sorted indices of the vertices of artist (eg a Line2D)
+    inside the display space rectangle with corners x1, y1 and x2, y2,
+    eg eclick.x, eclick.y, erelease.x, erelease.y from a
+    RectangleSelector.  This uses the artist's cached spatial index so
+    it doesn't visit every vertex.  For lines, the indices are into
+    the valid data, ie line.get_xdata(valid_only=True)
+    """
+    index = artist.get_spatial_index()
+    if index is None:
+        raise ValueError('%s does not support a spatial index'%artist)
+    bbox = lbwh_to_bbox(min(x1, x2), min(y1, y2), abs(x2-x1), abs(y2-y1))
+    return index.indices_in_bbox(bbox)
+
 class Widget:
     """
     OK, I couldn't resist; abstract base class for mpl GUI neutral
@@ -841,13 +857,15 @@ class RectangleSelector:
     Example usage:
 
       ax = subplot(111)
-      ax.plot(x,y)
+      line, = ax.plot(x,y)
 
       def onselect(eclick, erelease):
           'eclick and erelease are matplotlib events at press and release'
           print 'startposition : (%f,%f)'%(eclick.xdata, eclick.ydata)
           print 'endposition   : (%f,%f)'%(erelease.xdata, erelease.ydata)
           print 'used button   : ', eclick.button
+          print 'selected      : ', select_vertices(line, eclick.x, eclick.y,
+                                                    erelease.x, erelease.y)
 
       span = Selector(ax, onselect,drawtype='box')
       show()
@@ -7,6 +7,9 @@ Olson timezone database:
 
     ftp://elsie.nci.nih.gov/pub/tz*.tar.gz
 
+The zones are compiled into one file, zones.dat, which is read by
+zonedata.ZoneData.
+
 See the datetime section of the Python Library Reference for information
 on how to use these modules.
 '''
@@ -20,10 +23,15 @@ VERSION = OLSEN_VERSION + '.2'
 
 __all__ = ['timezone', 'all_timezones', 'common_timezones']
 
-import sys
+import os
 
 from tzinfo import AmbiguousTimeError
 
+# the compiled database, opened by the first timezone call, and the
+# tzinfo instance of every zone looked up
+_zonedata = None
+_tzinfo_cache = {}
+
 def timezone(zone):
     ''' Return a datetime.tzinfo implementation for the given timezone 
     
@@ -42,29 +50,21 @@ def timezone(zone):
     >>> (loc_dt + timedelta(minutes=10)).strftime(fmt)
     '2002-10-27 01:10:00 EST (-0500)'
     '''
-    zone = _munge_zone(zone)
-    zone_bits = ['zoneinfo'] + zone.split('/')
-
-    # Load zone's module
-    module_name = '.'.join(zone_bits)
     try:
-        module = __import__(module_name, globals(), locals())
-    except ImportError:
-        raise KeyError, zone
-    rv = module
-    for bit in zone_bits[1:]:
-        rv = getattr(rv, bit)
+        return _tzinfo_cache[zone]
+    except KeyError:
+        pass
 
-    # Return instance from that module
-    rv = getattr(rv, zone_bits[-1])
-    assert type(rv) != type(sys)
+    # Decode the zone from the compiled database, zones.dat
+    global _zonedata
+    if _zonedata is None:
+        from zonedata import ZoneData
+        _zonedata = ZoneData(os.path.join(os.path.dirname(__file__),
+                                          'zones.dat'))
+    rv = _zonedata.load(zone)
+    _tzinfo_cache[zone] = rv
     return rv
 
-def _munge_zone(zone):
-    ''' Convert a zone into a string suitable for use as a Python identifier 
-    '''
-    return zone.replace('+', '_plus_').replace('-', '_minus_')
-
 def _test():
     import doctest, os, sys
     sys.path.insert(0, os.pardir)
@@ -382,6 +382,35 @@ class LocalTestCase(unittest.TestCase):
                 '2004-10-31 02:00:00 CET+0100'
                 )
 
+class ZoneDataTestCase(unittest.TestCase):
+    def testAllZones(self):
+        for zone in pytz.all_timezones:
+            self.failUnlessEqual(str(pytz.timezone(zone)), zone)
+
+    def testCache(self):
+        self.failUnless(
+                pytz.timezone('Europe/Amsterdam')
+                is pytz.timezone('Europe/Amsterdam')
+                )
+
+    def testUnknownZone(self):
+        self.assertRaises(KeyError, pytz.timezone, 'Nowhere/Special')
+
+    def testTransitionTimes(self):
+        tz = pytz.timezone('US/Eastern')
+        self.failUnlessEqual(tz._utc_transition_times[0], datetime(1,1,1))
+        self.failUnlessEqual(
+                tz._utc_transition_times[1], datetime(1918,3,31,7,0,0)
+                )
+        self.failUnlessEqual(
+                len(tz._utc_transition_times), len(tz._transition_info)
+                )
+
+    def testStaticZone(self):
+        tz = pytz.timezone('Etc/GMT+5')
+        dt = datetime(2004, 6, 1, 12, 0, 0, tzinfo=UTC).astimezone(tz)
+        self.failUnlessEqual(dt.strftime(fmt), '2004-06-01 07:00:00 GMT+5-0500')
+
 def test_suite():
     suite = unittest.TestSuite()
     suite.addTest(doctest.DocTestSuite('pytz'))
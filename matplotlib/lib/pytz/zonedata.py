@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+'''
+The compiled timezone database: every zone in one binary file, read
+through a memory map and decoded one zone at a time.
+
+All numbers are big endian.  The file starts with the header
+
+    'PYTZ', version (H), number of zones n (L), length of names (L)
+
+followed by the zone names joined by newlines and n+1 offsets (L) of
+the zone records, the last being the end of the file.  A record is
+either a static zone
+
+    0 (B), utcoffset seconds (l), length of tzname (B), tzname
+
+or a zone with transitions
+
+    1 (B), number of transitions (H), number of ttinfos (B),
+    ttinfos: utcoffset seconds (l), dst seconds (l), length of
+        tzname (B), tzname
+    transition times in UTC seconds since the epoch (d), one per
+        transition
+    the ttinfo index of each transition (B)
+
+write() compiles a database from tzinfo instances.
+'''
+
+import mmap, struct, sys
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timedelta
+
+from tzinfo import StaticTzInfo, DstTzInfo, memorized_timedelta, \
+     memorized_ttinfo
+
+MAGIC = 'PYTZ'
+VERSION = 1
+_header = '>4sHLL'
+_headersize = struct.calcsize(_header)
+
+_epoch = datetime(1970, 1, 1)
+
+
+def _seconds(dt):
+    '''Seconds from the epoch to the naive datetime dt'''
+    delta = dt - _epoch
+    return delta.days*86400 + delta.seconds + delta.microseconds*1e-6
+
+
+class CompiledDstTzInfo(DstTzInfo):
+    '''A DstTzInfo whose transition times are an array of seconds
+
+    fromutc bisects the numeric array, so the transitions never have
+    to be made into datetimes.
+
+    '''
+    # Overridden in subclass
+    _utc_transition_seconds = None
+
+    def _get_utc_transition_times(self):
+        return [_epoch + timedelta(seconds=t)
+                for t in self._utc_transition_seconds]
+    _utc_transition_times = property(_get_utc_transition_times)
+
+    def fromutc(self, dt):
+        '''See datetime.tzinfo.fromutc'''
+        dt = dt.replace(tzinfo=None)
+        idx = max(0, bisect_right(self._utc_transition_seconds,
+                                  _seconds(dt)) - 1)
+        inf = self._transition_info[idx]
+        return (dt + inf[0]).replace(tzinfo=self._tzinfos[inf])
+
+
+class ZoneData:
+    '''The zones of a compiled database file, by name
+
+    Only the header and the names are read when the file is opened;
+    a zone is decoded by load.
+
+    '''
+    def __init__(self, fname):
+        fh = open(fname, 'rb')
+        try:
+            self._data = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, EnvironmentError, ValueError):
+            # no mmap on this platform, or it can not map the file
+            self._data = fh.read()
+        fh.close()
+
+        data = self._data
+        magic, version, n, namesize = struct.unpack(
+            _header, data[:_headersize])
+        if magic != MAGIC or version != VERSION:
+            raise ValueError, '%s is not a compiled timezone database' % fname
+        start = _headersize + namesize
+        self._names = data[_headersize:start].split('\n')
+        self._offsets = struct.unpack('>%dL' % (n+1), data[start:start+4*(n+1)])
+        self._index = {}
+        for i, name in enumerate(self._names):
+            self._index[name] = i
+
+    def names(self):
+        '''Return the zone names, sorted'''
+        return self._names[:]
+
+    def has_key(self, zone):
+        return self._index.has_key(zone)
+
+    def load(self, zone):
+        '''Return a new tzinfo instance for zone; raise KeyError if
+        there is no zone of that name'''
+        i = self._index[zone]
+        data = self._data[self._offsets[i]:self._offsets[i+1]]
+        classname = str(zone.split('/')[-1].replace('-', '_'))
+
+        if data[0] == '\x00':
+            utcoffset, size = struct.unpack('>lB', data[1:6])
+            return type(classname, (StaticTzInfo,), {
+                '_zone': zone,
+                '_utcoffset': memorized_timedelta(utcoffset),
+                '_tzname': data[6:6+size],
+                })()
+
+        ntrans, ninfo = struct.unpack('>HB', data[1:4])
+        pos = 4
+        infos = []
+        for k in range(ninfo):
+            utcoffset, dst, size = struct.unpack('>llB', data[pos:pos+9])
+            pos += 9
+            infos.append(memorized_ttinfo(utcoffset, dst, data[pos:pos+size]))
+            pos += size
+
+        seconds = array('d')
+        seconds.fromstring(data[pos:pos+8*ntrans])
+        if sys.byteorder == 'little':
+            seconds.byteswap()
+        pos += 8*ntrans
+        transition_info = [infos[k] for k in array('B', data[pos:pos+ntrans])]
+
+        return type(classname, (CompiledDstTzInfo,), {
+            '_zone': zone,
+            '_utc_transition_seconds': seconds,
+            '_transition_info': transition_info,
+            })()
+
+
+def _pack_name(name):
+    return struct.pack('>B', len(name)) + name
+
+def write(fname, zones):
+    '''Write zones, a sequence of (name, tzinfo) pairs where tzinfo is
+    a StaticTzInfo or DstTzInfo instance, to the compiled database
+    fname'''
+    records = []
+    for name, tz in zones:
+        if isinstance(tz, StaticTzInfo):
+            records.append((name, '\x00' +
+                struct.pack('>l', _total_seconds(tz._utcoffset)) +
+                _pack_name(tz._tzname)))
+            continue
+
+        infos = []
+        indices = []
+        for inf in tz._transition_info:
+            if inf not in infos:
+                infos.append(inf)
+            indices.append(infos.index(inf))
+        transitions = tz._utc_transition_times
+        chunks = ['\x01', struct.pack('>HB', len(transitions), len(infos))]
+        for utcoffset, dst, tzname in infos:
+            chunks.append(struct.pack('>ll', _total_seconds(utcoffset),
+                                      _total_seconds(dst)))
+            chunks.append(_pack_name(tzname))
+        chunks.append(struct.pack('>%dd' % len(transitions),
+                                  *[_seconds(dt) for dt in transitions]))
+        chunks.append(struct.pack('>%dB' % len(indices), *indices))
+        records.append((name, ''.join(chunks)))
+
+    records.sort()
+    names = '\n'.join([name for name, record in records])
+    offset = _headersize + len(names) + 4*(len(records)+1)
+    offsets = []
+    for name, record in records:
+        offsets.append(offset)
+        offset += len(record)
+    offsets.append(offset)
+
+    fh = open(fname, 'wb')
+    fh.write(struct.pack(_header, MAGIC, VERSION, len(records), len(names)))
+    fh.write(names)
+    fh.write(struct.pack('>%dL' % len(offsets), *offsets))
+    for name, record in records:
+        fh.write(record)
+    fh.close()
+
+def _total_seconds(delta):
+    return delta.days*86400 + delta.seconds
@@ -1,88 +0,0 @@
-'''tzinfo timezone information for Africa/Khartoum.'''
-from pytz.tzinfo import DstTzInfo
-from pytz.tzinfo import memorized_datetime as d
-from pytz.tzinfo import memorized_ttinfo as i
-
-class Khartoum(DstTzInfo):
-    '''Africa/Khartoum timezone definition. See datetime.tzinfo for details'''
-
-    _zone = 'Africa/Khartoum'
-
-    _utc_transition_times = [
-d(1,1,1,0,0,0),
-d(1930,12,31,21,49,52),
-d(1970,4,30,22,0,0),
-d(1970,10,14,21,0,0),
-d(1971,4,29,22,0,0),
-d(1971,10,14,21,0,0),
-d(1972,4,29,22,0,0),
-d(1972,10,14,21,0,0),
-d(1973,4,28,22,0,0),
-d(1973,10,14,21,0,0),
-d(1974,4,27,22,0,0),
-d(1974,10,14,21,0,0),
-d(1975,4,26,22,0,0),
-d(1975,10,14,21,0,0),
-d(1976,4,24,22,0,0),
-d(1976,10,14,21,0,0),
-d(1977,4,23,22,0,0),
-d(1977,10,14,21,0,0),
-d(1978,4,29,22,0,0),
-d(1978,10,14,21,0,0),
-d(1979,4,28,22,0,0),
-d(1979,10,14,21,0,0),
-d(1980,4,26,22,0,0),
-d(1980,10,14,21,0,0),
-d(1981,4,25,22,0,0),
-d(1981,10,14,21,0,0),
-d(1982,4,24,22,0,0),
-d(1982,10,14,21,0,0),
-d(1983,4,23,22,0,0),
-d(1983,10,14,21,0,0),
-d(1984,4,28,22,0,0),
-d(1984,10,14,21,0,0),
-d(1985,4,27,22,0,0),
-d(1985,10,14,21,0,0),
-d(2000,1,15,10,0,0),
-        ]
-
-    _transition_info = [
-i(7800,0,'LMT'),
-i(7200,0,'CAT'),
-i(10800,3600,'CAST'),
-i(7200,0,'CAT'),
-i(10800,3600,'CAST'),
-i(7200,0,'CAT'),
-i(10800,3600,'CAST'),
-i(7200,0,'CAT'),
-i(10800,3600,'CAST'),
-i(7200,0,'CAT'),
-i(10800,3600,'CAST'),
-i(7200,0,'CAT'),
-i(10800,3600,'CAST'),
-i(7200,0,'CAT'),
-i(10800,3600,'CAST'),
-i(7200,0,'CAT'),
-i(10800,3600,'CAST'),
-i(7200,0,'CAT'),
-i(10800,3600,'CAST'),
-i(7200,0,'CAT'),
-i(10800,3600,'CAST'),
-i(7200,0,'CAT'),
-i(10800,3600,'CAST'),
-i(7200,0,'CAT'),
-i(10800,3600,'CAST'),
-i(7200,0,'CAT'),
-i(10800,3600,'CAST'),
-i(7200,0,'CAT'),
-i(10800,3600,'CAST'),
-i(7200,0,'CAT'),
-i(10800,3600,'CAST'),
-i(7200,0,'CAT'),
-i(10800,3600,'CAST'),
-i(7200,0,'CAT'),
-i(10800,0,'EAT'),
-        ]
-
-Khartoum = Khartoum()
-
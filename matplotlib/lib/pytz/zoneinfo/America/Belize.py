@@ -1,130 +0,0 @@
-'''tzinfo timezone information for America/Belize.'''
-from pytz.tzinfo import DstTzInfo
-from pytz.tzinfo import memorized_datetime as d
-from pytz.tzinfo import memorized_ttinfo as i
-
-class Belize(DstTzInfo):
-    '''America/Belize timezone definition. See datetime.tzinfo for details'''
-
-    _zone = 'America/Belize'
-
-    _utc_transition_times = [
-d(1,1,1,0,0,0),
-d(1912,4,1,5,52,48),
-d(1918,10,6,6,0,0),
-d(1919,2,9,5,30,0),
-d(1919,10,5,6,0,0),
-d(1920,2,15,5,30,0),
-d(1920,10,3,6,0,0),
-d(1921,2,13,5,30,0),
-d(1921,10,2,6,0,0),
-d(1922,2,12,5,30,0),
-d(1922,10,8,6,0,0),
-d(1923,2,11,5,30,0),
-d(1923,10,7,6,0,0),
-d(1924,2,10,5,30,0),
-d(1924,10,5,6,0,0),
-d(1925,2,15,5,30,0),
-d(1925,10,4,6,0,0),
-d(1926,2,14,5,30,0),
-d(1926,10,3,6,0,0),
-d(1927,2,13,5,30,0),
-d(1927,10,2,6,0,0),
-d(1928,2,12,5,30,0),
-d(1928,10,7,6,0,0),
-d(1929,2,10,5,30,0),
-d(1929,10,6,6,0,0),
-d(1930,2,9,5,30,0),
-d(1930,10,5,6,0,0),
-d(1931,2,15,5,30,0),
-d(1931,10,4,6,0,0),
-d(1932,2,14,5,30,0),
-d(1932,10,2,6,0,0),
-d(1933,2,12,5,30,0),
-d(1933,10,8,6,0,0),
-d(1934,2,11,5,30,0),
-d(1934,10,7,6,0,0),
-d(1935,2,10,5,30,0),
-d(1935,10,6,6,0,0),
-d(1936,2,9,5,30,0),
-d(1936,10,4,6,0,0),
-d(1937,2,14,5,30,0),
-d(1937,10,3,6,0,0),
-d(1938,2,13,5,30,0),
-d(1938,10,2,6,0,0),
-d(1939,2,12,5,30,0),
-d(1939,10,8,6,0,0),
-d(1940,2,11,5,30,0),
-d(1940,10,6,6,0,0),
-d(1941,2,9,5,30,0),
-d(1941,10,5,6,0,0),
-d(1942,2,15,5,30,0),
-d(1942,10,4,6,0,0),
-d(1943,2,14,5,30,0),
-d(1973,12,5,6,0,0),
-d(1974,2,9,5,0,0),
-d(1982,12,18,6,0,0),
-d(1983,2,12,5,0,0),
-        ]
-
-    _transition_info = [
-i(-21180,0,'LMT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-19800,1800,'CHDT'),
-i(-21600,0,'CST'),
-i(-18000,3600,'CDT'),
-i(-21600,0,'CST'),
-i(-18000,3600,'CDT'),
-i(-21600,0,'CST'),
-        ]
-
-Belize = Belize()
-
@@ -1,62 +0,0 @@
-'''tzinfo timezone information for America/Jamaica.'''
-from pytz.tzinfo import DstTzInfo
-from pytz.tzinfo import memorized_datetime as d
-from pytz.tzinfo import memorized_ttinfo as i
-
-class Jamaica(DstTzInfo):
-    '''America/Jamaica timezone definition. See datetime.tzinfo for details'''
-
-    _zone = 'America/Jamaica'
-
-    _utc_transition_times = [
-d(1,1,1,0,0,0),
-d(1912,2,1,5,7,12),
-d(1974,4,28,7,0,0),
-d(1974,10,27,6,0,0),
-d(1975,2,23,7,0,0),
-d(1975,10,26,6,0,0),
-d(1976,4,25,7,0,0),
-d(1976,10,31,6,0,0),
-d(1977,4,24,7,0,0),
-d(1977,10,30,6,0,0),
-d(1978,4,30,7,0,0),
-d(1978,10,29,6,0,0),
-d(1979,4,29,7,0,0),
-d(1979,10,28,6,0,0),
-d(1980,4,27,7,0,0),
-d(1980,10,26,6,0,0),
-d(1981,4,26,7,0,0),
-d(1981,10,25,6,0,0),
-d(1982,4,25,7,0,0),
-d(1982,10,31,6,0,0),
-d(1983,4,24,7,0,0),
-d(1983,10,30,6,0,0),
-        ]
-
-    _transition_info = [
-i(-18420,0,'KMT'),
-i(-18000,0,'EST'),
-i(-14400,3600,'EDT'),
-i(-18000,0,'EST'),
-i(-14400,3600,'EDT'),
-i(-18000,0,'EST'),
-i(-14400,3600,'EDT'),
-i(-18000,0,'EST'),
-i(-14400,3600,'EDT'),
-i(-18000,0,'EST'),
-i(-14400,3600,'EDT'),
-i(-18000,0,'EST'),
-i(-14400,3600,'EDT'),
-i(-18000,0,'EST'),
-i(-14400,3600,'EDT'),
-i(-18000,0,'EST'),
-i(-14400,3600,'EDT'),
-i(-18000,0,'EST'),
-i(-14400,3600,'EDT'),
-i(-18000,0,'EST'),
-i(-14400,3600,'EDT'),
-i(-18000,0,'EST'),
-        ]
-
-Jamaica = Jamaica()
-
@@ -1,276 +0,0 @@
-'''tzinfo timezone information for America/Sao_Paulo.'''
-from pytz.tzinfo import DstTzInfo
-from pytz.tzinfo import memorized_datetime as d
-from pytz.tzinfo import memorized_ttinfo as i
-
-class Sao_Paulo(DstTzInfo):
-    '''America/Sao_Paulo timezone definition. See datetime.tzinfo for details'''
-
-    _zone = 'America/Sao_Paulo'
-
-    _utc_transition_times = [
-d(1,1,1,0,0,0),
-d(1914,1,1,3,6,28),
-d(1931,10,3,14,0,0),
-d(1932,4,1,2,0,0),
-d(1932,10,3,3,0,0),
-d(1933,4,1,2,0,0),
-d(1949,12,1,3,0,0),
-d(1950,4,16,3,0,0),
-d(1950,12,1,3,0,0),
-d(1951,4,1,2,0,0),
-d(1951,12,1,3,0,0),
-d(1952,4,1,2,0,0),
-d(1952,12,1,3,0,0),
-d(1953,3,1,2,0,0),
-d(1963,10,23,3,0,0),
-d(1964,3,1,2,0,0),
-d(1965,1,31,3,0,0),
-d(1965,3,31,2,0,0),
-d(1965,12,1,3,0,0),
-d(1966,3,1,2,0,0),
-d(1966,11,1,3,0,0),
-d(1967,3,1,2,0,0),
-d(1967,11,1,3,0,0),
-d(1968,3,1,2,0,0),
-d(1985,11,2,3,0,0),
-d(1986,3,15,2,0,0),
-d(1986,10,25,3,0,0),
-d(1987,2,14,2,0,0),
-d(1987,10,25,3,0,0),
-d(1988,2,7,2,0,0),
-d(1988,10,16,3,0,0),
-d(1989,1,29,2,0,0),
-d(1989,10,15,3,0,0),
-d(1990,2,11,2,0,0),
-d(1990,10,21,3,0,0),
-d(1991,2,17,2,0,0),
-d(1991,10,20,3,0,0),
-d(1992,2,9,2,0,0),
-d(1992,10,25,3,0,0),
-d(1993,1,31,2,0,0),
-d(1993,10,17,3,0,0),
-d(1994,2,20,2,0,0),
-d(1994,10,16,3,0,0),
-d(1995,2,19,2,0,0),
-d(1995,10,15,3,0,0),
-d(1996,2,11,2,0,0),
-d(1996,10,6,3,0,0),
-d(1997,2,16,2,0,0),
-d(1997,10,6,3,0,0),
-d(1998,3,1,2,0,0),
-d(1998,10,11,3,0,0),
-d(1999,2,21,2,0,0),
-d(1999,10,3,3,0,0),
-d(2000,2,27,2,0,0),
-d(2000,10,8,3,0,0),
-d(2001,2,18,2,0,0),
-d(2001,10,14,3,0,0),
-d(2002,2,17,2,0,0),
-d(2002,11,3,3,0,0),
-d(2003,2,16,2,0,0),
-d(2003,10,19,3,0,0),
-d(2004,2,15,2,0,0),
-d(2004,10,17,3,0,0),
-d(2005,2,20,2,0,0),
-d(2005,10,16,3,0,0),
-d(2006,2,19,2,0,0),
-d(2006,10,15,3,0,0),
-d(2007,2,18,2,0,0),
-d(2007,10,21,3,0,0),
-d(2008,2,17,2,0,0),
-d(2008,10,19,3,0,0),
-d(2009,2,15,2,0,0),
-d(2009,10,18,3,0,0),
-d(2010,2,21,2,0,0),
-d(2010,10,17,3,0,0),
-d(2011,2,20,2,0,0),
-d(2011,10,16,3,0,0),
-d(2012,2,19,2,0,0),
-d(2012,10,21,3,0,0),
-d(2013,2,17,2,0,0),
-d(2013,10,20,3,0,0),
-d(2014,2,16,2,0,0),
-d(2014,10,19,3,0,0),
-d(2015,2,15,2,0,0),
-d(2015,10,18,3,0,0),
-d(2016,2,21,2,0,0),
-d(2016,10,16,3,0,0),
-d(2017,2,19,2,0,0),
-d(2017,10,15,3,0,0),
-d(2018,2,18,2,0,0),
-d(2018,10,21,3,0,0),
-d(2019,2,17,2,0,0),
-d(2019,10,20,3,0,0),
-d(2020,2,16,2,0,0),
-d(2020,10,18,3,0,0),
-d(2021,2,21,2,0,0),
-d(2021,10,17,3,0,0),
-d(2022,2,20,2,0,0),
-d(2022,10,16,3,0,0),
-d(2023,2,19,2,0,0),
-d(2023,10,15,3,0,0),
-d(2024,2,18,2,0,0),
-d(2024,10,20,3,0,0),
-d(2025,2,16,2,0,0),
-d(2025,10,19,3,0,0),
-d(2026,2,15,2,0,0),
-d(2026,10,18,3,0,0),
-d(2027,2,21,2,0,0),
-d(2027,10,17,3,0,0),
-d(2028,2,20,2,0,0),
-d(2028,10,15,3,0,0),
-d(2029,2,18,2,0,0),
-d(2029,10,21,3,0,0),
-d(2030,2,17,2,0,0),
-d(2030,10,20,3,0,0),
-d(2031,2,16,2,0,0),
-d(2031,10,19,3,0,0),
-d(2032,2,15,2,0,0),
-d(2032,10,17,3,0,0),
-d(2033,2,20,2,0,0),
-d(2033,10,16,3,0,0),
-d(2034,2,19,2,0,0),
-d(2034,10,15,3,0,0),
-d(2035,2,18,2,0,0),
-d(2035,10,21,3,0,0),
-d(2036,2,17,2,0,0),
-d(2036,10,19,3,0,0),
-d(2037,2,15,2,0,0),
-d(2037,10,18,3,0,0),
-        ]
-
-    _transition_info = [
-i(-11160,0,'LMT'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-i(-10800,0,'BRT'),
-i(-7200,3600,'BRST'),
-        ]
-
-Sao_Paulo = Sao_Paulo()
-
@@ -1,300 +0,0 @@
-'''tzinfo timezone information for Asia/Beirut.'''
-from pytz.tzinfo import DstTzInfo
-from pytz.tzinfo import memorized_datetime as d
-from pytz.tzinfo import memorized_ttinfo as i
-
-class Beirut(DstTzInfo):
-    '''Asia/Beirut timezone definition. See datetime.tzinfo for details'''
-
-    _zone = 'Asia/Beirut'
-
-    _utc_transition_times = [
-d(1,1,1,0,0,0),
-d(1920,3,27,22,0,0),
-d(1920,10,24,21,0,0),
-d(1921,4,2,22,0,0),
-d(1921,10,2,21,0,0),
-d(1922,3,25,22,0,0),
-d(1922,10,7,21,0,0),
-d(1923,4,21,22,0,0),
-d(1923,9,15,21,0,0),
-d(1957,4,30,22,0,0),
-d(1957,9,30,21,0,0),
-d(1958,4,30,22,0,0),
-d(1958,9,30,21,0,0),
-d(1959,4,30,22,0,0),
-d(1959,9,30,21,0,0),
-d(1960,4,30,22,0,0),
-d(1960,9,30,21,0,0),
-d(1961,4,30,22,0,0),
-d(1961,9,30,21,0,0),
-d(1972,6,21,22,0,0),
-d(1972,9,30,21,0,0),
-d(1973,4,30,22,0,0),
-d(1973,9,30,21,0,0),
-d(1974,4,30,22,0,0),
-d(1974,9,30,21,0,0),
-d(1975,4,30,22,0,0),
-d(1975,9,30,21,0,0),
-d(1976,4,30,22,0,0),
-d(1976,9,30,21,0,0),
-d(1977,4,30,22,0,0),
-d(1977,9,30,21,0,0),
-d(1978,4,29,22,0,0),
-d(1978,9,29,21,0,0),
-d(1984,4,30,22,0,0),
-d(1984,10,15,21,0,0),
-d(1985,4,30,22,0,0),
-d(1985,10,15,21,0,0),
-d(1986,4,30,22,0,0),
-d(1986,10,15,21,0,0),
-d(1987,4,30,22,0,0),
-d(1987,10,15,21,0,0),
-d(1988,5,31,22,0,0),
-d(1988,10,15,21,0,0),
-d(1989,5,9,22,0,0),
-d(1989,10,15,21,0,0),
-d(1990,4,30,22,0,0),
-d(1990,10,15,21,0,0),
-d(1991,4,30,22,0,0),
-d(1991,10,15,21,0,0),
-d(1992,4,30,22,0,0),
-d(1992,10,3,21,0,0),
-d(1993,3,27,22,0,0),
-d(1993,9,25,21,0,0),
-d(1994,3,26,22,0,0),
-d(1994,9,24,21,0,0),
-d(1995,3,25,22,0,0),
-d(1995,9,23,21,0,0),
-d(1996,3,30,22,0,0),
-d(1996,9,28,21,0,0),
-d(1997,3,29,22,0,0),
-d(1997,9,27,21,0,0),
-d(1998,3,28,22,0,0),
-d(1998,9,26,21,0,0),
-d(1999,3,27,22,0,0),
-d(1999,10,30,21,0,0),
-d(2000,3,25,22,0,0),
-d(2000,10,28,21,0,0),
-d(2001,3,24,22,0,0),
-d(2001,10,27,21,0,0),
-d(2002,3,30,22,0,0),
-d(2002,10,26,21,0,0),
-d(2003,3,29,22,0,0),
-d(2003,10,25,21,0,0),
-d(2004,3,27,22,0,0),
-d(2004,10,30,21,0,0),
-d(2005,3,26,22,0,0),
-d(2005,10,29,21,0,0),
-d(2006,3,25,22,0,0),
-d(2006,10,28,21,0,0),
-d(2007,3,24,22,0,0),
-d(2007,10,27,21,0,0),
-d(2008,3,29,22,0,0),
-d(2008,10,25,21,0,0),
-d(2009,3,28,22,0,0),
-d(2009,10,24,21,0,0),
-d(2010,3,27,22,0,0),
-d(2010,10,30,21,0,0),
-d(2011,3,26,22,0,0),
-d(2011,10,29,21,0,0),
-d(2012,3,24,22,0,0),
-d(2012,10,27,21,0,0),
-d(2013,3,30,22,0,0),
-d(2013,10,26,21,0,0),
-d(2014,3,29,22,0,0),
-d(2014,10,25,21,0,0),
-d(2015,3,28,22,0,0),
-d(2015,10,24,21,0,0),
-d(2016,3,26,22,0,0),
-d(2016,10,29,21,0,0),
-d(2017,3,25,22,0,0),
-d(2017,10,28,21,0,0),
-d(2018,3,24,22,0,0),
-d(2018,10,27,21,0,0),
-d(2019,3,30,22,0,0),
-d(2019,10,26,21,0,0),
-d(2020,3,28,22,0,0),
-d(2020,10,24,21,0,0),
-d(2021,3,27,22,0,0),
-d(2021,10,30,21,0,0),
-d(2022,3,26,22,0,0),
-d(2022,10,29,21,0,0),
-d(2023,3,25,22,0,0),
-d(2023,10,28,21,0,0),
-d(2024,3,30,22,0,0),
-d(2024,10,26,21,0,0),
-d(2025,3,29,22,0,0),
-d(2025,10,25,21,0,0),
-d(2026,3,28,22,0,0),
-d(2026,10,24,21,0,0),
-d(2027,3,27,22,0,0),
-d(2027,10,30,21,0,0),
-d(2028,3,25,22,0,0),
-d(2028,10,28,21,0,0),
-d(2029,3,24,22,0,0),
-d(2029,10,27,21,0,0),
-d(2030,3,30,22,0,0),
-d(2030,10,26,21,0,0),
-d(2031,3,29,22,0,0),
-d(2031,10,25,21,0,0),
-d(2032,3,27,22,0,0),
-d(2032,10,30,21,0,0),
-d(2033,3,26,22,0,0),
-d(2033,10,29,21,0,0),
-d(2034,3,25,22,0,0),
-d(2034,10,28,21,0,0),
-d(2035,3,24,22,0,0),
-d(2035,10,27,21,0,0),
-d(2036,3,29,22,0,0),
-d(2036,10,25,21,0,0),
-d(2037,3,28,22,0,0),
-d(2037,10,24,21,0,0),
-        ]
-
-    _transition_info = [
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-i(10800,3600,'EEST'),
-i(7200,0,'EET'),
-        ]
-
-Beirut = Beirut()
-
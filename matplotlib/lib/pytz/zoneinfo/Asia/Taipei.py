@@ -1,100 +0,0 @@
-'''tzinfo timezone information for Asia/Taipei.'''
-from pytz.tzinfo import DstTzInfo
-from pytz.tzinfo import memorized_datetime as d
-from pytz.tzinfo import memorized_ttinfo as i
-
-class Taipei(DstTzInfo):
-    '''Asia/Taipei timezone definition. See datetime.tzinfo for details'''
-
-    _zone = 'Asia/Taipei'
-
-    _utc_transition_times = [
-d(1,1,1,0,0,0),
-d(1945,4,30,16,0,0),
-d(1945,9,30,15,0,0),
-d(1946,4,30,16,0,0),
-d(1946,9,30,15,0,0),
-d(1947,4,30,16,0,0),
-d(1947,9,30,15,0,0),
-d(1948,4,30,16,0,0),
-d(1948,9,30,15,0,0),
-d(1949,4,30,16,0,0),
-d(1949,9,30,15,0,0),
-d(1950,4,30,16,0,0),
-d(1950,9,30,15,0,0),
-d(1951,4,30,16,0,0),
-d(1951,9,30,15,0,0),
-d(1952,2,29,16,0,0),
-d(1952,10,31,15,0,0),
-d(1953,3,31,16,0,0),
-d(1953,10,31,15,0,0),
-d(1954,3,31,16,0,0),
-d(1954,10,31,15,0,0),
-d(1955,3,31,16,0,0),
-d(1955,9,30,15,0,0),
-d(1956,3,31,16,0,0),
-d(1956,9,30,15,0,0),
-d(1957,3,31,16,0,0),
-d(1957,9,30,15,0,0),
-d(1958,3,31,16,0,0),
-d(1958,9,30,15,0,0),
-d(1959,3,31,16,0,0),
-d(1959,9,30,15,0,0),
-d(1960,5,31,16,0,0),
-d(1960,9,30,15,0,0),
-d(1961,5,31,16,0,0),
-d(1961,9,30,15,0,0),
-d(1974,3,31,16,0,0),
-d(1974,9,30,15,0,0),
-d(1975,3,31,16,0,0),
-d(1975,9,30,15,0,0),
-d(1980,6,29,16,0,0),
-d(1980,9,29,15,0,0),
-        ]
-
-    _transition_info = [
-i(28800,0,'CST'),
-i(32400,3600,'CDT'),
-i(28800,0,'CST'),
-i(32400,3600,'CDT'),
-i(28800,0,'CST'),
-i(32400,3600,'CDT'),
-i(28800,0,'CST'),
-i(32400,3600,'CDT'),
-i(28800,0,'CST'),
-i(32400,3600,'CDT'),
-i(28800,0,'CST'),
-i(32400,3600,'CDT'),
-i(28800,0,'CST'),
-i(32400,3600,'CDT'),
-i(28800,0,'CST'),
-i(32400,3600,'CDT'),
-i(28800,0,'CST'),
-i(32400,3600,'CDT'),
-i(28800,0,'CST'),
-i(32400,3600,'CDT'),
-i(28800,0,'CST'),
-i(32400,3600,'CDT'),
-i(28800,0,'CST'),
-i(32400,3600,'CDT'),
-i(28800,0,'CST'),
-i(32400,3600,'CDT'),
-i(28800,0,'CST'),
-i(32400,3600,'CDT'),
-i(28800,0,'CST'),
-i(32400,3600,'CDT'),
-i(28800,0,'CST'),
-i(32400,3600,'CDT'),
-i(28800,0,'CST'),
-i(32400,3600,'CDT'),
-i(28800,0,'CST'),
-i(32400,3600,'CDT'),
-i(28800,0,'CST'),
-i(32400,3600,'CDT'),
-i(28800,0,'CST'),
-i(32400,3600,'CDT'),
-i(28800,0,'CST'),
-        ]
-
-Taipei = Taipei()
-
@@ -1,12 +0,0 @@
-'''tzinfo timezone information for Pacific/Truk.'''
-from pytz.tzinfo import StaticTzInfo
-from pytz.tzinfo import memorized_timedelta as timedelta
-
-class Truk(StaticTzInfo):
-    '''Pacific/Truk timezone definition. See datetime.tzinfo for details'''
-    _zone = 'Pacific/Truk'
-    _utcoffset = timedelta(seconds=36000)
-    _tzname = 'TRUT'
-
-Truk = Truk()
-
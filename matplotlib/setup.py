@@ -159,9 +159,8 @@ if havedate: # dates require python23 datetime
     # only install pytz and dateutil if the user hasn't got them
     def add_pytz():
         packages.append('pytz')
-        # install pytz subdirs
-        for dirpath, dirname, filenames in os.walk(os.path.join('lib', 'pytz','zoneinfo')):
-            packages.append('/'.join(dirpath.split(os.sep)[1:]))
+        # the compiled timezone database
+        data_files.append(('pytz', ['lib/pytz/zones.dat']))
 
     def add_dateutil():
         packages.append('dateutil')
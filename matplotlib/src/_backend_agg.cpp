@@ -4,6 +4,8 @@
 #include <iostream>
 #include <fstream>
 #include <cmath>
+#include <algorithm>
+#include <vector>
 #include <cstdio>
 #include <stdexcept>
 #include <png.h>
@@ -34,11 +36,104 @@
 #endif
 #endif
 
+/* A contiguous array of doubles with nd dimensions, converted from a
+   numerix array or a nested sequence so the collection drawing
+   methods can read it without unboxing every element; None and
+   empty sequences give an empty array */
+class DoubleArray {
+public:
+  DoubleArray(int nd, const char* name) :
+    a(NULL), nd(nd), rowlen(0), name(name) {}
+  DoubleArray(const Py::Object& o, int nd, const char* name) :
+    a(NULL), nd(nd), rowlen(0), name(name) { set(o); }
+  ~DoubleArray() { Py_XDECREF(a); }
+
+  void set(const Py::Object& o) {
+    Py_XDECREF(a);
+    a = NULL;
+    rowlen = 0;
+    if (o.ptr()==Py_None ||
+	(PySequence_Check(o.ptr()) && PySequence_Length(o.ptr())==0))
+      return;
+    a = (PyArrayObject *) PyArray_ContiguousFromObject(o.ptr(), PyArray_DOUBLE, nd, nd);
+    if (a==NULL) {
+      PyErr_Clear();
+      throw Py::TypeError(Printf("%s must be convertible to a %d dimensional array of floats", name, nd).str());
+    }
+    rowlen = 1;
+    for (int j=1; j<nd; j++) rowlen *= a->dimensions[j];
+  }
+
+  size_t size() const { return a==NULL ? 0 : a->dimensions[0]; }
+  size_t dim(int i) const { return a==NULL ? 0 : a->dimensions[i]; }
+  // row i%size(), the properties of a collection cycle
+  const double* row(size_t i) const {
+    return (const double *)a->data + (i%a->dimensions[0])*rowlen;
+  }
+  // check the length of the trailing dimension, eg 2 for x,y pairs
+  void require(int i, size_t n) const {
+    if (a!=NULL && dim(i)!=n)
+      throw Py::TypeError(Printf("%s must have length %d along dimension %d", name, n, i).str());
+  }
+
+private:
+  PyArrayObject *a;
+  int nd;
+  size_t rowlen;
+  const char* name;
+  DoubleArray(const DoubleArray&);
+  DoubleArray& operator=(const DoubleArray&);
+};
+
+/* The vertex sequences of a line or polygon collection: an NxMx2
+   array, or a sequence of Mx2 arrays or x,y sequences which may
+   differ in length and are converted one at a time */
+class VertexSeqs {
+public:
+  VertexSeqs(const Py::Object& o, const char* name) :
+    seqs(o), all(3, name), current(2, name), isarray(false) {
+    isarray = PyArray_Check(o.ptr()) && ((PyArrayObject *)o.ptr())->nd==3;
+    if (isarray) {
+      all.set(o);
+      all.require(2, 2);
+    }
+  }
+
+  size_t size() const { return isarray ? all.size() : seqs.length(); }
+
+  // set xy to the Npoints vertices of sequence i%size()
+  void get(size_t i, const double*& xy, size_t& Npoints) {
+    if (isarray) {
+      xy = all.row(i);
+      Npoints = all.dim(1);
+      return;
+    }
+    current.set(seqs[i%seqs.length()]);
+    current.require(1, 2);
+    Npoints = current.size();
+    xy = Npoints ? current.row(0) : NULL;
+  }
+
+private:
+  Py::SeqBase<Py::Object> seqs;
+  DoubleArray all, current;
+  bool isarray;
+};
+
+// a color as 8 bit r, g, b and a in one int, to compare colors as
+// they will be drawn
+static inline agg::int32u
+pack_rgba8(const agg::rgba& c) {
+  return ((agg::int32u(c.r*255+0.5)<<24) | (agg::int32u(c.g*255+0.5)<<16) |
+	  (agg::int32u(c.b*255+0.5)<<8) | agg::int32u(c.a*255+0.5));
+}
+
 /* ------------ RendererAgg methods ------------- */
 
 
 GCAgg::GCAgg(const Py::Object &gc, double dpi, bool snapto) :
-  dpi(dpi), snapto(snapto), isaa(true), linewidth(1.0), alpha(1.0), 
+  dpi(dpi), snapto(snapto), isaa(true), markercull(false),
+  linewidth(1.0), alpha(1.0), 
   cliprect(NULL),
   Ndash(0), dashOffset(0.0), dasha(NULL)
 {
@@ -52,6 +147,8 @@ GCAgg::GCAgg(const Py::Object &gc, double dpi, bool snapto) :
   _set_joinstyle(gc);
   _set_dashes(gc);
   _set_clip_rectangle(gc);
+  if (gc.hasAttr("_markercull"))
+    markercull = gc.getAttr("_markercull").isTrue();
 }
 
 void
@@ -378,30 +475,33 @@ RendererAgg::draw_polygon(const Py::Tuple& args) {
   if (Npoints<=0)
     return Py::Object();
 
-
-  // dump the x.y vertices into a double array for faster look ahread
-  // and behind access
-  double xs[Npoints];
-  double ys[Npoints];
-
-  for (size_t i=0; i<Npoints; i++) {
-    Py::SeqBase<Py::Object> xy(points[i]);
-    xy = Py::Tuple(points[i]);
-    xs[i] = Py::Float(xy[0]);
-    ys[i] = Py::Float(xy[1]);
-    ys[i] = height - ys[i];
-
-  }
-
-
   agg::path_storage path;
-  for (size_t j=0; j<Npoints; j++) {
 
-    double x = xs[j];
-    double y = ys[j];
+  if (PyArray_Check(points.ptr())) {
+    // an Nx2 array, eg from Transformation.numerix_xy; read the
+    // vertices straight from the buffer
+    PyArrayObject *xya = (PyArrayObject *) PyArray_ContiguousFromObject(points.ptr(), PyArray_DOUBLE, 2, 2);
+    if (xya==NULL || xya->dimensions[1]!=2) {
+      Py_XDECREF(xya);
+      throw Py::TypeError("RendererAgg::draw_polygon expected an Nx2 numerix array");
+    }
+    double *xy = (double *)xya->data;
+    for (size_t j=0; j<Npoints; j++) {
+      if (j==0) path.move_to(xy[2*j], height-xy[2*j+1]);
+      else path.line_to(xy[2*j], height-xy[2*j+1]);
+    }
+    Py_XDECREF(xya);
+  }
+  else {
+    for (size_t j=0; j<Npoints; j++) {
+      Py::SeqBase<Py::Object> xy(points[j]);
+      xy = Py::Tuple(points[j]);
+      double x = Py::Float(xy[0]);
+      double y = height - double(Py::Float(xy[1]));
 
-    if (j==0) path.move_to(x,y);
-    else path.line_to(x,y);
+      if (j==0) path.move_to(x,y);
+      else path.line_to(x,y);
+    }
   }
   path.close_polygon();
 
@@ -421,33 +521,35 @@ RendererAgg::draw_line_collection(const Py::Tuple& args) {
 
 
   //segments, trans, clipbox, colors, linewidths, antialiaseds
-  Py::SeqBase<Py::Object> segments = args[0];
+  VertexSeqs segments(args[0], "segments");
 
   Transformation* transform = static_cast<Transformation*>(args[1].ptr());
 
   set_clip_from_bbox(args[2]);
 
-  Py::SeqBase<Py::Object> colors = args[3];
-  Py::SeqBase<Py::Object> linewidths = args[4];
+  DoubleArray colors(args[3], 2, "colors");
+  colors.require(1, 4);
+  DoubleArray linewidths(args[4], 1, "linewidths");
   Py::SeqBase<Py::Object> linestyle = args[5];
-  Py::SeqBase<Py::Object> antialiaseds = args[6];
+  DoubleArray antialiaseds(args[6], 1, "antialiaseds");
 
   bool usingOffsets = args[7].ptr()!=Py_None;
-  Py::SeqBase<Py::Object> offsets;
+  DoubleArray offsets(args[7], 2, "offsets");
+  offsets.require(1, 2);
   Transformation* transOffset=NULL;
   if  (usingOffsets) {
-    offsets = Py::SeqBase<Py::Object>(args[7]);
     transOffset = static_cast<Transformation*>(args[8].ptr());
   }
 
-  size_t Nsegments = segments.length();
-  size_t Nc = colors.length();
-  size_t Nlw = linewidths.length();
-  size_t Naa = antialiaseds.length();
+  size_t Nsegments = segments.size();
   size_t Noffsets = 0;
   size_t N = Nsegments;
   size_t Ndash = 0;
 
+  if (Nsegments==0 || colors.size()==0 || linewidths.size()==0 ||
+      antialiaseds.size()==0)
+    return Py::Object();
+
   Py::SeqBase<Py::Object> dashtup(linestyle);
   bool useDashes = dashtup[0].ptr() != Py_None;
 
@@ -474,21 +576,20 @@ RendererAgg::draw_line_collection(const Py::Tuple& args) {
 
 
   if (usingOffsets) {
-    Noffsets = offsets.length();
+    Noffsets = offsets.size();
+    if (Noffsets==0) usingOffsets = false;
     if (Noffsets>Nsegments) N = Noffsets;
   }
 
   double xo(0.0), yo(0.0), thisx(0.0), thisy(0.0);
   std::pair<double, double> xy;
-  Py::SeqBase<Py::Object> xyo;
-  Py::SeqBase<Py::Object> xys;
+  const double *xys;
+  size_t numtups;
   for (size_t i=0; i<N; i++) {
     if (usingOffsets) {
-      xyo = Py::SeqBase<Py::Object>(offsets[i%Noffsets]);
-      xo = Py::Float(xyo[0]);
-      yo = Py::Float(xyo[1]);
+      const double *xyo = offsets.row(i);
       try {
-	xy = transOffset->operator()(xo,yo);
+	xy = transOffset->operator()(xyo[0], xyo[1]);
       }
       catch (...) {
 	throw Py::ValueError("Domain error on transOffset->operator in draw_line_collection");
@@ -498,17 +599,15 @@ RendererAgg::draw_line_collection(const Py::Tuple& args) {
       yo = xy.second;
     }
 
-    xys = segments[i%Nsegments];
-    size_t numtups = xys.length();
+    segments.get(i, xys, numtups);
     if (numtups<2) continue;
     bool snapto=numtups==2;
     agg::path_storage path;
 
 
     for (size_t j=0; j<numtups; j++) {
-      xyo = xys[j];
-      thisx = Py::Float(xyo[0]);
-      thisy = Py::Float(xyo[1]);
+      thisx = xys[2*j];
+      thisy = xys[2*j+1];
       try {
 	xy = transform->operator()(thisx,thisy);
       }
@@ -536,7 +635,7 @@ RendererAgg::draw_line_collection(const Py::Tuple& args) {
 
 
 
-    double lw = points_to_pixels ( Py::Float( linewidths[i%Nlw] ) );
+    double lw = *linewidths.row(i) * dpi/72.0;
 
     if (! useDashes ) {
 
@@ -561,16 +660,11 @@ RendererAgg::draw_line_collection(const Py::Tuple& args) {
     }
 
     // get the color and render
-    Py::SeqBase<Py::Object> rgba(colors[ i%Nc]);
-    double r = Py::Float(rgba[0]);
-    double g = Py::Float(rgba[1]);
-    double b = Py::Float(rgba[2]);
-    double a = Py::Float(rgba[3]);
-    agg::rgba color(r, g, b, a);
+    const double *rgba = colors.row(i);
+    agg::rgba color(rgba[0], rgba[1], rgba[2], rgba[3]);
 
     // render antialiased or not
-    int isaa = Py::Int(antialiaseds[i%Naa]);
-    if ( isaa ) {
+    if ( *antialiaseds.row(i) ) {
       rendererAA->color(color);
       agg::render_scanlines(*theRasterizer, *slineP8, *rendererAA);
     }
@@ -903,7 +997,7 @@ RendererAgg::draw_poly_collection(const Py::Tuple& args) {
   args.verify_length(9);
 
 
-  Py::SeqBase<Py::Object> verts = args[0];
+  VertexSeqs verts(args[0], "verts");
 
   //todo: fix transformation check
   Transformation* transform = static_cast<Transformation*>(args[1].ptr());
@@ -918,17 +1012,18 @@ RendererAgg::draw_poly_collection(const Py::Tuple& args) {
 
   set_clip_from_bbox(args[2]);
 
-  Py::SeqBase<Py::Object> facecolors = args[3];
-  Py::SeqBase<Py::Object> edgecolors = args[4];
-  Py::SeqBase<Py::Object> linewidths = args[5];
-  Py::SeqBase<Py::Object> antialiaseds = args[6];
+  DoubleArray facecolors(args[3], 2, "facecolors");
+  facecolors.require(1, 4);
+  DoubleArray edgecolors(args[4], 2, "edgecolors");
+  edgecolors.require(1, 4);
+  DoubleArray linewidths(args[5], 1, "linewidths");
+  DoubleArray antialiaseds(args[6], 1, "antialiaseds");
 
-
-  Py::SeqBase<Py::Object> offsets;
+  DoubleArray offsets(args[7], 2, "offsets");
+  offsets.require(1, 2);
   Transformation* transOffset = NULL;
-  bool usingOffsets = args[7].ptr() != Py_None;
+  bool usingOffsets = offsets.size()>0;
   if (usingOffsets) {
-    offsets = args[7];
     //todo: fix transformation check
     transOffset = static_cast<Transformation*>(args[8].ptr());
     try {
@@ -940,47 +1035,44 @@ RendererAgg::draw_poly_collection(const Py::Tuple& args) {
 
   }
 
-  size_t Noffsets = offsets.length();
-  size_t Nverts = verts.length();
-  size_t Nface = facecolors.length();
-  size_t Nedge = edgecolors.length();
-  size_t Nlw = linewidths.length();
-  size_t Naa = antialiaseds.length();
+  size_t Noffsets = offsets.size();
+  size_t Npolys = verts.size();
 
-  size_t N = (Noffsets>Nverts) ? Noffsets : Nverts;
+  if (Npolys==0 || facecolors.size()==0 || edgecolors.size()==0 ||
+      linewidths.size()==0 || antialiaseds.size()==0)
+    return Py::Object();
+
+  size_t N = (Noffsets>Npolys) ? Noffsets : Npolys;
 
   std::pair<double, double> xyo, xy;
-  Py::SeqBase<Py::Object> thisverts;
+  const double *thisverts;
+  size_t Nverts;
+  std::vector<double> xs, ys;
   for (size_t i=0; i<N; i++) {
 
-    thisverts = verts[i % Nverts];
+    verts.get(i, thisverts, Nverts);
+    if (Nverts==0) continue;
 
     if (usingOffsets) {
-      Py::SeqBase<Py::Object> pos = Py::SeqBase<Py::Object>(offsets[i]);
-      double xo = Py::Float(pos[0]);
-      double yo = Py::Float(pos[1]);
+      const double *pos = offsets.row(i);
       try {
-	xyo = transOffset->operator()(xo, yo);
+	xyo = transOffset->operator()(pos[0], pos[1]);
       }
       catch (...) {
-	throw Py::ValueError("Domain error on transOffset->operator in draw_line_collection");
+	throw Py::ValueError("Domain error on transOffset->operator in draw_poly_collection");
       }
 
     }
 
-    size_t Nverts = thisverts.length();
     agg::path_storage path;
 
-    Py::SeqBase<Py::Object>  thisvert;
-
-
     // dump the verts to double arrays so we can do more efficient
     // look aheads and behinds when doing snapto pixels
-    double xs[Nverts], ys[Nverts];
+    xs.resize(Nverts);
+    ys.resize(Nverts);
     for (size_t j=0; j<Nverts; j++) {
-      thisvert = thisverts[j];
-      double x = Py::Float(thisvert[0]);
-      double y = Py::Float(thisvert[1]);
+      double x = thisverts[2*j];
+      double y = thisverts[2*j+1];
       try {
 	xy = transform->operator()(x, y);
       }
@@ -1028,15 +1120,11 @@ RendererAgg::draw_poly_collection(const Py::Tuple& args) {
     }
 
     path.close_polygon();
-    int isaa = Py::Int(antialiaseds[i%Naa]);
+    int isaa = *antialiaseds.row(i)!=0;
     // get the facecolor and render
-    Py::SeqBase<Py::Object>  rgba = Py::SeqBase<Py::Object>(facecolors[ i%Nface]);
-    double r = Py::Float(rgba[0]);
-    double g = Py::Float(rgba[1]);
-    double b = Py::Float(rgba[2]);
-    double a = Py::Float(rgba[3]);
-    if (a>0) { //only render if alpha>0
-      agg::rgba facecolor(r, g, b, a);
+    const double *rgba = facecolors.row(i);
+    if (rgba[3]>0) { //only render if alpha>0
+      agg::rgba facecolor(rgba[0], rgba[1], rgba[2], rgba[3]);
 
       theRasterizer->add_path(path);
 
@@ -1051,19 +1139,15 @@ RendererAgg::draw_poly_collection(const Py::Tuple& args) {
     } //renderer face
 
     // get the edgecolor and render
-    rgba = Py::SeqBase<Py::Object>(edgecolors[ i%Nedge]);
-    r = Py::Float(rgba[0]);
-    g = Py::Float(rgba[1]);
-    b = Py::Float(rgba[2]);
-    a = Py::Float(rgba[3]);
+    rgba = edgecolors.row(i);
 
-    if (a>0) { //only render if alpha>0
-      agg::rgba edgecolor(r, g, b, a);
+    if (rgba[3]>0) { //only render if alpha>0
+      agg::rgba edgecolor(rgba[0], rgba[1], rgba[2], rgba[3]);
 
       agg::conv_stroke<agg::path_storage> stroke(path);
       //stroke.line_cap(cap);
       //stroke.line_join(join);
-      double lw = points_to_pixels ( Py::Float( linewidths[i%Nlw] ) );
+      double lw = *linewidths.row(i) * dpi/72.0;
       stroke.width(lw);
       theRasterizer->add_path(stroke);
 
@@ -1092,7 +1176,8 @@ RendererAgg::draw_regpoly_collection(const Py::Tuple& args) {
 
   set_clip_from_bbox(args[0]);
 
-  Py::SeqBase<Py::Object> offsets = args[1];
+  DoubleArray offsets(args[1], 2, "offsets");
+  offsets.require(1, 2);
 
   // this is throwing even though the instance is a Transformation!
   //if (!Transformation::check(args[2]))
@@ -1109,40 +1194,31 @@ RendererAgg::draw_regpoly_collection(const Py::Tuple& args) {
   }
 
 
-  Py::SeqBase<Py::Object> verts = args[3];
-  Py::SeqBase<Py::Object> sizes = args[4];
-  Py::SeqBase<Py::Object> facecolors = args[5];
-  Py::SeqBase<Py::Object> edgecolors = args[6];
-  Py::SeqBase<Py::Object> linewidths = args[7];
-  Py::SeqBase<Py::Object> antialiaseds = args[8];
+  DoubleArray verts(args[3], 2, "verts");
+  verts.require(1, 2);
+  DoubleArray sizes(args[4], 1, "sizes");
+  DoubleArray facecolors(args[5], 2, "facecolors");
+  facecolors.require(1, 4);
+  DoubleArray edgecolors(args[6], 2, "edgecolors");
+  edgecolors.require(1, 4);
+  DoubleArray linewidths(args[7], 1, "linewidths");
+  DoubleArray antialiaseds(args[8], 1, "antialiaseds");
 
-  size_t Noffsets = offsets.length();
-  size_t Nverts = verts.length();
-  size_t Nsizes = sizes.length();
-  size_t Nface = facecolors.length();
-  size_t Nedge = edgecolors.length();
-  size_t Nlw = linewidths.length();
-  size_t Naa = antialiaseds.length();
+  size_t Noffsets = offsets.size();
+  size_t Nverts = verts.size();
 
-  double thisx, thisy;
+  if (Noffsets==0 || Nverts==0 || sizes.size()==0 || facecolors.size()==0 ||
+      edgecolors.size()==0 || linewidths.size()==0 || antialiaseds.size()==0)
+    return Py::Object();
 
-  // dump the x.y vertices into a double array for faster access
-  double xverts[Nverts];
-  double yverts[Nverts];
-  Py::SeqBase<Py::Object> xy;
-  for (size_t i=0; i<Nverts; i++) {
-    xy = Py::SeqBase<Py::Object>(verts[i]);
-    xverts[i] = Py::Float(xy[0]);
-    yverts[i] = Py::Float(xy[1]);
-  }
+  double thisx, thisy;
+  const double *xyverts = verts.row(0);
 
   std::pair<double, double> offsetPair;
   for (size_t i=0; i<Noffsets; i++) {
-    Py::SeqBase<Py::Object> pos = Py::SeqBase<Py::Object>(offsets[i]);
-    double xo = Py::Float(pos[0]);
-    double yo = Py::Float(pos[1]);
+    const double *pos = offsets.row(i);
     try {
-      offsetPair = transOffset->operator()(xo, yo);
+      offsetPair = transOffset->operator()(pos[0], pos[1]);
     }
     catch(...) {
       throw Py::ValueError("Domain error on eval_scalars in RendererAgg::draw_regpoly_collection");
@@ -1150,14 +1226,14 @@ RendererAgg::draw_regpoly_collection(const Py::Tuple& args) {
 
 
 
-    double scale = Py::Float(sizes[i%Nsizes]);
+    double scale = *sizes.row(i);
 
 
     agg::path_storage path;
 
     for (size_t j=0; j<Nverts; j++) {
-      thisx = scale*xverts[j] + offsetPair.first;
-      thisy = scale*yverts[j] + offsetPair.second;
+      thisx = scale*xyverts[2*j] + offsetPair.first;
+      thisy = scale*xyverts[2*j+1] + offsetPair.second;
       thisy = height - thisy;
       if (j==0) path.move_to(thisx, thisy);
       else path.line_to(thisx, thisy);
@@ -1165,15 +1241,11 @@ RendererAgg::draw_regpoly_collection(const Py::Tuple& args) {
 
     }
     path.close_polygon();
-    int isaa = Py::Int(antialiaseds[i%Naa]);
+    int isaa = *antialiaseds.row(i)!=0;
     // get the facecolor and render
-    Py::SeqBase<Py::Object> rgba = Py::SeqBase<Py::Object>(facecolors[ i%Nface]);
-    double r = Py::Float(rgba[0]);
-    double g = Py::Float(rgba[1]);
-    double b = Py::Float(rgba[2]);
-    double a = Py::Float(rgba[3]);
-    if (a>0) { //only render if alpha>0
-      agg::rgba facecolor(r, g, b, a);
+    const double *rgba = facecolors.row(i);
+    if (rgba[3]>0) { //only render if alpha>0
+      agg::rgba facecolor(rgba[0], rgba[1], rgba[2], rgba[3]);
 
       theRasterizer->add_path(path);
 
@@ -1188,18 +1260,14 @@ RendererAgg::draw_regpoly_collection(const Py::Tuple& args) {
     } //renderer face
 
     // get the edgecolor and render
-    rgba = Py::SeqBase<Py::Object>(edgecolors[ i%Nedge]);
-    r = Py::Float(rgba[0]);
-    g = Py::Float(rgba[1]);
-    b = Py::Float(rgba[2]);
-    a = Py::Float(rgba[3]);
-    if (a>0) { //only render if alpha>0
-      agg::rgba edgecolor(r, g, b, a);
+    rgba = edgecolors.row(i);
+    if (rgba[3]>0) { //only render if alpha>0
+      agg::rgba edgecolor(rgba[0], rgba[1], rgba[2], rgba[3]);
 
       agg::conv_stroke<agg::path_storage> stroke(path);
       //stroke.line_cap(cap);
       //stroke.line_join(join);
-      double lw = points_to_pixels ( Py::Float( linewidths[i%Nlw] ) );
+      double lw = *linewidths.row(i) * dpi/72.0;
       stroke.width(lw);
       theRasterizer->add_path(stroke);
 
@@ -1530,46 +1598,73 @@ RendererAgg::_draw_markers_nocache(const Py::Tuple& args) {
 }
 
 */
+void
+RendererAgg::_render_marker_stamp(agg::path_storage& path, double scale,
+				  const GCAgg& gc, bool fill, MarkerStamp& stamp) {
+  //rasterize the marker path at scale into the serialized fill
+  //and stroke scanlines of stamp
+  _VERBOSE("RendererAgg::_render_marker_stamp");
+  typedef agg::conv_transform<agg::path_storage> transformed_t;
+  typedef agg::conv_curve<transformed_t> curve_t;
+
+  agg::trans_affine_scaling scaling(scale);
+  transformed_t transformed(path, scaling);
+  curve_t curve(transformed);
+
+  //maxim's suggestions for cached scanlines
+  agg::scanline_storage_aa8 scanlines;
+
+  if (fill) {
+    theRasterizer->reset();
+    theRasterizer->add_path(curve);
+    agg::render_scanlines(*theRasterizer, *slineP8, scanlines);
+    stamp.fill.resize(scanlines.byte_size());
+    if (stamp.fill.size()) scanlines.serialize(&stamp.fill[0]);
+  }
+
+  agg::conv_stroke<curve_t> stroke(curve);
+  stroke.width(gc.linewidth);
+  stroke.line_cap(gc.cap);
+  stroke.line_join(gc.join);
+  theRasterizer->reset();
+  theRasterizer->add_path(stroke);
+  agg::render_scanlines(*theRasterizer, *slineP8, scanlines);
+  stamp.stroke.resize(scanlines.byte_size());
+  if (stamp.stroke.size()) scanlines.serialize(&stamp.stroke[0]);
+}
+
 Py::Object
 RendererAgg::draw_markers(const Py::Tuple& args) {
-  //_draw_markers_cache(gc, path, rgbFace, xo, yo, transform)
+  //draw_markers(gc, path, rgbFace, xo, yo, transform[, facecolors, edgecolors, scales])
   theRasterizer->reset_clipping();
 
-  _VERBOSE("RendererAgg::_draw_markers_cache");
-  args.verify_length(6);
+  _VERBOSE("RendererAgg::draw_markers");
+  args.verify_length(6, 9);
+  if (args.length()!=6 && args.length()!=9)
+    throw Py::TypeError("draw_markers takes 6 or 9 arguments");
 
-  _VERBOSE("RendererAgg::_draw_markers_cache setting gc");
   GCAgg gc = GCAgg(args[0], dpi);
 
-
   agg::path_storage *ppath;
-  _VERBOSE("RendererAgg::_draw_markers_cache get path storage");
   swig_type_info * descr = SWIG_TypeQuery("agg::path_storage *");
-  _VERBOSE("RendererAgg::_draw_markers_cache got path storage");
   assert(descr);
-  _VERBOSE("RendererAgg::_draw_markers_cache asserted");
   if (SWIG_ConvertPtr(args[1].ptr(),(void **)(&ppath), descr, 0) == -1) {
-    _VERBOSE("RendererAgg::_draw_markers_cache throwing");
     throw Py::TypeError("Could not convert path_storage");
   }
-  _VERBOSE("RendererAgg::_draw_markers_cache getface");
   facepair_t face = _get_rgba_face(args[2], gc.alpha);
 
-  _VERBOSE("RendererAgg::_draw_markers_cache 1");
-  Py::Object xo = args[3];
-  Py::Object yo = args[4];
-
-  PyArrayObject *xa = (PyArrayObject *) PyArray_ContiguousFromObject(xo.ptr(), PyArray_DOUBLE, 1, 1);
-
-  if (xa==NULL)
-    throw Py::TypeError("RendererAgg::_draw_markers_cache expected numerix array");
+  // the optional per marker colors and scales, which cycle like the
+  // properties of a collection; None uses rgbFace, the gc color and
+  // the path as it is
+  bool perMarker = args.length()==9;
+  DoubleArray facecolors(perMarker ? args[6] : Py::Object(), 2, "facecolors");
+  facecolors.require(1, 4);
+  DoubleArray edgecolors(perMarker ? args[7] : Py::Object(), 2, "edgecolors");
+  edgecolors.require(1, 4);
+  DoubleArray scales(perMarker ? args[8] : Py::Object(), 1, "scales");
 
-
-  PyArrayObject *ya = (PyArrayObject *) PyArray_ContiguousFromObject(yo.ptr(), PyArray_DOUBLE, 1, 1);
-
-  _VERBOSE("RendererAgg::_draw_markers_cache 2");
-  if (ya==NULL)
-    throw Py::TypeError("RendererAgg::_draw_markers_cache expected numerix array");
+  DoubleArray xa(args[3], 1, "x");
+  DoubleArray ya(args[4], 1, "y");
 
   Transformation* mpltransform = static_cast<Transformation*>(args[5].ptr());
 
@@ -1578,59 +1673,47 @@ RendererAgg::draw_markers(const Py::Tuple& args) {
     mpltransform->affine_params_api(&a, &b, &c, &d, &tx, &ty);
   }
   catch(...) {
-    throw Py::ValueError("Domain error on affine_params_api in RendererAgg::_draw_markers_cache");
+    throw Py::ValueError("Domain error on affine_params_api in RendererAgg::draw_markers");
   }
 
   agg::trans_affine xytrans = agg::trans_affine(a,b,c,d,tx,ty);
 
-  _VERBOSE("RendererAgg::_draw_markers_cache 3");
-  size_t Nx = xa->dimensions[0];
-  size_t Ny = ya->dimensions[0];
+  size_t Nx = xa.size();
+  size_t Ny = ya.size();
 
   if (Nx!=Ny)
     throw Py::ValueError(Printf("x and y must be equal length arrays; found %d and %d", Nx, Ny).str());
-
+  if (Nx==0)
+    return Py::Object();
 
   double heightd = double(height);
 
-
   ppath->rewind(0);
   ppath->flip_y(0,0);
-  typedef agg::conv_curve<agg::path_storage> curve_t;
-  curve_t curve(*ppath);
 
-  _VERBOSE("RendererAgg::_draw_markers_cache 4");
-  //maxim's suggestions for cached scanlines
-  agg::scanline_storage_aa8 scanlines;
-  theRasterizer->reset();
+  bool fill = face.first || facecolors.size()>0;
 
-  agg::int8u* fillCache = NULL;
-  unsigned fillSize = 0;
-  if (face.first) {
-    theRasterizer->add_path(curve);
-    agg::render_scanlines(*theRasterizer, *slineP8, scanlines);
-    fillSize = scanlines.byte_size();
-    fillCache = new agg::int8u[fillSize]; // or any container
-    scanlines.serialize(fillCache);
+  // the stamps are keyed by the marker radius in quarter pixels, so
+  // markers whose scales round to the same radius share one stamp
+  const double stampsPerPixel = 4.0;
+  double rmax = 0.0;
+  size_t Npath = ppath->total_vertices();
+  for (size_t i=0; i<Npath; i++) {
+    double x, y;
+    unsigned cmd = ppath->vertex(i, &x, &y);
+    if (agg::is_vertex(cmd)) rmax = std::max(rmax, sqrt(x*x+y*y));
   }
 
-  _VERBOSE("RendererAgg::_draw_markers_cache 5");
-
-
-  agg::conv_stroke<curve_t> stroke(curve);
-  stroke.width(gc.linewidth);
-  stroke.line_cap(gc.cap);
-  stroke.line_join(gc.join);
-  theRasterizer->reset();
-  theRasterizer->add_path(stroke);
-  agg::render_scanlines(*theRasterizer, *slineP8, scanlines);
-  unsigned strokeSize = scanlines.byte_size();
-  agg::int8u* strokeCache = new agg::int8u[strokeSize]; // or any container
-  scanlines.serialize(strokeCache);
+  std::map<int, MarkerStamp> stamps;
+  MarkerStamp* stamp = NULL;
+  int stampKey = 0;
+  if (scales.size()==0) {
+    stamp = &stamps[0];
+    _render_marker_stamp(*ppath, 1.0, gc, fill, *stamp);
+  }
 
   theRasterizer->reset_clipping();
 
-
   if (gc.cliprect==NULL) {
     rendererBase->reset_clipping(true);
   }
@@ -1642,12 +1725,21 @@ RendererAgg::draw_markers(const Py::Tuple& args) {
     rendererBase->clip_box(l, height-(b+h),l+w, height-b);
   }
 
+  agg::serialized_scanlines_adaptor_aa8 sa;
+  agg::serialized_scanlines_adaptor_aa8::embedded_scanline sl;
+
+  // with gc.markercull, an opaque marker is skipped if the last one
+  // stamped at its pixel has the same size and colors, so dense
+  // clouds cost one stamp per pixel and color.  The pixels are kept
+  // in a map keyed on the pixel index, so the bookkeeping grows with
+  // the markers drawn rather than with the canvas
+  std::map<size_t, MarkerPixel> pixels;
 
-  _VERBOSE("RendererAgg::_draw_markers_cache 6");
+  const double *xs = xa.row(0), *ys = ya.row(0);
   double thisx, thisy;
   for (size_t i=0; i<Nx; i++) {
-    thisx = *(double *)(xa->data + i*xa->strides[0]);
-    thisy = *(double *)(ya->data + i*ya->strides[0]);
+    thisx = xs[i];
+    thisy = ys[i];
 
     if (mpltransform->need_nonlinear_api())
       try {
@@ -1661,40 +1753,75 @@ RendererAgg::draw_markers(const Py::Tuple& args) {
 
     thisy = heightd - thisy;  //flipy
 
-    thisx = (int)thisx + 0.5;
-    thisy = (int)thisy + 0.5;
-    if (thisx<0) continue;
-    if (thisy<0) continue;
-    if (thisx>width) continue;
-    if (thisy>height) continue;
+    // skip the markers which can not reach the canvas; one centered
+    // off it may still cover its edge
+    double reach = (scales.size() ? *scales.row(i) : 1.0)*rmax +
+      gc.linewidth/2.0 + 1.0;
+    if (!(thisx>-reach && thisx<width+reach)) continue;
+    if (!(thisy>-reach && thisy<height+reach)) continue;
+
+    thisx = floor(thisx) + 0.5;
+    thisy = floor(thisy) + 0.5;
+    bool onCanvas = thisx>0 && thisy>0 && thisx<width && thisy<height;
+
+    if (scales.size()) {
+      double scale = *scales.row(i);
+      stampKey = (int)(scale*rmax*stampsPerPixel + 0.5);
+      std::map<int, MarkerStamp>::iterator it = stamps.find(stampKey);
+      if (it==stamps.end()) {
+	stamp = &stamps[stampKey];
+	if (rmax>0) scale = stampKey/(stampsPerPixel*rmax);
+	_render_marker_stamp(*ppath, scale, gc, fill, *stamp);
+      }
+      else
+	stamp = &it->second;
+    }
 
-    agg::serialized_scanlines_adaptor_aa8 sa;
-    agg::serialized_scanlines_adaptor_aa8::embedded_scanline sl;
+    agg::rgba facecolor = face.second;
+    if (facecolors.size()) {
+      const double *rgba = facecolors.row(i);
+      facecolor = agg::rgba(rgba[0], rgba[1], rgba[2], rgba[3]);
+    }
+    agg::rgba edgecolor = gc.color;
+    if (edgecolors.size()) {
+      const double *rgba = edgecolors.row(i);
+      edgecolor = agg::rgba(rgba[0], rgba[1], rgba[2], rgba[3]);
+    }
+    bool drawFill = fill && stamp->fill.size() && facecolor.a>0;
+    bool drawStroke = stamp->stroke.size() && edgecolor.a>0;
+
+    if (gc.markercull && onCanvas) {
+      MarkerPixel& pixel = pixels[size_t(thisy)*width + size_t(thisx)];
+      if ((!drawFill || facecolor.a>=1) && (!drawStroke || edgecolor.a>=1)) {
+	agg::int32u facekey = drawFill ? pack_rgba8(facecolor) : 0;
+	agg::int32u edgekey = drawStroke ? pack_rgba8(edgecolor) : 0;
+	if (pixel.stamp==stampKey && pixel.face==facekey && pixel.edge==edgekey)
+	  continue;
+	pixel.stamp = stampKey;
+	pixel.face = facekey;
+	pixel.edge = edgekey;
+      }
+      else // a translucent marker changes what an opaque one covers
+	pixel.stamp = -1;
+    }
 
-    _VERBOSE("RendererAgg::_draw_markers_cache 7");
-    if (face.first) {
+    if (drawFill) {
       //render the fill
-      sa.init(fillCache, fillSize, thisx, thisy);
-      rendererAA->color(face.second);
+      sa.init(&stamp->fill[0], stamp->fill.size(), thisx, thisy);
+      rendererAA->color(facecolor);
       agg::render_scanlines(sa, sl, *rendererAA);
     }
 
-    //render the stroke
-    sa.init(strokeCache, strokeSize, thisx, thisy);
-    rendererAA->color(gc.color);
-    agg::render_scanlines(sa, sl, *rendererAA);
+    if (drawStroke) {
+      //render the stroke
+      sa.init(&stamp->stroke[0], stamp->stroke.size(), thisx, thisy);
+      rendererAA->color(edgecolor);
+      agg::render_scanlines(sa, sl, *rendererAA);
+    }
 
   } //for each marker
 
-  _VERBOSE("RendererAgg::_draw_markers_cache 8");
-  Py_XDECREF(xa);
-  Py_XDECREF(ya);
-
-  if (face.first)
-    delete [] fillCache;
-  delete [] strokeCache;
-
-  _VERBOSE("RendererAgg::_draw_markers_cache done");
+  _VERBOSE("RendererAgg::draw_markers done");
   return Py::Object();
 
 }
@@ -1795,7 +1922,6 @@ RendererAgg::draw_text(const Py::Tuple& args) {
   p.a = int(255*gc.color.a);
 
   //y = y-font->image.height;
-  unsigned thisx, thisy;
 
   double l = 0;
   double b = 0;
@@ -1810,16 +1936,23 @@ RendererAgg::draw_text(const Py::Tuple& args) {
     t = b+h;
   }
 
-
-  for (size_t i=0; i<font->image.width; i++) {
-    for (size_t j=0; j<font->image.height; j++) {
-      thisx = i+x+font->image.offsetx;
-      thisy = j+y+font->image.offsety;
-      if (thisx<l || thisx>=r)  continue;
-      if (thisy<height-t || thisy>=height-b) continue;
-      pixFmt->blend_pixel
-	(thisx, thisy, p, font->image.buffer[i + j*font->image.width]);
-    }
+  // the pixel ranges of the canvas inside the clip box
+  long x0 = std::max(0L, (long)ceil(l));
+  long x1 = std::min((long)width, (long)ceil(r));
+  long y0 = std::max(0L, (long)ceil(height-t));
+  long y1 = std::min((long)height, (long)ceil(height-b));
+
+  // blend the glyph coverage of the text a row at a time
+  long ox = x+font->image.offsetx;
+  long oy = y+font->image.offsety;
+  long i0 = std::max(0L, x0-ox);
+  long i1 = std::min((long)font->image.width, x1-ox);
+  if (i1<=i0) return Py::Object();
+  for (long j=0; j<(long)font->image.height; j++) {
+    long thisy = j+oy;
+    if (thisy<y0 || thisy>=y1) continue;
+    pixFmt->blend_solid_hspan(i0+ox, thisy, i1-i0, p,
+			      font->image.buffer + i0 + j*font->image.width);
   }
 
   /*  bbox the text for debug purposes
@@ -1890,9 +2023,6 @@ RendererAgg::write_rgba(const Py::Tuple& args) {
 }
 
 
-// this code is heavily adapted from the paint license, which is in
-// the file paint.license (BSD compatible) included in this
-// distribution.  TODO, add license file to MANIFEST.in and CVS
 Py::Object
 RendererAgg::write_png(const Py::Tuple& args)
 {
@@ -1900,85 +2030,20 @@ RendererAgg::write_png(const Py::Tuple& args)
 
   args.verify_length(1);
 
-  FILE *fp;
-  Py::Object o = Py::Object(args[0]);
-  bool fpclose = true;
-  if (o.isString()) {
-    std::string fileName = Py::String(o);
-    const char *file_name = fileName.c_str();
-    if ((fp = fopen(file_name, "wb")) == NULL)
-      throw Py::RuntimeError( Printf("Could not open file %s", file_name).str() );
-  }
-  else {
-    if ((fp = PyFile_AsFile(o.ptr())) == NULL)
-      throw Py::TypeError("Could not convert object to file pointer");
-    fpclose = false;
-  }
-
-  png_structp png_ptr;
-  png_infop info_ptr;
-  struct        png_color_8_struct sig_bit;
-  png_uint_32 row;
-
-  png_bytep row_pointers[height];
-  for (row = 0; row < height; ++row) {
-    row_pointers[row] = pixBuffer + row * width * 4;
-  }
-
-
-  if (fp == NULL)
-    throw Py::RuntimeError("Could not open file");
-
-
-  png_ptr = png_create_write_struct(PNG_LIBPNG_VER_STRING, NULL, NULL, NULL);
-  if (png_ptr == NULL) {
-    if (fpclose) fclose(fp);
-    throw Py::RuntimeError("Could not create write struct");
-  }
-
-  info_ptr = png_create_info_struct(png_ptr);
-  if (info_ptr == NULL) {
-    if (fpclose) fclose(fp);
-    png_destroy_write_struct(&png_ptr, &info_ptr);
-    throw Py::RuntimeError("Could not create info struct");
-  }
-
-  if (setjmp(png_ptr->jmpbuf)) {
-    if (fpclose) fclose(fp);
-    png_destroy_write_struct(&png_ptr, &info_ptr);
-    throw Py::RuntimeError("Error building image");
-  }
-
-  png_init_io(png_ptr, fp);
-  png_set_IHDR(png_ptr, info_ptr,
-	       width, height, 8,
-	       PNG_COLOR_TYPE_RGB_ALPHA, PNG_INTERLACE_NONE,
-	       PNG_COMPRESSION_TYPE_BASE, PNG_FILTER_TYPE_BASE);
-
-  // this a a color image!
-  sig_bit.gray = 0;
-  sig_bit.red = 8;
-  sig_bit.green = 8;
-  sig_bit.blue = 8;
-  /* if the image has an alpha channel then */
-  sig_bit.alpha = 8;
-  png_set_sBIT(png_ptr, info_ptr, &sig_bit);
-
-  png_write_info(png_ptr, info_ptr);
-  png_write_image(png_ptr, row_pointers);
-  png_write_end(png_ptr, info_ptr);
-
-  /* Changed calls to png_destroy_write_struct to follow
-     http://www.libpng.org/pub/png/libpng-manual.txt.
-     This ensures the info_ptr memory is released.
-  */
+  // a filename, a python file or any object with a write method
+  return write_png_rgba(pixBuffer, width, height, args[0]);
+}
 
-  png_destroy_write_struct(&png_ptr, &info_ptr);
 
+Py::Object
+RendererAgg::tostring_png(const Py::Tuple& args)
+{
+  //"Return the rendered buffer encoded as png in a string";
+  _VERBOSE("RendererAgg::tostring_png");
 
-  if (fpclose) fclose(fp);
+  args.verify_length(0);
 
-  return Py::Object();
+  return write_png_rgba(pixBuffer, width, height, Py::None());
 }
 
 
@@ -2200,7 +2265,7 @@ void RendererAgg::init_type()
   add_varargs_method("draw_lines", &RendererAgg::draw_lines,
 		     "draw_lines(gc, x, y,)\n");
   add_varargs_method("draw_markers", &RendererAgg::draw_markers,
-		     "draw_markers(gc, path, x, y)\n");
+		     "draw_markers(gc, path, rgbFace, x, y, transform[, facecolors, edgecolors, scales])\n");
   add_varargs_method("draw_path", &RendererAgg::draw_path,
 		     "draw_path(gc, rgbFace, path, transform)\n");
   add_varargs_method("draw_text", &RendererAgg::draw_text,
@@ -2211,6 +2276,8 @@ void RendererAgg::init_type()
 		     "write_rgba(fname)");
   add_varargs_method("write_png", &RendererAgg::write_png,
 		     "write_png(fname)");
+  add_varargs_method("tostring_png", &RendererAgg::tostring_png,
+		     "s = tostring_png()");
   add_varargs_method("tostring_rgb", &RendererAgg::tostring_rgb,
 		     "s = tostring_rgb()");
   add_varargs_method("tostring_argb", &RendererAgg::tostring_argb,
@@ -4,7 +4,9 @@
 
 #ifndef __BACKEND_AGG_H
 #define __BACKEND_AGG_H
+#include <map>
 #include <utility>
+#include <vector>
 #include "CXX/Extensions.hxx"
 #include "agg_buffer.h"  // a swig wrapper
 
@@ -54,7 +56,7 @@ public:
     behaviors().doc("A wrapper to pass agg buffer objects to and from the python level");
   }
 
-  virtual ~BufferRegion() {};
+  virtual ~BufferRegion() {delete [] aggbuf.data;};
 };
 
 class GCAgg {
@@ -69,6 +71,7 @@ public:
   double dpi;
   bool snapto;
   bool isaa;
+  bool markercull;
   
   agg::line_cap_e cap; 
   agg::line_join_e join;
@@ -96,6 +99,20 @@ protected:
 };
 
 // th renderer
+// the serialized fill and stroke scanlines of a marker at one scale,
+// which draw_markers stamps at every point
+struct MarkerStamp {
+  std::vector<agg::int8u> fill, stroke;
+};
+
+// the last opaque marker stamped at a pixel: its stamp and packed
+// face and edge colors; stamp is -1 where none was
+struct MarkerPixel {
+  MarkerPixel() : stamp(-1), face(0), edge(0) {}
+  int stamp;
+  agg::int32u face, edge;
+};
+
 class RendererAgg: public Py::PythonExtension<RendererAgg> {
   typedef std::pair<bool, agg::rgba> facepair_t;
 public:
@@ -122,6 +139,7 @@ public:
 
   Py::Object write_rgba(const Py::Tuple & args);
   Py::Object write_png(const Py::Tuple & args);
+  Py::Object tostring_png(const Py::Tuple & args);
   Py::Object tostring_rgb(const Py::Tuple & args);
   Py::Object tostring_argb(const Py::Tuple & args);
   Py::Object tostring_bgra(const Py::Tuple & args);
@@ -169,6 +187,7 @@ protected:
   agg::rgba rgb_to_color(const Py::SeqBase<Py::Object>& rgb, double alpha);
   facepair_t _get_rgba_face(const Py::Object& rgbFace, double alpha);
   void set_clipbox_rasterizer( double *cliprect);
+  void _render_marker_stamp(agg::path_storage&, double, const GCAgg&, bool, MarkerStamp&);
   template <class VS> void _fill_and_stroke(VS&, const GCAgg&, const facepair_t&, bool curvy=true);  
 
   template<class PathSource>
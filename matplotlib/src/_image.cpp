@@ -4,6 +4,7 @@
 #include <cstdio>
 #include <png.h>
 #include <string>
+#include <vector>
 #include "Python.h"
 
 #ifdef NUMARRAY
@@ -602,69 +603,107 @@ Image::set_interpolation(const Py::Tuple& args) {
 
 
 
+// write callbacks used when the png target is a python object with a
+// write method or an in memory string rather than a FILE*
+struct _png_target {
+  PyObject *write;
+  std::string *buffer;
+};
+
+static void
+_png_write_data(png_structp png_ptr, png_bytep data, png_size_t length) {
+  _png_target *target = (_png_target *)png_get_io_ptr(png_ptr);
+  if (target->buffer != NULL) {
+    target->buffer->append((const char *)data, length);
+    return;
+  }
+  PyObject *result = PyObject_CallFunction(target->write, "s#",
+					   (char *)data, (int)length);
+  if (result == NULL)
+    png_error(png_ptr, "Error calling write method");
+  Py_DECREF(result);
+}
+
+static void
+_png_flush_data(png_structp png_ptr) {
+}
+
 // this code is heavily adapted from the paint license, which is in
 // the file paint.license (BSD compatible) included in this
 // distribution.  TODO, add license file to MANIFEST.in and CVS
-char Image::write_png__doc__[] =
-"write_png(fname)\n"
-"\n"
-"Write the image to filename fname as png\n"
-;
 Py::Object
-Image::write_png(const Py::Tuple& args)
-{
-  //small memory leak in this function - JDH 2004-06-08
-  _VERBOSE("Image::write_png");
-
-  args.verify_length(1);
-
-  std::pair<agg::int8u*,bool> bufpair = _get_output_buffer();
+write_png_rgba(agg::int8u *pixels, size_t width, size_t height,
+	       const Py::Object& o) {
+  _VERBOSE("write_png_rgba");
+
+  FILE *fp = NULL;
+  bool fpclose = false;
+  std::string buffer;
+  _png_target target;
+  target.write = NULL;
+  target.buffer = NULL;
+
+  if (o.ptr() == Py_None)
+    target.buffer = &buffer;
+  else if (o.isString()) {
+    std::string fileName = Py::String(o);
+    const char *file_name = fileName.c_str();
+    if ((fp = fopen(file_name, "wb")) == NULL)
+      throw Py::RuntimeError( Printf("Could not open file %s", file_name).str() );
+    fpclose = true;
+  }
+  else if (PyFile_Check(o.ptr())) {
+    if ((fp = PyFile_AsFile(o.ptr())) == NULL)
+      throw Py::TypeError("Could not convert object to file pointer");
+  }
+  else {
+    target.write = PyObject_GetAttrString(o.ptr(), "write");
+    if (target.write == NULL) {
+      PyErr_Clear();
+      throw Py::TypeError("Expected a filename, a file or an object with a write method");
+    }
+  }
 
-  std::string fileName = Py::String(args[0]);
-  const char *file_name = fileName.c_str();
-  FILE *fp;
   png_structp png_ptr;
   png_infop info_ptr;
   struct        png_color_8_struct sig_bit;
-  png_uint_32 row=0;
-
-  //todo: allocate on heap
-  png_bytep row_pointers[rowsOut];
-  for (row = 0; row < rowsOut; ++row)
-    row_pointers[row] = bufpair.first + row * colsOut * 4;
-
-  fp = fopen(file_name, "wb");
-  if (fp == NULL) {
-    if (bufpair.second) delete [] bufpair.first;
-    throw Py::RuntimeError(Printf("Could not open file %s", file_name).str());
-  }
 
+  std::vector<png_bytep> row_pointers(height);
+  for (size_t row = 0; row < height; ++row)
+    row_pointers[row] = pixels + row * width * 4;
 
   png_ptr = png_create_write_struct(PNG_LIBPNG_VER_STRING, NULL, NULL, NULL);
   if (png_ptr == NULL) {
-    if (bufpair.second) delete [] bufpair.first;
-    fclose(fp);
+    if (fpclose) fclose(fp);
+    Py_XDECREF(target.write);
     throw Py::RuntimeError("Could not create write struct");
   }
 
   info_ptr = png_create_info_struct(png_ptr);
   if (info_ptr == NULL) {
-    if (bufpair.second) delete [] bufpair.first;
-    fclose(fp);
+    if (fpclose) fclose(fp);
+    Py_XDECREF(target.write);
     png_destroy_write_struct(&png_ptr, &info_ptr);
     throw Py::RuntimeError("Could not create info struct");
   }
 
-  if (setjmp(png_ptr->jmpbuf)) {
-    if (bufpair.second) delete [] bufpair.first;
-    fclose(fp);
+  if (setjmp(png_jmpbuf(png_ptr))) {
+    if (fpclose) fclose(fp);
+    Py_XDECREF(target.write);
     png_destroy_write_struct(&png_ptr, &info_ptr);
+    // a python exception raised by the write method takes precedence
+    if (PyErr_Occurred()) throw Py::Exception();
     throw Py::RuntimeError("Error building image");
   }
 
-  png_init_io(png_ptr, fp);
+  if (fp != NULL)
+    png_init_io(png_ptr, fp);
+  else
+    png_set_write_fn(png_ptr, (void *)&target,
+		     &_png_write_data, &_png_flush_data);
+
   png_set_IHDR(png_ptr, info_ptr,
-	       colsOut, rowsOut, 8,
+	       width, height, 8,
 	       PNG_COLOR_TYPE_RGB_ALPHA, PNG_INTERLACE_NONE,
 	       PNG_COMPRESSION_TYPE_BASE, PNG_FILTER_TYPE_BASE);
 
@@ -678,15 +717,78 @@ Image::write_png(const Py::Tuple& args)
   png_set_sBIT(png_ptr, info_ptr, &sig_bit);
 
   png_write_info(png_ptr, info_ptr);
-  png_write_image(png_ptr, row_pointers);
+  png_write_image(png_ptr, &row_pointers[0]);
   png_write_end(png_ptr, info_ptr);
+
+  /* Changed calls to png_destroy_write_struct to follow
+     http://www.libpng.org/pub/png/libpng-manual.txt.
+     This ensures the info_ptr memory is released.
+  */
   png_destroy_write_struct(&png_ptr, &info_ptr);
-  fclose(fp);
+
+  if (fpclose) fclose(fp);
+  Py_XDECREF(target.write);
+
+  if (target.buffer != NULL)
+    return Py::String(buffer);
+  return Py::Object();
+}
+
+
+char Image::write_png__doc__[] =
+"write_png(fname)\n"
+"\n"
+"Write the image as png to fname, which may be a filename, a file\n"
+"or any object with a write method, eg a cStringIO instance\n"
+;
+Py::Object
+Image::write_png(const Py::Tuple& args)
+{
+  _VERBOSE("Image::write_png");
+
+  args.verify_length(1);
+
+  std::pair<agg::int8u*,bool> bufpair = _get_output_buffer();
+
+  try {
+    write_png_rgba(bufpair.first, colsOut, rowsOut, args[0]);
+  }
+  catch (...) {
+    if (bufpair.second) delete [] bufpair.first;
+    throw;
+  }
 
   if (bufpair.second) delete [] bufpair.first;
   return Py::Object();
 }
 
+char Image::as_png_str__doc__[] =
+"s = as_png_str()\n"
+"\n"
+"Return the image encoded as png in a string\n"
+;
+Py::Object
+Image::as_png_str(const Py::Tuple& args)
+{
+  _VERBOSE("Image::as_png_str");
+
+  args.verify_length(0);
+
+  std::pair<agg::int8u*,bool> bufpair = _get_output_buffer();
+
+  Py::Object s;
+  try {
+    s = write_png_rgba(bufpair.first, colsOut, rowsOut, Py::None());
+  }
+  catch (...) {
+    if (bufpair.second) delete [] bufpair.first;
+    throw;
+  }
+
+  if (bufpair.second) delete [] bufpair.first;
+  return s;
+}
+
 
 
 char Image::set_aspect__doc__[] =
@@ -718,6 +820,7 @@ Image::init_type() {
   add_varargs_method( "apply_rotation", &Image::apply_rotation, Image::apply_rotation__doc__);
   add_varargs_method( "apply_scaling",	&Image::apply_scaling, Image::apply_scaling__doc__);
   add_varargs_method( "apply_translation", &Image::apply_translation, Image::apply_translation__doc__);
+  add_varargs_method( "as_png_str", &Image::as_png_str, Image::as_png_str__doc__);
   add_keyword_method( "as_rgba_str", &Image::as_rgba_str, Image::as_rgba_str__doc__);
   add_varargs_method( "buffer_argb32", &Image::buffer_argb32, Image::buffer_argb32__doc__);
   add_varargs_method( "buffer_rgba", &Image::buffer_rgba, Image::buffer_rgba__doc__);
@@ -1218,6 +1321,157 @@ _image_module::frombyte(const Py::Tuple& args) {
   return Py::asObject( imo );
 }
 
+// map the n values of data to rgba bytes in out, normalizing them as
+// colors.normalize does and looking them up in lut as
+// colors.Colormap.__call__ does.  lut has N colors followed by the
+// under, over and bad colors; mask, if not NULL, is nonzero for the
+// bad values
+template <class T>
+static void
+_scalars_to_rgba(const T *data, const agg::int8u *mask, size_t n,
+		 double vmin, double vmax, bool clip,
+		 const agg::int8u *lut, size_t N, agg::int8u *out) {
+  const agg::int8u *under = lut + 4*N;
+  const agg::int8u *over = lut + 4*(N+1);
+  const agg::int8u *bad = lut + 4*(N+2);
+  const double range = vmax - vmin;
+  const agg::int8u *color;
+  double x;
+
+  for (size_t i=0; i<n; i++) {
+    bool masked = mask!=NULL && mask[i];
+    // normalize fills masked values with vmax when it clips
+    if (masked && (!clip || range==0)) color = bad;
+    else {
+      x = masked ? vmax : data[i];
+      if (range==0) x = 0;
+      else {
+	if (clip) {
+	  if (x<vmin) x = vmin;
+	  else if (x>vmax) x = vmax;
+	}
+	x = (x-vmin)/range;
+      }
+      if (x==1.0) x = 0.9999999;
+      x *= N;
+
+      // truncate toward zero, as astype(Int) does; NaN is bad
+      if (x>-1.0 && x<N) color = lut + 4*size_t(x);
+      else if (x<=-1.0) color = under;
+      else if (x>=N) color = over;
+      else color = bad;
+    }
+    *out++ = color[0];
+    *out++ = color[1];
+    *out++ = color[2];
+    *out++ = color[3];
+  }
+}
+
+char _image_module_fromscalars__doc__[] =
+"fromscalars(A, mask, vmin, vmax, clip, lut, isoutput)\n"
+"\n"
+"Load the image from the rank 2 array A of scalars, normalized and\n"
+"color mapped in one pass.  mask is None or an array the shape of A\n"
+"which is nonzero where A is bad.  The values are scaled from vmin,\n"
+"vmax to 0, 1, clipping them if clip is true, and looked up in lut,\n"
+"an N+3 x 4 byte array of N rgba colors followed by the under, over\n"
+"and bad colors.  Float32 arrays are read without converting them.\n"
+"By default this function fills the input buffer, which can subsequently\n"
+"be resampled using resize.  If isoutput=1, fill the output buffer."
+;
+Py::Object
+_image_module::fromscalars(const Py::Tuple& args) {
+  _VERBOSE("_image_module::fromscalars");
+
+  args.verify_length(7);
+
+  Py::Object x = args[0];
+  Py::Object m = args[1];
+  double vmin = Py::Float(args[2]);
+  double vmax = Py::Float(args[3]);
+  bool clip = Py::Int(args[4]);
+  Py::Object l = args[5];
+  int isoutput = Py::Int(args[6]);
+
+  int type = PyArray_DOUBLE;
+  if (PyArray_Check(x.ptr()) &&
+      ((PyArrayObject *)x.ptr())->descr->type_num == PyArray_FLOAT)
+    type = PyArray_FLOAT;
+  PyArrayObject *A = (PyArrayObject *) PyArray_ContiguousFromObject(x.ptr(), type, 2, 2);
+  if (A==NULL)
+    throw Py::ValueError("Array must be rank 2 of scalars");
+
+  PyArrayObject *mask = NULL;
+  if (m.ptr()!=Py_None) {
+    mask = (PyArrayObject *) PyArray_ContiguousFromObject(m.ptr(), PyArray_UBYTE, 2, 2);
+    if (mask==NULL) {
+      Py_XDECREF(A);
+      throw Py::ValueError("mask must be rank 2");
+    }
+    if (mask->dimensions[0]!=A->dimensions[0] ||
+	mask->dimensions[1]!=A->dimensions[1]) {
+      Py_XDECREF(A);
+      Py_XDECREF(mask);
+      throw Py::ValueError("mask must have the shape of the array");
+    }
+  }
+
+  PyArrayObject *lut = (PyArrayObject *) PyArray_ContiguousFromObject(l.ptr(), PyArray_UBYTE, 2, 2);
+  if (lut==NULL || lut->dimensions[1]!=4 || lut->dimensions[0]<4) {
+    Py_XDECREF(A);
+    Py_XDECREF(mask);
+    Py_XDECREF(lut);
+    throw Py::ValueError("lut must be an N+3 x 4 array of bytes");
+  }
+
+  Image* imo = new Image;
+
+  imo->rowsIn  = A->dimensions[0];
+  imo->colsIn  = A->dimensions[1];
+
+  size_t NUMBYTES(imo->colsIn * imo->rowsIn * imo->BPP);
+  agg::int8u *buffer = new agg::int8u[NUMBYTES];
+  if (buffer==NULL) //todo: also handle allocation throw
+    throw Py::MemoryError("_image_module::fromscalars could not allocate memory");
+
+  if (isoutput) {
+    // make the output buffer point to the input buffer
+
+    imo->rowsOut  = imo->rowsIn;
+    imo->colsOut  = imo->colsIn;
+
+    imo->rbufOut = new agg::rendering_buffer;
+    imo->bufferOut = buffer;
+    imo->rbufOut->attach(imo->bufferOut, imo->colsOut, imo->rowsOut, imo->colsOut * imo->BPP);
+
+  }
+  else {
+    imo->bufferIn = buffer;
+    imo->rbufIn = new agg::rendering_buffer;
+    imo->rbufIn->attach(buffer, imo->colsIn, imo->rowsIn, imo->colsIn*imo->BPP);
+  }
+
+  const size_t N = imo->rowsIn * imo->colsIn;
+  const agg::int8u *maskdata = NULL;
+  if (mask!=NULL) maskdata = reinterpret_cast<agg::int8u *>(mask->data);
+  const agg::int8u *lutdata = reinterpret_cast<agg::int8u *>(lut->data);
+  const size_t ncolors = lut->dimensions[0] - 3;
+
+  if (type==PyArray_FLOAT)
+    _scalars_to_rgba(reinterpret_cast<float *>(A->data), maskdata, N,
+		     vmin, vmax, clip, lutdata, ncolors, buffer);
+  else
+    _scalars_to_rgba(reinterpret_cast<double *>(A->data), maskdata, N,
+		     vmin, vmax, clip, lutdata, ncolors, buffer);
+
+  Py_XDECREF(A);
+  Py_XDECREF(mask);
+  Py_XDECREF(lut);
+
+  return Py::asObject( imo );
+}
+
 char _image_module_frombuffer__doc__[] =
 "frombuffer(buffer, width, height, isoutput)\n"
 "\n"
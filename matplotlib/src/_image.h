@@ -26,6 +26,7 @@ public:
   Py::Object apply_rotation(const Py::Tuple& args);
   Py::Object apply_scaling(const Py::Tuple& args);
   Py::Object apply_translation(const Py::Tuple& args);
+  Py::Object as_png_str(const Py::Tuple& args);
   Py::Object as_rgba_str(const Py::Tuple& args, const Py::Dict& kwargs);
   Py::Object buffer_argb32(const Py::Tuple& args);
   Py::Object buffer_rgba(const Py::Tuple& args);
@@ -84,6 +85,7 @@ private:
   static char apply_rotation__doc__[];
   static char apply_scaling__doc__[];
   static char apply_translation__doc__[];
+  static char as_png_str__doc__[];
   static char as_rgba_str__doc__[];
   static char buffer_argb32__doc__[];
   static char buffer_rgba__doc__[];
@@ -102,6 +104,12 @@ private:
 
 };
 
+// write the width x height rgba pixels as png to o, which is a
+// filename, a python file or an object with a write method.  If o is
+// None, return the png data as a string, otherwise return None
+Py::Object write_png_rgba(agg::int8u *pixels, size_t width, size_t height,
+			  const Py::Object& o);
+
 
 /*
 class ImageComposite : public Py::PythonExtension<ImageComposite> {
@@ -126,6 +134,8 @@ public:
 		       "frombyte");
     add_varargs_method("frombuffer", &_image_module::frombuffer, 
 		       "frombuffer");
+    add_varargs_method("fromscalars", &_image_module::fromscalars,
+		       "fromscalars");
     add_varargs_method("readpng", &_image_module::readpng, 
 		       "readpng");
     add_varargs_method("from_images", &_image_module::from_images, 
@@ -140,6 +150,7 @@ public:
 private:
   Py::Object frombyte (const Py::Tuple &args);
   Py::Object frombuffer (const Py::Tuple &args);
+  Py::Object fromscalars (const Py::Tuple &args);
   Py::Object fromarray (const Py::Tuple &args);
   Py::Object fromarray2 (const Py::Tuple &args);
   Py::Object pcolor (const Py::Tuple &args);
@@ -151,6 +162,7 @@ private:
   static char _image_module_fromarray2__doc__[];
   static char _image_module_frombyte__doc__[];
   static char _image_module_frombuffer__doc__[];
+  static char _image_module_fromscalars__doc__[];
 };
 
 
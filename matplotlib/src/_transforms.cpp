@@ -1,4 +1,5 @@
 #include <functional>
+#include <algorithm>
 #include "_transforms.h"
 #include "mplutils.h"
 #include "MPL_isnan.h"
@@ -13,6 +14,26 @@
 #   endif
 #endif
 
+// convert o to a contiguous Nx2 double array; sequences of length 0
+// are returned as a 0x2 array.  Returns a new reference or NULL
+static PyArrayObject*
+_get_xy_array(const Py::Object& o) {
+  if (PySequence_Check(o.ptr()) && PySequence_Length(o.ptr())==0) {
+    int dimensions[2];
+    dimensions[0] = 0;
+    dimensions[1] = 2;
+    return (PyArrayObject *)PyArray_FromDims(2,dimensions,PyArray_DOUBLE);
+  }
+
+  PyArrayObject *xy = (PyArrayObject *) PyArray_ContiguousFromObject(o.ptr(), PyArray_DOUBLE, 2, 2);
+  if (xy==NULL) return NULL;
+  if (xy->dimensions[1]!=2) {
+    Py_XDECREF(xy);
+    return NULL;
+  }
+  return xy;
+}
+
 Value::~Value() {
   _VERBOSE("Value::~Value");
 
@@ -429,6 +450,16 @@ Bbox::update(const Py::Tuple &args) {
   size_t Nx = xys.length();
   if (Nx==0) return Py::Object();
 
+  if (PyArray_Check(xys.ptr())) {
+    // an Nx2 array; read the raw buffer rather than a tuple per row
+    PyArrayObject *xya = _get_xy_array(xys);
+    if (xya==NULL)
+      throw Py::TypeError("Bbox::update expected an Nx2 numerix array");
+    update_xy_api((double *)xya->data, Nx, ignore);
+    Py_XDECREF(xya);
+    return Py::Object();
+  }
+
 
   double minx = _ll->xval();
   double maxx = _ur->xval();
@@ -469,6 +500,35 @@ Bbox::update(const Py::Tuple &args) {
   return Py::Object();
 }
 
+void
+Bbox::update_xy_api(const double* xy, size_t N, int ignore) {
+  double minx = _ll->xval();
+  double maxx = _ur->xval();
+  double miny = _ll->yval();
+  double maxy = _ur->yval();
+
+  if (ignore) {
+    minx = maxx = xy[0];
+    miny = maxy = xy[1];
+  }
+
+  for (size_t i=0; i<N; ++i) {
+    double x = xy[2*i];
+    double y = xy[2*i+1];
+    _posx.update(x);
+    _posy.update(y);
+    if (x<minx) minx=x;
+    if (x>maxx) maxx=x;
+    if (y<miny) miny=y;
+    if (y>maxy) maxy=y;
+  }
+
+  _ll->x_api()->set_api(minx);
+  _ll->y_api()->set_api(miny);
+  _ur->x_api()->set_api(maxx);
+  _ur->y_api()->set_api(maxy);
+}
+
 Py::Object
 Bbox::update_numerix(const Py::Tuple &args) {
   //update the box from the numerix arrays x and y
@@ -567,6 +627,395 @@ Bbox::update_numerix(const Py::Tuple &args) {
   return Py::Object();
 }
 
+SpatialIndex::SpatialIndex(const double* x, const double* y, size_t N, bool connect) :
+  _connect(connect), _segBucketed(false), _minx(0), _miny(0), _maxx(0), _maxy(0),
+  _cellw(1), _cellh(1), _nx(1), _ny(1) {
+  _VERBOSE("SpatialIndex::SpatialIndex");
+
+  _x.reserve(N);
+  _y.reserve(N);
+
+  bool first = true;
+  for (size_t i=0; i<N; ++i) {
+    double thisx = x[i];
+    double thisy = y[i];
+    _x.push_back(thisx);
+    _y.push_back(thisy);
+    if (MPL_isnan64(thisx) || MPL_isnan64(thisy)) continue;
+    if (first) {
+      _minx = _maxx = thisx;
+      _miny = _maxy = thisy;
+      first = false;
+      continue;
+    }
+    if (thisx<_minx) _minx = thisx;
+    if (thisx>_maxx) _maxx = thisx;
+    if (thisy<_miny) _miny = thisy;
+    if (thisy>_maxy) _maxy = thisy;
+  }
+
+  // aim for a few vertices per cell, with the cells roughly square
+  double w = _maxx - _minx;
+  double h = _maxy - _miny;
+  if (w<=0) w = 1.0;
+  if (h<=0) h = 1.0;
+  double ncells = N/4.0;
+  if (ncells<1) ncells = 1;
+  if (ncells>1048576) ncells = 1048576;
+  double side = sqrt(w*h/ncells);
+  _nx = (size_t)(w/side) + 1;
+  _ny = (size_t)(h/side) + 1;
+  if (_nx>4096) _nx = 4096;
+  if (_ny>4096) _ny = 4096;
+  _cellw = w/_nx;
+  _cellh = h/_ny;
+
+  size_t Ncells = _nx*_ny;
+
+  // bucket the vertices with a counting sort
+  _cellStart.assign(Ncells+1, 0);
+  for (size_t i=0; i<N; ++i) {
+    if (MPL_isnan64(_x[i]) || MPL_isnan64(_y[i])) continue;
+    _cellStart[celly(_y[i])*_nx + cellx(_x[i]) + 1] += 1;
+  }
+  for (size_t k=0; k<Ncells; ++k)
+    _cellStart[k+1] += _cellStart[k];
+
+  _items.resize(_cellStart[Ncells]);
+  std::vector<size_t> fill(_cellStart.begin(), _cellStart.end()-1);
+  for (size_t i=0; i<N; ++i) {
+    if (MPL_isnan64(_x[i]) || MPL_isnan64(_y[i])) continue;
+    _items[fill[celly(_y[i])*_nx + cellx(_x[i])]++] = i;
+  }
+
+  // the segments are bucketed by bucket_segments on the first
+  // cuts_bbox query, so nearest and the bbox counts don't pay for them
+}
+
+void
+SpatialIndex::segment_cells(size_t i, std::vector<size_t>& cells) const {
+  // the cells the segment i -> i+1 crosses, stepping from the cell of
+  // one end to the cell of the other through the nearer cell boundary
+  // (Amanatides and Woo)
+  cells.clear();
+  double x0 = _x[i], y0 = _y[i], x1 = _x[i+1], y1 = _y[i+1];
+  size_t cx = cellx(x0), cy = celly(y0);
+  size_t cxend = cellx(x1), cyend = celly(y1);
+
+  double dx = x1-x0, dy = y1-y0;
+  int stepx = dx>0 ? 1 : -1;
+  int stepy = dy>0 ? 1 : -1;
+  double inf = std::numeric_limits<double>::max();
+  // the segment parameter t at the next x and y cell boundaries, and
+  // its increment per cell
+  double tdx = dx!=0 ? _cellw/fabs(dx) : inf;
+  double tdy = dy!=0 ? _cellh/fabs(dy) : inf;
+  double tx = inf, ty = inf;
+  if (dx!=0) {
+    double edge = _minx + (cx + (stepx>0 ? 1 : 0))*_cellw;
+    tx = (edge-x0)/dx;
+  }
+  if (dy!=0) {
+    double edge = _miny + (cy + (stepy>0 ? 1 : 0))*_cellh;
+    ty = (edge-y0)/dy;
+  }
+
+  cells.push_back(cy*_nx + cx);
+  while (cx!=cxend || cy!=cyend) {
+    // never step past the end cell on either axis, whatever the
+    // rounding of t says
+    if (cy==cyend || (cx!=cxend && tx<ty)) {
+      cx += stepx;
+      tx += tdx;
+    }
+    else {
+      cy += stepy;
+      ty += tdy;
+    }
+    cells.push_back(cy*_nx + cx);
+  }
+}
+
+void
+SpatialIndex::bucket_segments() {
+  // bucket the segments i -> i+1 into the cells they cross
+  _segBucketed = true;
+  size_t N = _x.size();
+  if (!_connect || N<2) return;
+
+  size_t Ncells = _nx*_ny;
+  std::vector<size_t> cells, fill;
+  _segStart.assign(Ncells+1, 0);
+  for (int pass=0; pass<2; ++pass) {
+    if (pass==1) {
+      for (size_t k=0; k<Ncells; ++k)
+	_segStart[k+1] += _segStart[k];
+      _segItems.resize(_segStart[Ncells]);
+      fill.assign(_segStart.begin(), _segStart.end()-1);
+    }
+
+    for (size_t i=0; i<N-1; ++i) {
+      if (MPL_isnan64(_x[i]) || MPL_isnan64(_y[i]) ||
+	  MPL_isnan64(_x[i+1]) || MPL_isnan64(_y[i+1])) continue;
+      segment_cells(i, cells);
+      for (size_t n=0; n<cells.size(); ++n) {
+	if (pass==0) _segStart[cells[n] + 1] += 1;
+	else _segItems[fill[cells[n]]++] = i;
+      }
+    }
+  }
+}
+
+SpatialIndex::~SpatialIndex() {
+  _VERBOSE("SpatialIndex::~SpatialIndex");
+}
+
+size_t
+SpatialIndex::cellx(double x) const {
+  // clamp to the grid
+  if (x<=_minx) return 0;
+  size_t cx = (size_t)((x-_minx)/_cellw);
+  if (cx>=_nx) cx = _nx-1;
+  return cx;
+}
+
+size_t
+SpatialIndex::celly(double y) const {
+  // clamp to the grid
+  if (y<=_miny) return 0;
+  size_t cy = (size_t)((y-_miny)/_cellh);
+  if (cy>=_ny) cy = _ny-1;
+  return cy;
+}
+
+long
+SpatialIndex::nearest_api(double x, double y, double* dist) {
+  if (_items.size()==0) return -1;
+
+  size_t cx = cellx(x);
+  size_t cy = celly(y);
+
+  long best = -1;
+  double bestd2 = std::numeric_limits<double>::max();
+
+  // search rings of cells around x, y until no unsearched cell can
+  // hold a closer vertex
+  for (size_t r=0; ; ++r) {
+    size_t x0 = cx>r ? cx-r : 0;
+    size_t y0 = cy>r ? cy-r : 0;
+    size_t x1 = cx+r<_nx ? cx+r : _nx-1;
+    size_t y1 = cy+r<_ny ? cy+r : _ny-1;
+
+    for (size_t j=y0; j<=y1; ++j)
+      for (size_t i=x0; i<=x1; ++i) {
+	// only the ring; the inside was searched on the previous pass
+	if (r>0 && j!=cy-r && j!=cy+r && i!=cx-r && i!=cx+r) continue;
+	size_t k = j*_nx + i;
+	for (size_t n=_cellStart[k]; n<_cellStart[k+1]; ++n) {
+	  size_t ind = _items[n];
+	  double dx = _x[ind]-x;
+	  double dy = _y[ind]-y;
+	  double d2 = dx*dx + dy*dy;
+	  if (d2<bestd2) {
+	    bestd2 = d2;
+	    best = ind;
+	  }
+	}
+      }
+
+    bool done = x0==0 && y0==0 && x1==_nx-1 && y1==_ny-1;
+    if (done) break;
+    if (best<0) continue;
+
+    // distance from x, y to the nearest unsearched cell
+    double bound = std::numeric_limits<double>::max();
+    if (x0>0)     bound = std::min(bound, x - (_minx + x0*_cellw));
+    if (x1<_nx-1) bound = std::min(bound, (_minx + (x1+1)*_cellw) - x);
+    if (y0>0)     bound = std::min(bound, y - (_miny + y0*_cellh));
+    if (y1<_ny-1) bound = std::min(bound, (_miny + (y1+1)*_cellh) - y);
+    if (bound>0 && bestd2<=bound*bound) break;
+  }
+
+  *dist = sqrt(bestd2);
+  return best;
+}
+
+long
+SpatialIndex::count_contains_api(double minx, double miny, double maxx, double maxy) {
+  if (minx>maxx) std::swap(minx, maxx);
+  if (miny>maxy) std::swap(miny, maxy);
+  if (_items.size()==0 || maxx<_minx || minx>_maxx || maxy<_miny || miny>_maxy)
+    return 0;
+
+  size_t x0 = cellx(minx), x1 = cellx(maxx);
+  size_t y0 = celly(miny), y1 = celly(maxy);
+
+  long count = 0;
+  for (size_t j=y0; j<=y1; ++j)
+    for (size_t i=x0; i<=x1; ++i) {
+      size_t k = j*_nx + i;
+      bool inside = (i>x0 && i<x1 && j>y0 && j<y1);
+      if (inside) {
+	// the cell is strictly inside the box
+	count += _cellStart[k+1] - _cellStart[k];
+	continue;
+      }
+      for (size_t n=_cellStart[k]; n<_cellStart[k+1]; ++n) {
+	size_t ind = _items[n];
+	if (_x[ind]>=minx && _x[ind]<=maxx && _y[ind]>=miny && _y[ind]<=maxy)
+	  count += 1;
+      }
+    }
+  return count;
+}
+
+bool
+SpatialIndex::segment_cuts_edge(size_t i, double x3, double y3, double x4, double y4) const {
+  // the same test as matplotlib.mlab.segments_intersect
+  double x1 = _x[i],   y1 = _y[i];
+  double x2 = _x[i+1], y2 = _y[i+1];
+
+  double den = ((y4-y3) * (x2-x1)) - ((x4-x3)*(y2-y1));
+  if (den==0) return false;  // parallel
+
+  double n1 = ((x4-x3) * (y1-y3)) - ((y4-y3)*(x1-x3));
+  double n2 = ((x2-x1) * (y1-y3)) - ((y2-y1)*(x1-x3));
+  double u1 = n1/den;
+  double u2 = n2/den;
+  return (u1>=0.0 && u1<=1.0 && u2>=0.0 && u2<=1.0);
+}
+
+bool
+SpatialIndex::edge_cut(double x3, double y3, double x4, double y4) const {
+  // does any segment cut the horizontal or vertical edge x3,y3 - x4,y4?
+  if (std::max(x3, x4)<_minx || std::min(x3, x4)>_maxx ||
+      std::max(y3, y4)<_miny || std::min(y3, y4)>_maxy)
+    return false;
+
+  size_t x0 = cellx(std::min(x3, x4)), x1 = cellx(std::max(x3, x4));
+  size_t y0 = celly(std::min(y3, y4)), y1 = celly(std::max(y3, y4));
+  for (size_t j=y0; j<=y1; ++j)
+    for (size_t i=x0; i<=x1; ++i) {
+      size_t k = j*_nx + i;
+      for (size_t n=_segStart[k]; n<_segStart[k+1]; ++n)
+	if (segment_cuts_edge(_segItems[n], x3, y3, x4, y4)) return true;
+    }
+  return false;
+}
+
+bool
+SpatialIndex::cuts_bbox_api(double minx, double miny, double maxx, double maxy) {
+  if (!_segBucketed) bucket_segments();
+  if (_segItems.size()==0) return false;
+  return (edge_cut(minx, miny, minx, maxy) ||
+	  edge_cut(minx, miny, maxx, miny) ||
+	  edge_cut(maxx, miny, maxx, maxy) ||
+	  edge_cut(minx, maxy, maxx, maxy));
+}
+
+Py::Object
+SpatialIndex::nearest(const Py::Tuple &args) {
+  _VERBOSE("SpatialIndex::nearest");
+  args.verify_length(2);
+
+  double x = Py::Float(args[0]);
+  double y = Py::Float(args[1]);
+
+  double dist;
+  long ind = nearest_api(x, y, &dist);
+  if (ind<0) return Py::Object();
+
+  Py::Tuple ret(2);
+  ret[0] = Py::Int(ind);
+  ret[1] = Py::Float(dist);
+  return ret;
+}
+
+Py::Object
+SpatialIndex::count_contains(const Py::Tuple &args) {
+  _VERBOSE("SpatialIndex::count_contains");
+  args.verify_length(1);
+
+  if (!Bbox::check(args[0]))
+    throw Py::TypeError("SpatialIndex::count_contains expected a Bbox");
+  Bbox* bbox = static_cast<Bbox*>(args[0].ptr());
+
+  long count = count_contains_api(bbox->ll_api()->xval(), bbox->ll_api()->yval(),
+				  bbox->ur_api()->xval(), bbox->ur_api()->yval());
+  return Py::Int(count);
+}
+
+Py::Object
+SpatialIndex::indices_in_bbox(const Py::Tuple &args) {
+  _VERBOSE("SpatialIndex::indices_in_bbox");
+  args.verify_length(1);
+
+  if (!Bbox::check(args[0]))
+    throw Py::TypeError("SpatialIndex::indices_in_bbox expected a Bbox");
+  Bbox* bbox = static_cast<Bbox*>(args[0].ptr());
+
+  double minx = bbox->ll_api()->xval();
+  double miny = bbox->ll_api()->yval();
+  double maxx = bbox->ur_api()->xval();
+  double maxy = bbox->ur_api()->yval();
+  if (minx>maxx) std::swap(minx, maxx);
+  if (miny>maxy) std::swap(miny, maxy);
+
+  std::vector<long> found;
+  if (_items.size() && !(maxx<_minx || minx>_maxx || maxy<_miny || miny>_maxy)) {
+    size_t x0 = cellx(minx), x1 = cellx(maxx);
+    size_t y0 = celly(miny), y1 = celly(maxy);
+    for (size_t j=y0; j<=y1; ++j)
+      for (size_t i=x0; i<=x1; ++i) {
+	size_t k = j*_nx + i;
+	for (size_t n=_cellStart[k]; n<_cellStart[k+1]; ++n) {
+	  size_t ind = _items[n];
+	  if (_x[ind]>=minx && _x[ind]<=maxx && _y[ind]>=miny && _y[ind]<=maxy)
+	    found.push_back(ind);
+	}
+      }
+    std::sort(found.begin(), found.end());
+  }
+
+  int dimensions[1];
+  dimensions[0] = found.size();
+  PyArrayObject *ret = (PyArrayObject *)PyArray_FromDims(1,dimensions,PyArray_LONG);
+  if (ret==NULL)
+    throw Py::RuntimeError("Could not create return indices array");
+
+  for (size_t i=0; i<found.size(); ++i)
+    *(long *)(ret->data + i*ret->strides[0]) = found[i];
+
+  return Py::asObject((PyObject*)ret);
+}
+
+Py::Object
+SpatialIndex::cuts_bbox(const Py::Tuple &args) {
+  _VERBOSE("SpatialIndex::cuts_bbox");
+  args.verify_length(1);
+
+  if (!Bbox::check(args[0]))
+    throw Py::TypeError("SpatialIndex::cuts_bbox expected a Bbox");
+  Bbox* bbox = static_cast<Bbox*>(args[0].ptr());
+
+  bool b = cuts_bbox_api(bbox->ll_api()->xval(), bbox->ll_api()->yval(),
+			 bbox->ur_api()->xval(), bbox->ur_api()->yval());
+  return Py::Int(b);
+}
+
+Py::Object
+SpatialIndex::get_bounds(const Py::Tuple &args) {
+  _VERBOSE("SpatialIndex::get_bounds");
+  args.verify_length(0);
+
+  Py::Tuple ret(4);
+  ret[0] = Py::Float(_minx);
+  ret[1] = Py::Float(_miny);
+  ret[2] = Py::Float(_maxx-_minx);
+  ret[3] = Py::Float(_maxy-_miny);
+  return ret;
+}
+
 Func::~Func() {
   _VERBOSE("Func::~Func");
 }
@@ -1068,6 +1517,100 @@ Transformation::nonlinear_only_numerix(const Py::Tuple & args, const Py::Dict &k
 
 }
 
+Py::Object
+Transformation::numerix_xy(const Py::Tuple & args) {
+  _VERBOSE("Transformation::numerix_xy");
+  args.verify_length(1);
+
+  PyArrayObject *xya = _get_xy_array(args[0]);
+  if (xya==NULL)
+    throw Py::TypeError("Transformation::numerix_xy expected an Nx2 numerix array");
+
+  try {
+    if (!_frozen) eval_scalars();
+  }
+  catch(...) {
+    Py_XDECREF(xya);
+    throw Py::ValueError("Domain error on Transformation::numerix_xy");
+  }
+
+  size_t N = xya->dimensions[0];
+  int dimensions[2];
+  dimensions[0] = N;
+  dimensions[1] = 2;
+
+  PyArrayObject *ret = (PyArrayObject *)PyArray_FromDims(2,dimensions,PyArray_DOUBLE);
+  if (ret==NULL) {
+    Py_XDECREF(xya);
+    throw Py::RuntimeError("Could not create return xy array");
+  }
+
+  double *in = (double *)xya->data;
+  double *out = (double *)ret->data;
+  for (size_t i=0; i< N; ++i) {
+    try {
+      this->operator()(in[2*i], in[2*i+1]);
+    }
+    catch(...) {
+      Py_XDECREF(xya);
+      Py_XDECREF(ret);
+      throw Py::ValueError("Domain error on nonlinear Transformation::numerix_xy operator()(thisx, thisy)");
+    }
+    out[2*i]   = xy.first;
+    out[2*i+1] = xy.second;
+  }
+
+  Py_XDECREF(xya);
+  return Py::asObject((PyObject*)ret);
+}
+
+Py::Object
+Transformation::inverse_numerix_xy(const Py::Tuple & args) {
+  _VERBOSE("Transformation::inverse_numerix_xy");
+  args.verify_length(1);
+
+  PyArrayObject *xya = _get_xy_array(args[0]);
+  if (xya==NULL)
+    throw Py::TypeError("Transformation::inverse_numerix_xy expected an Nx2 numerix array");
+
+  try {
+    if (!_frozen) eval_scalars();
+  }
+  catch(...) {
+    Py_XDECREF(xya);
+    throw Py::ValueError("Domain error on Transformation::inverse_numerix_xy");
+  }
+
+  size_t N = xya->dimensions[0];
+  int dimensions[2];
+  dimensions[0] = N;
+  dimensions[1] = 2;
+
+  PyArrayObject *ret = (PyArrayObject *)PyArray_FromDims(2,dimensions,PyArray_DOUBLE);
+  if (ret==NULL) {
+    Py_XDECREF(xya);
+    throw Py::RuntimeError("Could not create return xy array");
+  }
+
+  double *in = (double *)xya->data;
+  double *out = (double *)ret->data;
+  for (size_t i=0; i< N; ++i) {
+    try {
+      inverse_api(in[2*i], in[2*i+1]);
+    }
+    catch(...) {
+      Py_XDECREF(xya);
+      Py_XDECREF(ret);
+      throw Py::ValueError("Domain error on Transformation::inverse_numerix_xy");
+    }
+    out[2*i]   = xy.first;
+    out[2*i+1] = xy.second;
+  }
+
+  Py_XDECREF(xya);
+  return Py::asObject((PyObject*)ret);
+}
+
 Py::Object
 Transformation::seq_xy_tups(const Py::Tuple & args) {
   _VERBOSE("Transformation::seq_xy_tups");
@@ -1769,6 +2312,42 @@ _transforms_module::new_interval (const Py::Tuple &args)
   return Py::asObject(new Interval(v1, v2) );
 }
 
+Py::Object
+_transforms_module::new_spatial_index (const Py::Tuple &args)
+{
+  _VERBOSE("_transforms_module::new_spatial_index ");
+
+  if (args.length()!=2 && args.length()!=3)
+    throw Py::TypeError("SpatialIndex(x, y, connect=0) expected 2 or 3 arguments");
+
+  int connect = 0;
+  if (args.length()==3) connect = Py::Int(args[2]);
+
+  PyArrayObject *x = (PyArrayObject *) PyArray_ContiguousFromObject(args[0].ptr(), PyArray_DOUBLE, 1, 1);
+  if (x==NULL)
+    throw Py::TypeError("SpatialIndex expected numerix array for x");
+
+  PyArrayObject *y = (PyArrayObject *) PyArray_ContiguousFromObject(args[1].ptr(), PyArray_DOUBLE, 1, 1);
+  if (y==NULL) {
+    Py_XDECREF(x);
+    throw Py::TypeError("SpatialIndex expected numerix array for y");
+  }
+
+  size_t Nx = x->dimensions[0];
+  size_t Ny = y->dimensions[0];
+  if (Nx!=Ny) {
+    Py_XDECREF(x);
+    Py_XDECREF(y);
+    throw Py::ValueError("x and y must be equal length sequences");
+  }
+
+  SpatialIndex* index = new SpatialIndex((double *)x->data, (double *)y->data,
+					 Nx, connect!=0);
+  Py_XDECREF(x);
+  Py_XDECREF(y);
+  return Py::asObject(index);
+}
+
 Py::Object
 _transforms_module::new_bbox (const Py::Tuple &args)
 {
@@ -1973,6 +2552,21 @@ Bbox::init_type()
 
 
 
+void
+SpatialIndex::init_type()
+{
+  _VERBOSE("SpatialIndex::init_type");
+  behaviors().name("SpatialIndex");
+  behaviors().doc("A grid index of display space vertices");
+
+  add_varargs_method("nearest", &SpatialIndex::nearest, "nearest(x, y); return index, distance of the closest vertex or None\n");
+  add_varargs_method("count_contains", &SpatialIndex::count_contains, "count_contains(bbox)\n");
+  add_varargs_method("indices_in_bbox", &SpatialIndex::indices_in_bbox, "indices_in_bbox(bbox); return the sorted indices of the vertices in bbox\n");
+  add_varargs_method("cuts_bbox", &SpatialIndex::cuts_bbox, "cuts_bbox(bbox); return True if the connected vertices cross an edge of bbox\n");
+  add_varargs_method("get_bounds", &SpatialIndex::get_bounds, "get_bounds()\n");
+  add_varargs_method("size", &SpatialIndex::size, "size()\n");
+}
+
 void
 Func::init_type()
 {
@@ -2032,6 +2626,8 @@ Transformation::init_type()
   add_keyword_method("nonlinear_only_numerix",  &Transformation::nonlinear_only_numerix, "nonlinear_only_numerix\n");
   add_varargs_method("need_nonlinear",  &Transformation::need_nonlinear, "need_nonlinear\n");
   add_varargs_method("seq_xy_tups", &Transformation::seq_xy_tups, "seq_xy_tups(seq)\n");
+  add_varargs_method("numerix_xy", &Transformation::numerix_xy, "numerix_xy(xy); xy is an Nx2 numerix array, return the transformed Nx2 array\n");
+  add_varargs_method("inverse_numerix_xy", &Transformation::inverse_numerix_xy, "inverse_numerix_xy(xy); xy is an Nx2 numerix array, return the inverse transformed Nx2 array\n");
   add_varargs_method("inverse_xy_tup",   &Transformation::inverse_xy_tup,  "inverse_xy_tup(xy)\n");
 
   add_varargs_method("set_offset",   &Transformation::set_offset,  "set_offset(xy, trans)\n");
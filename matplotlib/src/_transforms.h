@@ -9,6 +9,7 @@
 #include <cmath>
 #include <limits>
 #include <utility>
+#include <vector>
 #include "CXX/Extensions.hxx"
 
 template <class T> inline T&
@@ -313,6 +314,8 @@ public:
   // update the current bbox with data from xy tuples
   Py::Object update(const Py::Tuple &args);
   Py::Object update_numerix( const Py::Tuple &args);
+  // update from N interleaved x,y values
+  void update_xy_api(const double* xy, size_t N, int ignore);
   Py::Object contains(const Py::Tuple &args);
   Py::Object count_contains(const Py::Tuple &args);
 
@@ -369,6 +372,53 @@ private:
 };
 
 
+// a uniform grid over a set of (display space) vertices for fast
+// nearest vertex, bbox containment and line crossing queries.  The
+// vertices are bucketed by grid cell in a compressed layout: the
+// vertex indices of cell k are _items[_cellStart[k]:_cellStart[k+1]].
+// If the vertices are connected, the segments i -> i+1 are bucketed
+// the same way in _segItems for every cell they cross, on the first
+// cuts_bbox query.
+class SpatialIndex: public Py::PythonExtension<SpatialIndex> {
+public:
+  SpatialIndex(const double* x, const double* y, size_t N, bool connect);
+  ~SpatialIndex();
+  static void init_type(void);
+
+  Py::Object nearest(const Py::Tuple &args);
+  Py::Object count_contains(const Py::Tuple &args);
+  Py::Object indices_in_bbox(const Py::Tuple &args);
+  Py::Object cuts_bbox(const Py::Tuple &args);
+  Py::Object get_bounds(const Py::Tuple &args);
+  Py::Object size(const Py::Tuple &args) {
+    args.verify_length(0);
+    return Py::Int((long)_x.size());
+  }
+
+  // for the extension API; index of the nearest vertex to x, y or -1
+  // if there are no vertices.  The distance is returned in dist
+  long nearest_api(double x, double y, double* dist);
+  long count_contains_api(double minx, double miny, double maxx, double maxy);
+  bool cuts_bbox_api(double minx, double miny, double maxx, double maxy);
+
+private:
+  std::vector<double> _x, _y;
+  bool _connect, _segBucketed;
+  double _minx, _miny, _maxx, _maxy;  // the grid extent
+  double _cellw, _cellh;
+  size_t _nx, _ny;
+  std::vector<size_t> _cellStart, _items;
+  std::vector<size_t> _segStart, _segItems;
+
+  size_t cellx(double x) const;
+  size_t celly(double y) const;
+  void segment_cells(size_t i, std::vector<size_t>& cells) const;
+  void bucket_segments();
+  bool segment_cuts_edge(size_t i, double x3, double y3, double x4, double y4) const;
+  bool edge_cut(double x3, double y3, double x4, double y4) const;
+};
+
+
 
 
 //abstract base class for a function that takes maps a double to a
@@ -435,7 +485,7 @@ public:
     else if (_type==LOG10) {
 	for(int i=0; i < length; i++)
 	{
-		if (x<=0) { throw std::domain_error("Cannot take log of nonpositive value"); }
+		if (x[i]<=0) { throw std::domain_error("Cannot take log of nonpositive value"); }
 		else newx[i] = log10(x[i]);
 	}
       }
@@ -517,7 +567,7 @@ public:
       		if (r==0)
 			throw Py::ValueError("Cannot invert zero radius polar");
       		double theta = acos(x[i]/r);
-      		if (y<0) theta = 2*3.1415926535897931-theta;
+      		if (y[i]<0) theta = 2*3.1415926535897931-theta;
       		newx[i] = theta;
 		newy[i] = r;
 	}
@@ -601,6 +651,8 @@ public:
   // for all children
   Py::Object xy_tup(const Py::Tuple &args);
   Py::Object seq_xy_tups(const Py::Tuple &args);
+  Py::Object numerix_xy(const Py::Tuple &args);
+  Py::Object inverse_numerix_xy(const Py::Tuple &args);
   Py::Object seq_x_y(const Py::Tuple &args);
   Py::Object numerix_x_y(const Py::Tuple &args, const Py::Dict &kwargs);
   Py::Object nonlinear_only_numerix(const Py::Tuple &args, const Py::Dict &kwargs);
@@ -797,6 +849,7 @@ public:
     Point::init_type();
     Interval::init_type();
     Bbox::init_type();
+    SpatialIndex::init_type();
     Func::init_type();
     FuncXY::init_type();
     Transformation::init_type();
@@ -813,6 +866,8 @@ public:
 		       "Bbox(ll, ur)");
     add_varargs_method("Interval", &_transforms_module::new_interval,
 		       "Interval(val1, val2)");
+    add_varargs_method("SpatialIndex", &_transforms_module::new_spatial_index,
+		       "SpatialIndex(x, y, connect=0)");
 
     add_varargs_method("Func", &_transforms_module::new_func,
 		       "Func(typecode)");
@@ -838,6 +893,7 @@ private:
   Py::Object new_point (const Py::Tuple &args);
   Py::Object new_bbox (const Py::Tuple &args);
   Py::Object new_interval (const Py::Tuple &args);
+  Py::Object new_spatial_index (const Py::Tuple &args);
   Py::Object new_affine (const Py::Tuple &args);
   Py::Object new_func (const Py::Tuple &args);
   Py::Object new_funcxy (const Py::Tuple &args);
@@ -1,4 +1,5 @@
 #include <sstream>
+#include <algorithm>
 #include "ft2font.h"
 #include "mplutils.h"
 
@@ -310,7 +311,10 @@ Glyph::get_path( const FT_Face& face) {
 }
 
 
-FT2Font::FT2Font(std::string facefile)
+const size_t FT2Font::maxGlyphCacheBytes = 1<<20;
+
+FT2Font::FT2Font(std::string facefile) :
+  charSize(12*64), charDpi(72), glyphCacheBytes(0)
 {
   _VERBOSE(Printf("FT2Font::FT2Font %s", facefile.c_str()).str());
   clear(Py::Tuple(0));
@@ -548,6 +552,8 @@ FT2Font::clear(const Py::Tuple & args) {
   }
 
   glyphs.resize(0);
+  glyphIndices.resize(0);
+  pos.resize(0);
   gms.resize(0);
 
   return Py::Object();
@@ -570,11 +576,17 @@ FT2Font::set_size(const Py::Tuple & args) {
   double ptsize = Py::Float(args[0]);
   double dpi = Py::Float(args[1]);
 
-  int error = FT_Set_Char_Size( face, (long)(ptsize * 64), 0,
+  long size = (long)(ptsize * 64);
+  if (size==charSize && (unsigned int)dpi==charDpi)
+    return Py::Object();
+
+  int error = FT_Set_Char_Size( face, size, 0,
 				(unsigned int)dpi,
 				(unsigned int)dpi );
   if (error)
     throw Py::RuntimeError("Could not set the fontsize");
+  charSize = size;
+  charDpi = (unsigned int)dpi;
   return Py::Object();
 }
 
@@ -695,6 +707,8 @@ FT2Font::set_text(const Py::Tuple & args) {
   FT_UInt previous = 0;
 
   glyphs.resize(0);
+  glyphIndices.resize(0);
+  pos.resize(0);
   pen.x = 0;
   pen.y = 0;
 
@@ -744,10 +758,12 @@ FT2Font::set_text(const Py::Tuple & args) {
     xy[0] = Py::Float(pen.x);
     xy[1] = Py::Float(pen.y);
     xys[n] = xy;
+    pos.push_back(pen);
     pen.x += face->glyph->advance.x;
 
     previous = glyph_index;
     glyphs.push_back(thisGlyph);
+    glyphIndices.push_back(glyph_index);
   }
 
   // now apply the rotation
@@ -828,6 +844,11 @@ FT2Font::load_char(const Py::Tuple & args) {
 
   size_t num = glyphs.size();  //the index into the glyphs list
   glyphs.push_back(thisGlyph);
+  glyphIndices.push_back(FT_Get_Char_Index( face, (unsigned long)charcode ));
+  FT_Vector origin;
+  origin.x = 0;
+  origin.y = 0;
+  pos.push_back(origin);
   Glyph* gm = new Glyph(face, thisGlyph, num);
   gms.push_back(gm);
   Py_INCREF(gm); //todo: refcount correct?
@@ -876,25 +897,69 @@ void
 FT2Font::draw_bitmap( FT_Bitmap*  bitmap,
 		      FT_Int      x,
 		      FT_Int      y) {
+  draw_bitmap(bitmap->buffer, bitmap->width, bitmap->rows, x, y);
+}
+
+void
+FT2Font::draw_bitmap( const unsigned char* buffer,
+		      FT_Int      bwidth,
+		      FT_Int      brows,
+		      FT_Int      x,
+		      FT_Int      y) {
   _VERBOSE("FT2Font::draw_bitmap");
   FT_Int  i, j, p, q;
-  FT_Int  x_max = x + bitmap->width;
-  FT_Int  y_max = y + bitmap->rows;
-
   FT_Int width = (FT_Int)image.width;
   FT_Int height = (FT_Int)image.height;
-  for ( i = x, p = 0; i < x_max; i++, p++ )
-    {
-      for ( j = y, q = 0; j < y_max; j++, q++ )
-	{
-	  if ( i >= width || j >= height )
-	    continue;
-	  image.buffer[i + j*width] |= bitmap->buffer[p + q*bitmap->width];
+  FT_Int  x_max = std::min(x + bwidth, width);
+  FT_Int  y_max = std::min(y + brows, height);
 
-	}
+  for ( j = y, q = 0; j < y_max; j++, q++ )
+    {
+      unsigned char* dst = image.buffer + j*width;
+      const unsigned char* src = buffer + q*bwidth;
+      for ( i = x, p = 0; i < x_max; i++, p++ )
+	dst[i] |= src[p];
     }
 }
 
+const CachedGlyph&
+FT2Font::get_cached_glyph(size_t n, FT_Pos ipen, int offset) {
+  // the bitmap of glyph n, whose pen position is ipen pixels plus
+  // offset subpixels.  Rendering on a miss converts glyphs[n] to a
+  // bitmap, just like the uncached path of draw_glyphs_to_bitmap
+  GlyphCacheKey key(glyphIndices[n], offset, charSize, charDpi);
+  std::map<GlyphCacheKey, CachedGlyph>::iterator it = glyphCache.find(key);
+  if (it != glyphCache.end())
+    return it->second;
+
+  error = FT_Glyph_To_Bitmap(&glyphs[n],
+			     ft_render_mode_normal,
+			     0,
+			     1  //destroy image;
+			     );
+  if (error)
+    throw Py::RuntimeError("Could not convert glyph to bitmap");
+  FT_BitmapGlyph bitmap = (FT_BitmapGlyph)glyphs[n];
+
+  CachedGlyph cached;
+  cached.left = bitmap->left - ipen;
+  cached.top = bitmap->top;
+  cached.width = bitmap->bitmap.width;
+  cached.rows = bitmap->bitmap.rows;
+  cached.buffer.resize(cached.width*cached.rows);
+  for (unsigned int q=0; q<cached.rows; q++)
+    for (unsigned int p=0; p<cached.width; p++)
+      cached.buffer[p + q*cached.width] =
+	bitmap->bitmap.buffer[p + q*bitmap->bitmap.pitch];
+
+  if (glyphCacheBytes + cached.buffer.size() > maxGlyphCacheBytes) {
+    glyphCache.clear();
+    glyphCacheBytes = 0;
+  }
+  glyphCacheBytes += cached.buffer.size();
+  return glyphCache.insert(std::make_pair(key, cached)).first->second;
+}
+
 char FT2Font::write_bitmap__doc__[] =
 "write_bitmap(fname)\n"
 "\n"
@@ -1013,10 +1078,25 @@ FT2Font::draw_glyphs_to_bitmap(const Py::Tuple & args) {
 
 
 
+  // unrotated glyphs only differ by the subpixel part of their pen
+  // position, so their bitmaps come from the glyph cache
+  bool useCache = angle==0 && pos.size()==glyphs.size();
+
   for ( size_t n = 0; n < glyphs.size(); n++ )
     {
-      FT_BBox bbox;
-      FT_Glyph_Get_CBox(glyphs[n], ft_glyph_bbox_pixels, &bbox);
+      if (useCache) {
+	FT_Pos ipen = pos[n].x>=0 ? pos[n].x/64 : -((63-pos[n].x)/64);
+	int offset = (int)(pos[n].x - ipen*64);
+	const CachedGlyph& cached = get_cached_glyph(n, ipen, offset);
+
+	FT_Int x = (FT_Int)(cached.left+ipen-string_bbox.xMin/64.);
+	FT_Int y = (FT_Int)(string_bbox.yMax/64.-cached.top+1);
+	x = x<0?0:x;
+	y = y<0?0:y;
+	if (cached.buffer.size())
+	  draw_bitmap( &cached.buffer[0], cached.width, cached.rows, x, y);
+	continue;
+      }
 
       error = FT_Glyph_To_Bitmap(&glyphs[n],
 				 ft_render_mode_normal,
@@ -1043,6 +1123,22 @@ FT2Font::draw_glyphs_to_bitmap(const Py::Tuple & args) {
   return Py::Object();
 }
 
+char FT2Font::get_glyph_cache_size__doc__[] =
+"n, nbytes = get_glyph_cache_size()\n"
+"\n"
+"Return the number of cached glyph bitmaps and their size in bytes\n"
+;
+Py::Object
+FT2Font::get_glyph_cache_size(const Py::Tuple & args) {
+  _VERBOSE("FT2Font::get_glyph_cache_size");
+  args.verify_length(0);
+
+  Py::Tuple ret(2);
+  ret[0] = Py::Int((long)glyphCache.size());
+  ret[1] = Py::Int((long)glyphCacheBytes);
+  return ret;
+}
+
 
 char FT2Font::get_xys__doc__[] =
 "get_xys()\n"
@@ -1566,6 +1662,8 @@ FT2Font::init_type() {
 		     FT2Font::draw_glyphs_to_bitmap__doc__);
   add_varargs_method("get_xys", &FT2Font::get_xys,
 		     FT2Font::get_xys__doc__);
+  add_varargs_method("get_glyph_cache_size", &FT2Font::get_glyph_cache_size,
+		     FT2Font::get_glyph_cache_size__doc__);
 
   add_varargs_method("get_glyph", &FT2Font::get_glyph,
 		     FT2Font::get_glyph__doc__);
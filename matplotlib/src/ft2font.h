@@ -6,6 +6,7 @@
 #include <string>
 #include <cmath>
 #include <utility>
+#include <map>
 
 extern "C" {
 #include <ft2build.h>
@@ -32,6 +33,32 @@ public:
 };
 
 
+// a rendered glyph bitmap, with the bitmap left relative to the
+// integer part of the pen position
+class CachedGlyph {
+public:
+  int left, top;
+  unsigned int width, rows;
+  std::vector<unsigned char> buffer;
+};
+
+// glyph index, subpixel pen offset, char size in 26.6 and dpi
+class GlyphCacheKey {
+public:
+  GlyphCacheKey(FT_UInt index_, int offset_, long size_, unsigned int dpi_) :
+    index(index_), offset(offset_), size(size_), dpi(dpi_) {}
+  FT_UInt index;
+  int offset;
+  long size;
+  unsigned int dpi;
+  bool operator<(const GlyphCacheKey& o) const {
+    if (index!=o.index) return index<o.index;
+    if (offset!=o.offset) return offset<o.offset;
+    if (size!=o.size) return size<o.size;
+    return dpi<o.dpi;
+  }
+};
+
 class Glyph : public Py::PythonExtension<Glyph> {
 public:
   Glyph( const FT_Face&, const FT_Glyph&, size_t);
@@ -76,6 +103,7 @@ public:
   Py::Object get_ps_font_info(const Py::Tuple & args);
   Py::Object get_sfnt_table(const Py::Tuple & args);
   Py::Object horiz_image_to_vert_image(const Py::Tuple & args);
+  Py::Object get_glyph_cache_size(const Py::Tuple & args);
   int setattr( const char *_name, const Py::Object &value );
   Py::Object getattr( const char *_name );
   FT2Image image;
@@ -87,14 +115,27 @@ private:
   FT_Vector     pen;                    /* untransformed origin  */
   FT_Error      error;
   std::vector<FT_Glyph> glyphs;
+  std::vector<FT_UInt> glyphIndices;
   std::vector<FT_Vector> pos;
   std::vector<Glyph*> gms;
   double angle;
 
+  // the current char size in 26.6 points and dpi
+  long charSize;
+  unsigned int charDpi;
 
+  // rendered bitmaps of unrotated glyphs, reused by
+  // draw_glyphs_to_bitmap across strings and draws.  The cache is
+  // emptied when it grows beyond maxGlyphCacheBytes
+  std::map<GlyphCacheKey, CachedGlyph> glyphCache;
+  size_t glyphCacheBytes;
+  static const size_t maxGlyphCacheBytes;
 
   FT_BBox compute_string_bbox();
+  const CachedGlyph& get_cached_glyph(size_t n, FT_Pos ipen, int offset);
   void draw_bitmap( FT_Bitmap*  bitmap, FT_Int x, FT_Int y);
+  void draw_bitmap( const unsigned char* buffer, FT_Int bwidth, FT_Int brows,
+		    FT_Int x, FT_Int y);
   void set_scalable_attributes();
 
   static char set_bitmap_size__doc__ [];
@@ -121,6 +162,7 @@ private:
   static char get_ps_font_info__doc__[];
   static char get_sfnt_table__doc__[];
   static char horiz_image_to_vert_image__doc__[];
+  static char get_glyph_cache_size__doc__[];
 };
 
 // the extension module
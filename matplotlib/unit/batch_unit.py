@@ -0,0 +1,29 @@
+from matplotlib.batch import render_many
+
+def plot_line(fig, n):
+    ax = fig.add_subplot(111)
+    ax.plot(range(n))
+    ax.set_title('%d points' % n)
+
+specs = [(plot_line, n) for n in range(2, 12)]
+serial = dict(render_many(specs, processes=1, figsize=(2,2), dpi=50))
+assert(serial.keys()==range(len(specs)))
+for png in serial.values():
+    assert(png.startswith('\x89PNG'))
+
+# the workers draw the same pngs, in any order, and can be recycled
+parallel = dict(render_many(specs, processes=3, figsize=(2,2), dpi=50,
+                            maxtasks=2))
+assert(parallel==serial)
+
+def fail(fig):
+    raise ValueError('bad spec')
+
+try:
+    list(render_many([(plot_line, 3), fail], processes=2))
+except RuntimeError, msg:
+    assert(str(msg).find('bad spec')>=0)
+else:
+    raise AssertionError('the failing spec was not reported')
+
+print 'all tests passed'
@@ -0,0 +1,40 @@
+from matplotlib.numerix import arange, sin, cos
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+fig = Figure(figsize=(3,2), dpi=72)
+canvas = FigureCanvasAgg(fig)
+ax = fig.add_subplot(111)
+x = arange(50)/5.0
+line, = ax.plot(x, sin(x))
+ax.plot(x, cos(x))
+# keep the animated line inside the axes, away from the edge of the
+# background region
+ax.set_xlim((-1, 11))
+ax.set_ylim((-2, 2))
+manager = canvas.get_blit_manager()
+manager.add_artist(line)
+assert(line.get_animated())
+
+draws = []
+canvas.mpl_connect('draw_event', lambda event: draws.append(event))
+canvas.draw()
+assert(len(draws)==1)
+
+# an update draws what a full draw of the same data does
+line.set_ydata(sin(x+1))
+manager.update()
+assert(len(draws)==1)
+frame = canvas.tostring_rgb()
+canvas.draw()
+assert(canvas.tostring_rgb()==frame)
+
+# new view limits make the background stale
+ax.set_xlim((0, 5))
+manager.update()
+assert(len(draws)==3)
+
+manager.remove_artist(line)
+assert(not line.get_animated())
+
+print 'all tests passed'
@@ -0,0 +1,102 @@
+from matplotlib.numerix import array, arange, sin, cos, Float
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection, LineCollection
+
+# collections keep their verts, offsets and colors as Float arrays
+verts = [[(0,0), (1,0), (1,1)], [(0,0), (0,1), (1,1)]]
+col = PolyCollection(verts, offsets=(0.5, 0.5), facecolors='r')
+assert(col._verts.shape==(2, 3, 2))
+assert(col._offsets.shape==(1, 2))
+assert(col._facecolors.shape==(1, 4))
+col.set_alpha(0.5)
+assert(col._facecolors[0,3]==0.5)
+
+# ragged segments are kept as a list of Mx2 arrays
+col = LineCollection([[(0,0), (1,1)], [(0,1), (1,0), (2,2)]], offsets=(1,2))
+assert(len(col.get_segments())==2)
+assert(tuple(col.get_segments()[1][2])==(3.0, 4.0))
+
+# the RendererBase fallbacks transform the verts as arrays, to the
+# same points as the tuple transform api
+from matplotlib.backend_bases import RendererBase
+from matplotlib.transforms import scale_transform, translation_transform
+
+class Recorder(RendererBase):
+    def __init__(self): self.drawn = []
+    def draw_polygon(self, gc, rgbFace, points): self.drawn.append(list(points))
+    def draw_lines(self, gc, x, y): self.drawn.append(zip(list(x), list(y)))
+
+trans = scale_transform(2, 3)
+transOffset = translation_transform(10, 20)
+renderer = Recorder()
+renderer.draw_poly_collection(verts, trans, None, ((1,0,0,1),),
+                              ((0,0,0,1),), (1,), (1,), ((1,1), (2,2)),
+                              transOffset)
+renderer.draw_line_collection(verts, trans, None, ((0,0,0,1),), (1,),
+                              (None, None), (1,), ((1,1), (2,2)),
+                              transOffset)
+expected = []
+for seg, offset in zip(verts, ((1,1), (2,2))):
+    xo, yo = transOffset.xy_tup(offset)
+    expected.append([(x+xo, y+yo) for x, y in trans.seq_xy_tups(seg)])
+assert(renderer.drawn==expected+expected)
+
+# Agg draws array and sequence arguments alike
+def draw(func):
+    fig = Figure(figsize=(3,3), dpi=72)
+    canvas = FigureCanvasAgg(fig)
+    func(fig.add_subplot(111))
+    canvas.draw()
+    return canvas.tostring_rgb()
+
+x = arange(20)*0.25
+y = sin(x)
+def scatter(ax): ax.scatter(x, y, s=arange(20)*5+10, c=cos(x))
+def scatter_lists(ax): ax.scatter(list(x), list(y), s=list(arange(20)*5+10), c=cos(x))
+assert(draw(scatter)==draw(scatter_lists))
+
+Z = array([[1,2,3],[4,5,6]], Float)
+def pcolor(ax): ax.pcolor(Z)
+def pcolor_lists(ax):
+    verts = [[(j,i), (j,i+1), (j+1,i+1), (j+1,i)]
+             for i in range(2) for j in range(3)]
+    col = PolyCollection(verts, edgecolors=((0,0,0,1),),
+                         antialiaseds=(0,), linewidths=(0.25,))
+    col.set_alpha(1.0)
+    col.set_array(array([1,2,3,4,5,6], Float))
+    ax.grid(False)
+    ax.update_datalim(((0,0), (3,2)))
+    ax.autoscale_view()
+    ax.add_collection(col)
+assert(draw(pcolor)==draw(pcolor_lists))
+
+# scatter markers are stamped from one raster per quantized size
+def scatter_sizes(ax): ax.scatter(x, y, s=arange(20)*0+100, c=cos(x))
+def scatter_close_sizes(ax): ax.scatter(x, y, s=arange(20)*1e-6+100, c=cos(x))
+assert(draw(scatter_sizes)==draw(scatter_close_sizes))
+
+# the stamped markers cover what the polygon path does, including the
+# markers centered off the canvas, within the half pixel the stamps
+# are snapped by
+from matplotlib.backends.backend_agg import RendererAgg
+def scatter_edges(ax):
+    ax.set_position([0, 0, 1, 1])
+    ax.scatter([-0.03, 0.5, 1.02, 0.3], [0.5, -0.04, 0.7, 0.3],
+               s=[400, 300, 500, 200], c=[0.1, 0.4, 0.7, 1.0])
+    ax.set_xlim((0, 1))
+    ax.set_ylim((0, 1))
+stamped = draw(scatter_edges)
+def draw_polygons(self, clipbox, offsets, transOffset, verts, sizes,
+                  facecolors, edgecolors, linewidths, antialiaseds):
+    self._renderer.draw_regpoly_collection(
+        clipbox, offsets, transOffset, verts, sizes,
+        facecolors, edgecolors, linewidths, antialiaseds)
+routed = RendererAgg.draw_regpoly_collection
+RendererAgg.draw_regpoly_collection = draw_polygons
+try: polygons = draw(scatter_edges)
+finally: RendererAgg.draw_regpoly_collection = routed
+diff = [abs(ord(a)-ord(b)) for a, b in zip(stamped, polygons)]
+assert(max(diff)<=160 and sum(diff)<0.02*255*len(diff))
+
+print 'all tests passed'
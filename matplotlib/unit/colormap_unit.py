@@ -0,0 +1,47 @@
+from matplotlib import _image
+from matplotlib._cm import _jet_data
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import normalize, no_norm, ListedColormap, \
+     LinearSegmentedColormap
+from matplotlib.image import _fromscalars
+from matplotlib.numerix import arange, concatenate, reshape, Float32
+import matplotlib.numerix.ma as ma
+
+class Mappable(ScalarMappable):
+    _alpha = 0.5
+
+def slow(mappable, A):
+    'the pixels to_rgba and fromarray make'
+    x = mappable.to_rgba(A, mappable._alpha)
+    return _image.fromarray(x, 1).as_rgba_str()
+
+# values in the middle of the colormap bins, so both ways of doing
+# the float arithmetic pick the same colors; -1 and 2 are under and
+# over when not clipped
+x = (arange(256)+0.5)/256
+A = reshape(concatenate([x, [-1., 2., 0.5, 0.5]]), (26, 10))
+mask = reshape(arange(260)==258, (26, 10))
+
+# a new jet, so the shared cm.jet keeps its extremes
+cmap = LinearSegmentedColormap('jet', _jet_data)
+cmap.set_under('w')
+cmap.set_over('k')
+cmap.set_bad('g', 1.0)
+listed = ListedColormap(['r', 'g', 'b'])
+for data in (A, A.astype(Float32), ma.array(A, mask=mask)):
+    for norm in (normalize(0, 1), normalize(0, 1, clip=False),
+                 normalize(0.5, 0.5, clip=False)):
+        for c in (cmap, listed):
+            m = Mappable(norm, c)
+            assert(_fromscalars(m, data, 1).as_rgba_str()==slow(m, data))
+
+# the limits of a normalize are set from the data
+norm = normalize()
+_fromscalars(Mappable(norm, cmap), A, 0)
+assert((norm.vmin, norm.vmax)==(-1, 2))
+
+# other norms and colormaps go through to_rgba
+m = Mappable(no_norm(), listed)
+assert(_fromscalars(m, A*3, 1).as_rgba_str()==slow(m, A*3))
+
+print 'all tests passed'
@@ -0,0 +1,71 @@
+import datetime, random
+from dateutil.parser import parse
+from matplotlib.dates import date2num, num2date, epoch2num, num2epoch,\
+     datestr2num, timezone, _to_ordinalf, _from_ordinalf
+
+def close(d1, d2, epsilon=5):
+    'datetimes d1 and d2 are the same instant within epsilon microseconds'
+    delta = abs(_to_ordinalf(d1)-_to_ordinalf(d2))*86400e6
+    return delta<epsilon
+
+# the array conversions agree with the conversions of single values
+random.seed(0)
+x = [random.uniform(700000, 740000) for i in range(500)]
+for name in ('UTC', 'US/Eastern', 'Europe/Amsterdam', 'Asia/Calcutta'):
+    tz = timezone(name)
+    dates = num2date(x, tz)
+    for val, dt in zip(x, dates):
+        ref = _from_ordinalf(val, tz)
+        assert(close(dt, ref))
+        assert(dt.utcoffset()==ref.utcoffset() and dt.tzname()==ref.tzname())
+    # float days resolve about 10 microseconds at these dates
+    nums = date2num(dates)
+    for val, num in zip(x, nums):
+        assert(abs(val-num)*86400e6<20)
+
+# local times across the end of daylight saving time
+eastern = timezone('US/Eastern')
+start = datetime.datetime(2004, 10, 31, 4, 30, tzinfo=timezone('UTC'))
+hours = [start + datetime.timedelta(hours=i) for i in range(3)]
+local = num2date(date2num(hours), eastern)
+assert([dt.strftime('%H:%M %Z') for dt in local]==
+       ['00:30 EDT', '01:30 EDT', '01:30 EST'])
+
+# naive datetimes are UTC, and dates are midnight
+assert(date2num([datetime.datetime(1970, 1, 1, 12)])[0]==719163.5)
+assert(date2num([datetime.date(1970, 1, 2)])[0]==719164)
+
+# lists give lists, and other sequences arrays
+assert(type(date2num(hours))==list and type(datestr2num(['2005-01-31']))==list)
+assert(date2num(tuple(hours)).shape==(3,))
+
+# date strings parse as dateutil parses them, in the inferred format
+# or with dateutil for the strings which do not match it
+columns = [
+    ['2005-01-31', '2005-02-01 13:45:10', '2005-02-01T13:45:10.25',
+     '2005-2-1 9:05 +0130', 'Feb 1 2005 1pm'],
+    ['01/31/2005', '2/1/05 13:45', '2005-02-01'],
+    ['31-Jan-05', '1-Feb-2005', '01 February 2005'],
+    ['20050131', '20050201'],
+    ]
+for strings in columns:
+    nums = datestr2num(strings)
+    for s, num in zip(strings, nums):
+        assert(num==date2num(parse(s)))
+        assert(datestr2num(s)==num)
+assert(len(datestr2num([]))==0)
+
+# 4 digit years, which every numerix must make numbers of
+for s in ('2005-01-31', '2005/01/31', '01/31/2005', '31-Jan-2005',
+          'Jan 31 2005', '20050131'):
+    assert(datestr2num([s])==[731977])
+
+try: datestr2num(['2005-01-31', '2005-02-30'])
+except ValueError: pass
+else: raise AssertionError('Feb 30 is not a date')
+
+# epoch conversions
+e = [0, 86400*365.25, 1.1e9]
+assert(max(abs(num2epoch(epoch2num(e))-e))<1e-3)
+
+print 'all tests passed'
@@ -0,0 +1,33 @@
+import os
+from matplotlib import get_data_path
+from matplotlib.ft2font import FT2Font
+
+fname = os.path.join(get_data_path(), 'Vera.ttf')
+
+def render(font, s, size=12, dpi=72):
+    font.clear()
+    font.set_size(size, dpi)
+    font.set_text(s, 0)
+    font.draw_glyphs_to_bitmap()
+    return font.image_as_str()
+
+# the glyph cache must not change what is drawn
+font = FT2Font(fname)
+for s in ('1.0', '0.5 1.5 2.5', 'hi mom', 'AV Wa 10'):
+    expected = render(FT2Font(fname), s)
+    assert(render(font, s)==expected)
+    assert(render(font, s)==expected)
+
+n, nbytes = font.get_glyph_cache_size()
+assert(n>0 and nbytes>0)
+
+# a new size renders new glyphs
+assert(render(font, '1.0', 14)==render(FT2Font(fname), '1.0', 14))
+assert(font.get_glyph_cache_size()[0]>n)
+
+# rotated text bypasses the cache
+font.clear()
+font.set_text('hi mom', 90)
+font.draw_glyphs_to_bitmap()
+
+print 'all tests passed'
@@ -0,0 +1,70 @@
+"""
+Measure the cold import time of matplotlib and pylab, each in a fresh
+interpreter, and check the modules which should load on first use
+are not imported with them.
+
+  python import_time.py [budget]
+
+budget is the most seconds the fastest import pylab may take; the
+default is 1.0.
+"""
+import os, sys
+
+budget = 1.0
+if len(sys.argv)>1: budget = float(sys.argv[1])
+numruns = 5
+
+# modules which should not be imported until they are used.  The
+# numerix fft and linear_algebra modules are not among them: Numeric's
+# MLab imports LinearAlgebra, and numpy imports its linalg and fft
+# (dft) modules, with the array package itself
+lazy = ['matplotlib.mathtext', 'matplotlib.pyparsing',
+        'matplotlib.texmanager', 'matplotlib.finance', 'dateutil.parser']
+
+script = """
+import sys, time
+start = time.time()
+%s
+print time.time()-start
+print ' '.join([name for name, mod in sys.modules.items() if mod is not None])
+"""
+
+imports = {
+    'matplotlib' : 'import matplotlib',
+    'pylab' : "import matplotlib\nmatplotlib.use('Agg')\nimport pylab",
+    }
+
+def cold_import(name):
+    'import name in a new interpreter; return the seconds and the modules'
+    fh = os.popen('%s -c "%s"' % (sys.executable,
+                                  script % imports[name]))
+    lines = fh.readlines()
+    if fh.close() is not None:
+        raise RuntimeError('import %s failed' % name)
+    return float(lines[0]), lines[1].split()
+
+for name in ('matplotlib', 'pylab'):
+    times = []
+    for i in range(numruns):
+        t, modules = cold_import(name)
+        times.append(t)
+    times.sort()
+    print 'import %-10s best %1.3fs  median %1.3fs  %d modules' % (
+        name, times[0], times[numruns//2], len(modules))
+    for mod in lazy:
+        assert(mod not in modules), '%s imports %s' % (name, mod)
+
+# the numerix and pylab names are still there
+import matplotlib
+matplotlib.use('Agg')
+import pylab
+from matplotlib import numerix, mlab
+assert(numerix.la is numerix.linear_algebra)
+assert(numerix.fft.fft is pylab.fft is mlab.fft)
+for name in ('SubplotTool', 'Button', 'Slider', 'Widget'):
+    assert(hasattr(pylab, name))
+
+assert(times[0]<=budget), 'import pylab took %1.3fs; the budget is %1.3fs' % (
+    times[0], budget)
+
+print 'all tests passed'
@@ -0,0 +1,77 @@
+from matplotlib.numerix import arange, sin, cos
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+def make(incremental):
+    fig = Figure(figsize=(4,3), dpi=72)
+    fig.set_incremental(incremental)
+    canvas = FigureCanvasAgg(fig)
+    x = arange(20)
+    lines = []
+    for i in range(4):
+        ax = fig.add_subplot(2, 2, i+1)
+        lines.extend(ax.plot(x, sin(x+i)))
+    # keep the tick labels of neighbouring axes apart
+    fig.subplots_adjust(wspace=0.6, hspace=0.8)
+    fig.text(0.5, 0.95, 'dashboard')
+    canvas.draw()
+    return fig, canvas, lines
+
+def update(fig, lines):
+    x = arange(20)
+    lines[1].set_ydata(cos(x))
+    fig.axes[2].set_xlim((0, 10))
+    fig.axes[3].set_title('panel 4')
+
+# an incremental redraw draws what a full one does
+fig, canvas, lines = make(True)
+full, fullcanvas, fulllines = make(False)
+assert(canvas.tostring_rgb()==fullcanvas.tostring_rgb())
+update(fig, lines)
+update(full, fulllines)
+canvas.draw()
+fullcanvas.draw()
+assert(canvas.tostring_rgb()==fullcanvas.tostring_rgb())
+
+# only the changed axes are drawn again
+drawn = []
+for ax in fig.axes:
+    def draw(renderer, ax=ax, axdraw=ax.draw):
+        drawn.append(ax)
+        axdraw(renderer)
+    ax.draw = draw
+lines[0].set_color('r')
+canvas.draw()
+assert(drawn==[fig.axes[0]])
+
+# figure level changes draw everything
+del drawn[:]
+fig.set_facecolor('w')
+canvas.draw()
+assert(len(drawn)==4)
+
+# grid, scale and tick changes made through the axes and axis api
+# are drawn again
+def positive(fig, lines):
+    lines[2].set_ydata(arange(20)+1.)
+    fig.axes[2].set_ylim((1, 20))
+changes = [lambda ax: ax.grid(True),
+           lambda ax: ax.set_yscale('log'),
+           lambda ax: ax.set_xticks([0, 5, 10]),
+           lambda ax: ax.set_xticklabels(['a', 'b', 'c']),
+           lambda ax: ax.xaxis.grid(False)]
+fig, canvas, lines = make(True)
+full, fullcanvas, fulllines = make(False)
+positive(fig, lines)
+positive(full, fulllines)
+for change in [None] + changes:
+    if change is not None:
+        before = canvas.tostring_rgb()
+        change(fig.axes[2])
+        change(full.axes[2])
+    canvas.draw()
+    fullcanvas.draw()
+    assert(canvas.tostring_rgb()==fullcanvas.tostring_rgb())
+    if change is not None: assert(canvas.tostring_rgb()!=before)
+
+print 'all tests passed'
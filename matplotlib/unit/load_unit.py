@@ -0,0 +1,51 @@
+import os, tempfile
+import matplotlib
+matplotlib.use('Agg')
+from pylab import load, save, datestr2num, arange, reshape, allclose
+
+fname = tempfile.mktemp('.dat')
+
+# save and load round trip, plain and gzipped, in any number of chunks
+X = reshape(arange(300000.)/7, (100000, 3))
+for name in (fname, fname+'.gz'):
+    save(name, X)
+    assert(allclose(load(name), X))
+    os.remove(name)
+
+# one column loads as a 1D array, and save writes it as a column
+x = arange(10.)
+save(fname, x, fmt='%d', delimiter=',')
+assert(file(fname).read()==''.join(['%d\n'%i for i in range(10)]))
+assert(load(fname).shape==(10,))
+
+# comments, blank lines, skiprows, converters and usecols
+fh = file(fname, 'w')
+fh.write("""Date,Open,Close
+% the opening prices
+19-Sep-03,29.76,29.96
+18-Sep-03,28.49,29.50 % closing
+
+17-Sep-03,28.76,28.36""")
+fh.close()
+X = load(fname, delimiter=',', skiprows=1, converters={0:datestr2num})
+assert(X.shape==(3, 3))
+assert(X[0,0]==datestr2num('2003-09-19') and X[2,2]==28.36)
+X = load(fname, delimiter=',', skiprows=1, usecols=(2, 0),
+         converters={0:datestr2num})
+assert(allclose(X[:,0], [29.96, 29.50, 28.36]))
+assert(X[1,1]==datestr2num('2003-09-18'))
+
+# ragged rows are an error, even when the values add up to whole rows
+for s, delimiter in (('1 2\n3\n', None), ('1 2 3\n4 5\n6 7 8 9\n', None),
+                     ('1,2,3\n4,5\n6,7,8,9\n', ',')):
+    file(fname, 'w').write(s)
+    try: load(fname, delimiter=delimiter)
+    except ValueError, msg: assert(str(msg).startswith('Data row 2 '))
+    else: raise AssertionError('loaded ragged rows')
+
+# an empty file loads as an empty 1D array
+file(fname, 'w').write('% no data\n\n')
+assert(load(fname).shape==(0,))
+os.remove(fname)
+
+print 'all tests passed'
@@ -0,0 +1,27 @@
+"""
+Check the level of detail decimation of Line2D: at most 4 vertices
+per pixel column, and the min and max of every column are preserved
+"""
+from matplotlib.numerix import arange, sin, floor, compress
+from matplotlib.lines import Line2D
+
+width = 100
+N = 100000
+x = arange(N)*(width/float(N))
+y = sin(x)
+
+line = Line2D(x, y)
+xd, yd = line._lod_decimate(x, y, width)
+assert(len(xd)<=4*width)
+assert(xd[0]==x[0] and xd[-1]==x[-1])
+
+for col in range(width):
+    ind = floor(x)==col
+    indd = floor(xd)==col
+    assert(max(compress(ind, y))==max(compress(indd, yd)))
+    assert(min(compress(ind, y))==min(compress(indd, yd)))
+
+# short lines are left alone
+xd, yd = line._lod_decimate(x[:50], y[:50], width)
+assert(len(xd)==50)
+print 'passed lod tests'
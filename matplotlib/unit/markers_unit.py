@@ -0,0 +1,23 @@
+from matplotlib.numerix import arange, resize, sin
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+def draw(x, y, **kwargs):
+    fig = Figure(figsize=(2,2), dpi=72)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    ax.plot(x, y, 'o', **kwargs)
+    ax.set_xlim((-1, 10))
+    ax.set_ylim((-2, 2))
+    canvas.draw()
+    return canvas.tostring_rgb()
+
+# with culling, repeats of opaque markers are skipped, so plotting
+# every point many times draws what plotting them once does
+x = arange(10)
+y = sin(x)
+once = draw(x, y)
+assert(draw(resize(x, (1000,)), resize(y, (1000,)), markercull=True)==once)
+assert(draw(x, y, markercull=True)==once)
+
+print 'all tests passed'
@@ -0,0 +1,49 @@
+from matplotlib import mathtext
+from matplotlib.mathtext import LayoutCache, math_parse_s_ft2font, \
+     math_parse_s_ps
+
+# the grammar is built on first use
+assert(mathtext._expression is None)
+
+# a string is parsed once, whatever the dpi and size
+s = r'$\alpha_{i+1}^j \/ = \/ \rm{sin}(2\pi f_j t_i)$'
+w72, h72, fonts = math_parse_s_ft2font(s, 72, 12)
+assert(mathtext._expression is not None)
+expr = mathtext._parsed[s[1:-1]][0]
+w144, h144, fonts = math_parse_s_ft2font(s, 144, 12)
+assert(mathtext._parsed[s[1:-1]][0] is expr)
+assert(w144>w72 and h144>h72)
+
+# a layout at another dpi does not change what a new layout gives
+math_parse_s_ft2font.cache.clear()
+assert(math_parse_s_ft2font(s, 72, 12)[:2]==(w72, h72))
+assert(math_parse_s_ft2font(s, 72, 12, angle=90)[:2]==(w72, h72))
+assert(len(math_parse_s_ft2font.cache)==2)
+math_parse_s_ps(s, 72, 12)
+
+# drawing a string rotated does not change how it draws horizontally
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+def draw(angle):
+    fig = Figure(figsize=(3,3), dpi=72)
+    canvas = FigureCanvasAgg(fig)
+    fig.text(0.5, 0.5, s, rotation=angle)
+    canvas.draw()
+    return canvas.tostring_rgb()
+math_parse_s_ft2font.cache.clear()
+horizontal = draw(0)
+math_parse_s_ft2font.cache.clear()
+draw(90)
+assert(draw(0)==horizontal)
+
+# the layout caches are bounded by entries and by bytes
+cache = LayoutCache(maxentries=2, maxbytes=100)
+cache.set('a', 1, 10)
+cache.set('b', 2, 10)
+cache.get('a')
+cache.set('c', 3, 10)
+assert(cache.get('b') is None and cache.get('a')==1 and cache.get('c')==3)
+cache.set('d', 4, 95)
+assert(len(cache)==1 and cache.nbytes==95)
+
+print 'all tests passed'
@@ -0,0 +1,36 @@
+from matplotlib.cbook import countingdict
+from matplotlib.transforms import Value
+from matplotlib.font_manager import FontProperties
+from matplotlib.backends.backend_agg import RendererAgg
+
+# the cache is bounded and counts its hits and misses
+d = countingdict(2)
+d['a'] = 1
+d['b'] = 2
+assert(d.get('a')==1 and d.get('c') is None)
+assert((d.hits, d.misses)==(1, 1))
+d['c'] = 3
+assert(len(d)==1 and d.get('c')==3)
+
+# renderers share the metrics, and a hit is what the font measures
+RendererAgg.metricsd.clear()
+prop = FontProperties(size=12)
+r1 = RendererAgg(100, 100, Value(72))
+r2 = RendererAgg(200, 50, Value(72))
+hits, misses = RendererAgg.metricsd.hits, RendererAgg.metricsd.misses
+wh = r1.get_text_width_height('0.5', prop, False)
+assert(RendererAgg.metricsd.misses==misses+1)
+assert(r2.get_text_width_height('0.5', prop, False)==wh)
+assert(RendererAgg.metricsd.hits==hits+1)
+
+font = r1._get_agg_font(prop)
+font.set_text('0.5', 0.0)
+w, h = font.get_width_height()
+assert(wh==(w/64.0, h/64.0))
+
+# another dpi or size is measured again
+r3 = RendererAgg(100, 100, Value(144))
+assert(r3.get_text_width_height('0.5', prop, False)!=wh)
+assert(r1.get_text_width_height('0.5', FontProperties(size=20), False)!=wh)
+
+print 'all tests passed'
@@ -0,0 +1,30 @@
+import os, struct
+from cStringIO import StringIO
+from matplotlib import get_data_path
+from matplotlib.backends.backend_pdf import PdfFile, subset_truetype
+
+# subsetting keeps the requested outlines and is idempotent
+data = file(os.path.join(get_data_path(), 'Vera.ttf'), 'rb').read()
+sub = subset_truetype(data, [36, 37, 68])
+assert(len(sub)<len(data))
+assert(subset_truetype(sub, [36, 37, 68])==sub)
+
+# the xref offsets point at the objects they number
+fh = StringIO()
+pdf = PdfFile(fh)
+contents = pdf.newPage(100, 50)
+contents.write('1 0 0 rg 10 10 30 20 re f\n')
+pdf.imageObject(2, 1, '\xff\x00\x00\x00\xff\x00', 'DeviceRGB', '\x80\xff')
+pdf.endPage()
+pdf.close()
+s = fh.getvalue()
+assert(s.startswith('%PDF-1.4'))
+xref = int(s[s.rindex('startxref')+len('startxref'):].split()[0])
+lines = s[xref:].split('\n')
+assert(lines[0]=='xref')
+n = int(lines[1].split()[1])
+for i in range(1, n):
+    offset = int(lines[2+i][:10])
+    assert(s[offset:].startswith('%d 0 obj' % i))
+
+print 'all tests passed'
@@ -0,0 +1,52 @@
+import os, struct, tempfile
+from cStringIO import StringIO
+from matplotlib import _image
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.numerix import arange, reshape, Float
+
+def check_png(s, width, height):
+    'assert s is a png of width x height pixels'
+    assert(s[:8]=='\x89PNG\r\n\x1a\n')
+    assert(s[12:16]=='IHDR')
+    assert(struct.unpack('>LL', s[16:24])==(width, height))
+
+def write_png(writer):
+    """
+    return the bytes writer(target) writes to a StringIO, to a file
+    object and to a filename; they must be the same
+    """
+    fname = tempfile.mktemp('.png')
+    buf = StringIO()
+    writer(buf)
+    fh = file(fname, 'wb')
+    writer(fh)
+    fh.close()
+    fromfh = file(fname, 'rb').read()
+    os.remove(fname)
+    writer(fname)
+    fromname = file(fname, 'rb').read()
+    os.remove(fname)
+    assert(buf.getvalue()==fromfh==fromname)
+    return fromname
+
+# the Agg renderer
+fig = Figure(figsize=(4, 3), dpi=50)
+canvas = FigureCanvasAgg(fig)
+fig.add_subplot(111).plot([1, 2, 3])
+canvas.draw()
+s = write_png(canvas.renderer._renderer.write_png)
+check_png(s, 200, 150)
+assert(canvas.tostring_png()==s)
+
+# print_figure to a file object and to a filename
+s = write_png(lambda target: canvas.print_figure(target, dpi=50))
+check_png(s, 200, 150)
+
+# images
+im = _image.fromarray(reshape(arange(60*40*3)%100/100., (60, 40, 3)), 1)
+s = write_png(im.write_png)
+check_png(s, 40, 60)
+assert(im.as_png_str()==s)
+
+print 'all tests passed'
@@ -0,0 +1,49 @@
+import zlib
+from matplotlib.backends.backend_ps import ascii85_lines, runlength_encode, \
+     encode_image_data
+
+def runlength_decode(s):
+    out = []
+    i = 0
+    while i<len(s):
+        n = ord(s[i])
+        if n<128:
+            out.append(s[i+1:i+n+2])
+            i += n+2
+        elif n>128:
+            out.append(s[i+1]*(257-n))
+            i += 2
+        else: break
+    return ''.join(out)
+
+def ascii85_decode(s):
+    s = ''.join(s.split())
+    if s.endswith('~>'): s = s[:-2]
+    pad = -len(s) % 5
+    s += 'u'*pad
+    out = []
+    for i in range(0, len(s), 5):
+        v = 0L
+        for c in s[i:i+5]: v = 85*v + ord(c)-33
+        out.append(''.join([chr((v>>shift) & 255) for shift in (24,16,8,0)]))
+    out = ''.join(out)
+    if pad: out = out[:-pad]
+    return out
+
+assert(ascii85_lines('Man ')=='9jqo^\n')
+assert(ascii85_lines('Ma')=='9jn\n')
+
+data = 'x'*1000 + ''.join([chr(i%7) for i in range(1000)]) + '\xff'*300
+assert(runlength_decode(runlength_encode(data))==data)
+
+for encoding in ('flate', 'runlength'):
+    text = ''.join(encode_image_data(data, encoding, chunksize=256))
+    assert(text.endswith('~>\n'))
+    for line in text.split('\n'):
+        assert(len(line)<=76 and not line.startswith('%'))
+    decoded = ascii85_decode(text)
+    if encoding=='flate': decoded = zlib.decompress(decoded)
+    else: decoded = runlength_decode(decoded)
+    assert(decoded==data)
+
+print 'all tests passed'
@@ -0,0 +1,57 @@
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.image import _reduce
+from matplotlib.numerix import arange, array, reshape, ravel, alltrue, \
+     typecode, UInt8, UInt16, Int8
+import matplotlib.numerix.ma as ma
+
+# the levels are the mean or max of 2x2 blocks, without the odd row
+A = reshape(arange(30.), (5, 6))
+assert(alltrue(ravel(_reduce(A, 'mean')==array([[3.5, 5.5, 7.5],
+                                                [15.5, 17.5, 19.5]]))))
+assert(alltrue(ravel(_reduce(A, 'max')==array([[7., 9., 11.],
+                                               [19., 21., 23.]]))))
+B = _reduce(array([[250, 250], [250, 251]], UInt8), 'mean')
+assert(typecode(B)==UInt8 and B[0,0]==250)
+B = _reduce(array([[65535, 65535], [65535, 65534]], UInt16), 'mean')
+assert(typecode(B)==UInt16 and B[0,0]==65535)
+B = _reduce(array([[-128, -128], [-128, -127]], Int8), 'mean')
+assert(typecode(B)==Int8 and B[0,0]==-128)
+M = ma.array(A, mask=A==8)
+assert(ma.getmaskarray(_reduce(M, 'mean'))[0,1])
+
+X = reshape(arange(800*1000) % 997, (800, 1000))
+
+def render(pyramid, xlim, ylim, origin):
+    'draw X with limits xlim, ylim; return the pixels and the image'
+    fig = Figure(figsize=(3, 3), dpi=72)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_axes([0, 0, 1, 1])
+    im = ax.imshow(X, vmin=0, vmax=996, interpolation='nearest',
+                   origin=origin, pyramid=pyramid)
+    ax.set_xlim(xlim)
+    ax.set_ylim(ylim)
+    canvas.draw()
+    return canvas.tostring_rgb(), im
+
+# zoomed in, only the block in view of the image itself is resampled
+# and it draws what the whole image does
+for origin in ('upper', 'lower'):
+    xlim, ylim = (300.3, 400.7), (200.2, 300.9)
+    full, im = render(None, xlim, ylim, origin)
+    part, im = render('mean', xlim, ylim, origin)
+    rows, cols = im.make_image().get_size()
+    assert(rows<150 and cols<150)
+    diff = [i for i in range(len(full)) if full[i]!=part[i]]
+    assert(len(diff)<0.001*len(full))
+
+# zoomed out, the coarsest level with a pixel per screen pixel is used
+part, im = render('max', (0, 1000), (0, 800), 'upper')
+assert(im.make_image().get_size()==(400, 500))
+assert(len(im._levels)==4)
+im.set_data(X[:500])
+assert(im._levels is None)
+
+print 'all tests passed'
@@ -0,0 +1,46 @@
+import os, shutil, tempfile
+from matplotlib import rcParams
+from matplotlib.numerix import ones, Float
+from matplotlib.texmanager import TexManager
+
+# the tex cache dir is kept under rcParams['text.texcachesize'] by
+# deleting the least recently used files of every type; no latex needed
+tmpdir = tempfile.mkdtemp()
+oldsize = rcParams['text.texcachesize']
+try:
+    texmanager = TexManager()
+    texmanager.texcache = tmpdir
+    TexManager._cachesize = None
+    rcParams['text.texcachesize'] = 0.05
+    maxsize = 0.05*1024*1024
+
+    # stale dvi, png and tex files count toward the limit too
+    for i, ext in enumerate(['.dvi', '.png', '.tex']*3):
+        fname = os.path.join(tmpdir, 'old%d%s'%(i, ext))
+        fh = file(fname, 'wb')
+        fh.write('x'*4096)
+        fh.close()
+        os.utime(fname, (i, i))
+
+    alpha = ones((50, 100), Float)
+    for i in range(30):
+        texmanager._write_grey(os.path.join(tmpdir, '%d.alpha'%i), alpha)
+
+    def cachesize():
+        return sum([os.path.getsize(os.path.join(tmpdir, fname))
+                    for fname in os.listdir(tmpdir)])
+    assert(cachesize()<=maxsize)
+    assert([fname for fname in os.listdir(tmpdir)
+            if not fname.endswith('.alpha')]==[])
+    assert(len(os.listdir(tmpdir))>0)
+
+    # a full scan leaves the estimate at the size on disk
+    texmanager._evict_cache()
+    assert(TexManager._cachesize==cachesize())
+    assert(TexManager._cachewrites==0)
+finally:
+    rcParams['text.texcachesize'] = oldsize
+    TexManager._cachesize = None
+    shutil.rmtree(tmpdir)
+
+print 'all tests passed'
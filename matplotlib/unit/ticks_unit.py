@@ -0,0 +1,65 @@
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.ticker import AutoLocator
+
+class CountingLocator(AutoLocator):
+    calls = 0
+    def __call__(self):
+        CountingLocator.calls += 1
+        return AutoLocator.__call__(self)
+
+def make(fontsize=None):
+    fig = Figure(figsize=(3,2), dpi=72)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    ax.plot([0, 1, 2], [0, 1, 4])
+    ax.set_xlim((0, 2))
+    ax.xaxis.set_major_locator(CountingLocator())
+    if fontsize is not None:
+        for label in ax.get_xticklabels(): label.set_fontsize(fontsize)
+    return fig, canvas, ax
+
+# the locator is asked once per layout, and not again while the view
+# is unchanged
+fig, canvas, ax = make()
+canvas.draw()
+first = canvas.tostring_rgb()
+calls = CountingLocator.calls
+canvas.draw()
+assert(CountingLocator.calls==calls)
+assert(canvas.tostring_rgb()==first)
+
+# new limits lay the ticks out again
+ax.set_xlim((0, 5))
+canvas.draw()
+assert(CountingLocator.calls>calls)
+labels = [t.get_text() for t in ax.get_xticklabels()]
+ax.set_xlim((0, 2))
+canvas.draw()
+assert([t.get_text() for t in ax.get_xticklabels()]!=labels)
+assert(canvas.tostring_rgb()==first)
+
+# collecting the tick labels for the tex batch, as Figure.draw does
+# with text.usetex, lays the ticks out once for the draw after it,
+# at the locations the locator gives
+fig, canvas, ax = make()
+CountingLocator.calls = 0
+texts = fig._get_tex_strings()
+canvas.draw()
+assert(CountingLocator.calls==1)
+locs = [loc for loc in ax.xaxis.major.locator() if 0<=loc<=2]
+ticks = list(ax.xaxis.iter_ticks())
+assert([tick.get_loc() for tick in ticks]==locs)
+for tick in ticks:
+    label = tick.label1
+    assert(not label.get_text() or
+           (label.get_text(), label.get_size()) in texts)
+
+# changing a tick label property draws what a new figure does
+for label in ax.get_xticklabels(): label.set_fontsize(20)
+canvas.draw()
+fig2, canvas2, ax2 = make(20)
+canvas2.draw()
+assert(canvas.tostring_rgb()==canvas2.tostring_rgb())
+
+print 'all tests passed'
@@ -1,6 +1,6 @@
 #from __future__ import division
 
-from matplotlib.numerix import array, asarray, alltrue, arange
+from matplotlib.numerix import array, asarray, alltrue, arange, transpose, ravel
 from matplotlib.numerix.mlab import rand
 from matplotlib.transforms import Point, Bbox, Value, Affine
 from matplotlib.transforms import multiply_affines
@@ -302,4 +302,54 @@ if have_nan:
 else:
     print 'nan could not be imported from numarray.ieeespecial, test skipped'
  
+# the spatial index
+from matplotlib.transforms import SpatialIndex, lbwh_to_bbox
+x = rand(1000)*100
+y = rand(1000)*100
+index = SpatialIndex(x, y, 1)
+assert(index.size()==1000)
+for px, py in ((10, 10), (50.5, 20), (-30, 150)):
+    d = (x-px)**2 + (y-py)**2
+    ind, dist = index.nearest(px, py)
+    assert(d[ind]==min(d))
+    assert(closeto(dist**2, min(d)))
+
+bbox = lbwh_to_bbox(20, 30, 40, 10)
+inside = (x>=20) & (x<=60) & (y>=30) & (y<=40)
+assert(index.count_contains(bbox)==sum(inside))
+assert(len(index.indices_in_bbox(bbox))==sum(inside))
+
+line = SpatialIndex(array([0., 10.]), array([0., 10.]), 1)
+assert(line.cuts_bbox(lbwh_to_bbox(4, 0, 2, 10)))
+assert(not line.cuts_bbox(lbwh_to_bbox(20, 0, 2, 10)))
+assert(SpatialIndex(array([]), array([])).nearest(0, 0) is None)
+
+# the segments are found in every cell they cross: compare cuts_bbox
+# with testing every segment against every edge
+from matplotlib.mlab import segments_intersect
+walk = SpatialIndex(x, y, 1)
+for i in range(50):
+    l, b = rand(2)*100
+    w, h = rand(2)*20
+    edges = (((l, b), (l, b+h)), ((l, b), (l+w, b)),
+             ((l+w, b), (l+w, b+h)), ((l, b+h), (l+w, b+h)))
+    cuts = False
+    for j in range(len(x)-1):
+        for edge in edges:
+            if segments_intersect(((x[j], y[j]), (x[j+1], y[j+1])), edge):
+                cuts = True
+    assert(walk.cuts_bbox(lbwh_to_bbox(l, b, w, h))==cuts)
+
+# Nx2 array transforms agree with the tuple api
+trans = SeparableTransformation(lbwh_to_bbox(0, 0, 100, 100),
+                                lbwh_to_bbox(10, 20, 300, 200),
+                                Func(IDENTITY), Func(LOG10))
+xy = transpose(array([x, y+1]))
+txy = trans.numerix_xy(xy)
+assert(txy.shape==(1000,2))
+for i in (0, 10, 999):
+    assert(closeto_seq(txy[i], trans.xy_tup(tuple(xy[i]))))
+assert(closeto_seq(ravel(trans.inverse_numerix_xy(txy)), ravel(xy)))
+assert(trans.numerix_xy([]).shape==(0,2))
+
 print 'all tests passed'